@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+입력 오디오 변환 벤치마크 (20ms 프레임 스트리밍)
+NumPy 벡터화 다운믹스/폴리페이즈 리샘플러와 같은 필터를 쓰는 순수 Python 구현의
+오디오 1초당 CPU 시간 비교
+
+사용법:
+    python benchmarks/bench_audio_resample.py [오디오 길이(초)]
+"""
+import sys
+import time
+from math import gcd
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.audio_resample import AudioConverter, design_filter
+
+FRAME_MS = 20
+
+
+class PurePythonConverter:
+    """기준 구현: 같은 필터 계수로 샘플마다 파이썬 루프"""
+
+    def __init__(self, input_rate: int, input_channels: int, output_rate: int):
+        divisor = gcd(input_rate, output_rate)
+        self.up, self.down = output_rate // divisor, input_rate // divisor
+        self.channels = input_channels
+        self.bank = design_filter(self.up, self.down).tolist()
+        self.taps = len(self.bank[0])
+        self.history = [0.0] * (self.taps - 1)
+        self.position = 0
+
+    def convert(self, audio: bytes) -> bytes:
+        pcm = memoryview(audio).cast("h")
+        channels = self.channels
+        samples = [sum(pcm[i:i + channels]) / channels for i in range(0, len(pcm), channels)]
+        buffer = self.history + samples
+        span = len(samples) * self.up
+        out = []
+        position = self.position
+        while position < span:
+            index, phase = divmod(position, self.up)
+            coefficients = self.bank[phase]
+            acc = 0.0
+            for k in range(self.taps):
+                acc += buffer[index + k] * coefficients[k]
+            out.append(max(-32768, min(32767, round(acc))))
+            position += self.down
+        self.position = position - span
+        self.history = buffer[len(samples):]
+        return np.array(out, dtype=np.int16).tobytes()
+
+
+def make_frames(rate: int, channels: int, seconds: float):
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(int(rate * seconds) * channels) * 3000).astype(np.int16)
+    step = rate * FRAME_MS // 1000 * channels * 2
+    audio = samples.tobytes()
+    return [audio[i:i + step] for i in range(0, len(audio), step)]
+
+
+def bench(converter, frames, seconds: float) -> float:
+    started = time.process_time()
+    for frame in frames:
+        converter.convert(frame)
+    return (time.process_time() - started) * 1000 / seconds
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    reference_seconds = min(seconds, 1.0)  # 순수 Python은 느려서 짧게
+    print(f"{FRAME_MS}ms 프레임 → 16kHz 모노 (CPU ms / 오디오 1초)")
+    print(f"{'입력 형식':<16} {'NumPy':>10} {'순수 Python':>12} {'배속':>8}")
+    for rate, channels in ((48000, 2), (48000, 1), (44100, 2), (24000, 1), (8000, 1)):
+        fast = bench(AudioConverter(rate, channels, 16000), make_frames(rate, channels, seconds), seconds)
+        slow = bench(PurePythonConverter(rate, channels, 16000), make_frames(rate, channels, reference_seconds),
+                     reference_seconds)
+        print(f"{f'{rate}Hz/{channels}ch':<16} {fast:>8.2f}ms {slow:>10.1f}ms {slow / fast:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
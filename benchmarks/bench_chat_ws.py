@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+채팅 WebSocket 프로토콜 전송량 벤치마크
+한 세션(연결 + N턴) 동안 브라우저로 나가는 프레임 수/바이트를 v1과 v2로 비교
+(permessage-deflate는 zlib raw deflate + 컨텍스트 유지로 계산, RFC 7692 기본 설정과 같음)
+
+턴 하나: 사용자 전사 → 제품 카드(3개) → 어시스턴트 응답, 세 번째 턴마다 매장 카드 추가
+- 틱 단위: 이벤트가 서로 다른 루프 틱에 생기는 실제 흐름 (CHAT_WS_COALESCE_MS=0)
+- 턴 단위: 턴 전체가 묶음 창 안에 들어오는 경우 (CHAT_WS_COALESCE_MS를 크게 둔 경우)
+
+사용법:
+    python benchmarks/bench_chat_ws.py [턴 수]
+"""
+import asyncio
+import sys
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src import websocket_manager
+from src.store_service import StoreService
+
+
+class MeasuringWebSocket:
+    """프레임 수, 원본 바이트, permessage-deflate 후 바이트를 집계"""
+
+    def __init__(self):
+        self.frames = 0
+        self.raw_bytes = 0
+        self.deflated_bytes = 0
+        self._deflate = zlib.compressobj(wbits=-15)
+
+    async def send_text(self, text: str):
+        data = text.encode("utf-8")
+        compressed = self._deflate.compress(data) + self._deflate.flush(zlib.Z_SYNC_FLUSH)
+        self.frames += 1
+        self.raw_bytes += len(data)
+        self.deflated_bytes += len(compressed) - 4  # 끝의 00 00 ff ff는 전송하지 않음
+
+
+async def run_session(service: StoreService, protocol: int, turns: int, per_turn: bool) -> MeasuringWebSocket:
+    ws = MeasuringWebSocket()
+    websocket_manager.add_websocket(protocol, ws, protocol=protocol)
+    websocket_manager.send_catalog(protocol, service)
+    await websocket_manager.flush()
+
+    products = service.get_all_products()
+    main_store = service.data["store"]
+    for turn in range(turns):
+        ids = [products[(turn * 3 + i) % len(products)]["product_id"] for i in range(3)]
+        await websocket_manager.broadcast_message({"type": "transcript", "speaker": "user", "text": "수분 세럼 추천해 주세요"})
+        if not per_turn:
+            await websocket_manager.flush()
+        await websocket_manager.broadcast_products(service, ids)
+        if turn % 3 == 2:
+            await websocket_manager.broadcast_message({
+                "type": "show_images",
+                "content_type": "store",
+                "data": {
+                    "store_name": main_store.get("store_name", ""),
+                    "image_url": main_store.get("store_images", [""])[0],
+                    "address": main_store.get("address", ""),
+                },
+            })
+        if not per_turn:
+            await websocket_manager.flush()
+        await websocket_manager.broadcast_message({
+            "type": "response",
+            "speaker": "assistant",
+            "text": "토리든 다이브인 세럼을 추천드려요. 지금 할인 중이고 스킨케어 섹션에 있습니다.",
+        })
+        await websocket_manager.flush()
+
+    websocket_manager.remove_websocket(protocol)
+    return ws
+
+
+def main():
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    logger.remove()
+    service = StoreService()
+
+    print(f"채팅 WebSocket 세션 전송량 ({turns}턴, 카탈로그 {len(service.get_all_products())}개 제품)")
+    print(f"{'방식':<16} {'프레임/턴':>10} {'바이트/턴':>10} {'deflate/턴':>12}")
+    for label, protocol, per_turn in (("v1", 1, False), ("v2 (틱 단위)", 2, False), ("v2 (턴 단위)", 2, True)):
+        ws = asyncio.run(run_session(service, protocol, turns, per_turn))
+        print(
+            f"{label:<16} {ws.frames / turns:>10.1f} {ws.raw_bytes / turns:>10.0f} {ws.deflated_bytes / turns:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+서버 콜드 스타트 벤치마크
+새 인터프리터에서 src.server / src.bot 임포트 시간과 최대 RSS를 측정하고,
+`-X importtime` 출력으로 누적 임포트 시간이 큰 모듈을 보고합니다.
+
+src.server 임포트가 봇 의존성(pipecat 등)을 끌어오거나 --max-server-ms를 넘으면 종료 코드 1 (회귀 감지용)
+
+사용법:
+    python benchmarks/bench_cold_start.py [--repeat 3] [--top 15] [--max-server-ms 1500]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# 서버 워커가 임포트하면 안 되는 무거운 봇 의존성
+HEAVY_MODULES = ("src.bot", "pipecat", "openai", "onnxruntime", "daily")
+
+_CHILD = """
+import json, resource, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+heavy = sorted({{prefix for prefix in {heavy!r} for name in sys.modules
+                if name == prefix or name.startswith(prefix + ".")}})
+print(json.dumps({{"ms": elapsed * 1000, "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                  "heavy": heavy}}))
+"""
+
+
+def run_child(module: str, importtime: bool = False):
+    """새 인터프리터에서 모듈 하나를 임포트하고 (측정값, importtime 출력)을 반환"""
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _CHILD.format(module=module, heavy=HEAVY_MODULES)]
+    result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def parse_importtime(stderr: str):
+    """`-X importtime` 출력 → [(모듈, 자체 us, 누적 us, 깊이)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def report(module: str, repeat: int, top: int):
+    samples = [run_child(module)[0] for _ in range(repeat)]
+    measured, stderr = run_child(module, importtime=True)
+    ms = statistics.median(sample["ms"] for sample in samples)
+    rss_mb = statistics.median(sample["maxrss_kb"] for sample in samples) / 1024
+
+    print(f"\n=== import {module} ===")
+    print(f"  import time (median of {repeat}): {ms:8.1f} ms")
+    print(f"  max RSS:                         {rss_mb:8.1f} MB")
+    print(f"  heavy bot deps loaded: {', '.join(measured['heavy']) or '-'}")
+
+    rows = parse_importtime(stderr)
+    print(f"  top {top} by cumulative import time:")
+    for name, self_us, cumulative_us, depth in sorted(rows, key=lambda row: -row[2])[:top]:
+        print(f"    {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f} ms)  {'  ' * min(depth, 6)}{name}")
+    return ms, measured["heavy"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=15, help="보고할 모듈 수")
+    parser.add_argument("--max-server-ms", type=float, default=None, help="src.server 임포트 시간 상한 (ms)")
+    args = parser.parse_args()
+
+    server_ms, server_heavy = report("src.server", args.repeat, args.top)
+    bot_ms, _ = report("src.bot", args.repeat, args.top)
+    print(f"\nsrc.server는 봇 임포트({bot_ms:.0f} ms)를 첫 세션까지 미룸 → 워커 시작 {server_ms:.0f} ms")
+
+    failed = False
+    if server_heavy:
+        print(f"❌ src.server imports bot dependencies at load: {', '.join(server_heavy)}")
+        failed = True
+    if args.max_server_ms is not None and server_ms > args.max_server_ms:
+        print(f"❌ src.server import {server_ms:.0f} ms > budget {args.max_server_ms:.0f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
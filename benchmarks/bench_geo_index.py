@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+매장 공간 색인 벤치마크 (전국 약 1,300개 매장 규모)
+KD-tree k-최근접/반경 검색과 전체 haversine 탐색 비교
+
+사용법:
+    python benchmarks/bench_geo_index.py [매장 수]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.geo_index import GeoIndex, haversine_m
+
+
+def bench(label: str, fn, queries):
+    for q in queries[:10]:
+        fn(*q)  # 워밍업
+    start = time.perf_counter()
+    for q in queries:
+        fn(*q)
+    per_query = (time.perf_counter() - start) / len(queries)
+    print(f"  {label:<36} {per_query * 1e6:9.1f} µs/query")
+    return per_query
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1300
+    rng = random.Random(42)
+    # 매장은 도심에 몰려 있으므로 절반은 서울 근처에 배치
+    stores = []
+    for i in range(n):
+        if i % 2:
+            lat, lng = rng.gauss(37.55, 0.08), rng.gauss(126.99, 0.1)
+        else:
+            lat, lng = rng.uniform(33.2, 38.5), rng.uniform(126.1, 129.5)
+        stores.append((lat, lng, {"store_id": f"S{i:04d}", "status": "영업 중" if rng.random() > 0.1 else "영업 종료"}))
+    queries = [(rng.gauss(37.55, 0.1), rng.gauss(126.99, 0.1)) for _ in range(2000)]
+
+    start = time.perf_counter()
+    index = GeoIndex(stores)
+    print(f"🗺️ Stores: {n:,} (index build {(time.perf_counter() - start) * 1000:.1f} ms)\n")
+
+    def linear_nearest(lat, lng, k=1):
+        return sorted((haversine_m(lat, lng, s_lat, s_lng), i) for i, (s_lat, s_lng, _) in enumerate(stores))[:k]
+
+    is_open = lambda store: store["status"] == "영업 중"
+    base = bench("linear scan nearest (k=1)", linear_nearest, queries[:200])
+    fast = bench("KD-tree nearest (k=1)", lambda lat, lng: index.nearest(lat, lng, k=1), queries)
+    print(f"  → {base / fast:.0f}x faster")
+    bench("KD-tree nearest open (k=5)", lambda lat, lng: index.nearest(lat, lng, k=5, predicate=is_open), queries)
+    bench("KD-tree within 1 km", lambda lat, lng: index.within(lat, lng, 1000), queries)
+
+
+if __name__ == "__main__":
+    main()
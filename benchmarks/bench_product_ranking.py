@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+제품 랭킹/필터 벤치마크 (100k 제품)
+기존 방식(전체 정렬 + Python 루프 필터)과 NumPy 컬럼 뷰(argpartition top-k + 벡터 필터) 비교
+
+사용법:
+    python benchmarks/bench_product_ranking.py [제품 수]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.product_array import ProductArray
+
+CATEGORIES = ["스킨케어", "클렌징", "메이크업", "바디케어", "헤어케어", "기타"]
+
+
+def make_catalog(n: int, seed: int = 42):
+    """합성 카탈로그 생성"""
+    rng = random.Random(seed)
+    by_category = {name: [] for name in CATEGORIES}
+    products = []
+    for i in range(n):
+        price = rng.randrange(3000, 120000, 100)
+        product = {
+            "product_id": f"A{i:012d}",
+            "name": f"테스트 제품 {i}",
+            "original_price": price,
+            "discount_rate": rng.randrange(0, 70),
+            "sale_price": price - price * rng.randrange(0, 60) // 100,
+            "stock_status": "재고있음" if rng.random() > 0.15 else "품절",
+        }
+        products.append(product)
+        by_category[rng.choice(CATEGORIES)].append(product)
+    category_of = {p["product_id"]: name for name, items in by_category.items() for p in items}
+    return products, by_category, category_of
+
+
+def bench(label: str, fn, repeat: int = 20):
+    fn()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<44} {elapsed * 1000:9.3f} ms")
+    return elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    products, by_category, category_of = make_catalog(n)
+    print(f"📦 Products: {n:,}")
+
+    start = time.perf_counter()
+    array = ProductArray.from_products(products, by_category)
+    print(f"  {'ProductArray build (one-time per snapshot)':<44} {(time.perf_counter() - start) * 1000:9.3f} ms\n")
+
+    print("🔥 Popular products (top 3 by discount)")
+    base = bench("sorted(...)[:3]", lambda: sorted(products, key=lambda p: p.get("discount_rate", 0), reverse=True)[:3])
+    fast = bench("ProductArray.top_k(3)", lambda: array.select(array.top_k(3)))
+    print(f"  → {base / fast:.1f}x faster\n")
+
+    print("🔎 <= 30,000원, in stock, 스킨케어, top 5 by discount")
+
+    def python_query():
+        matches = [
+            p for p in products
+            if p["sale_price"] <= 30000
+            and p["stock_status"] == "재고있음"
+            and category_of.get(p["product_id"]) == "스킨케어"
+        ]
+        return sorted(matches, key=lambda p: p["discount_rate"], reverse=True)[:5]
+
+    def numpy_query():
+        mask = array.mask(max_price=30000, in_stock=True, category="스킨케어")
+        return array.select(array.top_k(5, mask=mask))
+
+    assert python_query() == numpy_query()
+    base = bench("Python loop filter + sorted", python_query)
+    fast = bench("ProductArray.mask + top_k", numpy_query)
+    print(f"  → {base / fast:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+세션 시작 프롬프트 준비 시간 벤치마크
+카탈로그 크기별로 캐시 없는 렌더링(기존 방식)과 캐시된 프롬프트 + few-shot 메시지 준비 시간 비교,
+리로드 시 카테고리 하나만 바뀐 경우의 재빌드 시간 측정
+
+사용법:
+    python benchmarks/bench_prompt_startup.py
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src.prompt_builder import PromptBuilder
+from src.store_service import StoreService
+
+CATEGORIES = ["스킨케어", "클렌징", "메이크업", "바디케어", "헤어케어", "기타"]
+
+
+def make_data(n: int, seed: int = 42) -> dict:
+    """합성 카탈로그 데이터 생성"""
+    rng = random.Random(seed)
+    by_category = {name: [] for name in CATEGORIES}
+    products = []
+    for i in range(n):
+        price = rng.randrange(3000, 120000, 100)
+        product = {
+            "product_id": f"A{i:012d}",
+            "name": f"테스트 브랜드 테스트 제품 {i} 대용량 기획세트",
+            "original_price": price,
+            "discount_rate": rng.randrange(0, 70),
+            "sale_price": price - price * rng.randrange(0, 60) // 100,
+            "stock_status": "재고있음",
+        }
+        products.append(product)
+        by_category[rng.choice(CATEGORIES)].append(product)
+    return {
+        "store": {"store_name": "올리브영 명동 타운", "store_id": "D176", "address": "서울특별시 중구 명동길 53"},
+        "products": {"total": n, "by_category": by_category, "all_products": products},
+        "nearby_stores": [],
+    }
+
+
+def write_service(data: dict, directory: Path, name: str, version: int) -> StoreService:
+    path = directory / name
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return StoreService(str(path), version=version)
+
+
+def bench(label: str, fn, repeat: int = 20):
+    fn()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<44} {elapsed * 1000:9.3f} ms")
+    return elapsed
+
+
+def main():
+    logger.remove()
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for n in (100, 1_000, 10_000):
+            data = make_data(n)
+            service = write_service(data, directory, f"catalog_{n}.json", version=1)
+            print(f"📦 Products: {n:,}")
+
+            def uncached():
+                builder = PromptBuilder()
+                builder.initial_messages(builder.system_prompt(service))
+
+            builder = PromptBuilder()
+
+            def cached():
+                builder.initial_messages(builder.system_prompt(service))
+
+            base = bench("Render per session (no cache)", uncached, repeat=5)
+            fast = bench("Cached prompt + few-shot messages", cached, repeat=1000)
+            print(f"  → {base / fast:.0f}x faster")
+
+            # 리로드: 카테고리 하나의 가격만 변경
+            data["products"]["by_category"][CATEGORIES[0]][0]["sale_price"] += 100
+            reloaded = write_service(data, directory, f"catalog_{n}_v2.json", version=2)
+            start = time.perf_counter()
+            builder.system_prompt(reloaded)
+            incremental = time.perf_counter() - start
+            print(f"  {'Reload, 1 of 6 categories changed':<44} {incremental * 1000:9.3f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
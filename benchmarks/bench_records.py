@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+카탈로그 레코드 메모리/접근 비용 벤치마크
+제품을 딕셔너리로 들고 있는 기존 방식과 읽기 전용 slots 레코드(records.Product) 비교
+(레코드당 메모리는 tracemalloc, 접근 비용은 name/sale_price 읽기 반복 시간)
+
+사용법:
+    python benchmarks/bench_records.py [제품 수]
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.records import Product
+
+
+def sample_products(count: int):
+    """assistant_data.json 제품과 같은 키의 합성 제품 (문자열은 레코드마다 새로 만든 값)"""
+    return [
+        {
+            "product_id": f"A{i:08d}",
+            "name": f"테스트 세럼 {i}",
+            "image_url": f"https://image.oliveyoung.co.kr/uploads/images/goods/{i}.jpg",
+            "original_price": 20000 + i % 5000,
+            "discount_rate": i % 50,
+            "sale_price": 15000 + i % 4000,
+            "stock_info": "재고 있음",
+            "stock_status": "재고 있음",
+        }
+        for i in range(count)
+    ]
+
+
+def measure(build):
+    """build()가 만든 컨테이너 메모리 (문자열/정수 값 제외한 컨테이너 증가분, 바이트)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build()
+    grown = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return items, grown
+
+
+def time_access(fn, products, repeat: int = 5) -> float:
+    """레코드당 접근 시간 (ns, 가장 빠른 반복 기준)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(products)
+        best = min(best, time.perf_counter() - started)
+    return best / len(products) * 1e9
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    source = sample_products(count)
+
+    dicts, dict_bytes = measure(lambda: [dict(p) for p in source])
+    records, record_bytes = measure(lambda: [Product.from_dict(p) for p in source])
+
+    print(f"제품 {count:,}개 (값 객체 공유, 컨테이너 메모리만)")
+    print(f"{'방식':<14} {'전체':>10} {'제품당':>10}")
+    print(f"{'dict':<14} {dict_bytes / 1e6:>8.1f}MB {dict_bytes / count:>8.0f}B")
+    print(f"{'Product':<14} {record_bytes / 1e6:>8.1f}MB {record_bytes / count:>8.0f}B")
+    print(f"→ {dict_bytes / record_bytes:.1f}배 작음")
+
+    print()
+    print(f"{'접근':<26} {'제품당':>10}")
+    cases = [
+        ("dict p['name']", dicts, lambda ps: [p["name"] for p in ps]),
+        ("dict p.get('sale_price')", dicts, lambda ps: [p.get("sale_price") for p in ps]),
+        ("Product p.name", records, lambda ps: [p.name for p in ps]),
+        ("Product p.sale_price", records, lambda ps: [p.sale_price for p in ps]),
+        ("Product p.get('sale_price')", records, lambda ps: [p.get("sale_price") for p in ps]),
+    ]
+    for label, products, fn in cases:
+        print(f"{label:<26} {time_access(fn, products):>8.1f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+JSON 직렬화 백엔드 벤치마크
+실제 트래픽 형태의 메시지(Scribe 오디오 청크 송신/전사 수신, 채팅 WebSocket 브로드캐스트, 카탈로그 파일)로
+백엔드별(orjson / msgspec / 표준 json) 메시지당 인코드·디코드 시간과 Scribe 타입 디코더 비용 비교
+
+사용법:
+    python benchmarks/bench_serialization.py [반복 횟수]
+"""
+import base64
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import serialization
+from src.serialization import available_backends, get_codec
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "assistant_data.json"
+
+
+def sample_messages():
+    """프로토콜 형식 그대로의 대표 메시지 (오디오 청크는 16kHz 20ms PCM)"""
+    catalog = get_codec("json").loads(DATA_PATH.read_bytes())
+    products = catalog["products"]["all_products"][:3]
+    store = catalog["store"]
+    pcm = (np.random.default_rng(0).standard_normal(320) * 2000).astype(np.int16).tobytes()
+    return {
+        "scribe 오디오 청크 (송신)": {
+            "message_type": "input_audio_chunk",
+            "audio_base_64": base64.b64encode(pcm).decode("ascii"),
+            "commit": False,
+            "sample_rate": 16000,
+        },
+        "scribe partial (수신)": {"message_type": "partial_transcript", "text": "토리든 세럼 재고 있"},
+        "scribe committed+words (수신)": {
+            "message_type": "committed_transcript_with_timestamps",
+            "text": "토리든 세럼 재고 있어요?",
+            "language_code": "ko",
+            "words": [
+                {"text": word, "start": 120 + i * 300, "end": 400 + i * 300, "type": "word", "logprob": -0.05}
+                for i, word in enumerate("토리든 세럼 재고 있어요?".split())
+            ],
+        },
+        "채팅 응답 브로드캐스트": {"type": "response", "speaker": "assistant",
+                          "text": "토리든 다이브인 세럼은 2층 스킨케어 코너에 있습니다."},
+        "제품 카드 브로드캐스트": {"type": "show_images", "content_type": "products", "products": products},
+        "매장 카드 브로드캐스트": {"type": "show_images", "content_type": "store", "store": store},
+        "카탈로그 파일": catalog,
+    }
+
+
+def per_call_us(fn, arg, repeat: int) -> float:
+    for _ in range(min(repeat, 100)):
+        fn(arg)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter() - started) * 1e6 / repeat
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    backends = available_backends()
+    codecs = {name: get_codec(name) for name in backends}
+    print(f"백엔드: {', '.join(backends)} (기본: {serialization.BACKEND})  단위: µs/메시지")
+    header = "".join(f"{name + ' enc':>13}{name + ' dec':>13}" for name in backends)
+    print(f"{'메시지':<28}{'크기':>8}{header}")
+    for label, message in sample_messages().items():
+        n = max(20, repeat // 200) if label == "카탈로그 파일" else repeat
+        encoded = codecs["json"].dumps_bytes(message)
+        cells = ""
+        for name, codec in codecs.items():
+            cells += f"{per_call_us(codec.dumps, message, n):>13.2f}{per_call_us(codec.loads, encoded, n):>13.2f}"
+        print(f"{label:<28}{len(encoded):>7}B{cells}")
+
+    raw = codecs["json"].dumps(sample_messages()["scribe committed+words (수신)"])
+    typed = per_call_us(serialization.decode_scribe_message, raw, repeat)
+    generic = per_call_us(lambda r: serialization._scribe_from_dict(codecs["json"].loads(r)), raw, repeat)
+    print(f"\nScribe 타입 디코드: {typed:.2f}µs (현재 디코더) vs {generic:.2f}µs (json.loads + dict → dataclass)")
+
+
+if __name__ == "__main__":
+    main()
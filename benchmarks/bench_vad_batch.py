@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+세션 간 배치 VAD 추론 벤치마크
+동시 세션 1/10/50개가 실시간 속도(16kHz, 32ms 프레임)로 오디오를 보낼 때
+세션별 단독 추론과 배치 추론의 CPU 사용량(세션·초당 CPU ms), 평균 배치 크기, 프레임 지연(p95) 비교
+
+사용법:
+    python benchmarks/bench_vad_batch.py [측정 시간(초)]
+"""
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src.vad_batch import BatchedVADService
+from src.vad_pool import VADAnalyzerPool
+
+FRAME_SAMPLES = 512
+FRAME_SECONDS = FRAME_SAMPLES / 16000
+
+
+def make_frames(seed: int, count: int):
+    rng = np.random.default_rng(seed)
+    audio = (rng.standard_normal(FRAME_SAMPLES * count) * 3000).astype(np.int16).tobytes()
+    step = FRAME_SAMPLES * 2
+    return [audio[i:i + step] for i in range(0, len(audio), step)]
+
+
+def run(sessions: int, seconds: float, batched: bool):
+    pool = VADAnalyzerPool(size=0, batched=False)
+    session = pool._load_session()
+    service = None
+    if batched:
+        from src.vad_batch import BatchedSileroVADAnalyzer
+        service = BatchedVADService()
+        service.start(session)
+    analyzers = []
+    for _ in range(sessions):
+        if batched:
+            analyzer = BatchedSileroVADAnalyzer(session=session, service=service)
+        else:
+            analyzer = pool.acquire()
+        analyzer.reset()
+        analyzer.set_sample_rate(16000)
+        analyzers.append(analyzer)
+
+    count = int(seconds / FRAME_SECONDS)
+    latencies = [[] for _ in range(sessions)]
+    start_at = time.perf_counter() + 0.2
+
+    def session_loop(i):
+        frames = make_frames(i, count)
+        offset = (i / sessions) * FRAME_SECONDS  # 세션마다 프레임 도착 시점이 다름
+        for k, frame in enumerate(frames):
+            due = start_at + offset + k * FRAME_SECONDS
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            began = time.perf_counter()
+            analyzers[i].voice_confidence(frame)
+            latencies[i].append(time.perf_counter() - began)
+
+    threads = [threading.Thread(target=session_loop, args=(i,)) for i in range(sessions)]
+    cpu_before = time.process_time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cpu = time.process_time() - cpu_before
+
+    all_latencies = sorted(latency for per_session in latencies for latency in per_session)
+    p95 = all_latencies[int(len(all_latencies) * 0.95)] * 1000
+    average_batch = service.average_batch if service else 1.0
+    if service:
+        service.stop()
+    return cpu * 1000 / (sessions * seconds), average_batch, p95
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    logger.remove()
+    print(f"실시간 VAD 부하 {seconds:.0f}초 (프레임 {FRAME_SECONDS * 1000:.0f}ms)")
+    print(f"{'세션':>4} {'방식':<8} {'CPU ms/세션·초':>16} {'평균 배치':>10} {'p95 지연':>10}")
+    for sessions in (1, 10, 50):
+        for batched in (False, True):
+            cpu, batch, p95 = run(sessions, seconds, batched)
+            label = "batched" if batched else "single"
+            print(f"{sessions:>4} {label:<8} {cpu:>16.2f} {batch:>10.1f} {p95:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Silero VAD 분석기 준비 시간/메모리 벤치마크
+세션마다 SileroVADAnalyzer를 새로 만드는 기존 방식과 공유 모델 + 분석기 풀 비교
+(각 방식은 새 인터프리터에서 실행해 RSS 증가량을 따로 측정)
+
+사용법:
+    python benchmarks/bench_vad_pool.py [세션 수]
+"""
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def run_mode(mode: str, sessions: int) -> dict:
+    """세션 수만큼 분석기를 준비하고 (첫 준비 시간, 이후 평균 준비 시간, 세션당 RSS 증가)를 측정"""
+    from loguru import logger
+    from pipecat.audio.vad.silero import SileroVADAnalyzer
+    from pipecat.audio.vad.vad_analyzer import VADParams
+
+    from src.vad_pool import VADAnalyzerPool
+
+    logger.remove()
+    pool = VADAnalyzerPool(size=sessions)
+    baseline = _rss_mb()
+
+    timings = []
+    analyzers = []
+    for _ in range(sessions):
+        started = time.perf_counter()
+        if mode == "fresh":
+            analyzer = SileroVADAnalyzer(params=VADParams(stop_secs=0.2))
+        else:
+            analyzer = pool.acquire(VADParams(stop_secs=0.2))
+        analyzer.set_sample_rate(16000)
+        analyzer.voice_confidence(b"\x00\x00" * 512)
+        timings.append((time.perf_counter() - started) * 1000)
+        analyzers.append(analyzer)
+    grown = _rss_mb() - baseline
+
+    # 두 번째 세션 묶음: 풀은 반납된 분석기를 재사용
+    if mode == "pool":
+        for analyzer in analyzers:
+            pool.release(analyzer)
+    reuse = []
+    for _ in range(sessions):
+        started = time.perf_counter()
+        if mode == "fresh":
+            analyzer = SileroVADAnalyzer(params=VADParams(stop_secs=0.2))
+        else:
+            analyzer = pool.acquire(VADParams(stop_secs=0.2))
+        analyzer.set_sample_rate(16000)
+        reuse.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "first_ms": timings[0],
+        "avg_ms": sum(timings[1:]) / max(1, len(timings) - 1),
+        "reuse_ms": sum(reuse) / len(reuse),
+        "rss_per_session_mb": grown / sessions,
+    }
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        print(json.dumps(run_mode(sys.argv[2], int(sys.argv[3]))))
+        return
+
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"VAD 분석기 준비 ({sessions} 세션)")
+    print(f"{'방식':<8} {'첫 세션':>10} {'이후 평균':>10} {'재시작 평균':>12} {'세션당 RSS':>12}")
+    for mode in ("fresh", "pool"):
+        result = subprocess.run(
+            [sys.executable, __file__, "--child", mode, str(sessions)],
+            capture_output=True, text=True, check=True,
+        )
+        r = json.loads(result.stdout.strip().splitlines()[-1])
+        print(
+            f"{mode:<8} {r['first_ms']:>8.1f}ms {r['avg_ms']:>8.2f}ms {r['reuse_ms']:>10.3f}ms "
+            f"{r['rss_per_session_mb']:>10.2f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+웹 UI 전송량 벤치마크
+첫 방문(index.html + app.css + app.js, 지도 이미지)과 재방문(조건부 요청) 전송 바이트를
+Accept-Encoding별로 측정 (brotli는 설치되어 있을 때만 br 변형 제공)
+
+사용법:
+    python benchmarks/bench_web_ui.py
+"""
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+from loguru import logger
+
+
+def load_page(client: TestClient, encoding: str, etags=None):
+    """페이지(HTML/CSS/JS)와 지도 이미지를 받고 ({"page": 바이트, "maps": 바이트}, 요청 수, 304 수, ETag) 반환"""
+    etags = etags or {}
+    sent = {"page": 0, "maps": 0}
+    requests = not_modified = 0
+
+    def fetch(url, kind):
+        nonlocal requests, not_modified
+        headers = {"Accept-Encoding": encoding}
+        if url in etags:
+            headers["If-None-Match"] = etags[url]
+        response = client.get(url, headers=headers)
+        requests += 1
+        sent[kind] += int(response.headers.get("content-length", 0))
+        not_modified += response.status_code == 304
+        etags[url] = response.headers.get("etag")
+        return response
+
+    fetch("/", "page")
+    # 자산 URL은 최신 본문에서 찾음 (재방문 304 응답에는 본문이 없음)
+    urls = re.findall(r'/static/[\w.]+\?v=\w+', client.get("/").text)
+    for url in urls:
+        fetch(url, "page")
+    script = client.get(next(url for url in urls if url.startswith("/static/app.js"))).text
+    for url in sorted(set(re.findall(r"/data/[\w.]+\.png\?v=\w+", script))):
+        fetch(url, "maps")
+    return sent, requests, not_modified, etags
+
+
+def main():
+    logger.remove()
+    from src import static_assets
+    from src.server import app
+
+    client = TestClient(app)
+    print(f"brotli: {'설치됨' if static_assets.brotli else '없음 (gzip만)'}")
+    print(f"{'Accept-Encoding':<20} {'첫 방문 페이지':>14} {'지도 이미지':>12} {'재방문':>8} {'304':>6}")
+    for encoding in ("identity", "gzip", "gzip, deflate, br"):
+        first, requests, _, etags = load_page(client, encoding)
+        repeat, _, not_modified, _ = load_page(client, encoding, dict(etags))
+        print(
+            f"{encoding:<20} {first['page'] / 1024:>12.1f}KB {first['maps'] / 1024:>10.1f}KB "
+            f"{sum(repeat.values()) / 1024:>6.1f}KB {not_modified:>3}/{requests}"
+        )
+
+    count = 1000
+    started = time.perf_counter()
+    for _ in range(count):
+        client.get("/", headers={"Accept-Encoding": "gzip"})
+    print(f"\nindex.html 응답 시간 (TestClient 포함): {(time.perf_counter() - started) / count * 1000:.3f}ms/요청")
+
+
+if __name__ == "__main__":
+    main()
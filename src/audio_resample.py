@@ -0,0 +1,121 @@
+"""
+스트리밍 오디오 리샘플러 / 다운믹서 (NumPy 벡터화)
+트랜스포트가 보내는 PCM(예: 48kHz 스테레오)을 STT가 기대하는 형식(16kHz 모노)으로 변환합니다.
+
+- 다운믹스: 인터리브 int16 → 채널 평균
+- 리샘플: 유리수 비율(L/M) 폴리페이즈 FIR (Kaiser 창 sinc 저역 통과 필터)
+- 프레임 경계에서 필터 이력(마지막 K-1 샘플)과 출력 위상을 유지하므로 잘게 나눠 넣어도 한 번에 변환한 결과와 같음
+- 작업 버퍼는 미리 할당해 프레임 크기가 같으면 재사용
+"""
+from math import gcd
+from typing import Optional
+
+import numpy as np
+
+# 폴리페이즈 단계별 탭 수 (클수록 차단 대역 감쇠가 좋아지고 계산량 증가)
+DEFAULT_TAPS_PER_PHASE = 32
+# 저역 통과 차단 주파수 (출력 나이퀴스트 대비 비율)
+DEFAULT_ROLLOFF = 0.9
+KAISER_BETA = 8.0
+
+
+def design_filter(up: int, down: int, taps_per_phase: int = DEFAULT_TAPS_PER_PHASE,
+                  rolloff: float = DEFAULT_ROLLOFF) -> np.ndarray:
+    """
+    폴리페이즈 필터 뱅크를 만듭니다.
+
+    Returns:
+        (up, taps_per_phase) 배열 - 각 행은 시간 역순 계수 (입력 창과 바로 내적)
+    """
+    length = up * taps_per_phase
+    cutoff = rolloff * 0.5 / max(up, down)  # 업샘플 도메인 기준 (cycles/sample)
+    n = np.arange(length) - (length - 1) / 2
+    prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, KAISER_BETA)
+    prototype *= up / prototype.sum()  # 통과 대역 이득 1 (업샘플링 보상 포함)
+    bank = prototype.reshape(taps_per_phase, up).T  # bank[p, k] = h[p + k*up]
+    return np.ascontiguousarray(bank[:, ::-1], dtype=np.float32)
+
+
+class StreamingResampler:
+    """상태를 유지하는 모노 float32 리샘플러"""
+
+    def __init__(self, input_rate: int, output_rate: int, taps_per_phase: int = DEFAULT_TAPS_PER_PHASE):
+        divisor = gcd(input_rate, output_rate)
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self.up = output_rate // divisor
+        self.down = input_rate // divisor
+        self.taps = taps_per_phase
+        self._bank = design_filter(self.up, self.down, taps_per_phase)
+        self._history = taps_per_phase - 1
+        self._buffer = np.zeros(self._history + 4096, dtype=np.float32)  # [이력 | 현재 프레임]
+        self._position = 0  # 다음 출력 샘플의 위치 (업샘플 도메인, 현재 프레임 첫 샘플 기준)
+
+    def reset(self):
+        self._buffer[:self._history] = 0
+        self._position = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """프레임 하나를 변환합니다 (float32 모노 → float32 모노)."""
+        count = len(samples)
+        needed = self._history + count
+        if len(self._buffer) < needed:
+            grown = np.zeros(needed, dtype=np.float32)
+            grown[:self._history] = self._buffer[:self._history]
+            self._buffer = grown
+        buffer = self._buffer[:needed]
+        buffer[self._history:] = samples
+
+        span = count * self.up
+        outputs = max(0, -(-(span - self._position) // self.down))
+        positions = self._position + self.down * np.arange(outputs)
+        indices = positions // self.up
+        phases = positions % self.up
+
+        windows = np.lib.stride_tricks.sliding_window_view(buffer, self.taps)[indices]
+        if self.up == 1:
+            result = windows @ self._bank[0]
+        else:
+            result = np.einsum("nk,nk->n", windows, self._bank[phases])
+
+        self._position += outputs * self.down - span
+        buffer[:self._history] = buffer[count:count + self._history].copy()
+        return result.astype(np.float32, copy=False)
+
+
+class AudioConverter:
+    """인터리브 int16 PCM → 목표 샘플레이트 모노 int16 PCM (형식이 같으면 그대로 통과)"""
+
+    def __init__(self, input_rate: int, input_channels: int, output_rate: int,
+                 taps_per_phase: int = DEFAULT_TAPS_PER_PHASE):
+        self.input_rate = input_rate
+        self.input_channels = input_channels
+        self.output_rate = output_rate
+        self.passthrough = input_rate == output_rate and input_channels == 1
+        self._resampler: Optional[StreamingResampler] = None
+        if input_rate != output_rate:
+            self._resampler = StreamingResampler(input_rate, output_rate, taps_per_phase)
+        self._carry = b""  # 채널 수로 나눠지지 않고 남은 바이트
+
+    def reset(self):
+        self._carry = b""
+        if self._resampler:
+            self._resampler.reset()
+
+    def convert(self, audio: bytes) -> bytes:
+        if self.passthrough:
+            return audio
+        frame_bytes = 2 * self.input_channels
+        if self._carry:
+            audio = self._carry + audio
+        usable = len(audio) - len(audio) % frame_bytes
+        self._carry = audio[usable:]
+
+        pcm = np.frombuffer(audio, dtype=np.int16, count=usable // 2)
+        if self.input_channels > 1:
+            samples = pcm.reshape(-1, self.input_channels).mean(axis=1, dtype=np.float32)
+        else:
+            samples = pcm.astype(np.float32)
+        if self._resampler:
+            samples = self._resampler.process(samples)
+        return np.clip(np.rint(samples), -32768, 32767).astype(np.int16).tobytes()
@@ -5,15 +5,28 @@ Pipecat을 사용한 실시간 음성 대화 구현 (Daily.co Transport)
 import asyncio
 import os
 import sys
+import time
 
-from pipecat.audio.vad.silero import SileroVADAnalyzer
+from pipecat.audio.interruptions.min_words_interruption_strategy import MinWordsInterruptionStrategy
 from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.frames.frames import (
+    AggregatedTextFrame,
     EndFrame,
+    InputAudioRawFrame,
+    InterruptionFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMMessagesFrame,
+    MetricsFrame,
+    StartFrame,
     TranscriptionFrame,
     TextFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
     Frame,
 )
+from pipecat.metrics.metrics import LLMUsageMetricsData, TTFBMetricsData
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
@@ -26,18 +39,47 @@ from pipecat.services.cartesia.tts import CartesiaTTSService
 from pipecat.services.openai.llm import OpenAILLMService
 from pipecat.services.openai.stt import OpenAISTTService
 from pipecat.transports.daily.transport import DailyParams, DailyTransport
+from pipecat.utils.text.base_text_aggregator import AggregationType
 
 from loguru import logger
 from dotenv import load_dotenv
 import aiohttp
 
-from .store_service import StoreService
-from .websocket_manager import broadcast_message
+from .audio_resample import AudioConverter
+from .context_budget import ContextBudgetManager
+from .faq_cache import FaqCache, faq_cache
+from .prompt_builder import prompt_builder
+from .sentence_splitter import SPEECH, SentenceSplitter
+from .store_service import StoreService, get_store_service
+from .tts_cache import TTSAudioCache, get_tts_cache
+from .vad_pool import vad_pool
+from .websocket_manager import broadcast_message, broadcast_products
 from .elevenlabs_stt import ElevenLabsSTTService
 
 # 환경 변수 로드
 load_dotenv()
 
+# 대화 컨텍스트 예산 (긴 세션에서도 턴당 입력 토큰/지연이 일정하도록)
+CONTEXT_MAX_TURNS = int(os.getenv("CONTEXT_MAX_TURNS", "6"))              # 원문 유지 최근 턴 수
+CONTEXT_MAX_HISTORY_CHARS = int(os.getenv("CONTEXT_MAX_HISTORY_CHARS", "4000"))  # 원문 유지 구간 최대 글자 수
+
+# 끼어들기(barge-in) 모드
+#   intent: 의도 판단을 통과한(Intent:YES) 발화가 BARGE_IN_MIN_WORDS 단어 이상이면 중단 (주변 대화로는 안 끊김)
+#   vad:    말소리가 감지되는 즉시 중단 (가장 빠르지만 주변 소음/대화에도 끊길 수 있음)
+#   off:    응답이 끝날 때까지 중단하지 않음 (기존 동작)
+BARGE_IN_MODE = os.getenv("BARGE_IN_MODE", "intent").lower()
+BARGE_IN_MIN_WORDS = int(os.getenv("BARGE_IN_MIN_WORDS", "1"))
+
+# 캐시된 TTS 오디오를 내보낼 때 프레임 하나의 길이 (초)
+TTS_CACHE_CHUNK_SECONDS = 0.2
+
+# 캐시된 응답의 앞부분과 일치해 보류 중일 때, 다음 텍스트가 이 시간 안에 안 오면 TTS로 흘려보냄 (초)
+# (첫 문장만 캐시와 같고 이어지는 응답이 늦게 오는 경우 첫 오디오가 늦어지지 않도록)
+TTS_CACHE_MAX_HOLD_SECONDS = float(os.getenv("TTS_CACHE_MAX_HOLD_MS", "200")) / 1000
+
+# FAQ 즉답 시 절약한 지연 추정값 (아직 측정된 LLM TTFB가 없을 때, ms)
+FAQ_DEFAULT_LLM_LATENCY_MS = 800.0
+
 # 로거 설정
 logger.remove(0)
 logger.add(sys.stderr, level="INFO")
@@ -163,6 +205,10 @@ Your answer (YES or NO):"""
 class TranscriptLogger(FrameProcessor):
     """사용자 입력을 WebSocket으로 전송하는 프로세서 (Intent:YES만 도달)"""
     
+    def __init__(self, counters: dict = None):
+        super().__init__()
+        self.counters = counters if counters is not None else {}
+    
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
         
@@ -171,6 +217,7 @@ class TranscriptLogger(FrameProcessor):
             text = frame.text
             # 빈 문자열이나 공백만 있는 경우 무시
             if text and text.strip() and len(text.strip()) > 1:
+                self.counters["user_turns"] = self.counters.get("user_turns", 0) + 1
                 # 브라우저 채팅창으로만 전송 (로그는 IntentDetectionFilter에서 이미 출력)
                 await broadcast_message({
                     "type": "transcript",
@@ -181,25 +228,476 @@ class TranscriptLogger(FrameProcessor):
         await self.push_frame(frame, direction)
 
 
+class FaqResponder(FrameProcessor):
+    """반복되는 매장 질문(위치/영업시간/전화/지하철)을 LLM 없이 즉답하는 프로세서 (사용자 집계기 앞)
+
+    적중하면 전사 프레임을 LLM 쪽으로 보내지 않고, LLM 응답과 같은 형태
+    (LLMFullResponseStart → TextFrame → LLMFullResponseEnd)로 답변을 흘려보냅니다.
+    이후 단계(태그 파싱, TTS, 어시스턴트 집계)는 LLM 응답과 똑같이 처리합니다.
+    """
+    
+    def __init__(
+        self,
+        messages: list,
+        store_service: StoreService,
+        counters: dict = None,
+        cache: FaqCache = None,
+        enabled: bool = True,
+    ):
+        super().__init__()
+        self.messages = messages  # 집계기와 공유하는 대화 기록 (사용자 발화는 여기서 직접 추가)
+        self.store_service = store_service
+        self.counters = counters if counters is not None else {}
+        self.cache = cache or faq_cache
+        self.enabled = enabled
+    
+    def _estimated_llm_latency_ms(self) -> float:
+        samples = self.counters.get("llm_ttfb_samples", 0)
+        if samples:
+            return self.counters.get("llm_ttfb_ms_total", 0.0) / samples
+        return FAQ_DEFAULT_LLM_LATENCY_MS
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if self.enabled and isinstance(frame, TranscriptionFrame) and direction == FrameDirection.DOWNSTREAM:
+            answer = self.cache.match(frame.text, self.store_service)
+            if answer:
+                saved = self._estimated_llm_latency_ms()
+                self.counters["faq_hits"] = self.counters.get("faq_hits", 0) + 1
+                self.counters["faq_latency_saved_ms"] = self.counters.get("faq_latency_saved_ms", 0.0) + saved
+                logger.info(
+                    f"⚡ FAQ hit ({answer.intent}, score {answer.score:.2f}, ~{saved:.0f}ms saved, "
+                    f"hit rate {self.cache.hit_rate:.0%}): {frame.text}"
+                )
+                self.messages.append({"role": "user", "content": frame.text})
+                await self.push_frame(LLMFullResponseStartFrame())
+                await self.push_frame(TextFrame(answer.text))
+                await self.push_frame(LLMFullResponseEndFrame())
+                return
+            self.counters["faq_misses"] = self.counters.get("faq_misses", 0) + 1
+        
+        await self.push_frame(frame, direction)
+
+
+class ReadinessProbe(FrameProcessor):
+    """오디오 입력이 준비된 시점(StartFrame 통과)을 알리는 프로세서 (transport.input 바로 뒤)"""
+    
+    def __init__(self, on_ready):
+        super().__init__()
+        self.on_ready = on_ready
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, StartFrame):
+            self.on_ready()
+        await self.push_frame(frame, direction)
+
+
+class AudioFormatConverter(FrameProcessor):
+    """입력 오디오를 STT 형식(샘플레이트, 모노)으로 맞추는 프로세서 (STT 바로 앞)
+
+    트랜스포트 형식이 같으면 프레임을 그대로 통과시키고, 다르면(예: 48kHz 스테레오)
+    다운믹스/리샘플한 새 프레임을 보냅니다. 필터 상태는 프레임 사이에 유지됩니다.
+    """
+    
+    def __init__(self, sample_rate: int = 16000):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self._converter: AudioConverter = None
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if isinstance(frame, InputAudioRawFrame) and direction == FrameDirection.DOWNSTREAM:
+            converter = self._converter
+            if converter is None or (converter.input_rate, converter.input_channels) != (frame.sample_rate, frame.num_channels):
+                converter = self._converter = AudioConverter(frame.sample_rate, frame.num_channels, self.sample_rate)
+                if not converter.passthrough:
+                    logger.info(
+                        f"🎚️ Converting input audio {frame.sample_rate}Hz/{frame.num_channels}ch → {self.sample_rate}Hz/1ch"
+                    )
+            if not converter.passthrough:
+                converted = InputAudioRawFrame(
+                    audio=converter.convert(frame.audio), sample_rate=self.sample_rate, num_channels=1
+                )
+                converted.transport_source = frame.transport_source
+                frame = converted
+        
+        await self.push_frame(frame, direction)
+
+
+class SentenceStreamer(FrameProcessor):
+    """LLM 토큰을 문장 단위로 묶어 완성되는 즉시 TTS로 보내는 프로세서 (ResponseLogger 뒤)
+
+    - 문장은 AggregatedTextFrame(SENTENCE)으로 보내 TTS 자체 문장 집계(다음 토큰 대기)를 건너뜀
+    - [PRODUCTS:...] / [STORE:...] 태그는 skip_tts TextFrame으로 분리 (음성 합성 안 함, 대화 기록에는 남음)
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.splitter = SentenceSplitter()
+        self._response_started_at = None  # 첫 문장 지연 로그용
+    
+    async def _push_pieces(self, pieces):
+        for kind, text in pieces:
+            if kind == SPEECH:
+                if self._response_started_at is not None:
+                    elapsed = time.perf_counter() - self._response_started_at
+                    logger.debug(f"🗣️ First sentence to TTS after {elapsed * 1000:.0f}ms")
+                    self._response_started_at = None
+                await self.push_frame(AggregatedTextFrame(text, AggregationType.SENTENCE))
+            else:
+                frame = TextFrame(text)
+                frame.skip_tts = True
+                await self.push_frame(frame)
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if isinstance(frame, InterruptionFrame):
+            self.splitter.reset()  # 끼어들기: 아직 TTS로 안 보낸 문장 버림
+            self._response_started_at = None
+            await self.push_frame(frame, direction)
+        elif direction != FrameDirection.DOWNSTREAM:
+            await self.push_frame(frame, direction)
+        elif isinstance(frame, LLMFullResponseStartFrame):
+            self.splitter.reset()
+            self._response_started_at = time.perf_counter()
+            await self.push_frame(frame, direction)
+        elif isinstance(frame, TextFrame) and not isinstance(frame, TranscriptionFrame) and not frame.skip_tts:
+            await self._push_pieces(self.splitter.feed(frame.text))
+        elif isinstance(frame, LLMFullResponseEndFrame):
+            await self._push_pieces(self.splitter.flush())
+            await self.push_frame(frame, direction)
+        else:
+            await self.push_frame(frame, direction)
+
+
+class TTSCacheLookup(FrameProcessor):
+    """캐시된 응답 오디오를 TTS 없이 바로 출력하는 프로세서 (TTS 바로 앞)
+
+    응답 텍스트가 캐시된 어떤 응답의 앞부분과 일치하는 동안만 프레임을 보류하고,
+    달라지는 순간 그대로 TTS로 흘려보냅니다 (캐시와 무관한 응답은 지연 없음).
+    응답 끝에서 전체 텍스트가 캐시와 같으면 TTS를 건너뛰고(skip_tts) 저장된 PCM을 출력합니다.
+    보류 중 max_hold_seconds 동안 다음 텍스트가 없으면 보류를 풀고 TTS로 넘깁니다.
+    """
+    
+    def __init__(
+        self,
+        voice_id: str,
+        language: str,
+        recorder: "TTSCacheRecorder",
+        counters: dict = None,
+        cache: TTSAudioCache = None,
+        max_hold_seconds: float = TTS_CACHE_MAX_HOLD_SECONDS,
+    ):
+        super().__init__()
+        self.voice_id = voice_id
+        self.language = language
+        self.recorder = recorder
+        self.counters = counters if counters is not None else {}
+        self.cache = cache or get_tts_cache()
+        self._text = ""       # 현재 응답 텍스트
+        self._held = []       # 보류 중인 프레임 (LLMFullResponseStart + TextFrame)
+        self._holding = False
+        self.max_hold_seconds = max_hold_seconds
+        self._hold_timer = None
+        # 보류 해제(타이머)와 프레임 처리가 같은 순서로 내보내도록 하류 텍스트 전송을 직렬화
+        self._push_lock = asyncio.Lock()
+    
+    def _cancel_hold_timer(self):
+        # 이미 깨어나 보류를 푸는 중인 타이머는 _hold_timer가 None이라 취소되지 않음
+        if self._hold_timer:
+            self._hold_timer.cancel()
+            self._hold_timer = None
+    
+    def _restart_hold_timer(self):
+        self._cancel_hold_timer()
+        self._hold_timer = asyncio.create_task(self._hold_expired())
+    
+    async def _hold_expired(self):
+        try:
+            await asyncio.sleep(self.max_hold_seconds)
+        except asyncio.CancelledError:
+            return  # 다음 텍스트가 와서 다시 시작됨
+        self._hold_timer = None
+        if self._holding:
+            logger.debug(f"🔊 TTS cache hold timed out: {self._text.strip()[:40]}")
+            await self._release()
+    
+    async def _release(self):
+        async with self._push_lock:
+            held, self._held, self._holding = self._held, [], False
+            for frame in held:
+                await self.push_frame(frame)
+    
+    async def _push_ordered(self, frame: Frame, direction: FrameDirection):
+        async with self._push_lock:
+            await self.push_frame(frame, direction)
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if isinstance(frame, InterruptionFrame):
+            # 끼어들기: 보류 중인 응답 버림
+            self._cancel_hold_timer()
+            self._text = ""
+            self._held, self._holding = [], False
+            await self.push_frame(frame, direction)
+        elif direction != FrameDirection.DOWNSTREAM:
+            await self.push_frame(frame, direction)
+        elif isinstance(frame, LLMFullResponseStartFrame):
+            self._cancel_hold_timer()
+            self._text = ""
+            self._held = [frame]
+            self._holding = True
+        elif isinstance(frame, TextFrame) and frame.skip_tts and self._holding:
+            self._held.append(frame)  # 태그 등 음성 외 텍스트도 순서 유지
+        elif isinstance(frame, TextFrame) and not isinstance(frame, TranscriptionFrame) and not frame.skip_tts:
+            self._text += frame.text
+            if not self._holding:
+                await self._push_ordered(frame, direction)
+                return
+            self._held.append(frame)
+            if not self.cache.has_prefix(self.voice_id, self.language, self._text):
+                self._cancel_hold_timer()
+                await self._release()
+            else:
+                self._restart_hold_timer()
+        elif isinstance(frame, LLMFullResponseEndFrame):
+            self._cancel_hold_timer()
+            cached = None
+            if self._holding and self._text.strip():
+                # 메모리 계층은 바로, 디스크 계층(블로킹 파일 읽기)은 이벤트 루프 밖에서
+                cached = self.cache.get_memory(self.voice_id, self.language, self._text)
+                if cached is None:
+                    cached = await asyncio.to_thread(self.cache.get, self.voice_id, self.language, self._text)
+            if cached:
+                await self._play_cached(cached, frame)
+            else:
+                await self._release()
+                if self._text.strip():
+                    # 오디오가 합성되는 응답만 순서대로 등록 (처음 본 응답은 저장하지 않음)
+                    admitted = self.cache.admit(self.voice_id, self.language, self._text)
+                    self.recorder.expect(self._text if admitted else None)
+                    self.counters["tts_cache_misses"] = self.counters.get("tts_cache_misses", 0) + 1
+                await self._push_ordered(frame, direction)
+            self._text = ""
+        else:
+            await self.push_frame(frame, direction)
+    
+    async def _play_cached(self, cached, end_frame: LLMFullResponseEndFrame):
+        """저장된 PCM을 TTS 출력과 같은 프레임 순서로 내보냅니다."""
+        self.counters["tts_cache_hits"] = self.counters.get("tts_cache_hits", 0) + 1
+        logger.info(f"🔊 TTS cache hit ({len(cached.audio) / 1024:.0f} KB): {self._text.strip()[:40]}")
+        async with self._push_lock:
+            held, self._held, self._holding = self._held, [], False
+            start = held[0] if held and isinstance(held[0], LLMFullResponseStartFrame) else LLMFullResponseStartFrame()
+            # 보류했던 음성 외 텍스트(태그)는 그대로 전달
+            passthrough = [frame for frame in held if isinstance(frame, TextFrame) and frame.skip_tts]
+        
+            start.skip_tts = True
+            await self.push_frame(start)
+            await self.push_frame(TTSStartedFrame())
+            chunk = int(cached.sample_rate * TTS_CACHE_CHUNK_SECONDS) * 2 * cached.num_channels
+            for offset in range(0, len(cached.audio), chunk):
+                await self.push_frame(
+                    TTSAudioRawFrame(cached.audio[offset:offset + chunk], cached.sample_rate, cached.num_channels)
+                )
+            await self.push_frame(TTSStoppedFrame())
+            # 어시스턴트 집계기가 대화 기록에 남기도록 텍스트는 TTS를 건너뛰어 전달
+            text_frame = TextFrame(self._text)
+            text_frame.skip_tts = True
+            await self.push_frame(text_frame)
+            for frame in passthrough:
+                await self.push_frame(frame)
+            end_frame.skip_tts = True
+            await self.push_frame(end_frame)
+
+
+class TTSCacheRecorder(FrameProcessor):
+    """TTS가 합성한 응답 오디오를 캐시에 저장하는 프로세서 (TTS 바로 뒤)
+
+    TTS는 응답(LLM 턴)마다 오디오 컨텍스트를 하나씩 순서대로 만들므로,
+    n번째 컨텍스트의 오디오를 TTSCacheLookup이 n번째로 TTS에 넘긴 응답 텍스트와 짝지어 저장합니다.
+    """
+    
+    # 응답 하나로 저장할 최대 오디오 크기 (24kHz 16bit mono 기준 약 60초)
+    MAX_AUDIO_BYTES = 24000 * 2 * 60
+    
+    def __init__(self, voice_id: str, language: str, counters: dict = None, cache: TTSAudioCache = None):
+        super().__init__()
+        self.voice_id = voice_id
+        self.language = language
+        self.counters = counters if counters is not None else {}
+        self.cache = cache or get_tts_cache()
+        self._expected = {}   # 응답 순번 → 저장 대상 텍스트 (None이면 저장 안 함)
+        self._responses = 0   # TTS로 넘긴 응답 수
+        self._contexts = {}   # context_id → [순번, 오디오, (sample_rate, num_channels)]
+        self._context_count = 0
+        self._abandoned = set()  # 끼어들기로 취소된 context_id (늦게 도착한 오디오 무시)
+    
+    def expect(self, text):
+        """TTS로 넘긴 응답 하나를 순서대로 등록합니다."""
+        self._expected[self._responses] = text
+        self._responses += 1
+    
+    def _reset(self):
+        """끼어들기: 진행 중인 컨텍스트를 버리고 응답 순번을 다시 맞춥니다."""
+        self._abandoned.update(self._contexts)
+        self._contexts.clear()
+        self._expected.clear()
+        self._responses = 0
+        self._context_count = 0
+    
+    def _context(self, context_id):
+        entry = self._contexts.get(context_id)
+        if entry is None:
+            entry = self._contexts[context_id] = [self._context_count, bytearray(), None]
+            self._context_count += 1
+        return entry
+    
+    @staticmethod
+    def _plausible(text: str, audio_seconds: float) -> bool:
+        """텍스트 길이에 비해 오디오 길이가 터무니없으면 (짝이 어긋난 경우) 저장하지 않음"""
+        chars = len(text.strip())
+        return chars / 30 <= audio_seconds <= chars / 2 + 3
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if isinstance(frame, InterruptionFrame):
+            self._reset()
+        elif getattr(frame, "context_id", None) in self._abandoned:
+            pass
+        # context_id가 없는 오디오(캐시 재생 등)는 기록하지 않음
+        elif isinstance(frame, TTSAudioRawFrame) and frame.context_id:
+            entry = self._context(frame.context_id)
+            if len(entry[1]) <= self.MAX_AUDIO_BYTES:
+                entry[1].extend(frame.audio)
+                entry[2] = (frame.sample_rate, frame.num_channels)
+        elif isinstance(frame, TTSStartedFrame) and frame.context_id:
+            self._context(frame.context_id)
+        elif isinstance(frame, TTSStoppedFrame) and frame.context_id in self._contexts:
+            index, audio, audio_format = self._contexts.pop(frame.context_id)
+            text = self._expected.pop(index, None)
+            if text and audio and audio_format and len(audio) <= self.MAX_AUDIO_BYTES:
+                sample_rate, num_channels = audio_format
+                if self._plausible(text, len(audio) / (sample_rate * 2 * num_channels)):
+                    # 디스크 쓰기는 이벤트 루프 밖에서
+                    await asyncio.to_thread(
+                        self.cache.put, self.voice_id, self.language, text, bytes(audio), sample_rate, num_channels
+                    )
+                    self.counters["tts_cache_stores"] = self.counters.get("tts_cache_stores", 0) + 1
+                    logger.info(f"💾 TTS cache stored ({len(audio) / 1024:.0f} KB): {text.strip()[:40]}")
+        
+        await self.push_frame(frame, direction)
+
+
+class ContextCompactor(FrameProcessor):
+    """LLM 호출 직전에 대화 기록을 예산 안으로 압축하는 프로세서 (사용자 집계기와 LLM 사이)"""
+    
+    def __init__(self, budget: ContextBudgetManager, counters: dict = None):
+        super().__init__()
+        self.budget = budget
+        self.counters = counters if counters is not None else {}
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if isinstance(frame, LLMMessagesFrame):
+            before = len(frame.messages)
+            # 집계기와 공유하는 리스트를 제자리에서 압축 (이후 턴도 압축된 기록에 이어서 추가됨)
+            if self.budget.compact(frame.messages):
+                self.counters["context_compactions"] = self.budget.compactions
+                logger.info(f"🗜️ Context compacted: {before} → {len(frame.messages)} messages")
+        
+        await self.push_frame(frame, direction)
+
+
+class PromptCacheMonitor(FrameProcessor):
+    """LLM 사용량 메트릭에서 턴별 캐시/비캐시 프롬프트 토큰을 기록하는 프로세서 (LLM 바로 뒤)"""
+    
+    def __init__(self, counters: dict = None, llm_name: str = None):
+        super().__init__()
+        self.counters = counters if counters is not None else {}
+        self.llm_name = llm_name  # 다른 서비스(STT/TTS)의 메트릭은 무시
+        self.last_ttfb = None     # 현재 턴의 첫 토큰 지연 (초)
+        self.turns = []           # 턴별 기록 (prompt_tokens, cached_tokens, ttfb)
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if isinstance(frame, MetricsFrame):
+            for data in frame.data:
+                if self.llm_name and data.processor != self.llm_name:
+                    continue
+                if isinstance(data, TTFBMetricsData):
+                    self.last_ttfb = data.value
+                elif isinstance(data, LLMUsageMetricsData):
+                    self._record(data.value)
+        
+        await self.push_frame(frame, direction)
+    
+    def _record(self, usage):
+        prompt_tokens = usage.prompt_tokens or 0
+        cached = usage.cache_read_input_tokens or 0
+        turn = {"prompt_tokens": prompt_tokens, "cached_tokens": cached, "ttfb": self.last_ttfb}
+        self.turns.append(turn)
+        self.last_ttfb = None
+        
+        self.counters["llm_calls"] = self.counters.get("llm_calls", 0) + 1
+        self.counters["prompt_tokens"] = self.counters.get("prompt_tokens", 0) + prompt_tokens
+        self.counters["cached_prompt_tokens"] = self.counters.get("cached_prompt_tokens", 0) + cached
+        if turn["ttfb"] is not None:
+            self.counters["llm_ttfb_samples"] = self.counters.get("llm_ttfb_samples", 0) + 1
+            self.counters["llm_ttfb_ms_total"] = self.counters.get("llm_ttfb_ms_total", 0.0) + turn["ttfb"] * 1000
+        
+        ratio = cached / prompt_tokens if prompt_tokens else 0.0
+        ttfb = f", TTFB {turn['ttfb'] * 1000:.0f}ms" if turn["ttfb"] is not None else ""
+        logger.info(
+            f"🧊 Prompt cache: {cached}/{prompt_tokens} tokens cached ({ratio:.0%}), "
+            f"{prompt_tokens - cached} uncached{ttfb}"
+        )
+
+
 class ResponseLogger(FrameProcessor):
     """LLM 응답을 로깅하고 태그를 파싱하는 프로세서"""
     
-    def __init__(self):
+    def __init__(self, counters: dict = None, store_service: StoreService = None):
         super().__init__()
-        # StoreService 인스턴스 (제품/매장 정보 조회용)
-        from .store_service import StoreService
-        self.store_service = StoreService()
+        self.counters = counters if counters is not None else {}
+        # 공유 카탈로그 스냅샷 (제품/매장 정보 조회용, 세션 시작 시점의 스냅샷을 유지)
+        self.store_service = store_service or get_store_service()
         self.response_buffer = ""  # 응답 버퍼링
         self.products_sent = False  # 제품 이미지 전송 여부
         self.store_sent = False     # 매장 이미지 전송 여부
         self.response_sent = False  # 응답 채팅창 전송 여부
         self.completion_timer = None  # 완료 감지 타이머
     
+    def _reset(self):
+        """응답 상태 초기화 (응답 전송 후, 또는 끼어들기로 응답이 취소됐을 때)"""
+        if self.completion_timer:
+            self.completion_timer.cancel()
+            self.completion_timer = None
+        self.response_buffer = ""
+        self.products_sent = False
+        self.store_sent = False
+        self.response_sent = False
+    
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
         
+        # 끼어들기: 진행 중이던 응답 버리기 (채팅창에는 보내지 않음)
+        if isinstance(frame, InterruptionFrame):
+            if self.response_buffer:
+                logger.info(f"✋ Response interrupted: {self.response_buffer[:40]}")
+                self.counters["interruptions"] = self.counters.get("interruptions", 0) + 1
+            self._reset()
+        
         # LLM 응답 텍스트 (TextFrame) - 스트리밍으로 들어옴
-        if isinstance(frame, TextFrame):
+        elif isinstance(frame, TextFrame):
             text = frame.text
             if text and text.strip():
                 # 응답 버퍼에 누적
@@ -215,29 +713,12 @@ class ResponseLogger(FrameProcessor):
                         product_ids = [pid.strip() for pid in products_match.group(1).split(',')]
                         logger.info(f"🛍️ Found product tag with IDs: {product_ids}")
                         
-                        # 제품 정보 조회
-                        all_products = self.store_service.get_all_products()
-                        selected_products = [
-                            p for p in all_products 
-                            if p.get('product_id') in product_ids
-                        ]
+                        # 실제 제품이 있으면 이미지 전송 (미리 직렬화된 제품 조각 / v2는 ID만)
+                        sent = await broadcast_products(self.store_service, product_ids)
                         
-                        if selected_products:
-                            # 제품에 카테고리 정보 추가 (지도 매핑용)
-                            categories_map = self.store_service.get_categories()
-                            for product in selected_products:
-                                for cat_name, cat_products in categories_map.items():
-                                    if any(p.get('product_id') == product.get('product_id') for p in cat_products):
-                                        product['category'] = cat_name
-                                        break
-                            
-                            # 실제 제품 찾음 → 이미지 전송
-                            await broadcast_message({
-                                "type": "show_images",
-                                "content_type": "products",
-                                "data": {"products": selected_products}
-                            })
-                            logger.info(f"✅ Sent product images: {len(selected_products)} items")
+                        if sent:
+                            logger.info(f"✅ Sent product images: {sent} items")
+                            self.counters["product_cards"] = self.counters.get("product_cards", 0) + 1
                             self.products_sent = True
                         else:
                             # 제품을 찾을 수 없음 → 할루시네이션 경고
@@ -267,6 +748,7 @@ class ResponseLogger(FrameProcessor):
                                     }
                                 })
                                 logger.info(f"✅ Sent store image")
+                                self.counters["store_cards"] = self.counters.get("store_cards", 0) + 1
                                 self.store_sent = True
                 
                 # 타이머 기반 완료 감지: 0.5초 동안 새 TextFrame 안 오면 완료로 간주
@@ -293,6 +775,7 @@ class ResponseLogger(FrameProcessor):
             return
         
         logger.info(f"🤖 [ASSISTANT]: {self.response_buffer}")
+        self.counters["assistant_turns"] = self.counters.get("assistant_turns", 0) + 1
         
         # 태그 제거 후 브라우저로 전송
         import re
@@ -308,17 +791,16 @@ class ResponseLogger(FrameProcessor):
             logger.info(f"✅ Sent complete response to chat")
         
         # 버퍼 및 플래그 리셋
-        self.response_buffer = ""
-        self.products_sent = False
-        self.store_sent = False
-        self.response_sent = False
+        self.completion_timer = None  # 이 메서드를 실행 중인 타이머 자신은 취소하지 않음
+        self._reset()
 
 
 class OliveYoungVoiceBot:
     """올리브영 음성 쇼핑 어시스턴트 봇"""
     
     def __init__(self):
-        self.store_service = StoreService()
+        # 프로세스 전역 카탈로그 스냅샷 (세션 시작 시 파일 I/O 없음)
+        self.store_service = get_store_service()
         
         # API 키 확인
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -334,105 +816,53 @@ class OliveYoungVoiceBot:
         if not self.elevenlabs_api_key:
             raise ValueError("ELEVENLABS_API_KEY가 설정되지 않았습니다.")
         
-        # 시스템 프롬프트 생성
-        self.system_prompt = self._create_system_prompt()
-    
-    def _create_system_prompt(self) -> str:
-        """봇의 시스템 프롬프트를 생성합니다."""
-        
-        # 매장 정보
-        main_store = self.store_service.data.get("store", {})
-        store_name = main_store.get("store_name", "")
-        store_address = main_store.get("address", "")
-        store_phone = main_store.get("phone", "")
-        subway_info = main_store.get("subway_info", "")
-        
-        # 카테고리별 제품 목록 (ID 포함) - 할루시네이션 방지
-        categories = self.store_service.get_categories()
-        
-        products_by_category = []
-        for category_name, category_products in categories.items():
-            products_by_category.append(f"\n[{category_name}]")
-            for p in category_products:
-                products_by_category.append(
-                    f"  - [{p['product_id']}] {p['name'][:60]}... (할인 {p['discount_rate']}%, {p['sale_price']:,}원)"
-                )
-        
-        products_summary = "\n".join(products_by_category)
-        categories_summary = ", ".join(categories.keys())
-        
-        # 인근 매장 (5개만)
-        nearby_stores = self.store_service.data.get("nearby_stores", [])[:5]
-        nearby_summary = "\n".join([
-            f"- {store.get('name', '')}: {store.get('address', '')}"
-            for store in nearby_stores
-        ])
+        # 시스템 프롬프트 (run()에서 세션 언어로 조회, 카탈로그 스냅샷별 캐시)
+        self.system_prompt = None
         
-        prompt = f"""당신은 올리브영(Olive Young)의 친절한 AI 쇼핑 어시스턴트입니다.
-
-[역할]
-- 고객에게 올리브영 매장 정보를 안내합니다
-- 제품 추천과 쇼핑 관련 질문에 답변합니다
-- 항상 친절하고 전문적인 톤으로 응대합니다
-- 자연스러운 대화체를 사용합니다
-
-[메인 매장 정보]
-매장명: {store_name}
-매장ID: D176
-주소: {store_address}
-전화: {store_phone}
-지하철: {subway_info}
-
-[사용 가능한 모든 제품 - 이 제품들만 사용 가능!]
-{products_summary}
-
-**⚠️ 경고: 위의 제품 ID만 사용하세요! 임의로 제품 ID를 만들지 마세요!**
-**존재하지 않는 제품 ID를 사용하면 이미지가 표시되지 않습니다!**
-
-[제품 카테고리]
-{categories_summary}
-
-[인근 매장 (참고용)]
-{nearby_summary}
-
-[이미지 표시 규칙 - 절대 필수!]
-제품 추천 시 응답 마지막에 반드시 PRODUCTS 태그를 추가하세요.
-매장 정보 시 응답 마지막에 반드시 STORE 태그를 추가하세요.
-
-형식:
-- 제품: [PRODUCTS:제품ID1,제품ID2,제품ID3]
-- 매장: [STORE:D176]
-
-**반드시 위의 [사용 가능한 모든 제품] 목록에 있는 실제 제품 ID만 사용하세요!**
-
-예시:
-Q: "제품 추천해줘"
-A: "토리든 세럼과 달바 세럼 추천드립니다. [PRODUCTS:A000000189261,A000000232724]"
-
-Q: "스킨케어 추천"
-A: "에스트라 크림, 라로슈포제 시카플라스트 추천합니다. [PRODUCTS:A000000236338,A000000236101]"
-
-Q: "매장 위치 알려줘"
-A: "서울 중구 명동길 53에 있습니다. 명동역 8번 출구입니다. [STORE:D176]"
-
-[응대 가이드라인]
-1. 고객의 질문을 정확히 이해하고 관련 정보를 제공하세요
-2. 매장 위치를 물으면 주소와 지하철 정보를 안내하세요
-3. 영업시간, 전화번호 등 구체적인 정보를 명확히 전달하세요
-4. **제품 추천 시: 2-3개 소개 → 반드시 [PRODUCTS:ID1,ID2,ID3] 추가**
-5. **매장 정보 시: 주소 안내 → 반드시 [STORE:D176] 추가**
-6. **응답은 20-30초 이내로 매우 짧고 간결하게**
-   - 핵심 정보만 2-3문장
-   - 긴 설명 금지
-7. [PRODUCTS:...] [STORE:...] 태그는 음성으로 읽히지 않으므로 걱정하지 마세요
-
-[중요]
-- 실제로 존재하지 않는 매장이나 제품 정보를 만들어내지 마세요
-- 위에 명시된 정보만 사용하세요
-- 가격 정보는 참고용으로만 제공 (실시간 변경 가능)
-- 의료적 조언이나 진단은 하지 마세요"""
-        
-        return prompt
+        # 세션 상태 (세션 레지스트리에서 조회)
+        self.task: PipelineTask = None  # run() 중인 파이프라인 태스크
+        self.counters = {
+            "user_turns": 0,       # Intent:YES로 통과한 사용자 발화
+            "assistant_turns": 0,  # 채팅창으로 전송된 응답
+            "product_cards": 0,    # 제품 이미지 팝업
+            "store_cards": 0,      # 매장 이미지 팝업
+            "llm_calls": 0,             # 응답 LLM 호출 (사용량 메트릭 수신 기준)
+            "prompt_tokens": 0,         # 입력 토큰 합계
+            "cached_prompt_tokens": 0,  # 그중 제공자 prefix 캐시에서 읽은 토큰
+            "context_compactions": 0,   # 대화 기록 압축 횟수
+            "faq_hits": 0,              # LLM 없이 FAQ로 답한 턴
+            "faq_misses": 0,            # FAQ 미적중 (LLM 처리)
+            "faq_latency_saved_ms": 0.0,  # FAQ 즉답으로 절약한 지연 추정 합계
+            "tts_cache_hits": 0,        # 저장된 오디오로 재생한 응답
+            "tts_cache_misses": 0,      # TTS로 합성한 응답
+            "tts_cache_stores": 0,      # 캐시에 저장한 응답
+            "interruptions": 0,         # 끼어들기로 취소된 응답
+            "startup_ms": 0.0,          # run() 시작 → 오디오 입력 준비
+            "join_to_ready_ms": 0.0,    # 참가자 입장 → 듣기 준비 (입장 전에 준비됐으면 0)
+        }
+        self._timeline = {}  # 세션 시작/참가자 입장/입력 준비 시각 (perf_counter)
+        self._stop_requested = False
+    
+    async def stop(self):
+        """실행 중인 파이프라인에 EndFrame을 보내 정상 종료를 요청합니다."""
+        self._stop_requested = True
+        if self.task:
+            await self.task.queue_frame(EndFrame())
+    
+    def _mark(self, event: str):
+        """세션 준비 과정 시각 기록 (started → joined/ready, 순서는 네트워크 상황에 따라 다름)"""
+        self._timeline.setdefault(event, time.perf_counter())
+        timeline = self._timeline
+        if event == "ready" and "started" in timeline:
+            self.counters["startup_ms"] = (timeline["ready"] - timeline["started"]) * 1000
+            logger.info(f"⏱️ Ready to listen {self.counters['startup_ms']:.0f}ms after session start")
+        if "joined" in timeline and "ready" in timeline:
+            self.counters["join_to_ready_ms"] = max(0.0, timeline["ready"] - timeline["joined"]) * 1000
+            logger.info(f"⏱️ Participant join → ready to listen: {self.counters['join_to_ready_ms']:.0f}ms")
+    
+    def _create_system_prompt(self, language: str = "ko") -> str:
+        """봇의 시스템 프롬프트를 반환합니다 (카탈로그 버전/언어별 캐시, 세션마다 다시 렌더링하지 않음)."""
+        return prompt_builder.system_prompt(self.store_service, language)
     
     async def run(self, room_url: str, token: str = None, language: str = "ko", stt_provider: str = "elevenlabs"):
         """
@@ -445,6 +875,10 @@ A: "서울 중구 명동길 53에 있습니다. 명동역 8번 출구입니다.
             stt_provider: STT 프로바이더 선택 ("whisper" 또는 "elevenlabs", 기본값: "elevenlabs")
         """
         logger.info(f"Starting Olive Young Voice Assistant Bot (Language: {language})")
+        self._mark("started")
+        
+        # 공유 Silero 모델 위의 미리 만들어 둔 VAD 분석기 (세션마다 모델을 다시 로드하지 않음)
+        vad_analyzer = vad_pool.acquire(VADParams(stop_secs=0.2))
         
         # Daily transport 설정
         transport = DailyTransport(
@@ -456,12 +890,15 @@ A: "서울 중구 명동길 53에 있습니다. 명동역 8번 출구입니다.
                 audio_out_enabled=True,
                 transcription_enabled=False,  # OpenAI Whisper 사용 (Daily transcription 끔)
                 vad_enabled=True,
-                vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2))
+                vad_analyzer=vad_analyzer
             ),
         )
         
         # STT 서비스 선택 (Whisper 또는 ElevenLabs)
         logger.info(f"🎙️ STT Provider: {stt_provider}")
+        stt_sample_rate = 16000
+        # 트랜스포트 오디오 형식이 다르면 STT 앞에서 변환 (같으면 그대로 통과)
+        audio_format_converter = AudioFormatConverter(stt_sample_rate)
         
         if stt_provider == "elevenlabs":
             # ElevenLabs Scribe Realtime v2 (초저지연!)
@@ -484,7 +921,7 @@ A: "서울 중구 명동길 53에 있습니다. 명동역 8번 출구입니다.
             stt = ElevenLabsSTTService(
                 api_key=self.elevenlabs_api_key,  # API 키 직접 사용
                 model_id="scribe_v2_realtime",
-                sample_rate=16000,
+                sample_rate=stt_sample_rate,
                 language_code=language if language in ["ko", "en"] else None,  # ISO-639-1 코드 (ko/en) 또는 None (자동 감지)
                 commit_strategy="vad",  # VAD: Voice Activity Detection - 자동 커밋
             )
@@ -516,40 +953,10 @@ A: "서울 중구 명동길 53에 있습니다. 명동역 8번 출구입니다.
             model="gpt-4o-mini"
         )
         
-        # 메시지 초기화 (few-shot 예제 포함)
-        messages = [
-            {
-                "role": "system",
-                "content": self.system_prompt
-            },
-            # Few-shot 예제 1: 제품 추천
-            {
-                "role": "user",
-                "content": "인기 제품 추천해줘"
-            },
-            {
-                "role": "assistant",
-                "content": "토리든 다이브인 히알루론산 세럼과 달바 퍼스트 스프레이 세럼 추천드립니다. [PRODUCTS:A000000189261,A000000232724]"
-            },
-            # Few-shot 예제 2: 매장 정보
-            {
-                "role": "user",
-                "content": "매장 어디 있어?"
-            },
-            {
-                "role": "assistant",
-                "content": "서울 중구 명동길 53에 있습니다. 명동역 8번 출구로 나오시면 됩니다. [STORE:D176]"
-            },
-            # Few-shot 예제 3: 제품 추천 (다른 예시)
-            {
-                "role": "user",
-                "content": "스킨케어 제품 추천"
-            },
-            {
-                "role": "assistant",
-                "content": "에스트라 아토베리어 크림, 라로슈포제 시카플라스트, 웰라쥬 히알루로닉 앰플 추천드립니다. [PRODUCTS:A000000236338,A000000236101,A000000235247]"
-            }
-        ]
+        # 메시지 초기화: 모든 세션이 바이트 단위로 같은 prefix(시스템 프롬프트 + few-shot + 인사말)로 시작
+        # → OpenAI 자동 prompt 캐시 적중. 세션별 대화는 이 뒤에만 추가됩니다.
+        self.system_prompt = self._create_system_prompt(language)
+        messages = prompt_builder.initial_messages(self.system_prompt)
         
         # 사용자/어시스턴트 응답 집계기
         user_response_aggregator = LLMUserResponseAggregator(messages)
@@ -559,32 +966,73 @@ A: "서울 중구 명동길 53에 있습니다. 명동역 8번 출구입니다.
         intent_filter = IntentDetectionFilter(self.openai_api_key)
         
         # 사용자 입력 로거 (Intent:YES만)
-        transcript_logger = TranscriptLogger()
+        transcript_logger = TranscriptLogger(self.counters)
         
         # LLM 응답 로거 (태그 파싱 및 이미지 표시)
-        response_logger = ResponseLogger()
+        response_logger = ResponseLogger(self.counters, self.store_service)
+        
+        # 매장 FAQ 즉답 (한국어 세션만 - 답변 템플릿이 한국어)
+        faq_responder = FaqResponder(messages, self.store_service, self.counters, enabled=language == "ko")
+        
+        # 대화 기록 압축 (공유 prefix + 요약 + 최근 N턴)
+        context_compactor = ContextCompactor(
+            ContextBudgetManager(
+                prefix_length=len(messages),
+                max_turns=CONTEXT_MAX_TURNS,
+                max_history_chars=CONTEXT_MAX_HISTORY_CHARS,
+            ),
+            self.counters,
+        )
+        
+        # prompt prefix 캐시 계측 (LLM 사용량 메트릭)
+        prompt_cache_monitor = PromptCacheMonitor(self.counters, llm_name=llm.name)
+        
+        # 문장 단위 TTS 스트리밍 (태그는 음성에서 분리)
+        sentence_streamer = SentenceStreamer()
+        
+        # TTS 오디오 캐시 (반복 응답은 합성 없이 저장된 PCM 출력)
+        # 첫 생성은 디스크 색인을 읽으므로 이벤트 루프 밖에서 (서버는 봇 모듈 로드 시 미리 생성)
+        tts_cache = await asyncio.to_thread(get_tts_cache)
+        tts_cache_recorder = TTSCacheRecorder(voice_id, language, self.counters, cache=tts_cache)
+        tts_cache_lookup = TTSCacheLookup(voice_id, language, tts_cache_recorder, self.counters, cache=tts_cache)
         
         # 파이프라인 구성 (ElevenLabs Scribe Realtime v2 STT 사용)
         pipeline = Pipeline(
             [
                 transport.input(),           # 오디오 입력
+                ReadinessProbe(lambda: self._mark("ready")),  # 듣기 준비 시점 기록
+                audio_format_converter,      # STT 입력 형식(16kHz 모노)으로 변환
                 stt,                         # ElevenLabs Scribe Realtime v2 (초저지연!)
                 intent_filter,               # 의도 판단 LLM (필터링) - NO는 여기서 차단
                 transcript_logger,           # 사용자 입력 로깅 (Intent:YES만)
+                faq_responder,               # 매장 FAQ 즉답 (적중 시 LLM 생략)
                 user_response_aggregator,    # 사용자 메시지 집계
+                context_compactor,           # 오래된 턴 요약 (컨텍스트 크기 상한)
                 llm,                         # 응답 LLM (실제 답변)
+                prompt_cache_monitor,        # 턴별 캐시/비캐시 프롬프트 토큰 기록
                 response_logger,             # LLM 응답 로깅 및 태그 파싱 (여기서 이미지 표시!)
+                sentence_streamer,           # 완성된 문장부터 TTS로 (태그 제외)
+                tts_cache_lookup,            # 캐시된 응답 오디오는 TTS 건너뜀
                 tts,                         # 텍스트 → 음성
+                tts_cache_recorder,          # 합성 오디오 캐시 저장
                 transport.output(),          # 오디오 출력
                 assistant_response_aggregator  # 어시스턴트 응답 집계
             ]
         )
         
+        # 끼어들기 전략 (intent 모드: 사용자 집계기가 의도 필터를 통과한 발화만 보므로 잡담으로는 안 끊김)
+        interruption_strategies = []
+        if BARGE_IN_MODE == "intent":
+            interruption_strategies = [MinWordsInterruptionStrategy(min_words=BARGE_IN_MIN_WORDS)]
+        logger.info(f"✋ Barge-in mode: {BARGE_IN_MODE}")
+        
         # 파이프라인 태스크 생성
         task = PipelineTask(
             pipeline,
             params=PipelineParams(
-                allow_interruptions=False,  # TTS 완료까지 중단 방지
+                # 끼어들기: 중단이 결정되면 InterruptionFrame(시스템 프레임)이 LLM 생성/TTS/출력 대기 오디오를 즉시 취소
+                allow_interruptions=BARGE_IN_MODE != "off",
+                interruption_strategies=interruption_strategies,
                 enable_metrics=True,
                 enable_usage_metrics=True,
             ),
@@ -594,13 +1042,8 @@ A: "서울 중구 명동길 53에 있습니다. 명동역 8번 출구입니다.
         @transport.event_handler("on_first_participant_joined")
         async def on_first_participant_joined(transport, participant):
             logger.info(f"✅ First participant joined: {participant['id']}")
-            # ElevenLabs Scribe Realtime v2 사용
-            # 초기 인사말
-            logger.info("Sending initial greeting")
-            messages.append({
-                "role": "system",
-                "content": "안녕하세요! 올리브영 쇼핑 어시스턴트입니다. 매장 정보나 제품 추천이 필요하시면 말씀해 주세요."
-            })
+            self._mark("joined")
+            # 초기 인사말은 공유 prefix에 포함 (입장 시점에 추가하면 세션마다 메시지 배치가 달라짐)
         
         # 참가자 퇴장 이벤트 핸들러
         @transport.event_handler("on_participant_left")
@@ -608,9 +1051,17 @@ A: "서울 중구 명동길 53에 있습니다. 명동역 8번 출구입니다.
             logger.info(f"❌ Participant left: {participant}")
             await task.queue_frame(EndFrame())
         
-        # 봇 실행
-        runner = PipelineRunner()
-        await runner.run(task)
+        # 봇 실행 (세션 레지스트리에서 stop() 가능하도록 태스크 보관)
+        self.task = task
+        if self._stop_requested:
+            await task.queue_frame(EndFrame())
+        # SIGINT/SIGTERM은 서버(uvicorn)가 받고, 진행 중인 대화는 세션 레지스트리 drain으로 정리
+        runner = PipelineRunner(handle_sigint=False)
+        try:
+            await runner.run(task)
+        finally:
+            self.task = None
+            vad_pool.release(vad_analyzer)
 
 
 async def main():
@@ -0,0 +1,291 @@
+"""
+올리브영 카탈로그 바이너리 포맷 (.oycat)
+assistant_data.json을 컬럼형 바이너리 파일로 컴파일하고, mmap으로 zero-copy 로드
+
+파일 구조 (little-endian, 섹션은 8바이트 정렬):
+    header     : magic(8) | version u32 | 제품 수 u32 | 섹션 수 u32 | 예약 u32 | meta 오프셋 u64 | meta 길이 u64
+    section    : 이름(16) | 오프셋 u64 | 길이 u64  (섹션 수만큼)
+    present    : u16[n]    필드 존재 비트마스크 (누락 필드 구분용)
+    숫자 컬럼  : i32[n]    original_price, sale_price, discount_rate, category
+    off:<필드> : u32[n+1]  문자열 테이블 내 오프셋 (product_id, name, image_url, stock_info, stock_status)
+    strings    : UTF-8 문자열 테이블
+    meta       : JSON (store, nearby_stores, metadata, 카테고리 목록/행 번호 등 작은 데이터)
+
+사용법 (오프라인 컴파일):
+    python -m src.catalog_binary data/assistant_data.json data/assistant_data.oycat
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from .records import Product
+
+MAGIC = b"OYCAT\x00\x00\x00"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIIIQQ")
+_SECTION = struct.Struct("<16sQQ")
+
+# 고정 폭 숫자 컬럼 (i32)
+NUMERIC_FIELDS = ("original_price", "sale_price", "discount_rate")
+# 문자열 테이블 컬럼
+STRING_FIELDS = ("product_id", "name", "image_url", "stock_info", "stock_status")
+# present 비트 순서
+_ALL_FIELDS = NUMERIC_FIELDS + STRING_FIELDS
+
+_I32_MIN, _I32_MAX = -(2 ** 31), 2 ** 31 - 1
+
+
+def _align(offset: int, alignment: int = 8) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _validate_rows(rows: List[Dict]):
+    """
+    고정 스키마로 그대로 옮길 수 있는 제품인지 확인합니다.
+    숫자 필드는 i32 범위의 정수, 문자열 필드는 문자열이어야 하며(아니면 ValueError),
+    스키마에 없는 필드는 바이너리에 저장되지 않으므로 경고를 남깁니다.
+    """
+    discarded: Dict[str, int] = {}
+    for i, product in enumerate(rows):
+        label = product.get("product_id", f"#{i}")
+        for field in NUMERIC_FIELDS:
+            value = product.get(field)
+            if value is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ValueError(f"Product {label}: {field} must be an integer, got {value!r}")
+            if not _I32_MIN <= value <= _I32_MAX:
+                raise ValueError(f"Product {label}: {field} {value} is out of i32 range")
+        for field in STRING_FIELDS:
+            value = product.get(field)
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"Product {label}: {field} must be a string, got {value!r}")
+        for field in product.keys() - set(_ALL_FIELDS):
+            discarded[field] = discarded.get(field, 0) + 1
+    if discarded:
+        summary = ", ".join(f"{field} ({count})" for field, count in sorted(discarded.items()))
+        logger.warning(f"⚠️ .oycat schema has no column for product fields, discarding: {summary}")
+
+
+def compile_catalog(json_path: str, out_path: str) -> Path:
+    """
+    assistant_data.json을 .oycat 바이너리 파일로 컴파일합니다.
+    임시 파일에 쓴 뒤 os.replace로 교체하므로, 기존 파일을 mmap 중인 프로세스는 영향을 받지 않습니다.
+
+    Args:
+        json_path: 원본 JSON 경로
+        out_path: 출력 .oycat 경로
+
+    Returns:
+        출력 파일 경로
+
+    Raises:
+        ValueError: 숫자 필드가 i32 정수가 아니거나 문자열 필드가 문자열이 아닌 제품이 있을 때
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    products_data = data.get("products", {})
+    by_category = products_data.get("by_category", {})
+
+    # 행 순서 = all_products 순서, by_category에만 있는 제품은 뒤에 추가
+    rows: List[Dict] = []
+    row_of: Dict[str, int] = {}
+    for product in products_data.get("all_products", []):
+        row_of.setdefault(product.get("product_id"), len(rows))
+        rows.append(product)
+    categories = list(by_category.keys())
+    category_rows = {}
+    for category, cat_products in by_category.items():
+        indices = []
+        for product in cat_products:
+            pid = product.get("product_id")
+            if pid not in row_of:
+                row_of[pid] = len(rows)
+                rows.append(product)
+            indices.append(row_of[pid])
+        category_rows[category] = indices
+    all_rows = list(range(len(products_data.get("all_products", []))))
+    _validate_rows(rows)
+
+    n = len(rows)
+    category_of = [-1] * n
+    for cat_index, category in enumerate(categories):
+        for row in category_rows[category]:
+            if category_of[row] < 0:
+                category_of[row] = cat_index
+
+    sections = []
+    present = [0] * n
+    for bit, field in enumerate(_ALL_FIELDS):
+        for i, product in enumerate(rows):
+            if product.get(field) is not None:
+                present[i] |= 1 << bit
+    sections.append(("present", struct.pack(f"<{n}H", *present)))
+    for field in NUMERIC_FIELDS:
+        values = [p.get(field) or 0 for p in rows]
+        sections.append((field, struct.pack(f"<{n}i", *values)))
+    sections.append(("category", struct.pack(f"<{n}i", *category_of)))
+
+    blob = bytearray()
+    for field in STRING_FIELDS:
+        offsets = []
+        for product in rows:
+            offsets.append(len(blob))
+            blob += (product.get(field) or "").encode("utf-8")
+        offsets.append(len(blob))
+        sections.append((f"off:{field}", struct.pack(f"<{n + 1}I", *offsets)))
+    sections.append(("strings", bytes(blob)))
+
+    meta = {
+        "metadata": data.get("metadata", {}),
+        "store": data.get("store", {}),
+        "nearby_stores": data.get("nearby_stores", []),
+        "total": products_data.get("total", n),
+        "categories": categories,
+        "category_rows": category_rows,
+        "all_rows": all_rows,
+    }
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+
+    # 오프셋 계산
+    offset = _align(_HEADER.size + _SECTION.size * len(sections))
+    table = []
+    for name, payload in sections:
+        table.append((name, offset, len(payload)))
+        offset = _align(offset + len(payload))
+    meta_offset = offset
+
+    out = Path(out_path)
+    tmp = out.with_name(out.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, n, len(sections), 0, meta_offset, len(meta_bytes)))
+        for name, sec_offset, length in table:
+            f.write(_SECTION.pack(name.encode("ascii"), sec_offset, length))
+        for (name, sec_offset, _), (_, payload) in zip(table, sections):
+            f.write(b"\x00" * (sec_offset - f.tell()))
+            f.write(payload)
+        f.write(b"\x00" * (meta_offset - f.tell()))
+        f.write(meta_bytes)
+    os.replace(tmp, out)
+    return out
+
+
+class BinaryCatalog:
+    """mmap으로 연 .oycat 카탈로그 (컬럼은 memoryview로 zero-copy 접근)"""
+
+    def __init__(self, path: str):
+        if sys.byteorder != "little":
+            raise RuntimeError(".oycat 포맷은 little-endian 호스트에서만 zero-copy 로드를 지원합니다.")
+
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            # ACCESS_READ: 여러 워커 프로세스가 OS 페이지 캐시를 공유
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mmap)
+
+        magic, version, count, n_sections, _, meta_offset, meta_len = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not an .oycat file: {self.path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported .oycat version {version} (expected {FORMAT_VERSION})")
+        self.count = count
+
+        self._sections: Dict[str, memoryview] = {}
+        for i in range(n_sections):
+            raw_name, offset, length = _SECTION.unpack_from(self._buf, _HEADER.size + i * _SECTION.size)
+            self._sections[raw_name.rstrip(b"\x00").decode("ascii")] = self._buf[offset:offset + length]
+
+        self.meta = json.loads(bytes(self._buf[meta_offset:meta_offset + meta_len]).decode("utf-8"))
+        self.categories: List[str] = self.meta["categories"]
+
+        self._present = self._sections["present"].cast("H")
+        self._numeric = {field: self._sections[field].cast("i") for field in NUMERIC_FIELDS}
+        self._category = self._sections["category"].cast("i")
+        self._offsets = {field: self._sections[f"off:{field}"].cast("I") for field in STRING_FIELDS}
+        self._strings = self._sections["strings"]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def column(self, field: str) -> memoryview:
+        """숫자 컬럼의 zero-copy 뷰 (numpy.frombuffer 등에 그대로 사용 가능)"""
+        if field == "category":
+            return self._category
+        return self._numeric[field]
+
+    def raw_section(self, name: str) -> memoryview:
+        """섹션 원본 바이트 뷰"""
+        return self._sections[name]
+
+    def string(self, field: str, row: int) -> str:
+        """문자열 컬럼 값 (필요할 때만 디코딩)"""
+        offsets = self._offsets[field]
+        return str(self._strings[offsets[row]:offsets[row + 1]], "utf-8")
+
+    def category_name(self, row: int) -> Optional[str]:
+        index = self._category[row]
+        return self.categories[index] if index >= 0 else None
+
+    def product(self, row: int) -> Product:
+        """한 행을 읽기 전용 제품 레코드로 만듭니다 (JSON 원본에 없던 필드는 None)."""
+        present = self._present[row]
+        values = {}
+        for bit, field in enumerate(_ALL_FIELDS):
+            if not present & (1 << bit):
+                continue
+            if field in self._numeric:
+                values[field] = self._numeric[field][row]
+            else:
+                values[field] = self.string(field, row)
+        return Product(**values)
+
+    def close(self):
+        """mmap 해제 (이 카탈로그에서 만든 뷰를 더 이상 쓰지 않을 때만 호출)"""
+        for view in (self._present, self._category, *self._numeric.values(), *self._offsets.values()):
+            view.release()
+        for view in self._sections.values():
+            view.release()
+        self._buf.release()
+        self._mmap.close()
+
+
+class ProductRows(Sequence):
+    """BinaryCatalog 행들의 지연 시퀀스 - 접근할 때만 제품 레코드를 만듭니다."""
+
+    def __init__(self, catalog: BinaryCatalog, rows: List[int]):
+        self.catalog = catalog
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.catalog.product(row) for row in self.rows[index]]
+        return self.catalog.product(self.rows[index])
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python -m src.catalog_binary <assistant_data.json> <output.oycat>")
+        sys.exit(1)
+    try:
+        out = compile_catalog(sys.argv[1], sys.argv[2])
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ Compiled {sys.argv[1]} → {out} ({out.stat().st_size:,} bytes)")
@@ -0,0 +1,121 @@
+"""
+대화 컨텍스트 예산 관리
+긴 세션에서도 LLM 입력이 일정 크기를 넘지 않도록 공유 prefix와 최근 N턴만 원문으로 유지하고,
+오래된 턴은 규칙 기반 요약(고객 질문 + 안내한 제품/매장 ID) 한 개의 메시지로 접습니다.
+"""
+import re
+from typing import Dict, List
+
+# 요약 메시지 머리말 (이 문자열로 시작하는 system 메시지를 기존 요약으로 인식)
+SUMMARY_HEADER = "[이전 대화 요약]"
+
+_PRODUCTS_TAG = re.compile(r"\[PRODUCTS:([^\]]*)\]")
+_STORE_TAG = re.compile(r"\[STORE:([^\]]*)\]")
+
+
+def _summarize_turn(turn: List[Dict]) -> str:
+    """턴 하나를 한 줄로 요약 (고객 질문 앞부분 + 응답에서 안내한 ID)"""
+    question = ""
+    product_ids: List[str] = []
+    store_ids: List[str] = []
+    for message in turn:
+        content = message.get("content") or ""
+        if not isinstance(content, str):
+            continue
+        if message.get("role") == "user" and not question:
+            question = " ".join(content.split())[:60]
+        elif message.get("role") == "assistant":
+            for tag in _PRODUCTS_TAG.findall(content):
+                product_ids.extend(pid.strip() for pid in tag.split(",") if pid.strip())
+            store_ids.extend(sid.strip() for sid in _STORE_TAG.findall(content) if sid.strip())
+
+    line = f"- 고객: {question}"
+    if product_ids:
+        line += f" → 추천 제품: {','.join(product_ids)}"
+    if store_ids:
+        line += f" → 안내 매장: {','.join(store_ids)}"
+    return line
+
+
+class ContextBudgetManager:
+    """메시지 목록을 제자리에서(in place) 압축하는 컨텍스트 예산 관리자
+
+    메시지 배치: [공유 prefix] [요약 1개(선택)] [최근 턴 ...]
+    - 공유 prefix는 절대 건드리지 않음 (제공자 prompt 캐시 유지)
+    - 최근 max_turns 턴은 원문 유지, 단 원문 길이가 max_history_chars를 넘으면 더 줄임 (최소 1턴)
+    - 밀려난 턴은 요약 줄로 바꿔 최근 summary_items 줄만 유지
+    """
+
+    def __init__(
+        self,
+        prefix_length: int,
+        max_turns: int = 6,
+        max_history_chars: int = 4000,
+        summary_items: int = 10,
+    ):
+        """
+        Args:
+            prefix_length: 공유 prefix 메시지 수 (시스템 프롬프트 + few-shot + 인사말)
+            max_turns: 원문으로 유지할 최근 턴 수 (턴 = 사용자 메시지 + 이어지는 응답)
+            max_history_chars: 원문 유지 구간의 최대 글자 수
+            summary_items: 요약에 남길 최대 줄 수
+        """
+        self.prefix_length = prefix_length
+        self.max_turns = max(1, max_turns)
+        self.max_history_chars = max_history_chars
+        self.summary_items = summary_items
+        self.compactions = 0      # 압축 횟수
+        self.dropped_turns = 0    # 요약으로 접힌 턴 수
+
+    def _split(self, messages: List[Dict]):
+        """prefix 이후를 (기존 요약 줄, 턴 목록)으로 나눕니다."""
+        history = messages[self.prefix_length:]
+        summary_lines: List[str] = []
+        if history and history[0].get("role") == "system" and \
+                str(history[0].get("content", "")).startswith(SUMMARY_HEADER):
+            summary_lines = history[0]["content"].split("\n")[1:]
+            history = history[1:]
+
+        turns: List[List[Dict]] = []
+        for message in history:
+            if message.get("role") == "user" or not turns:
+                turns.append([message])
+            else:
+                turns[-1].append(message)
+        return summary_lines, turns
+
+    @staticmethod
+    def _turn_chars(turn: List[Dict]) -> int:
+        return sum(len(str(message.get("content") or "")) for message in turn)
+
+    def compact(self, messages: List[Dict]) -> bool:
+        """
+        예산을 넘으면 메시지 목록을 제자리에서 압축합니다.
+        (집계기들이 같은 리스트를 공유하므로 새 리스트를 만들지 않고 슬라이스 대입)
+
+        Returns:
+            압축했으면 True
+        """
+        if len(messages) <= self.prefix_length:
+            return False
+        summary_lines, turns = self._split(messages)
+
+        keep = min(len(turns), self.max_turns)
+        chars = sum(self._turn_chars(turn) for turn in turns[len(turns) - keep:])
+        while keep > 1 and chars > self.max_history_chars:
+            chars -= self._turn_chars(turns[len(turns) - keep])
+            keep -= 1
+
+        dropped = turns[:len(turns) - keep]
+        if not dropped:
+            return False
+
+        summary_lines.extend(_summarize_turn(turn) for turn in dropped)
+        summary_lines = summary_lines[-self.summary_items:]
+        tail = [message for turn in turns[len(turns) - keep:] for message in turn]
+        summary = {"role": "system", "content": "\n".join([SUMMARY_HEADER, *summary_lines])}
+        messages[self.prefix_length:] = [summary, *tail]
+
+        self.compactions += 1
+        self.dropped_turns += len(dropped)
+        return True
@@ -8,7 +8,6 @@ https://elevenlabs.io/docs/cookbooks/speech-to-text/streaming
 """
 import asyncio
 import base64
-import json
 import time
 from typing import Optional
 
@@ -17,6 +16,8 @@ from loguru import logger
 from pipecat.frames.frames import AudioRawFrame, TranscriptionFrame, Frame
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
+from .serialization import DecodeError, ScribeMessage, decode_scribe_message, dumps
+
 
 class CommitStrategy:
     """전사 커밋 전략"""
@@ -69,6 +70,7 @@ class ElevenLabsSTTService(FrameProcessor):
         # 오디오 통계 (디버깅용)
         self.audio_chunks_sent = 0
         self.audio_bytes_sent = 0
+        self._format_warned = False  # 입력 형식 불일치 경고 (한 번만)
     
     def _build_websocket_url(self) -> str:
         """WebSocket URL 구성 (SDK와 동일한 방식)"""
@@ -200,13 +202,14 @@ class ElevenLabsSTTService(FrameProcessor):
         try:
             logger.info("📡 Starting message receiver loop...")
             logger.info("📡 Waiting for first message from ElevenLabs...")
-            async for message in self.websocket:
+            async for raw in self.websocket:
                 try:
-                    data = json.loads(message)
-                    await self._handle_message(data)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"⚠️ Invalid JSON received: {message[:100]}")
-                    logger.warning(f"⚠️ JSON error: {e}")
+                    # 전체 메시지 로깅 (디버깅용 - 원문 그대로, 다시 직렬화하지 않음)
+                    logger.debug(f"📨 Received message: {raw}")
+                    await self._handle_message(decode_scribe_message(raw))
+                except DecodeError as e:
+                    logger.warning(f"⚠️ Invalid message received: {raw[:100]}")
+                    logger.warning(f"⚠️ Decode error: {e}")
                 except Exception as e:
                     logger.error(f"❌ Error handling message: {e}")
                     logger.error(f"❌ Error type: {type(e).__name__}")
@@ -224,30 +227,27 @@ class ElevenLabsSTTService(FrameProcessor):
             self.is_connected = False
             self.session_started = False
     
-    async def _handle_message(self, data: dict):
+    async def _handle_message(self, message: ScribeMessage):
         """ElevenLabs 메시지 처리"""
-        # 전체 메시지 로깅 (디버깅용)
-        logger.info(f"📨 Received message: {json.dumps(data, indent=2)}")
-        
         # ElevenLabs는 정상 메시지는 "type", 에러 메시지는 "message_type"을 사용
-        message_type = data.get("type") or data.get("message_type")
+        message_type = message.kind
         
         # 모든 메시지 타입 로깅 (디버깅용)
-        logger.info(f"📨 Message type: {message_type}")
+        logger.debug(f"📨 Message type: {message_type}")
         
         if message_type == "session_started":
             logger.info("✅ ElevenLabs session started!")
             self.session_started = True  # 세션 시작 플래그 설정
             # 세션 설정 확인 (테스트 결과: config 필드에 있음, message_type 사용)
-            session_id = data.get("session_id", "")
-            session_config = data.get("config", {})  # session이 아니라 config 필드
+            session_id = message.session_id
+            session_config = message.config or {}  # session이 아니라 config 필드
             logger.info(f"📋 Session ID: {session_id}")
-            logger.info(f"📋 Session config: {json.dumps(session_config, indent=2)}")
+            logger.info(f"📋 Session config: {session_config}")
             logger.info("🎵 Ready to send audio chunks")
         
         elif message_type == "partial_transcript":
             # 부분 전사 결과 (실시간 업데이트)
-            text = data.get("text", "")
+            text = message.text
             if text:
                 self.partial_transcript = text
                 # 부분 전사는 로깅 (INFO 레벨로 변경)
@@ -255,7 +255,7 @@ class ElevenLabsSTTService(FrameProcessor):
         
         elif message_type == "committed_transcript":
             # 확정된 전사 결과 (최종)
-            text = data.get("text", "")
+            text = message.text
             if text and text.strip():
                 self.last_committed_transcript = text.strip()
                 self.partial_transcript = ""
@@ -271,7 +271,7 @@ class ElevenLabsSTTService(FrameProcessor):
         
         elif message_type == "committed_transcript_with_timestamps":
             # 타임스탬프 포함 전사 결과
-            text = data.get("text", "")
+            text = message.text
             if text and text.strip():
                 self.last_committed_transcript = text.strip()
                 self.partial_transcript = ""
@@ -279,11 +279,10 @@ class ElevenLabsSTTService(FrameProcessor):
                 # TranscriptionFrame 생성 및 전달 (timestamp 필수)
                 # ElevenLabs에서 제공하는 타임스탬프가 있으면 사용, 없으면 현재 시간
                 timestamp = time.time()
-                if "words" in data:
-                    # words 배열의 첫 번째 항목의 start_time 사용 가능
-                    words = data.get("words", [])
-                    if words and len(words) > 0 and "start" in words[0]:
-                        timestamp = words[0]["start"] / 1000.0  # 밀리초를 초로 변환
+                # words 배열의 첫 번째 항목의 start_time 사용 가능
+                words = message.words
+                if words and words[0].start is not None:
+                    timestamp = words[0].start / 1000.0  # 밀리초를 초로 변환
                 
                 logger.info(f"✅ Committed transcript (with timestamps): {text.strip()}")
                 frame = TranscriptionFrame(
@@ -294,61 +293,51 @@ class ElevenLabsSTTService(FrameProcessor):
                 await self.push_frame(frame, FrameDirection.DOWNSTREAM)
         
         elif message_type == "error":
-            error = data.get("error", {})
-            error_type = error.get("type", "unknown")
-            error_message = error.get("message", "Unknown error")
-            logger.error(f"❌ ElevenLabs error ({error_type}): {error_message}")
-            logger.error(f"❌ Full error data: {data}")
+            error_message = message.error_message or "Unknown error"
+            logger.error(f"❌ ElevenLabs error ({message.error_type}): {error_message}")
+            logger.error(f"❌ Full error data: {message}")
             self.is_connected = False
             self.session_started = False
         
         elif message_type == "auth_error":
-            error = data.get("error", {})
-            error_message = error.get("message", "Authentication error")
+            error_message = message.error_message or "Authentication error"
             logger.error(f"❌ ElevenLabs authentication error: {error_message}")
-            logger.error(f"❌ Full error data: {data}")
+            logger.error(f"❌ Full error data: {message}")
             self.is_connected = False
             self.session_started = False
         
         elif message_type == "quota_exceeded":
-            error = data.get("error", {})
-            error_message = error.get("message", "Quota exceeded")
+            error_message = message.error_message or "Quota exceeded"
             logger.error(f"❌ ElevenLabs quota exceeded: {error_message}")
-            logger.error(f"❌ Full error data: {data}")
+            logger.error(f"❌ Full error data: {message}")
             self.is_connected = False
             self.session_started = False
         
         elif message_type == "transcriber_error":
-            error = data.get("error", {})
-            error_message = error.get("message", "Transcriber error")
+            error_message = message.error_message or "Transcriber error"
             logger.error(f"❌ ElevenLabs transcriber error: {error_message}")
-            logger.error(f"❌ Full error data: {data}")
+            logger.error(f"❌ Full error data: {message}")
         
         elif message_type == "input_error":
-            # input_error는 에러 메시지 형식이 다를 수 있음
-            error_message = data.get("error")
-            if isinstance(error_message, str):
-                logger.error(f"❌ ElevenLabs input error: {error_message}")
-            else:
-                error = data.get("error", {})
-                error_message = error.get("message", "Input error") if isinstance(error, dict) else str(error)
-                logger.error(f"❌ ElevenLabs input error: {error_message}")
-            logger.error(f"❌ Full error data: {data}")
+            # input_error는 에러 메시지 형식이 다를 수 있음 (문자열 또는 객체)
+            error_message = message.error_message or "Input error"
+            logger.error(f"❌ ElevenLabs input error: {error_message}")
+            logger.error(f"❌ Full error data: {message}")
             # input_error는 연결을 끊지 않음 (재시도 가능)
         
         else:
             # 알 수 없는 메시지 타입 또는 type 필드가 없는 경우
             if message_type is None:
                 # type 필드가 없는 경우 - 전체 메시지를 확인
-                logger.info(f"ℹ️ Message without 'type' field: {json.dumps(data, indent=2)}")
+                logger.info(f"ℹ️ Message without 'type' field: {message}")
                 # 세션 시작일 수 있는 다른 필드 확인
-                if "session" in data or "session_id" in data:
+                if message.session is not None or message.session_id:
                     logger.info("✅ Session info found in message (treating as session started)")
                     self.session_started = True
             else:
                 # 알 수 없는 메시지 타입
                 logger.warning(f"⚠️ Unknown message type: {message_type}")
-                logger.info(f"⚠️ Full message data: {json.dumps(data, indent=2)}")
+                logger.info(f"⚠️ Full message data: {message}")
     
     async def _send_audio(self, audio_data: bytes):
         """오디오 데이터를 ElevenLabs로 전송
@@ -386,7 +375,7 @@ class ElevenLabsSTTService(FrameProcessor):
             }
             
             logger.debug(f"📤 Sending audio chunk: {len(audio_base64)} base64 chars")
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(dumps(message))
             
             # 통계 업데이트
             self.audio_chunks_sent += 1
@@ -419,7 +408,7 @@ class ElevenLabsSTTService(FrameProcessor):
             message = {
                 "type": "commit",
             }
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(dumps(message))
             logger.debug("📤 Sent commit message to ElevenLabs")
         except Exception as e:
             logger.error(f"❌ Error committing transcript: {e}")
@@ -430,6 +419,14 @@ class ElevenLabsSTTService(FrameProcessor):
         
         # AudioRawFrame 처리
         if isinstance(frame, AudioRawFrame):
+            # encoding(pcm_{sample_rate})과 다른 형식이면 잘못된 오디오가 전송됨 (앞단 AudioFormatConverter 필요)
+            if (frame.sample_rate, frame.num_channels) != (self.sample_rate, 1) and not self._format_warned:
+                logger.warning(
+                    f"⚠️ Audio format mismatch: got {frame.sample_rate}Hz/{frame.num_channels}ch, "
+                    f"expected {self.sample_rate}Hz/1ch ({self.encoding})"
+                )
+                self._format_warned = True
+            
             if not self.is_connected:
                 # 연결되지 않은 경우 연결 시도
                 logger.info("🔌 Not connected, attempting to connect...")
@@ -0,0 +1,185 @@
+"""
+매장 FAQ 응답 캐시
+"매장 어디 있어?", "영업시간" 같은 반복 질문을 LLM 호출 없이 매장 데이터 템플릿으로 즉시 답변
+"""
+import re
+import threading
+import weakref
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from loguru import logger
+
+# 유사도 임계값 (정규화한 발화와 대표 질문의 글자 bigram Dice 계수)
+DEFAULT_THRESHOLD = 0.6
+
+# 의도별 대표 질문 (매장 데이터에 해당 필드가 있을 때만 활성화)
+CANONICAL_QUESTIONS: Dict[str, Tuple[str, ...]] = {
+    "location": (
+        "매장 어디 있어", "매장 위치 알려줘", "위치가 어디야", "주소 알려줘", "주소가 어떻게 돼",
+        "어디에 있어요", "가게 어디야", "매장 어떻게 가",
+    ),
+    "hours": (
+        "영업시간 알려줘", "영업 시간이 어떻게 돼", "몇 시까지 해", "몇 시에 문 열어",
+        "언제 문 닫아", "오늘 몇 시까지 영업해",
+    ),
+    "phone": (
+        "전화번호 알려줘", "매장 연락처", "전화번호가 뭐야",
+    ),
+    "subway": (
+        "지하철 몇 번 출구야", "역 몇 번 출구야", "몇 번 출구로 나가", "무슨 역에서 내려", "가까운 지하철역",
+    ),
+}
+
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def normalize_question(text: str) -> str:
+    """발화 정규화 (소문자, 공백/문장부호 제거)"""
+    return _NON_WORD.sub("", (text or "").lower())
+
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)} or {text}
+
+
+def _dice(a: Set[str], b: Set[str]) -> float:
+    return 2 * len(a & b) / (len(a) + len(b)) if a and b else 0.0
+
+
+class FaqAnswer(NamedTuple):
+    intent: str
+    text: str   # 응답 텍스트 ([STORE:...] 태그 포함)
+    score: float
+
+
+def _format_hours(business_hours) -> str:
+    """영업시간 딕셔너리를 읽기 좋은 문장으로 (모든 요일이 같으면 "매일 ...")"""
+    if isinstance(business_hours, str):
+        return business_hours
+    if not business_hours:
+        return ""
+    values = list(business_hours.values())
+    if len(set(values)) == 1:
+        return f"매일 {values[0]}"
+    return ", ".join(f"{day} {hours}" for day, hours in business_hours.items())
+
+
+def _render_answers(store: Dict) -> Dict[str, str]:
+    """매장 레코드로 의도별 답변 템플릿을 채웁니다 (필드가 없는 의도는 제외)."""
+    store_id = store.get("store_id")
+    if not store_id:
+        return {}
+    name = store.get("store_name") or store.get("name", "")
+    tag = f"[STORE:{store_id}]"
+    subway = (store.get("subway_info") or "").replace(" / ", ", ")
+    hours = _format_hours(store.get("business_hours"))
+
+    answers = {}
+    if store.get("address"):
+        answers["location"] = f"{name}은 {store['address']}에 있습니다." + (
+            f" 지하철은 {subway}를 이용하시면 됩니다." if subway else ""
+        ) + f" {tag}"
+    if hours:
+        answers["hours"] = f"{name} 영업시간은 {hours}입니다. {tag}"
+    if store.get("phone"):
+        answers["phone"] = f"{name} 전화번호는 {store['phone']}입니다. {tag}"
+    if subway:
+        answers["subway"] = f"{subway}로 나오시면 됩니다. {tag}"
+    return answers
+
+
+class _CompiledFaq:
+    """카탈로그 스냅샷 하나에 대한 FAQ 답변/대표 질문 bigram
+
+    스냅샷을 참조하지 않음 (FaqCache가 스냅샷을 약한 참조 키로 보관 - 값이 키를 붙잡으면 해제되지 않음)
+    """
+
+    def __init__(self, store_service):
+        main_store = store_service.data.get("store", {})
+        answers = _render_answers(main_store)
+        self.questions: List[Tuple[str, Set[str]]] = [
+            (intent, _bigrams(normalize_question(question)))
+            for intent, questions in CANONICAL_QUESTIONS.items() if intent in answers
+            for question in questions
+        ]
+        self.answers = answers
+        # 다른 매장/장소를 묻는 질문은 메인 매장 답변으로 처리하지 않음
+        main_id = main_store.get("store_id")
+        self.other_store_names = {
+            normalize_question(name.replace("올리브영", ""))
+            for store in store_service.data.get("nearby_stores", [])
+            if store.get("store_id") != main_id and (name := store.get("name"))
+        } - {""}
+        self.main_context = normalize_question(
+            " ".join([main_store.get("subway_info", ""), main_store.get("address", "")])
+        )
+
+
+class FaqCache:
+    """정규화 발화 ↔ 대표 질문 유사도 매칭 FAQ 캐시
+
+    답변은 카탈로그 스냅샷별로 한 번 만들어 스냅샷을 약한 참조 키로 보관합니다.
+    리로드 전후 세션이 섞여도 서로의 답변을 다시 만들지 않고,
+    더 이상 쓰지 않는 스냅샷(과 mmap 카탈로그)은 답변과 함께 해제됩니다.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._compiled: "weakref.WeakKeyDictionary[object, _CompiledFaq]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.stats = {"lookups": 0, "hits": 0}
+
+    def _for(self, store_service) -> _CompiledFaq:
+        compiled = self._compiled.get(store_service)
+        if compiled is None:
+            with self._lock:
+                compiled = self._compiled.get(store_service)
+                if compiled is None:
+                    compiled = _CompiledFaq(store_service)
+                    self._compiled[store_service] = compiled
+                    logger.info(f"❓ FAQ answers built (catalog version {store_service.version}, intents: {list(compiled.answers)})")
+        return compiled
+
+    def _mentions_other_place(self, compiled: _CompiledFaq, store_service, key: str, text: str) -> bool:
+        if any(name in key for name in compiled.other_store_names):
+            return True
+        gazetteer = getattr(store_service, "gazetteer", None)
+        landmark = gazetteer.resolve(text) if gazetteer else None
+        return bool(landmark) and normalize_question(landmark["name"]) not in compiled.main_context
+
+    def match(self, text: str, store_service) -> Optional[FaqAnswer]:
+        """
+        발화에 맞는 FAQ 답변을 찾습니다.
+
+        Args:
+            text: 사용자 발화 (STT 결과)
+            store_service: 세션의 카탈로그 스냅샷
+
+        Returns:
+            FaqAnswer (없으면 None → LLM으로 처리)
+        """
+        self.stats["lookups"] += 1
+        key = normalize_question(text)
+        if len(key) < 2:
+            return None
+        compiled = self._for(store_service)
+        grams = _bigrams(key)
+        best_intent, best_score = None, 0.0
+        for intent, question in compiled.questions:
+            score = _dice(grams, question)
+            if score > best_score:
+                best_intent, best_score = intent, score
+        if best_intent is None or best_score < self.threshold:
+            return None
+        if self._mentions_other_place(compiled, store_service, key, text):
+            return None
+        self.stats["hits"] += 1
+        return FaqAnswer(best_intent, compiled.answers[best_intent], best_score)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.stats["hits"] / self.stats["lookups"] if self.stats["lookups"] else 0.0
+
+
+# 프로세스 전역 FAQ 캐시
+faq_cache = FaqCache()
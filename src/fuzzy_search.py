@@ -0,0 +1,221 @@
+"""
+한글 자모 기반 퍼지 검색
+STT 오인식(띄어쓰기, 잘못 들은 음절)에 강한 제품명/매장명 검색
+
+- 자모 분해: "토리든" → "ㅌㅗㄹㅣㄷㅡㄴ" (음절 하나가 틀려도 자모 1~2개 차이)
+- 초성 키: "ㅌㄹㄷ"로 "토리든" 검색 (초성 토큰 접두사 역색인으로 후보만 확인)
+- 후보 필터: 자모 trigram 역색인으로 후보만 추린 뒤 제한 편집 거리로 점수 계산
+"""
+import heapq
+import re
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+         "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+_CHOSUNG_SET = set(_CHO)
+
+# 토큰 분리: 한글/영문/숫자 이외 문자는 구분자
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣ㄱ-ㆎ]+")
+
+# 초성 역색인에 넣는 토큰 접두사 최대 길이 (더 긴 질의 키는 이 길이로 후보를 찾고 startswith로 확인)
+_CHOSUNG_PREFIX_LEN = 3
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해합니다 (그 외 문자는 소문자로 유지)."""
+    result = []
+    for ch in text.lower():
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            result.append(_CHO[offset // 588])
+            result.append(_JUNG[(offset % 588) // 28])
+            result.append(_JONG[offset % 28])
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def chosung(text: str) -> str:
+    """초성 키를 만듭니다 ("토리든 세럼" → "ㅌㄹㄷ ㅅㄹ"). 한글 외 문자는 그대로 유지합니다."""
+    result = []
+    for ch in text.lower():
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            result.append(_CHO[(code - _HANGUL_BASE) // 588])
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def is_chosung_query(text: str) -> bool:
+    """초성만으로 된 질의인지 확인 (예: "ㅌㄹㄷ")"""
+    letters = [ch for ch in text if not ch.isspace()]
+    return bool(letters) and all(ch in _CHOSUNG_SET for ch in letters)
+
+
+def tokenize(text: str) -> List[str]:
+    """검색 토큰으로 분리합니다 (소문자, 괄호/기호 제거)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    레벤슈타인 거리 (max_distance를 넘으면 None)
+    대각선 밴드만 계산하고, 행 최솟값이 한계를 넘으면 조기 종료합니다.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        lo = max(1, i - max_distance)
+        hi = min(len(b), i + max_distance)
+        current = [max_distance + 1] * (len(b) + 1)
+        current[0] = i
+        for j in range(lo, hi + 1):
+            cost = 0 if ca == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+        if min(current[lo - 1:hi + 1]) > max_distance:
+            return None
+        previous = current
+    distance = previous[len(b)]
+    return distance if distance <= max_distance else None
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"\x02{text}\x03"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyIndex:
+    """자모 trigram 후보 필터 + 제한 편집 거리 퍼지 검색 색인
+
+    항목 이름을 토큰 단위로 자모 분해해 색인하고, 질의 토큰마다 가장 비슷한
+    항목 토큰의 유사도(1 - 편집거리/길이)를 평균해 항목 점수를 매깁니다.
+    """
+
+    def __init__(self, items: Sequence[Tuple[str, Any]], max_error_ratio: float = 0.34):
+        """
+        Args:
+            items: (이름, 항목) 목록
+            max_error_ratio: 토큰 길이 대비 허용 편집 거리 비율 (자모 단위)
+        """
+        self.max_error_ratio = max_error_ratio
+        self._items = [item for _, item in items]
+        self._names: List[str] = []         # 공백 제거 자모 (띄어쓰기 차이 매칭용)
+        self._tokens: List[List[str]] = []  # 항목별 자모 토큰
+        self._chosung: List[List[str]] = []  # 항목별 초성 토큰
+        self._postings: Dict[str, Set[int]] = {}
+        self._chosung_postings: Dict[str, Set[int]] = {}  # 초성 토큰 접두사 → 항목
+        for item_id, (name, _) in enumerate(items):
+            tokens = tokenize(name)
+            jamo_tokens = [decompose_jamo(token) for token in tokens]
+            chosung_tokens = [chosung(token) for token in tokens]
+            self._names.append("".join(jamo_tokens))
+            self._tokens.append(jamo_tokens)
+            self._chosung.append(chosung_tokens)
+            for token in jamo_tokens:
+                for gram in _trigrams(token):
+                    self._postings.setdefault(gram, set()).add(item_id)
+            for token in chosung_tokens:
+                for length in range(1, min(len(token), _CHOSUNG_PREFIX_LEN) + 1):
+                    self._chosung_postings.setdefault(token[:length], set()).add(item_id)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _token_similarity(self, query: str, token: str) -> float:
+        if query in token:
+            # 토큰 일부 일치 (예: "세럼" ⊂ "속보습세럼") - 짧을수록 약간 감점
+            return 1.0 if len(query) == len(token) else 0.95
+        max_distance = max(1, int(len(query) * self.max_error_ratio))
+        score = 0.0
+        distance = bounded_edit_distance(query, token, max_distance)
+        if distance is not None:
+            score = 1.0 - distance / max(len(query), len(token))
+        if len(token) > len(query):
+            # 토큰 앞부분 일치 (예: "아토베리아" ↔ "아토베리어365")
+            distance = bounded_edit_distance(query, token[:len(query)], max_distance)
+            if distance is not None:
+                score = max(score, (1.0 - distance / len(query)) * 0.95)
+        return score
+
+    def _candidates(self, query_tokens: List[str]) -> Set[int]:
+        candidates: Set[int] = set()
+        for token in query_tokens:
+            grams = _trigrams(token)
+            counts: Dict[int, int] = {}
+            for gram in grams:
+                for item_id in self._postings.get(gram, ()):
+                    counts[item_id] = counts.get(item_id, 0) + 1
+            # 편집 1회는 최대 3개 trigram을 바꾸므로, 허용 편집 수만큼 빼고 남는 공유 trigram 수가 하한
+            max_distance = max(1, int(len(token) * self.max_error_ratio))
+            need = max(1, len(grams) - 3 * max_distance)
+            candidates.update(item_id for item_id, count in counts.items() if count >= need)
+        return candidates
+
+    def search(self, query: str, limit: int = 5, min_score: float = 0.6) -> List[Tuple[Any, float]]:
+        """
+        퍼지 검색
+
+        Args:
+            query: 검색어 (STT 결과 그대로, 초성 질의 가능)
+            limit: 최대 결과 수
+            min_score: 최소 유사도 (0~1)
+
+        Returns:
+            (항목, 유사도) 목록 (유사도 높은 순, 동점이면 색인 순서)
+        """
+        if is_chosung_query(query):
+            return self._search_chosung(query, limit)
+
+        query_tokens = [decompose_jamo(token) for token in tokenize(query)]
+        if not query_tokens:
+            return []
+        joined = "".join(query_tokens)
+
+        scored = []
+        for item_id in self._candidates(query_tokens):
+            if joined in self._names[item_id]:
+                # 띄어쓰기만 다른 경우 (예: "다이브 인" ↔ "다이브인")
+                score = 1.0
+            else:
+                score = sum(
+                    max((self._token_similarity(q, t) for t in self._tokens[item_id]), default=0.0)
+                    for q in query_tokens
+                ) / len(query_tokens)
+            if score >= min_score:
+                scored.append((-score, item_id))
+        scored.sort()
+        return [(self._items[item_id], -neg_score) for neg_score, item_id in scored[:limit]]
+
+    def _search_chosung(self, query: str, limit: int) -> List[Tuple[Any, float]]:
+        keys = query.split()
+        # 키마다 접두사 색인으로 후보를 좁힘 (작은 후보 집합부터 교집합)
+        postings = sorted(
+            (self._chosung_postings.get(key[:_CHOSUNG_PREFIX_LEN], set()) for key in keys), key=len
+        )
+        candidates = postings[0]
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates = candidates & posting
+        if all(len(key) <= _CHOSUNG_PREFIX_LEN for key in keys):
+            # 접두사 색인이 곧 일치 조건 → 색인 순서 앞쪽 limit개만
+            return [(self._items[item_id], 1.0) for item_id in heapq.nsmallest(limit, candidates)]
+
+        # 색인 길이보다 긴 키는 토큰 startswith로 확인
+        results = []
+        for item_id in sorted(candidates):
+            tokens = self._chosung[item_id]
+            if all(any(token.startswith(key) for token in tokens) for key in keys):
+                results.append((self._items[item_id], 1.0))
+                if len(results) >= limit:
+                    break
+        return results
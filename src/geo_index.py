@@ -0,0 +1,210 @@
+"""
+위치 기반 매장 검색
+haversine 거리, 3D KD-tree 공간 색인 (k-최근접/반경 검색), 랜드마크·지하철 출구 가제티어
+"""
+import heapq
+import math
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .serialization import loads
+
+EARTH_RADIUS_M = 6_371_008.8
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 대원 거리 (미터)"""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _to_xyz(lat: float, lng: float) -> Tuple[float, float, float]:
+    """위경도 → 단위 구면 3D 좌표 (유클리드 현 길이가 대원 거리와 단조 관계)"""
+    p, l = math.radians(lat), math.radians(lng)
+    return (math.cos(p) * math.cos(l), math.cos(p) * math.sin(l), math.sin(p))
+
+
+def _chord_for_distance(distance_m: float) -> float:
+    """대원 거리(m) → 단위 구면 현 길이"""
+    return 2 * math.sin(min(math.pi, distance_m / EARTH_RADIUS_M) / 2)
+
+
+class GeoIndex:
+    """좌표가 있는 항목의 KD-tree 색인
+
+    단위 구면 위 3D 좌표로 KD-tree를 만들어 극/날짜변경선 근처에서도 정확한
+    k-최근접, 반경 검색을 제공합니다. 반환 거리는 haversine(미터)입니다.
+    """
+
+    def __init__(self, entries: List[Tuple[float, float, Any]]):
+        """
+        Args:
+            entries: (lat, lng, item) 목록
+        """
+        self._items = [item for _, _, item in entries]
+        self._coords = [(lat, lng) for lat, lng, _ in entries]
+        self._points = [_to_xyz(lat, lng) for lat, lng, _ in entries]
+        # 노드: [점 번호, 분할 축, 왼쪽, 오른쪽] (리스트 기반, 재귀 없이 탐색)
+        self._nodes: List[List[int]] = []
+        self._root = self._build(list(range(len(entries))), 0)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _build(self, indices: List[int], depth: int) -> int:
+        if not indices:
+            return -1
+        axis = depth % 3
+        indices.sort(key=lambda i: self._points[i][axis])
+        mid = len(indices) // 2
+        node_id = len(self._nodes)
+        self._nodes.append([indices[mid], axis, -1, -1])
+        self._nodes[node_id][2] = self._build(indices[:mid], depth + 1)
+        self._nodes[node_id][3] = self._build(indices[mid + 1:], depth + 1)
+        return node_id
+
+    def nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int = 1,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        max_distance_m: Optional[float] = None,
+    ) -> List[Tuple[float, Any]]:
+        """
+        가장 가까운 k개 항목을 반환합니다.
+
+        Args:
+            lat, lng: 기준 좌표
+            k: 개수
+            predicate: 조건 함수 (False인 항목은 건너뜀, 예: 영업 중인 매장만)
+            max_distance_m: 최대 거리 (미터)
+
+        Returns:
+            (거리 m, 항목) 목록 (가까운 순)
+        """
+        if k <= 0 or self._root < 0:
+            return []
+        q = _to_xyz(lat, lng)
+        bound = _chord_for_distance(max_distance_m) ** 2 if max_distance_m is not None else math.inf
+        best: List[Tuple[float, int]] = []  # (-제곱거리, 점 번호) 최대 힙
+        stack = [self._root]
+        while stack:
+            node_id = stack.pop()
+            if node_id < 0:
+                continue
+            point_index, axis, left, right = self._nodes[node_id]
+            point = self._points[point_index]
+            d2 = (point[0] - q[0]) ** 2 + (point[1] - q[1]) ** 2 + (point[2] - q[2]) ** 2
+            worst = -best[0][0] if len(best) == k else bound
+            if d2 <= worst and (predicate is None or predicate(self._items[point_index])):
+                if len(best) == k:
+                    heapq.heapreplace(best, (-d2, point_index))
+                else:
+                    heapq.heappush(best, (-d2, point_index))
+                worst = -best[0][0] if len(best) == k else bound
+            diff = q[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # 분할면까지 거리가 현재 k번째보다 가까우면 반대편도 탐색
+            if diff * diff <= worst:
+                stack.append(far)
+            stack.append(near)
+        return [
+            (self._distance(lat, lng, i), self._items[i])
+            for _, i in sorted(best, key=lambda entry: (-entry[0], entry[1]))
+        ]
+
+    def within(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: float,
+        predicate: Optional[Callable[[Any], bool]] = None,
+    ) -> List[Tuple[float, Any]]:
+        """
+        반경 안의 모든 항목을 반환합니다.
+
+        Returns:
+            (거리 m, 항목) 목록 (가까운 순)
+        """
+        if self._root < 0:
+            return []
+        q = _to_xyz(lat, lng)
+        limit = _chord_for_distance(radius_m) ** 2
+        found = []
+        stack = [self._root]
+        while stack:
+            node_id = stack.pop()
+            if node_id < 0:
+                continue
+            point_index, axis, left, right = self._nodes[node_id]
+            point = self._points[point_index]
+            d2 = (point[0] - q[0]) ** 2 + (point[1] - q[1]) ** 2 + (point[2] - q[2]) ** 2
+            if d2 <= limit and (predicate is None or predicate(self._items[point_index])):
+                found.append(point_index)
+            diff = q[axis] - point[axis]
+            if diff <= 0 or diff * diff <= limit:
+                stack.append(left)
+            if diff >= 0 or diff * diff <= limit:
+                stack.append(right)
+        results = [(self._distance(lat, lng, i), i) for i in found]
+        results.sort()
+        return [(distance, self._items[i]) for distance, i in results]
+
+    def _distance(self, lat: float, lng: float, index: int) -> float:
+        item_lat, item_lng = self._coords[index]
+        return haversine_m(lat, lng, item_lat, item_lng)
+
+
+class Gazetteer:
+    """랜드마크/지하철역/출구 이름 → 좌표 사전
+
+    데이터 형식 (data/landmarks.json):
+        {"landmarks": [{"name": "명동역 8번 출구", "type": "subway_exit",
+                        "lat": 37.5613, "lng": 126.9855, "aliases": [...]}]}
+    """
+
+    def __init__(self, landmarks: List[Dict]):
+        self.landmarks = landmarks
+        self._by_name: Dict[str, Dict] = {}
+        for landmark in landmarks:
+            for name in [landmark["name"], *landmark.get("aliases", [])]:
+                self._by_name.setdefault(self._key(name), landmark)
+        # 긴 이름 우선 (예: "명동역 8번 출구"가 "명동역"보다 먼저 매칭)
+        self._names_by_length = sorted(self._by_name, key=len, reverse=True)
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return "".join((name or "").lower().split())
+
+    @classmethod
+    def load(cls, path: str) -> Optional["Gazetteer"]:
+        """가제티어 파일 로드 (없으면 None)"""
+        try:
+            with open(path, "rb") as f:
+                return cls(loads(f.read()).get("landmarks", []))
+        except FileNotFoundError:
+            return None
+
+    def __len__(self) -> int:
+        return len(self.landmarks)
+
+    def resolve(self, query: str) -> Optional[Dict]:
+        """
+        질의에서 랜드마크를 찾습니다.
+        1) 이름/별칭 정확히 일치 2) 질의에 포함된 가장 긴 이름 (예: "명동역 8번 출구 근처")
+        공백은 무시합니다 (STT 띄어쓰기 차이 허용).
+        """
+        key = self._key(query)
+        if not key:
+            return None
+        landmark = self._by_name.get(key)
+        if landmark:
+            return landmark
+        for name in self._names_by_length:
+            if name in key:
+                return self._by_name[name]
+        return None
@@ -0,0 +1,151 @@
+"""
+NumPy 컬럼형 제품 뷰
+가격/할인율/재고/카테고리 필터와 top-k 랭킹을 Python 루프 없이 벡터 연산으로 처리
+"""
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+IN_STOCK_STATUS = "재고있음"
+
+# top_k 정렬 기준으로 사용할 수 있는 숫자 컬럼
+SORTABLE_FIELDS = ("discount_rate", "sale_price", "original_price")
+
+
+class ProductArray:
+    """제품 카탈로그의 NumPy 컬럼 뷰 (읽기 전용 스냅샷과 함께 생성/폐기)
+
+    Attributes:
+        products: 원본 제품 시퀀스 (행 번호로 접근)
+        categories: 카테고리 이름 목록 (category 컬럼의 코드 → 이름)
+    """
+
+    def __init__(
+        self,
+        products: Sequence[Dict],
+        columns: Dict[str, np.ndarray],
+        categories: List[str],
+    ):
+        self.products = products
+        self.categories = categories
+        self._category_codes = {name: code for code, name in enumerate(categories)}
+        self.original_price = columns["original_price"]
+        self.sale_price = columns["sale_price"]
+        self.discount_rate = columns["discount_rate"]
+        self.category = columns["category"]
+        self.in_stock = columns["in_stock"]
+
+    @classmethod
+    def from_products(cls, products: Sequence[Dict], by_category: Dict[str, Sequence[Dict]]) -> "ProductArray":
+        """제품 딕셔너리 목록에서 컬럼 배열을 만듭니다 (로드 시 한 번)."""
+        categories = list(by_category.keys())
+        code_of = {}
+        for code, category in enumerate(categories):
+            for product in by_category[category]:
+                code_of.setdefault(product.get("product_id"), code)
+
+        n = len(products)
+        columns = {
+            field: np.fromiter((p.get(field) or 0 for p in products), dtype=np.int32, count=n)
+            for field in SORTABLE_FIELDS
+        }
+        columns["category"] = np.fromiter(
+            (code_of.get(p.get("product_id"), -1) for p in products), dtype=np.int32, count=n
+        )
+        columns["in_stock"] = np.fromiter(
+            (p.get("stock_status") == IN_STOCK_STATUS for p in products), dtype=bool, count=n
+        )
+        return cls(products, columns, categories)
+
+    @classmethod
+    def from_binary_catalog(cls, catalog, products: Sequence[Dict], rows: List[int]) -> "ProductArray":
+        """BinaryCatalog(mmap) 컬럼에서 배열을 만듭니다. 숫자 컬럼은 복사 없이 mmap을 그대로 참조합니다."""
+        columns = {field: np.frombuffer(catalog.column(field), dtype=np.int32) for field in SORTABLE_FIELDS}
+        columns["category"] = np.frombuffer(catalog.column("category"), dtype=np.int32)
+        columns["in_stock"] = np.fromiter(
+            (catalog.string("stock_status", row) == IN_STOCK_STATUS for row in range(len(catalog))),
+            dtype=bool,
+            count=len(catalog),
+        )
+        if rows != list(range(len(catalog))):
+            # all_products가 카탈로그 행의 부분집합/재정렬인 경우만 복사
+            index = np.asarray(rows, dtype=np.intp)
+            columns = {name: column[index] for name, column in columns.items()}
+        return cls(products, columns, list(catalog.categories))
+
+    def __len__(self) -> int:
+        return len(self.sale_price)
+
+    def mask(
+        self,
+        max_price: Optional[int] = None,
+        min_price: Optional[int] = None,
+        in_stock: Optional[bool] = None,
+        category: Optional[str] = None,
+        min_discount: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        필터 조건을 만족하는 행의 불리언 마스크를 반환합니다.
+
+        Args:
+            max_price: 최대 판매가 (원, 이하)
+            min_price: 최소 판매가 (원, 이상)
+            in_stock: True면 재고 있는 제품만, False면 품절만
+            category: 카테고리 이름 (예: "스킨케어")
+            min_discount: 최소 할인율 (%)
+        """
+        result = np.ones(len(self), dtype=bool)
+        if max_price is not None:
+            result &= self.sale_price <= max_price
+        if min_price is not None:
+            result &= self.sale_price >= min_price
+        if in_stock is not None:
+            result &= self.in_stock == in_stock
+        if category is not None:
+            code = self._category_codes.get(category)
+            if code is None:
+                return np.zeros(len(self), dtype=bool)
+            result &= self.category == code
+        if min_discount is not None:
+            result &= self.discount_rate >= min_discount
+        return result
+
+    def top_k(
+        self,
+        k: int,
+        by: str = "discount_rate",
+        mask: Optional[np.ndarray] = None,
+        descending: bool = True,
+    ) -> np.ndarray:
+        """
+        정렬 기준 상위 k개 행 번호를 반환합니다.
+        전체 정렬 대신 argpartition(O(n)) 후 k개만 정렬합니다. 값이 같으면 원래 순서를 유지합니다.
+
+        Args:
+            k: 반환할 개수
+            by: 정렬 기준 컬럼 (discount_rate, sale_price, original_price)
+            mask: 필터 마스크 (None이면 전체)
+            descending: True면 큰 값부터
+        """
+        if by not in SORTABLE_FIELDS:
+            raise ValueError(f"Unsupported sort field: {by}")
+
+        candidates = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if k <= 0 or len(candidates) == 0:
+            return candidates[:0]
+
+        # (값, 행 번호)를 하나의 int64 키로 합쳐 동점일 때도 원래 순서를 유지
+        values = getattr(self, by)[candidates].astype(np.int64)
+        if descending:
+            values = -values
+        keys = values * len(self) + candidates
+
+        if k < len(candidates):
+            part = np.argpartition(keys, k - 1)[:k]
+        else:
+            part = np.arange(len(candidates))
+        return candidates[part[np.argsort(keys[part])]]
+
+    def select(self, rows: np.ndarray) -> List[Dict]:
+        """행 번호 배열을 제품 딕셔너리 목록으로 변환합니다."""
+        return [self.products[int(row)] for row in rows]
@@ -0,0 +1,234 @@
+"""
+시스템 프롬프트/few-shot 메시지 빌더
+카탈로그 스냅샷 버전과 언어별로 렌더링한 프롬프트를 세션 간에 재사용하고,
+리로드 시에는 내용이 바뀐 카테고리 섹션만 다시 포맷팅합니다.
+"""
+import threading
+import weakref
+from typing import Dict, List, Tuple
+
+from loguru import logger
+
+# 모든 세션이 공유하는 few-shot 예제 (불변, 세션마다 얕은 복사만)
+FEW_SHOT_MESSAGES: Tuple[Dict[str, str], ...] = (
+    # Few-shot 예제 1: 제품 추천
+    {
+        "role": "user",
+        "content": "인기 제품 추천해줘"
+    },
+    {
+        "role": "assistant",
+        "content": "토리든 다이브인 히알루론산 세럼과 달바 퍼스트 스프레이 세럼 추천드립니다. [PRODUCTS:A000000189261,A000000232724]"
+    },
+    # Few-shot 예제 2: 매장 정보
+    {
+        "role": "user",
+        "content": "매장 어디 있어?"
+    },
+    {
+        "role": "assistant",
+        "content": "서울 중구 명동길 53에 있습니다. 명동역 8번 출구로 나오시면 됩니다. [STORE:D176]"
+    },
+    # Few-shot 예제 3: 제품 추천 (다른 예시)
+    {
+        "role": "user",
+        "content": "스킨케어 제품 추천"
+    },
+    {
+        "role": "assistant",
+        "content": "에스트라 아토베리어 크림, 라로슈포제 시카플라스트, 웰라쥬 히알루로닉 앰플 추천드립니다. [PRODUCTS:A000000236338,A000000236101,A000000235247]"
+    },
+)
+
+
+# 세션 시작 인사말 (모든 세션 동일 - 공유 prefix 바로 뒤에 고정 위치로 추가)
+SESSION_GREETING = "안녕하세요! 올리브영 쇼핑 어시스턴트입니다. 매장 정보나 제품 추천이 필요하시면 말씀해 주세요."
+
+
+def _section_key(category_name: str, products) -> Tuple:
+    """카테고리 섹션 캐시 키 (프롬프트에 들어가는 필드만으로 구성)"""
+    return (category_name, tuple(
+        (p["product_id"], p["name"][:60], p["discount_rate"], p["sale_price"]) for p in products
+    ))
+
+
+def _render_section(key: Tuple) -> str:
+    """카테고리별 제품 목록 (ID 포함) - 할루시네이션 방지"""
+    category_name, rows = key
+    lines = [f"\n[{category_name}]"]
+    for product_id, name, discount_rate, sale_price in rows:
+        lines.append(f"  - [{product_id}] {name}... (할인 {discount_rate}%, {sale_price:,}원)")
+    return "\n".join(lines)
+
+
+class PromptBuilder:
+    """시스템 프롬프트 캐시
+
+    - 스냅샷별 완성 프롬프트: 스냅샷을 약한 참조 키로 보관 (리로드 전후 세션이 섞여도 서로 다시 만들지 않고,
+      더 이상 쓰지 않는 스냅샷은 프롬프트와 함께 해제), 안쪽 키는 언어
+    - 본문은 언어와 무관한 한국어 공통이므로 스냅샷당 한 번만 렌더링하고 언어별로 같은 문자열을 공유
+    - 카테고리 섹션: 내용 키별로 캐시해 리로드 시 바뀐 카테고리만 다시 포맷팅
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._prompts: "weakref.WeakKeyDictionary[object, Dict[str, str]]" = weakref.WeakKeyDictionary()
+        self._sections: Dict[Tuple, str] = {}
+        self.stats = {"prompt_hits": 0, "prompt_builds": 0, "section_hits": 0, "section_builds": 0}
+
+    def system_prompt(self, store_service, language: str = "ko") -> str:
+        """
+        카탈로그 스냅샷의 시스템 프롬프트를 반환합니다.
+
+        Args:
+            store_service: 카탈로그 스냅샷 (StoreService)
+            language: 세션 언어 (ko/en) - 현재 프롬프트 본문은 한국어 공통
+
+        Returns:
+            시스템 프롬프트 문자열 (같은 스냅샷이면 같은 객체)
+        """
+        by_language = self._prompts.get(store_service)
+        prompt = by_language.get(language) if by_language is not None else None
+        if prompt is not None:
+            self.stats["prompt_hits"] += 1
+            return prompt
+
+        with self._lock:
+            by_language = self._prompts.get(store_service)
+            if by_language is None:
+                by_language = self._prompts[store_service] = {}
+            prompt = by_language.get(language)
+            if prompt is not None:
+                self.stats["prompt_hits"] += 1
+                return prompt
+            if by_language:
+                # 본문이 언어와 무관하므로 이미 만든 프롬프트를 그대로 공유
+                prompt = next(iter(by_language.values()))
+                self.stats["prompt_hits"] += 1
+            else:
+                prompt = self._build(store_service)
+                self.stats["prompt_builds"] += 1
+                logger.info(f"📝 System prompt built (catalog version {store_service.version}, {len(prompt):,} chars)")
+            by_language[language] = prompt
+            return prompt
+
+    def shared_prefix(self, system_prompt: str) -> Tuple[Dict[str, str], ...]:
+        """
+        모든 세션이 공유하는 메시지 prefix (시스템 프롬프트 + few-shot 예제 + 인사말)
+        LLM 제공자의 prompt prefix 캐시가 적중하도록 바이트 단위로 동일한 내용을 항상 맨 앞에 둡니다.
+        """
+        return (
+            {"role": "system", "content": system_prompt},
+            *FEW_SHOT_MESSAGES,
+            {"role": "system", "content": SESSION_GREETING},
+        )
+
+    def initial_messages(self, system_prompt: str) -> List[Dict[str, str]]:
+        """세션용 메시지 목록 (공유 prefix 복사본). 세션별 대화는 이 뒤에만 추가됩니다."""
+        return [dict(m) for m in self.shared_prefix(system_prompt)]
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._prompts.clear()
+            self._sections.clear()
+
+    def _build(self, store_service) -> str:
+        # 매장 정보
+        main_store = store_service.data.get("store", {})
+        store_name = main_store.get("store_name", "")
+        store_address = main_store.get("address", "")
+        store_phone = main_store.get("phone", "")
+        subway_info = main_store.get("subway_info", "")
+
+        # 카테고리 섹션 (내용이 같으면 이전 렌더링 재사용)
+        categories = store_service.get_categories()
+        sections = {}
+        for category_name, category_products in categories.items():
+            key = _section_key(category_name, category_products)
+            section = self._sections.get(key)
+            if section is None:
+                section = _render_section(key)
+                self.stats["section_builds"] += 1
+            else:
+                self.stats["section_hits"] += 1
+            sections[key] = section
+        self._sections = sections  # 현재 카탈로그에 없는 섹션은 폐기
+
+        products_summary = "\n".join(sections.values())
+        categories_summary = ", ".join(categories.keys())
+
+        # 인근 매장 (5개만)
+        nearby_stores = store_service.data.get("nearby_stores", [])[:5]
+        nearby_summary = "\n".join([
+            f"- {store.get('name', '')}: {store.get('address', '')}"
+            for store in nearby_stores
+        ])
+
+        return f"""당신은 올리브영(Olive Young)의 친절한 AI 쇼핑 어시스턴트입니다.
+
+[역할]
+- 고객에게 올리브영 매장 정보를 안내합니다
+- 제품 추천과 쇼핑 관련 질문에 답변합니다
+- 항상 친절하고 전문적인 톤으로 응대합니다
+- 자연스러운 대화체를 사용합니다
+
+[메인 매장 정보]
+매장명: {store_name}
+매장ID: D176
+주소: {store_address}
+전화: {store_phone}
+지하철: {subway_info}
+
+[사용 가능한 모든 제품 - 이 제품들만 사용 가능!]
+{products_summary}
+
+**⚠️ 경고: 위의 제품 ID만 사용하세요! 임의로 제품 ID를 만들지 마세요!**
+**존재하지 않는 제품 ID를 사용하면 이미지가 표시되지 않습니다!**
+
+[제품 카테고리]
+{categories_summary}
+
+[인근 매장 (참고용)]
+{nearby_summary}
+
+[이미지 표시 규칙 - 절대 필수!]
+제품 추천 시 응답 마지막에 반드시 PRODUCTS 태그를 추가하세요.
+매장 정보 시 응답 마지막에 반드시 STORE 태그를 추가하세요.
+
+형식:
+- 제품: [PRODUCTS:제품ID1,제품ID2,제품ID3]
+- 매장: [STORE:D176]
+
+**반드시 위의 [사용 가능한 모든 제품] 목록에 있는 실제 제품 ID만 사용하세요!**
+
+예시:
+Q: "제품 추천해줘"
+A: "토리든 세럼과 달바 세럼 추천드립니다. [PRODUCTS:A000000189261,A000000232724]"
+
+Q: "스킨케어 추천"
+A: "에스트라 크림, 라로슈포제 시카플라스트 추천합니다. [PRODUCTS:A000000236338,A000000236101]"
+
+Q: "매장 위치 알려줘"
+A: "서울 중구 명동길 53에 있습니다. 명동역 8번 출구입니다. [STORE:D176]"
+
+[응대 가이드라인]
+1. 고객의 질문을 정확히 이해하고 관련 정보를 제공하세요
+2. 매장 위치를 물으면 주소와 지하철 정보를 안내하세요
+3. 영업시간, 전화번호 등 구체적인 정보를 명확히 전달하세요
+4. **제품 추천 시: 2-3개 소개 → 반드시 [PRODUCTS:ID1,ID2,ID3] 추가**
+5. **매장 정보 시: 주소 안내 → 반드시 [STORE:D176] 추가**
+6. **응답은 20-30초 이내로 매우 짧고 간결하게**
+   - 핵심 정보만 2-3문장
+   - 긴 설명 금지
+7. [PRODUCTS:...] [STORE:...] 태그는 음성으로 읽히지 않으므로 걱정하지 마세요
+
+[중요]
+- 실제로 존재하지 않는 매장이나 제품 정보를 만들어내지 마세요
+- 위에 명시된 정보만 사용하세요
+- 가격 정보는 참고용으로만 제공 (실시간 변경 가능)
+- 의료적 조언이나 진단은 하지 마세요"""
+
+
+# 프로세스 전역 프롬프트 캐시
+prompt_builder = PromptBuilder()
@@ -0,0 +1,124 @@
+"""
+카탈로그 레코드 (제품 / 매장)
+세션 간 공유되는 스냅샷의 제품·매장을 읽기 전용 slots dataclass로 보관합니다.
+
+- frozen: 속성 대입/항목 대입이 모두 TypeError (다른 세션의 카탈로그를 몰래 수정할 수 없음)
+- slots: 레코드마다 __dict__ 없이 고정 필드만 저장 (딕셔너리보다 메모리/속성 접근 비용이 작음)
+- Mapping 호환: 기존 코드의 p.get("name"), p["sale_price"], dict(p), {**p}가 그대로 동작
+  (값이 None인 필드는 JSON 원본에 없던 키로 취급, serialization.dumps도 같은 키만 출력)
+- 스키마에 없는 키는 읽기 전용 extra 매핑에 보관, 중첩 list/dict는 tuple/MappingProxyType으로 고정
+"""
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+_EMPTY: Mapping = MappingProxyType({})
+
+
+def freeze(value: Any) -> Any:
+    """JSON 값을 수정할 수 없는 형태로 변환합니다 (list → tuple, dict → MappingProxyType)."""
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    return value
+
+
+def _with_keys(cls):
+    """dataclass 필드 이름을 클래스 속성으로 미리 계산 (get/from_dict의 키 판별용)"""
+    cls._keys = frozenset(cls.__dataclass_fields__) - {"extra"}
+    return cls
+
+
+class _Record(Mapping):
+    """딕셔너리처럼 읽을 수 있는 레코드 공통 동작 (하위 클래스는 frozen slots dataclass)"""
+
+    __slots__ = ()
+    _keys: FrozenSet[str] = frozenset()  # extra를 제외한 필드 이름 (_with_keys가 채움)
+
+    @classmethod
+    def from_dict(cls, data: Mapping):
+        """JSON 딕셔너리에서 레코드를 만듭니다 (이미 레코드면 그대로 반환)."""
+        if isinstance(data, cls):
+            return data
+        values = {}
+        extra = {}
+        for key, value in data.items():
+            if key in cls._keys:
+                values[key] = freeze(value)
+            else:
+                extra[key] = freeze(value)
+        return cls(**values, extra=MappingProxyType(extra) if extra else _EMPTY)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._keys:
+            value = getattr(self, key)
+        else:
+            value = self.extra.get(key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+    def __iter__(self):
+        for name in self.__dataclass_fields__:
+            if name != "extra" and getattr(self, name) is not None:
+                yield name
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 원본과 같은 키의 새 딕셔너리 (복사본이므로 수정해도 카탈로그에 영향 없음)"""
+        return {key: self[key] for key in self}
+
+    def __json__(self) -> Dict[str, Any]:
+        """JSON 인코딩 훅 (serialization 백엔드 공통) - None 필드 없이 원본 JSON과 같은 키만"""
+        return self.to_dict()
+
+
+@_with_keys
+@dataclass(frozen=True, slots=True, eq=False)
+class Product(_Record):
+    """제품 레코드 (assistant_data.json products 항목)"""
+    product_id: Optional[str] = None
+    name: Optional[str] = None
+    image_url: Optional[str] = None
+    original_price: Optional[int] = None
+    discount_rate: Optional[int] = None
+    sale_price: Optional[int] = None
+    stock_info: Optional[str] = None
+    stock_status: Optional[str] = None
+    extra: Mapping = field(default_factory=lambda: _EMPTY, repr=False)
+
+
+@_with_keys
+@dataclass(frozen=True, slots=True, eq=False)
+class Store(_Record):
+    """매장 레코드 (메인 매장은 store_name/business_hours, 인근 매장은 name/hours/status 사용)"""
+    store_id: Optional[str] = None
+    name: Optional[str] = None
+    store_name: Optional[str] = None
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    status: Optional[str] = None
+    hours: Any = None
+    business_hours: Optional[Mapping] = None
+    subway_info: Optional[str] = None
+    services: Optional[Tuple[str, ...]] = None
+    gift_services: Optional[Tuple[str, ...]] = None
+    store_images: Optional[Tuple[str, ...]] = None
+    image: Optional[str] = None
+    description: Optional[str] = None
+    nearby_landmarks: Optional[Tuple[str, ...]] = None
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    extra: Mapping = field(default_factory=lambda: _EMPTY, repr=False)
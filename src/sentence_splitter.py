@@ -0,0 +1,98 @@
+"""
+스트리밍 문장 분리기
+LLM 토큰 스트림을 한국어/영어 문장 경계에서 잘라 완성된 문장부터 내보내고,
+[PRODUCTS:...] / [STORE:...] 태그는 음성 텍스트에서 분리합니다.
+"""
+import re
+from typing import List, Tuple
+
+# 음성으로 읽지 않는 응답 태그
+TAG_NAMES = ("PRODUCTS:", "STORE:")
+
+# 닫는 괄호 없이 이 길이를 넘으면 태그가 아닌 일반 텍스트로 취급
+MAX_TAG_LENGTH = 256
+
+# 문장 끝: 마침표/물음표/느낌표/말줄임표 뒤 공백, 또는 줄바꿈
+_BOUNDARY = re.compile(r"(?<=[.!?。！？…])\s+|\n+")
+
+SPEECH = "speech"
+TAG = "tag"
+
+
+def _could_be_tag(rest: str) -> bool:
+    """'[' 뒤 텍스트가 태그(의 앞부분)일 수 있는지"""
+    return any(name.startswith(rest) or rest.startswith(name) for name in TAG_NAMES)
+
+
+class SentenceSplitter:
+    """응답 하나의 텍스트 스트림을 문장/태그 조각으로 나눕니다.
+
+    - 문장은 경계(문장부호 + 공백)가 확인되는 즉시 내보냄 (뒤따르는 공백 포함)
+    - '['는 태그인지 판단할 수 있을 때까지만 보류 (태그가 아니면 바로 일반 텍스트)
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._scan_from = 0  # 태그가 아닌 것으로 확인된 '[' 이후부터 검색
+
+    def reset(self):
+        self._buffer = ""
+        self._scan_from = 0
+
+    def feed(self, text: str) -> List[Tuple[str, str]]:
+        """
+        토큰을 추가하고 완성된 조각을 반환합니다.
+
+        Returns:
+            (종류, 텍스트) 목록 - 종류는 SPEECH(음성 문장) 또는 TAG(태그 원문)
+        """
+        self._buffer += text
+        return self._drain(final=False)
+
+    def flush(self) -> List[Tuple[str, str]]:
+        """응답 끝: 남은 텍스트를 문장으로 내보냅니다 (닫히지 않은 태그 조각은 버림)."""
+        pieces = self._drain(final=True)
+        self.reset()
+        return pieces
+
+    def _drain(self, final: bool) -> List[Tuple[str, str]]:
+        pieces: List[Tuple[str, str]] = []
+        hold = len(self._buffer)  # 이 위치부터는 태그 판단 전이라 보류
+
+        while True:
+            start = self._buffer.find("[", self._scan_from)
+            if start < 0:
+                break
+            rest = self._buffer[start + 1:]
+            if not _could_be_tag(rest[:max(len(name) for name in TAG_NAMES)]):
+                self._scan_from = start + 1  # 일반 텍스트의 '['
+                continue
+            end = self._buffer.find("]", start)
+            if end < 0:
+                if final:
+                    self._buffer = self._buffer[:start]  # 닫히지 않은 태그 조각
+                elif len(rest) > MAX_TAG_LENGTH:
+                    self._scan_from = start + 1
+                    continue
+                else:
+                    hold = start
+                break
+            pieces.append((TAG, self._buffer[start:end + 1]))
+            self._buffer = self._buffer[:start] + self._buffer[end + 1:]
+            self._scan_from = start
+
+        hold = min(hold, len(self._buffer))
+        speech = self._buffer[:hold]
+        cut = 0
+        for match in _BOUNDARY.finditer(speech):
+            sentence = speech[cut:match.end()]
+            if sentence.strip():
+                pieces.append((SPEECH, sentence))
+            cut = match.end()
+        if final and speech[cut:].strip():
+            pieces.append((SPEECH, speech[cut:]))
+            cut = len(speech)
+
+        self._buffer = self._buffer[cut:]
+        self._scan_from = max(0, self._scan_from - cut)
+        return pieces
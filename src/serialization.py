@@ -0,0 +1,193 @@
+"""
+JSON 직렬화 백엔드
+설치된 가장 빠른 백엔드(orjson → msgspec → 표준 json)를 사용합니다.
+모든 백엔드는 같은 형식(UTF-8 그대로, 공백 없는 구분자)으로 출력하고, 디코드 실패는 ValueError로 올립니다.
+
+JSON_BACKEND 환경 변수로 백엔드를 고정할 수 있습니다 (orjson / msgspec / json).
+"""
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # 선택 의존성
+    msgspec = None
+
+# 모든 백엔드의 디코드 오류는 ValueError 하위 클래스 (json.JSONDecodeError, orjson.JSONDecodeError, msgspec.DecodeError)
+DecodeError = ValueError
+
+
+def _default(obj):
+    """기본 타입이 아닌 값 변환 (__json__ 훅, dataclass, MappingProxyType 같은 Mapping, NumPy 스칼라)"""
+    hook = getattr(type(obj), "__json__", None)
+    if hook is not None:
+        # 카탈로그 레코드: 선언된 필드 전체가 아니라 원본 JSON과 같은 키만 (records._Record.__json__)
+        return hook(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # orjson/msgspec의 기본 dataclass 인코딩과 같은 형태 (선언된 필드 전체)
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class Codec(NamedTuple):
+    name: str
+    dumps: Callable[[Any], str]          # JSON 문자열 (WebSocket 텍스트 프레임용)
+    dumps_bytes: Callable[[Any], bytes]  # UTF-8 바이트 (파일/바이너리 전송용)
+    loads: Callable[[Union[str, bytes, bytearray, memoryview]], Any]
+
+
+def _json_codec() -> Codec:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+    decoder = json.JSONDecoder()
+
+    def loads(data):
+        if not isinstance(data, str):
+            data = bytes(data).decode("utf-8")
+        return decoder.decode(data)
+
+    return Codec("json", encoder.encode, lambda obj: encoder.encode(obj).encode("utf-8"), loads)
+
+
+def _orjson_codec() -> Codec:
+    # dataclass는 기본 인코딩 대신 _default로 (레코드의 __json__ 훅 적용)
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps_bytes(obj):
+        return orjson.dumps(obj, default=_default, option=options)
+
+    return Codec("orjson", lambda obj: dumps_bytes(obj).decode("utf-8"), dumps_bytes, orjson.loads)
+
+
+def _with_json_hooks(obj):
+    """__json__ 훅이 있는 값을 미리 변환 (msgspec은 dataclass를 enc_hook 없이 직접 인코딩하므로)"""
+    if isinstance(obj, dict):
+        return {key: _with_json_hooks(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_with_json_hooks(value) for value in obj]
+    hook = getattr(type(obj), "__json__", None)
+    if hook is not None:
+        return _with_json_hooks(hook(obj))
+    return obj
+
+
+def _msgspec_codec() -> Codec:
+    encoder = msgspec.json.Encoder(enc_hook=_default)
+    decoder = msgspec.json.Decoder()
+
+    def dumps_bytes(obj):
+        return encoder.encode(_with_json_hooks(obj))
+
+    return Codec("msgspec", lambda obj: dumps_bytes(obj).decode("utf-8"), dumps_bytes, decoder.decode)
+
+
+_FACTORIES = {"orjson": (orjson, _orjson_codec), "msgspec": (msgspec, _msgspec_codec), "json": (json, _json_codec)}
+
+
+def available_backends() -> List[str]:
+    """설치된 백엔드 (빠른 순)"""
+    return [name for name, (module, _) in _FACTORIES.items() if module is not None]
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """
+    백엔드 코덱을 반환합니다.
+
+    Args:
+        name: 백엔드 이름 (None이면 설치된 것 중 가장 빠른 것)
+    """
+    backends = available_backends()
+    if name is None or name not in backends:
+        name = backends[0]
+    return _FACTORIES[name][1]()
+
+
+_codec = get_codec(os.getenv("JSON_BACKEND"))
+BACKEND = _codec.name
+dumps = _codec.dumps
+dumps_bytes = _codec.dumps_bytes
+loads = _codec.loads
+
+
+# ----- ElevenLabs Scribe Realtime 수신 메시지 -----
+
+@dataclass(slots=True)
+class ScribeWord:
+    """타임스탬프 전사의 단어 (start/end는 밀리초)"""
+    text: str = ""
+    start: Optional[float] = None
+    end: Optional[float] = None
+    type: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ScribeMessage:
+    """Scribe 수신 메시지 (정상 메시지는 type, 에러 메시지는 message_type 필드 사용, 모르는 필드는 무시)"""
+    type: Optional[str] = None
+    message_type: Optional[str] = None
+    text: str = ""
+    session_id: str = ""
+    config: Optional[Dict[str, Any]] = None
+    words: Optional[List[ScribeWord]] = None
+    error: Union[str, Dict[str, Any], None] = None
+    session: Optional[Dict[str, Any]] = None
+
+    @property
+    def kind(self) -> Optional[str]:
+        return self.type or self.message_type
+
+    @property
+    def error_message(self) -> Optional[str]:
+        """에러 메시지 텍스트 (error가 문자열이거나 {"message": ...} 객체)"""
+        if isinstance(self.error, dict):
+            return self.error.get("message")
+        return self.error
+
+    @property
+    def error_type(self) -> str:
+        return self.error.get("type", "unknown") if isinstance(self.error, dict) else "unknown"
+
+
+_SCRIBE_FIELDS = set(ScribeMessage.__dataclass_fields__)
+_WORD_FIELDS = set(ScribeWord.__dataclass_fields__)
+_STRING_FIELDS = ("type", "message_type", "text", "session_id")
+
+
+def _scribe_from_dict(data: Dict[str, Any]) -> ScribeMessage:
+    """표준 json 백엔드용: dict → ScribeMessage (msgspec 디코더와 같은 기본 타입 검증)"""
+    if not isinstance(data, dict):
+        raise DecodeError(f"Expected a JSON object, got {type(data).__name__}")
+    fields = {key: value for key, value in data.items() if key in _SCRIBE_FIELDS}
+    for key in _STRING_FIELDS:
+        if key in fields and fields[key] is not None and not isinstance(fields[key], str):
+            raise DecodeError(f"Expected `str` at `$.{key}`, got {type(fields[key]).__name__}")
+    words = fields.get("words")
+    if words is not None:
+        if not isinstance(words, list) or not all(isinstance(word, dict) for word in words):
+            raise DecodeError("Expected an array of objects at `$.words`")
+        fields["words"] = [ScribeWord(**{k: v for k, v in word.items() if k in _WORD_FIELDS}) for word in words]
+    return ScribeMessage(**fields)
+
+
+if msgspec is not None:
+    # 스키마를 아는 디코더: 중간 dict 없이 바로 dataclass로 (타입 검증 포함)
+    _scribe_decoder = msgspec.json.Decoder(ScribeMessage)
+
+    def decode_scribe_message(raw: Union[str, bytes]) -> ScribeMessage:
+        """Scribe WebSocket 메시지를 디코드합니다 (JSON/스키마 오류는 ValueError)."""
+        return _scribe_decoder.decode(raw)
+else:
+    def decode_scribe_message(raw: Union[str, bytes]) -> ScribeMessage:
+        """Scribe WebSocket 메시지를 디코드합니다 (JSON/스키마 오류는 ValueError)."""
+        return _scribe_from_dict(loads(raw))
@@ -3,26 +3,90 @@ FastAPI 서버 - Daily.co 룸 생성 및 봇 관리
 """
 import os
 import asyncio
-from typing import Optional
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Optional, Type
 from datetime import datetime, timedelta
 
 import aiohttp
-from fastapi import FastAPI, HTTPException, WebSocket
+from fastapi import FastAPI, HTTPException, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, HTMLResponse
-from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import json
 from loguru import logger
 from dotenv import load_dotenv
 
-from .bot import OliveYoungVoiceBot
 from . import websocket_manager
+from .session_registry import SessionRejectedError, session_registry
+from .static_assets import CachedStaticFiles, web_ui
+from .store_service import get_store_service, reload_store_service_async, watch_store_data
+
+if TYPE_CHECKING:
+    from .bot import OliveYoungVoiceBot
 
 # 환경 변수 로드
 load_dotenv()
 
-app = FastAPI(title="올리브영 음성 쇼핑 어시스턴트 API")
+# 서버 종료 시 진행 중인 봇 세션 대기 시간 (초)
+BOT_DRAIN_TIMEOUT = float(os.getenv("BOT_DRAIN_TIMEOUT", "30"))
+
+# 카탈로그 파일 변경 확인 주기 (초, 0이면 감시 끔)
+CATALOG_WATCH_INTERVAL = float(os.getenv("CATALOG_WATCH_INTERVAL", "5"))
+
+# 서버 시작 직후 봇 모듈(pipecat, Silero 등)을 백그라운드에서 미리 로드할지 여부
+# (봇을 실행하는 워커는 켜서 첫 세션 지연을 없애고, HTML/헬스체크만 서빙하는 워커는 꺼서 메모리 절약)
+BOT_PRELOAD = os.getenv("BOT_PRELOAD", "false").lower() in ("1", "true", "yes")
+
+_bot_class: Optional[Type["OliveYoungVoiceBot"]] = None
+_bot_class_lock = threading.Lock()
+
+
+def _import_bot_class() -> Type["OliveYoungVoiceBot"]:
+    """봇 모듈을 임포트하고 VAD 풀을 준비합니다 (수 초 걸리는 무거운 작업 - 처음 한 번만).
+    미리 로드와 첫 /api/start가 동시에 불러도 한 스레드만 로드하고 나머지는 기다립니다."""
+    global _bot_class
+    if _bot_class is not None:
+        return _bot_class
+    with _bot_class_lock:
+        if _bot_class is not None:
+            return _bot_class
+        started = time.perf_counter()
+        from .bot import OliveYoungVoiceBot
+        from .tts_cache import get_tts_cache
+        from .vad_pool import vad_pool
+        vad_pool.warm()  # Silero 모델 로드 + 분석기 풀 채우기
+        get_tts_cache()  # TTS 캐시 디스크 색인 읽기 (첫 세션이 이벤트 루프에서 읽지 않도록)
+        _bot_class = OliveYoungVoiceBot
+        logger.info(f"🤖 Bot module loaded in {time.perf_counter() - started:.2f}s")
+    return _bot_class
+
+
+async def load_bot_class() -> Type["OliveYoungVoiceBot"]:
+    """봇 클래스 (첫 호출 시 이벤트 루프를 막지 않도록 스레드에서 임포트)"""
+    if _bot_class is not None:
+        return _bot_class
+    return await asyncio.to_thread(_import_bot_class)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 수명 주기 - 시작 시 카탈로그 로드/감시, 종료 시 진행 중인 대화를 graceful drain"""
+    get_store_service()
+    watcher = None
+    if CATALOG_WATCH_INTERVAL > 0:
+        watcher = asyncio.create_task(watch_store_data(CATALOG_WATCH_INTERVAL))
+    preload = asyncio.create_task(load_bot_class()) if BOT_PRELOAD else None
+    yield
+    if watcher:
+        watcher.cancel()
+    if preload and not preload.done():
+        await asyncio.gather(preload, return_exceptions=True)
+    await session_registry.drain(timeout=BOT_DRAIN_TIMEOUT)
+
+
+app = FastAPI(title="올리브영 음성 쇼핑 어시스턴트 API", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -33,8 +97,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 정적 파일 서빙 (지도 이미지 등)
-app.mount("/data", StaticFiles(directory="data"), name="data")
+# 정적 파일 서빙 (지도 이미지 등, 내용 해시 ETag + 버전 URL은 immutable 캐시)
+app.mount("/data", CachedStaticFiles(directory="data"), name="data")
 
 # Daily API 설정
 DAILY_API_KEY = os.getenv("DAILY_API_KEY")
@@ -130,1121 +194,18 @@ async def create_daily_room(duration_minutes: int = 30) -> dict:
 
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
-    """루트 페이지 - 웹 인터페이스"""
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>올리브영 음성 쇼핑 어시스턴트</title>
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            
-            body {
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                padding: 20px;
-            }
-            
-            .container {
-                background: white;
-                padding: 40px;
-                border-radius: 20px;
-                box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                max-width: 800px;
-                width: 100%;
-            }
-            
-            h1 {
-                color: #333;
-                text-align: center;
-                margin-bottom: 10px;
-                font-size: 2em;
-            }
-            
-            .subtitle {
-                text-align: center;
-                color: #666;
-                margin-bottom: 30px;
-                font-size: 1.1em;
-            }
-            
-            .status {
-                padding: 15px;
-                margin: 20px 0;
-                border-radius: 10px;
-                text-align: center;
-                font-weight: 500;
-                display: none;
-            }
-            
-            .status.info {
-                background: #d1ecf1;
-                color: #0c5460;
-                border: 1px solid #bee5eb;
-            }
-            
-            .status.success {
-                background: #d4edda;
-                color: #155724;
-                border: 1px solid #c3e6cb;
-            }
-            
-            .status.error {
-                background: #f8d7da;
-                color: #721c24;
-                border: 1px solid #f5c6cb;
-            }
-            
-            .btn {
-                display: block;
-                width: 100%;
-                padding: 18px;
-                background: #667eea;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-size: 18px;
-                font-weight: 600;
-                cursor: pointer;
-                transition: all 0.3s;
-                margin: 10px 0;
-            }
-            
-            .btn:hover:not(:disabled) {
-                background: #5568d3;
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-            }
-            
-            .btn:disabled {
-                background: #ccc;
-                cursor: not-allowed;
-                transform: none;
-            }
-            
-            #videoContainer {
-                margin: 20px 0;
-                display: none;
-            }
-            
-            .feature-list {
-                list-style: none;
-                padding: 0;
-                margin: 30px 0 20px 0;
-            }
-            
-            .feature-list li {
-                padding: 12px 15px;
-                margin: 8px 0;
-                background: #f8f9fa;
-                border-radius: 8px;
-                border-left: 4px solid #667eea;
-                transition: all 0.3s;
-            }
-            
-            .feature-list li:hover {
-                transform: translateX(5px);
-                background: #e9ecef;
-            }
-            
-            .feature-list li:before {
-                content: "✓ ";
-                color: #667eea;
-                font-weight: bold;
-                margin-right: 10px;
-            }
-            
-            .example-questions {
-                background: #f0f4ff;
-                padding: 20px;
-                border-radius: 10px;
-                margin-top: 20px;
-            }
-            
-            .example-questions h3 {
-                color: #667eea;
-                margin-bottom: 15px;
-            }
-            
-            .example-questions ul {
-                list-style: none;
-                padding: 0;
-            }
-            
-            .example-questions li {
-                padding: 10px;
-                margin: 5px 0;
-                background: white;
-                border-radius: 5px;
-                color: #495057;
-            }
-            
-            .example-questions li:before {
-                content: "💬 ";
-                margin-right: 8px;
-            }
-            
-            /* Face Detection Status */
-            .face-status {
-                position: fixed;
-                top: 20px;
-                right: 20px;
-                display: none;
-                align-items: center;
-                background: white;
-                padding: 12px 20px;
-                border-radius: 30px;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-                z-index: 1000;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            
-            .face-status.active {
-                display: flex;
-            }
-            
-            .face-status-icon {
-                width: 12px;
-                height: 12px;
-                border-radius: 50%;
-                margin-right: 10px;
-                animation: pulse 2s infinite;
-            }
-            
-            .face-status-icon.green {
-                background: #28a745;
-                box-shadow: 0 0 10px rgba(40, 167, 69, 0.5);
-            }
-            
-            .face-status-icon.red {
-                background: #dc3545;
-                box-shadow: 0 0 10px rgba(220, 53, 69, 0.5);
-            }
-            
-            @keyframes pulse {
-                0%, 100% { opacity: 1; }
-                50% { opacity: 0.6; }
-            }
-            
-            .face-status-text {
-                color: #495057;
-            }
-            
-            /* Image Popup Modal */
-            .image-modal {
-                display: none;
-                position: fixed;
-                z-index: 2000;
-                left: 0;
-                top: 0;
-                width: 100%;
-                height: 100%;
-                background-color: rgba(0, 0, 0, 0.8);
-                animation: fadeIn 0.3s;
-            }
-            
-            .image-modal.active {
-                display: flex;
-                align-items: center;
-                justify-content: center;
-            }
-            
-            .image-modal-content {
-                background: white;
-                padding: 30px;
-                border-radius: 15px;
-                max-width: 90%;
-                max-height: 90%;
-                overflow-y: auto;
-                position: relative;
-            }
-            
-            .image-modal-close {
-                position: absolute;
-                top: 15px;
-                right: 15px;
-                font-size: 30px;
-                font-weight: bold;
-                color: #999;
-                cursor: pointer;
-                background: none;
-                border: none;
-                width: 40px;
-                height: 40px;
-                border-radius: 50%;
-                transition: all 0.3s;
-            }
-            
-            .image-modal-close:hover {
-                background: #f0f0f0;
-                color: #333;
-            }
-            
-            .product-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                gap: 20px;
-                margin-top: 20px;
-            }
-            
-            .product-card {
-                border: 1px solid #e0e0e0;
-                border-radius: 10px;
-                overflow: hidden;
-                transition: transform 0.3s, box-shadow 0.3s, border-color 0.3s;
-                cursor: pointer;
-            }
-            
-            .product-card:hover {
-                transform: translateY(-5px);
-                box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);
-                border-color: #667eea;
-            }
-            
-            .product-card:active {
-                transform: translateY(-3px);
-            }
-            
-            .product-image {
-                width: 100%;
-                height: 250px;
-                object-fit: cover;
-                background: #f8f8f8;
-            }
-            
-            .product-info {
-                padding: 15px;
-            }
-            
-            .product-name {
-                font-size: 14px;
-                color: #333;
-                margin-bottom: 10px;
-                min-height: 40px;
-                display: -webkit-box;
-                -webkit-line-clamp: 2;
-                -webkit-box-orient: vertical;
-                overflow: hidden;
-            }
-            
-            .product-price {
-                display: flex;
-                align-items: center;
-                gap: 10px;
-            }
-            
-            .discount-badge {
-                background: #ff4757;
-                color: white;
-                padding: 4px 8px;
-                border-radius: 5px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            
-            .sale-price {
-                font-size: 18px;
-                font-weight: bold;
-                color: #667eea;
-            }
-            
-            .store-image-container {
-                text-align: center;
-            }
-            
-            .store-image {
-                max-width: 100%;
-                max-height: 500px;
-                border-radius: 10px;
-                margin: 20px 0;
-            }
-            
-            .store-info-text {
-                margin-top: 15px;
-                color: #666;
-                line-height: 1.6;
-            }
-            
-            @keyframes fadeIn {
-                from { opacity: 0; }
-                to { opacity: 1; }
-            }
-        </style>
-    </head>
-    <body>
-        <!-- Face Detection Status Indicator -->
-        <div id="faceStatus" class="face-status">
-            <div id="faceStatusIcon" class="face-status-icon red"></div>
-            <span id="faceStatusText" class="face-status-text">카메라 대기중...</span>
-        </div>
-        
-        <!-- Image Modal -->
-        <div id="imageModal" class="image-modal">
-            <div class="image-modal-content">
-                <button class="image-modal-close" onclick="closeImageModal()">&times;</button>
-                <div id="imageModalBody"></div>
-            </div>
-        </div>
-        
-        <div class="container">
-            <h1>🛍️ 올리브영 음성 쇼핑 어시스턴트</h1>
-            <p class="subtitle">AI 음성 봇과 대화하며 매장 정보를 확인하세요</p>
-            
-            <div id="status" class="status"></div>
-            
-            <!-- 언어 선택 -->
-            <div style="margin: 20px 0; text-align: center;">
-                <label style="font-size: 16px; margin-right: 10px;">🌐 언어 선택:</label>
-                <label style="margin-right: 20px;">
-                    <input type="radio" name="language" value="ko" checked> 한국어
-                </label>
-                <label>
-                    <input type="radio" name="language" value="en"> English
-                </label>
-            </div>
-            
-            <!-- STT 프로바이더 선택 -->
-            <div style="margin: 20px 0; text-align: center; padding: 15px; background: #f8f9fa; border-radius: 10px;">
-                <label style="font-size: 16px; margin-right: 10px; display: block; margin-bottom: 10px;">🎙️ 음성 인식 엔진 선택:</label>
-                <div style="display: flex; justify-content: center; gap: 20px;">
-                    <label style="cursor: pointer; padding: 10px 20px; border: 2px solid #667eea; border-radius: 8px; background: white; transition: all 0.3s;">
-                        <input type="radio" name="stt_provider" value="elevenlabs" checked style="margin-right: 8px;">
-                        <span style="font-weight: 500;">ElevenLabs Scribe</span>
-                        <div style="font-size: 12px; color: #666; margin-top: 5px;">초저지연 실시간</div>
-                    </label>
-                    <label style="cursor: pointer; padding: 10px 20px; border: 2px solid #e9ecef; border-radius: 8px; background: white; transition: all 0.3s;">
-                        <input type="radio" name="stt_provider" value="whisper" style="margin-right: 8px;">
-                        <span style="font-weight: 500;">OpenAI Whisper</span>
-                        <div style="font-size: 12px; color: #666; margin-top: 5px;">고정밀 전사</div>
-                    </label>
-                </div>
-            </div>
-            
-            <style>
-                input[type="radio"][name="stt_provider"]:checked + span {
-                    color: #667eea;
-                    font-weight: 600;
-                }
-                label:has(input[type="radio"][name="stt_provider"]:checked) {
-                    border-color: #667eea !important;
-                    background: #f0f4ff !important;
-                }
-                label:has(input[type="radio"][name="stt_provider"]):hover {
-                    border-color: #667eea;
-                    transform: translateY(-2px);
-                    box-shadow: 0 4px 12px rgba(102, 126, 234, 0.2);
-                }
-            </style>
-            
-            <button id="startBtn" class="btn" onclick="startConversation()">
-                🎙️ 대화 시작하기
-            </button>
-            
-            <button class="btn" onclick="testImagePopup()" style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); margin-top: 10px;">
-                🖼️ 이미지 팝업 테스트
-            </button>
-            
-            <div id="videoContainer"></div>
-            
-            <div id="chatContainer" class="chat-container">
-                <h3 style="margin: 0 0 15px 0; color: #667eea;">💬 대화 내역</h3>
-                <div id="chatHistory"></div>
-            </div>
-            
-            <h3 style="margin-top: 30px; color: #333;">주요 기능</h3>
-            <ul class="feature-list">
-                <li>실시간 음성 대화</li>
-                <li>올리브영 매장 위치 및 정보 안내</li>
-                <li>영업시간 및 연락처 제공</li>
-                <li>인기 제품 추천</li>
-                <li>교통 정보 및 주변 랜드마크 안내</li>
-            </ul>
-            
-            <div class="example-questions">
-                <h3>질문 예시</h3>
-                <ul>
-                    <li>"강남역 근처 올리브영 어디 있어요?"</li>
-                    <li>"명동점 영업시간 알려주세요"</li>
-                    <li>"인기 있는 제품 추천해주세요"</li>
-                    <li>"홍대 매장에서 피부 진단 서비스 있나요?"</li>
-                </ul>
-            </div>
-        </div>
-        
-        <script src="https://unpkg.com/@daily-co/daily-js"></script>
-        <script defer src="https://cdn.jsdelivr.net/npm/@tensorflow/tfjs"></script>
-        <script defer src="https://cdn.jsdelivr.net/npm/@tensorflow-models/blazeface"></script>
-        <script>
-            let callFrame = null;
-            let faceDetectionActive = false;
-            let isFacingForward = false;
-            let faceDetectionInterval = null;
-            let inactivityTimer = null;
-            const INACTIVITY_TIMEOUT = 5 * 60 * 1000; // 5분 (밀리초)
-            
-            function showStatus(message, type) {
-                const status = document.getElementById('status');
-                status.textContent = message;
-                status.className = 'status ' + type;
-                status.style.display = 'block';
-            }
-            
-            function addChatMessage(speaker, message) {
-                const chatHistory = document.getElementById('chatHistory');
-                
-                const messageDiv = document.createElement('div');
-                messageDiv.className = `chat-message ${speaker}`;
-                
-                const now = new Date();
-                const timeString = now.toLocaleTimeString('ko-KR', { hour: '2-digit', minute: '2-digit' });
-                
-                messageDiv.innerHTML = `
-                    <div class="speaker">${speaker === 'user' ? '👤 나' : '🤖 어시스턴트'}</div>
-                    <div>${message}</div>
-                    <div class="timestamp">${timeString}</div>
-                `;
-                
-                chatHistory.appendChild(messageDiv);
-                
-                // 스크롤을 맨 아래로
-                chatHistory.scrollTop = chatHistory.scrollHeight;
-            }
-            
-            function clearChat() {
-                const chatHistory = document.getElementById('chatHistory');
-                chatHistory.innerHTML = '';
-            }
-            
-            // Image Modal Functions
-            function showProductImages(products) {
-                const modal = document.getElementById('imageModal');
-                const modalBody = document.getElementById('imageModalBody');
-                
-                let html = '<h2 style="margin-bottom: 20px; color: #667eea;">🛍️ 추천 제품 <span style="font-size: 14px; color: #999;">(클릭하면 매장 내 위치 확인)</span></h2>';
-                html += '<div class="product-grid">';
-                
-                products.forEach((product, index) => {
-                    const category = product.category || '기타';
-                    const mapImage = getCategoryMapImage(category);
-                    
-                    html += `
-                        <div class="product-card" onclick="showLocationMap('${mapImage}', '${product.name}', '${category}')" style="cursor: pointer;">
-                            <img src="${product.image_url}" alt="${product.name}" class="product-image" 
-                                 onerror="this.src='https://via.placeholder.com/250x250?text=No+Image'">
-                            <div class="product-info">
-                                <div class="product-name">${product.name}</div>
-                                <div class="product-price">
-                                    ${product.discount_rate ? `<span class="discount-badge">${product.discount_rate}%</span>` : ''}
-                                    ${product.sale_price ? `<span class="sale-price">${product.sale_price.toLocaleString()}원</span>` : ''}
-                                </div>
-                                <div style="margin-top: 10px; font-size: 12px; color: #667eea;">
-                                    📍 ${category} 섹션
-                                </div>
-                            </div>
-                        </div>
-                    `;
-                });
-                
-                html += '</div>';
-                modalBody.innerHTML = html;
-                modal.classList.add('active');
-                
-                console.log('✅ Product images displayed:', products.length);
-            }
-            
-            function getCategoryMapImage(category) {
-                // 카테고리별 지도 이미지 매핑
-                const mapImages = {
-                    '스킨케어': '/data/skincare.png',
-                    '클렌징': '/data/cleansing.png',
-                    '기타': '/data/skincare.png'  // 기본값
-                };
-                return mapImages[category] || '/data/skincare.png';
-            }
-            
-            function showLocationMap(mapImageUrl, productName, category) {
-                const modal = document.getElementById('imageModal');
-                const modalBody = document.getElementById('imageModalBody');
-                
-                let html = `
-                    <div style="text-align: center;">
-                        <h2 style="margin-bottom: 20px; color: #667eea;">📍 매장 내 위치</h2>
-                        <p style="font-size: 16px; margin-bottom: 10px; color: #333;">${productName}</p>
-                        <p style="font-size: 14px; margin-bottom: 20px; color: #666;">${category} 섹션</p>
-                        <img src="${mapImageUrl}" alt="매장 지도" style="max-width: 100%; border-radius: 10px; box-shadow: 0 4px 12px rgba(0,0,0,0.1);"
-                             onerror="this.src='https://via.placeholder.com/600x400?text=지도+이미지+없음'">
-                        <p style="margin-top: 20px; color: #999; font-size: 12px;">
-                            💡 팁: 뒤로가기를 눌러 제품 목록으로 돌아가세요
-                        </p>
-                    </div>
-                `;
-                
-                modalBody.innerHTML = html;
-                modal.classList.add('active');
-                
-                console.log('🗺️ Location map displayed:', productName, category);
-            }
-            
-            function showStoreImage(storeData) {
-                const modal = document.getElementById('imageModal');
-                const modalBody = document.getElementById('imageModalBody');
-                
-                let html = `
-                    <div class="store-image-container">
-                        <h2 style="margin-bottom: 20px; color: #667eea;">🏪 ${storeData.store_name}</h2>
-                        <img src="${storeData.image_url}" alt="${storeData.store_name}" class="store-image"
-                             onerror="this.src='https://via.placeholder.com/600x400?text=No+Image'">
-                        <div class="store-info-text">
-                            <p><strong>📍 주소:</strong> ${storeData.address || ''}</p>
-                        </div>
-                    </div>
-                `;
-                
-                modalBody.innerHTML = html;
-                modal.classList.add('active');
-                
-                console.log('✅ Store image displayed:', storeData.store_name);
-            }
-            
-            function closeImageModal() {
-                const modal = document.getElementById('imageModal');
-                modal.classList.remove('active');
-            }
-            
-            // Close modal on background click
-            document.addEventListener('DOMContentLoaded', () => {
-                const modal = document.getElementById('imageModal');
-                modal.addEventListener('click', (e) => {
-                    if (e.target === modal) {
-                        closeImageModal();
-                    }
-                });
-            });
-            
-            // Test Image Popup (직접 표시)
-            async function testImagePopup() {
-                try {
-                    console.log('🧪 Testing image popup...');
-                    
-                    // 샘플 제품 데이터 (카테고리 포함)
-                    const sampleProducts = [
-                        {
-                            name: "[11월 올영픽] 에스트라 아토베리어365 크림 80ml 더블 기획",
-                            image_url: "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/10/0000/0023/A00000023633808ko.jpg?l=ko&rs=800x0",
-                            sale_price: 44500,
-                            discount_rate: 25,
-                            category: "스킨케어"
-                        },
-                        {
-                            name: "[속보습세럼] 토리든 다이브인 저분자 히알루론산 세럼 50ml",
-                            image_url: "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/10/0000/0018/A00000018926132ko.jpg?l=ko&rs=800x0",
-                            sale_price: 25650,
-                            discount_rate: 28,
-                            category: "스킨케어"
-                        },
-                        {
-                            name: "[11월 올영픽] 라로슈포제 시카플라스트 밤 B5+ 100ml",
-                            image_url: "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/10/0000/0023/A00000023609906ko.jpg?l=ko&rs=800x0",
-                            sale_price: 30000,
-                            discount_rate: 25,
-                            category: "클렌징"
-                        }
-                    ];
-                    
-                    showProductImages(sampleProducts);
-                    console.log('✅ Test popup displayed');
-                } catch (error) {
-                    console.error('❌ Test failed:', error);
-                }
-            }
-            
-            // Inactivity Timeout Functions
-            function resetInactivityTimer() {
-                // 기존 타이머 취소
-                if (inactivityTimer) {
-                    clearTimeout(inactivityTimer);
-                }
-                
-                // 새로운 타이머 시작 (5분)
-                inactivityTimer = setTimeout(() => {
-                    console.warn('⏰ Inactivity timeout (5 minutes). Ending session...');
-                    showStatus('⏰ 5분간 대화가 없어 세션이 종료됩니다.', 'warning');
-                    
-                    // 세션 종료
-                    setTimeout(() => {
-                        if (callFrame) {
-                            callFrame.leave();
-                        }
-                        stopFaceDetection();
-                    }, 2000);
-                }, INACTIVITY_TIMEOUT);
-                
-                console.log('⏱️ Inactivity timer reset (5 min)');
-            }
-            
-            function stopInactivityTimer() {
-                if (inactivityTimer) {
-                    clearTimeout(inactivityTimer);
-                    inactivityTimer = null;
-                    console.log('⏱️ Inactivity timer stopped');
-                }
-            }
-            
-            // Face Detection Functions
-            let blazefaceModel = null;
-            let localVideoStream = null;
-            let localVideoElement = null;
-            
-            async function loadFaceDetectionModel() {
-                try {
-                    console.log('Loading BlazeFace model...');
-                    blazefaceModel = await blazeface.load();
-                    console.log('BlazeFace model loaded');
-                } catch (error) {
-                    console.error('Failed to load BlazeFace model:', error);
-                }
-            }
-            
-            async function initializeLocalVideo() {
-                try {
-                    // 로컬 비디오 스트림 가져오기 (한 번만)
-                    localVideoStream = await navigator.mediaDevices.getUserMedia({ 
-                        video: { width: 640, height: 480 }, 
-                        audio: false 
-                    });
-                    
-                    // video element 생성 (디버깅용으로 보이게 설정)
-                    localVideoElement = document.createElement('video');
-                    localVideoElement.srcObject = localVideoStream;
-                    localVideoElement.autoplay = true;
-                    localVideoElement.muted = true;
-                    localVideoElement.playsInline = true;  // iOS 호환성
-                    localVideoElement.width = 640;
-                    localVideoElement.height = 480;
-                    
-                    // 디버깅용: 작은 미리보기로 표시
-                    localVideoElement.style.position = 'fixed';
-                    localVideoElement.style.bottom = '20px';
-                    localVideoElement.style.right = '20px';
-                    localVideoElement.style.width = '160px';
-                    localVideoElement.style.height = '120px';
-                    localVideoElement.style.border = '2px solid #667eea';
-                    localVideoElement.style.borderRadius = '10px';
-                    localVideoElement.style.zIndex = '999';
-                    document.body.appendChild(localVideoElement);
-                    
-                    // video가 재생될 때까지 대기
-                    await new Promise((resolve, reject) => {
-                        const timeout = setTimeout(() => reject(new Error('Video load timeout')), 5000);
-                        
-                        localVideoElement.onloadeddata = () => {
-                            clearTimeout(timeout);
-                            console.log(`✅ Local video stream ready: ${localVideoElement.videoWidth}x${localVideoElement.videoHeight}`);
-                            resolve();
-                        };
-                        
-                        localVideoElement.onerror = (e) => {
-                            clearTimeout(timeout);
-                            reject(e);
-                        };
-                    });
-                    
-                    // 재생 시작
-                    await localVideoElement.play();
-                    console.log('✅ Video playing');
-                    
-                    return true;
-                } catch (error) {
-                    console.error('Failed to initialize local video:', error);
-                    return false;
-                }
-            }
-            
-            function updateFaceStatus(isFacing) {
-                const statusDiv = document.getElementById('faceStatus');
-                const statusIcon = document.getElementById('faceStatusIcon');
-                const statusText = document.getElementById('faceStatusText');
-                
-                statusDiv.classList.add('active');
-                
-                if (isFacing) {
-                    statusIcon.className = 'face-status-icon green';
-                    statusText.textContent = '🎤 마이크 활성 (정면 인식)';
-                } else {
-                    statusIcon.className = 'face-status-icon red';
-                    statusText.textContent = '⏸️ 마이크 대기 (정면을 봐주세요)';
-                }
-            }
-            
-            async function detectFace(videoElement) {
-                if (!blazefaceModel) {
-                    console.warn('BlazeFace model not ready');
-                    return false;
-                }
-                
-                if (!videoElement) {
-                    console.warn('Video element not ready');
-                    return false;
-                }
-                
-                // 비디오 상태 확인
-                if (videoElement.readyState < 2) {
-                    console.warn(`Video not ready: readyState=${videoElement.readyState}`);
-                    return false;
-                }
-                
-                if (videoElement.videoWidth === 0 || videoElement.videoHeight === 0) {
-                    console.warn(`Video has no dimensions: ${videoElement.videoWidth}x${videoElement.videoHeight}`);
-                    return false;
-                }
-                
-                try {
-                    // BlazeFace 예측
-                    const predictions = await blazefaceModel.estimateFaces(videoElement, false);
-                    
-                    console.log(`🔍 BlazeFace predictions: ${predictions.length} face(s) detected`);
-                    
-                    if (predictions.length > 0) {
-                        const face = predictions[0];
-                        
-                        // 얼굴 크기로 거리 판단 (정면: 얼굴이 충분히 크게 보임)
-                        const landmarks = face.landmarks;
-                        const leftEye = landmarks[0];
-                        const rightEye = landmarks[1];
-                        const eyeDistance = Math.sqrt(
-                            Math.pow(rightEye[0] - leftEye[0], 2) + 
-                            Math.pow(rightEye[1] - leftEye[1], 2)
-                        );
-                        
-                        // 얼굴 박스 크기
-                        const faceWidth = face.bottomRight[0] - face.topLeft[0];
-                        const faceHeight = face.bottomRight[1] - face.topLeft[1];
-                        
-                        // 정면 판단: 얼굴 크기가 일정 이상 (임계값 완화)
-                        const isFrontal = faceWidth > 50 && faceHeight > 50 && eyeDistance > 20;
-                        
-                        console.log(`✅ Face detected: width=${faceWidth.toFixed(0)}, height=${faceHeight.toFixed(0)}, eyeDist=${eyeDistance.toFixed(0)}, frontal=${isFrontal}`);
-                        
-                        return isFrontal;
-                    } else {
-                        console.log(`❌ No face detected (video: ${videoElement.videoWidth}x${videoElement.videoHeight}, playing: ${!videoElement.paused})`);
-                        return false;
-                    }
-                } catch (error) {
-                    console.error('Face detection error:', error);
-                    return false;
-                }
-            }
-            
-            async function startFaceDetection() {
-                if (faceDetectionInterval) return;
-                
-                console.log('Starting face detection (1 fps)...');
-                
-                // 로컬 비디오 초기화 (한 번만)
-                const videoReady = await initializeLocalVideo();
-                if (!videoReady || !localVideoElement) {
-                    console.error('Failed to initialize video for face detection');
-                    updateFaceStatus(false);
-                    return;
-                }
-                
-                // 1초에 1번 체크
-                faceDetectionInterval = setInterval(async () => {
-                    if (!callFrame || !localVideoElement) {
-                        console.warn('callFrame or localVideoElement not ready');
-                        return;
-                    }
-                    
-                    try {
-                        const participants = callFrame.participants();
-                        const localParticipant = participants.local;
-                        
-                        if (!localParticipant) {
-                            console.warn('Local participant not found');
-                            return;
-                        }
-                        
-                        console.log(`👤 Local participant video: ${localParticipant.video ? 'ON' : 'OFF'}`);
-                        
-                        if (!localParticipant.video) {
-                            isFacingForward = false;
-                            updateFaceStatus(false);
-                            // Daily.co 마이크 mute
-                            await callFrame.setLocalAudio(false);
-                            return;
-                        }
-                        
-                        // 얼굴 감지 (재사용 video element)
-                        const wasFacing = isFacingForward;
-                        isFacingForward = await detectFace(localVideoElement);
-                        
-                        console.log(`📊 Face detection result: wasFacing=${wasFacing}, isFacingForward=${isFacingForward}`);
-                        
-                        // 상태 업데이트
-                        updateFaceStatus(isFacingForward);
-                        
-                        // Daily.co 마이크 제어 (mute/unmute)
-                        if (isFacingForward !== wasFacing && callFrame) {
-                            console.log(`🔄 Changing microphone state: ${wasFacing} → ${isFacingForward}`);
-                            await callFrame.setLocalAudio(isFacingForward);
-                            console.log(`🎤 Microphone ${isFacingForward ? 'UNMUTED ✅' : 'MUTED ⏸️'}`);
-                            
-                            // 상태 확인
-                            const currentState = await callFrame.localAudio();
-                            console.log(`✓ Current microphone state confirmed: ${currentState}`);
-                        }
-                        
-                    } catch (error) {
-                        console.error('Face detection loop error:', error);
-                    }
-                }, 1000); // 1초마다
-                
-                faceDetectionActive = true;
-            }
-            
-            function stopFaceDetection() {
-                if (faceDetectionInterval) {
-                    clearInterval(faceDetectionInterval);
-                    faceDetectionInterval = null;
-                }
-                faceDetectionActive = false;
-                
-                // 비디오 스트림 정리
-                if (localVideoStream) {
-                    localVideoStream.getTracks().forEach(track => track.stop());
-                    localVideoStream = null;
-                }
-                if (localVideoElement) {
-                    localVideoElement.srcObject = null;
-                    if (localVideoElement.parentNode) {
-                        localVideoElement.parentNode.removeChild(localVideoElement);
-                    }
-                    localVideoElement = null;
-                }
-                
-                const statusDiv = document.getElementById('faceStatus');
-                statusDiv.classList.remove('active');
-                
-                console.log('Face detection stopped and resources cleaned up');
-            }
-            
-            async function startConversation() {
-                const btn = document.getElementById('startBtn');
-                btn.disabled = true;
-                showStatus('룸을 생성하는 중...', 'info');
-                
-                // 얼굴 인식 모델 로드
-                if (!blazefaceModel) {
-                    showStatus('얼굴 인식 모델 로딩 중...', 'info');
-                    await loadFaceDetectionModel();
-                }
-                
-                try {
-                    // 룸 생성 요청
-                    const response = await fetch('/api/create-room', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({
-                            duration_minutes: 30
-                        })
-                    });
-                    
-                    if (!response.ok) {
-                        throw new Error('룸 생성 실패');
-                    }
-                    
-                    const data = await response.json();
-                    showStatus('연결 중... 잠시만 기다려주세요.', 'info');
-                    
-                    // Daily.co 클라이언트 생성
-                    console.log('Creating Daily iframe...');
-                    callFrame = DailyIframe.createFrame(
-                        document.getElementById('videoContainer'),
-                        {
-                            showLeaveButton: true,
-                            showFullscreenButton: false,
-                            iframeStyle: {
-                                width: '100%',
-                                height: '500px',
-                                border: 'none',
-                                borderRadius: '10px'
-                            }
-                        }
-                    );
-                    
-                    document.getElementById('videoContainer').style.display = 'block';
-                    
-                    // 룸 참여 (사용자 먼저) - 타임아웃 추가
-                    console.log('Joining room:', data.room_url);
-                    
-                    const joinPromise = callFrame.join({ url: data.room_url });
-                    const timeoutPromise = new Promise((_, reject) => 
-                        setTimeout(() => reject(new Error('Daily.co 연결 타임아웃 (30초)')), 30000)
-                    );
-                    
-                    const joinResult = await Promise.race([joinPromise, timeoutPromise]);
-                    console.log('Join result:', joinResult);
-                    
-                    // 초기 마이크 꺼진 상태 (얼굴 인식으로 제어)
-                    callFrame.setLocalAudio(false);
-                    console.log('Initial microphone state: DISABLED (face detection pending)');
-                    
-                    showStatus('봇이 참여하는 중... 잠시만 기다려주세요.', 'info');
-                    
-                    // 선택된 언어 및 STT 프로바이더 가져오기
-                    const selectedLanguage = document.querySelector('input[name="language"]:checked').value;
-                    const selectedSTTProvider = document.querySelector('input[name="stt_provider"]:checked').value;
-                    console.log('Selected language:', selectedLanguage);
-                    console.log('Selected STT provider:', selectedSTTProvider);
-                    
-                    // 사용자가 참여한 후 봇 시작 (token + language + stt_provider 전달)
-                    await fetch('/api/start-bot', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({
-                            room_url: data.room_url,
-                            room_name: data.room_name,
-                            token: data.token,
-                            language: selectedLanguage,
-                            stt_provider: selectedSTTProvider
-                        })
-                    });
-                    
-                    // 잠시 대기 후 성공 메시지 및 얼굴 인식 시작
-                    setTimeout(async () => {
-                        showStatus('✅ 연결되었습니다! 정면을 바라보면 마이크가 활성화됩니다.', 'success');
-                        
-                        // 얼굴 인식 시작 (1초에 1번 체크)
-                        await startFaceDetection();
-                        
-                        // 비활성 타이머 시작 (5분)
-                        resetInactivityTimer();
-                    }, 2000);
-                    
-                    // 채팅창 초기화
-                    clearChat();
-                    addChatMessage('assistant', '안녕하세요! 올리브영 쇼핑 어시스턴트입니다. 정면을 바라보시면 질문하실 수 있습니다.');
-                    
-                    // WebSocket 연결 (OpenAI Whisper 결과 수신용)
-                    const chatProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-                    const chatWs = new WebSocket(`${chatProtocol}//${window.location.host}/api/chat-ws`);
-                    
-                    chatWs.onopen = () => {
-                        console.log('✅ Chat WebSocket connected');
-                        
-                        // 연결 유지를 위한 ping (5초마다)
-                        setInterval(() => {
-                            if (chatWs.readyState === WebSocket.OPEN) {
-                                chatWs.send('ping');
-                            }
-                        }, 5000);
-                    };
-                    
-                    chatWs.onmessage = (event) => {
-                        try {
-                            const data = JSON.parse(event.data);
-                            console.log('📝 Received from server:', data);
-                            
-                            if (data.type === 'transcript' && data.speaker === 'user' && data.text) {
-                                console.log('✅ Adding user message:', data.text);
-                                addChatMessage('user', data.text);
-                                
-                                // Intent:YES로 통과한 메시지 → 비활성 타이머 리셋
-                                resetInactivityTimer();
-                            } else if (data.type === 'response' && data.speaker === 'assistant' && data.text) {
-                                console.log('✅ Adding assistant message:', data.text);
-                                addChatMessage('assistant', data.text);
-                            } else if (data.type === 'show_images') {
-                                // 이미지 팝업 표시
-                                console.log('🖼️ Showing images:', data.content_type);
-                                
-                                if (data.content_type === 'products' && data.data && data.data.products) {
-                                    showProductImages(data.data.products);
-                                } else if (data.content_type === 'store' && data.data) {
-                                    showStoreImage(data.data);
-                                }
-                            }
-                        } catch (e) {
-                            console.error('Error parsing chat message:', e);
-                        }
-                    };
-                    
-                    chatWs.onerror = (error) => {
-                        console.error('Chat WebSocket error:', error);
-                    };
-                    
-                    chatWs.onclose = () => {
-                        console.log('Chat WebSocket closed');
-                    };
-                    
-                    // 통화 종료 이벤트 처리
-                    callFrame.on('left-meeting', () => {
-                        document.getElementById('videoContainer').style.display = 'none';
-                        btn.disabled = false;
-                        showStatus('대화가 종료되었습니다.', 'info');
-                        
-                        // 얼굴 인식 중지
-                        stopFaceDetection();
-                        
-                        // 비활성 타이머 중지
-                        stopInactivityTimer();
-                    });
-                    
-                } catch (error) {
-                    console.error('Error:', error);
-                    
-                    // 얼굴 인식 중지
-                    stopFaceDetection();
-                    
-                    // 비활성 타이머 중지
-                    stopInactivityTimer();
-                    
-                    // 에러 타입별 처리
-                    let errorMessage = '오류가 발생했습니다: ' + error.message;
-                    
-                    if (error.message.includes('타임아웃')) {
-                        errorMessage = 'Daily.co 연결 시간 초과. 인터넷 연결을 확인하거나 다시 시도해주세요.';
-                    } else if (error.message.includes('룸 생성')) {
-                        errorMessage = 'Daily.co API 키를 확인해주세요. .env 파일에 DAILY_API_KEY가 설정되어 있나요?';
-                    }
-                    
-                    showStatus(errorMessage, 'error');
-                    btn.disabled = false;
-                    
-                    // Daily iframe 정리
-                    if (callFrame) {
-                        try {
-                            await callFrame.destroy();
-                        } catch (e) {
-                            console.log('Error destroying frame:', e);
-                        }
-                        callFrame = null;
-                    }
-                    document.getElementById('videoContainer').style.display = 'none';
-                }
-            }
-        </script>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=html_content)
+async def root(request: Request):
+    """루트 페이지 - 웹 인터페이스 (src/static/index.html, 미리 압축 + 강한 ETag)"""
+    return web_ui.index_response(request.headers)
+
+
+@app.get("/static/{name}")
+async def static_asset(name: str, request: Request):
+    """웹 UI 자산 (app.css, app.js) - ?v=가 내용 해시와 같으면 1년 immutable 캐시"""
+    response = web_ui.asset_response(name, request.headers, request.query_params.get("v"))
+    if response is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return response
 
 
 @app.post("/api/create-room", response_model=RoomResponse)
@@ -1274,23 +235,95 @@ async def start_bot(request: BotStartRequest):
     """
     봇을 시작합니다.
     """
+    if session_registry.draining:
+        raise HTTPException(status_code=503, detail="서버가 종료 대기 중입니다. 잠시 후 다시 시도해주세요.")
+    
     try:
-        # 백그라운드에서 봇 실행 (언어 및 STT 프로바이더 설정 전달)
-        bot = OliveYoungVoiceBot()
-        asyncio.create_task(bot.run(request.room_url, request.token, request.language, request.stt_provider))
+        # 백그라운드에서 봇 실행 (언어 및 STT 프로바이더 설정 전달) - 세션 레지스트리에 등록
+        bot_class = await load_bot_class()
+        bot = bot_class()
+        session = session_registry.start(
+            bot,
+            bot.run(request.room_url, request.token, request.language, request.stt_provider),
+            room_name=request.room_name,
+            room_url=request.room_url,
+        )
         
         return JSONResponse(
             content={
                 "status": "started",
                 "room_name": request.room_name,
+                "session_id": session.session_id,
                 "message": "봇이 시작되었습니다."
             }
         )
+    except SessionRejectedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error starting bot: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/sessions")
+async def list_sessions(include_finished: bool = False):
+    """실행 중인 봇 세션 목록"""
+    return {
+        "draining": session_registry.draining,
+        "active": session_registry.active_count,
+        "sessions": [s.to_dict() for s in session_registry.list_sessions(include_finished)],
+    }
+
+
+@app.post("/api/sessions/{session_id}/stop")
+async def stop_session(session_id: str, timeout: float = 10.0):
+    """봇 세션 중지 (EndFrame 전송 후 종료 대기)"""
+    session = await session_registry.stop(session_id, timeout=timeout)
+    if not session:
+        raise HTTPException(status_code=404, detail=f"세션을 찾을 수 없습니다: {session_id}")
+    return session.to_dict()
+
+
+class DrainRequest(BaseModel):
+    """drain 요청"""
+    timeout: Optional[float] = BOT_DRAIN_TIMEOUT
+
+
+@app.post("/api/drain")
+async def drain_sessions(request: DrainRequest):
+    """
+    graceful drain 모드로 전환합니다.
+    새 세션을 거부하고 활성 세션이 끝날 때까지 기다립니다 (롤링 재시작용).
+    """
+    summary = await session_registry.drain(timeout=request.timeout)
+    return {"status": "drained", **summary}
+
+
+@app.post("/api/drain/cancel")
+async def cancel_drain():
+    """drain 모드 해제 (새 세션 다시 허용)"""
+    session_registry.resume()
+    return {"status": "accepting", "active": session_registry.active_count}
+
+
+@app.post("/api/catalog/reload")
+async def reload_catalog():
+    """
+    카탈로그(assistant_data.json)를 다시 로드합니다.
+    진행 중인 대화는 기존 스냅샷으로 끝까지 진행되고, 새 세션부터 새 데이터를 사용합니다.
+    """
+    try:
+        service = await reload_store_service_async()
+    except Exception as e:
+        logger.error(f"❌ Catalog reload failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "status": "reloaded",
+        "version": service.version,
+        "products": len(service.get_all_products()),
+        "stores": len(service.get_all_stores()),
+    }
+
+
 @app.get("/api/elevenlabs-token")
 async def get_elevenlabs_token():
     """
@@ -1333,17 +366,11 @@ async def get_elevenlabs_token():
 @app.get("/api/test-images")
 async def test_images():
     """이미지 팝업 테스트 엔드포인트"""
-    from .store_service import StoreService
-    
-    store_service = StoreService()
+    store_service = get_store_service()
     products = store_service.get_popular_products(limit=3)
     
     # 모든 WebSocket에 이미지 전송
-    await websocket_manager.broadcast_message({
-        "type": "show_images",
-        "content_type": "products",
-        "data": {"products": products}
-    })
+    await websocket_manager.broadcast_products(store_service, [p.get("product_id") for p in products])
     
     return {"status": "success", "products_sent": len(products)}
 
@@ -1355,7 +382,13 @@ async def chat_websocket(websocket: WebSocket):
     
     await websocket.accept()
     client_id = id(websocket)
-    websocket_manager.add_websocket(client_id, websocket)
+    try:
+        protocol = int(websocket.query_params.get("protocol", "1"))
+    except ValueError:
+        protocol = 1
+    websocket_manager.add_websocket(client_id, websocket, protocol=protocol)
+    # v2: 제품 카드는 ID만 보내므로 카탈로그 사전을 먼저 전송
+    websocket_manager.send_catalog(client_id, get_store_service())
     
     try:
         # 연결 유지 (메시지 수신 대기)
@@ -1374,8 +407,21 @@ async def chat_websocket(websocket: WebSocket):
 
 @app.get("/api/health")
 async def health_check():
-    """헬스 체크"""
-    return {"status": "healthy", "service": "oliveyoung-voice-assistant"}
+    """헬스 체크 (drain 중에는 503 - 로드밸런서가 새 트래픽을 보내지 않도록)"""
+    if session_registry.draining:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "draining",
+                "service": "oliveyoung-voice-assistant",
+                "active_sessions": session_registry.active_count,
+            },
+        )
+    return {
+        "status": "healthy",
+        "service": "oliveyoung-voice-assistant",
+        "active_sessions": session_registry.active_count,
+    }
 
 
 if __name__ == "__main__":
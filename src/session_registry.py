@@ -0,0 +1,217 @@
+"""
+봇 세션 레지스트리
+실행 중인 봇 파이프라인의 수명 주기 추적, 중지 및 graceful drain 지원
+"""
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import Awaitable, Deque, Dict, List, Optional
+
+from loguru import logger
+
+
+class SessionState:
+    """봇 세션 상태"""
+    STARTING = "starting"  # 태스크 생성됨, 파이프라인 시작 전
+    RUNNING = "running"    # 파이프라인 실행 중
+    STOPPING = "stopping"  # 중지 요청됨 (EndFrame 전송)
+    FINISHED = "finished"  # 정상 종료
+    FAILED = "failed"      # 예외로 종료
+
+
+class SessionRejectedError(RuntimeError):
+    """drain 모드에서 새 세션 시작을 거부할 때 발생"""
+
+
+class BotSession:
+    """레지스트리에 등록된 봇 세션 하나의 상태"""
+
+    def __init__(self, session_id: str, room_name: str, room_url: str, bot):
+        self.session_id = session_id
+        self.room_name = room_name
+        self.room_url = room_url
+        self.bot = bot
+        self.state = SessionState.STARTING
+        self.started_at = time.time()
+        self.ended_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.state in (SessionState.STARTING, SessionState.RUNNING, SessionState.STOPPING)
+
+    def to_dict(self) -> Dict:
+        """API 응답용 딕셔너리"""
+        end = self.ended_at or time.time()
+        return {
+            "session_id": self.session_id,
+            "room_name": self.room_name,
+            "state": self.state,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "duration_secs": round(end - self.started_at, 1),
+            "error": self.error,
+            "counters": dict(getattr(self.bot, "counters", {})),
+        }
+
+
+class SessionRegistry:
+    """실행 중인 봇 세션을 추적하는 레지스트리
+
+    - start(): 봇 코루틴을 태스크로 실행하고 세션 등록 (예외는 로깅 후 FAILED 상태로 기록)
+    - stop(): 봇에 EndFrame을 보내고 종료를 기다림 (타임아웃 시 태스크 취소)
+    - drain(): 새 세션을 거부하고 활성 세션이 끝날 때까지 대기
+    """
+
+    def __init__(self, history_size: int = 50):
+        self._sessions: Dict[str, BotSession] = {}
+        self._history: Deque[BotSession] = deque(maxlen=history_size)  # 종료된 세션 (최근 N개)
+        self.draining = False
+
+    def start(self, bot, coro: Awaitable, room_name: str, room_url: str = "") -> BotSession:
+        """
+        봇 세션을 등록하고 백그라운드 태스크로 실행합니다.
+
+        Args:
+            bot: OliveYoungVoiceBot 인스턴스 (stop(), counters 제공)
+            coro: 실행할 봇 코루틴 (bot.run(...))
+            room_name: Daily.co 룸 이름
+            room_url: Daily.co 룸 URL
+
+        Returns:
+            등록된 BotSession
+
+        Raises:
+            SessionRejectedError: drain 모드인 경우
+        """
+        if self.draining:
+            coro.close()  # 실행되지 않은 코루틴 정리 (never awaited 경고 방지)
+            raise SessionRejectedError("서버가 종료 대기(drain) 중이라 새 세션을 시작할 수 없습니다.")
+
+        session = BotSession(uuid.uuid4().hex[:12], room_name, room_url, bot)
+        self._sessions[session.session_id] = session
+        session.task = asyncio.create_task(self._run(session, coro))
+        logger.info(f"🤖 Bot session started: {session.session_id} (room: {room_name}, active: {self.active_count})")
+        return session
+
+    async def _run(self, session: BotSession, coro: Awaitable):
+        """봇 코루틴 실행 래퍼 - 상태 전이와 예외 기록"""
+        session.state = SessionState.RUNNING
+        try:
+            await coro
+            session.state = SessionState.FINISHED
+        except asyncio.CancelledError:
+            session.state = SessionState.FINISHED
+            session.error = "cancelled"
+            raise
+        except Exception as e:
+            session.state = SessionState.FAILED
+            session.error = f"{type(e).__name__}: {e}"
+            logger.exception(f"❌ Bot session {session.session_id} failed: {e}")
+        finally:
+            session.ended_at = time.time()
+            self._sessions.pop(session.session_id, None)
+            self._history.append(session)
+            logger.info(
+                f"🏁 Bot session ended: {session.session_id} ({session.state}, "
+                f"{session.ended_at - session.started_at:.1f}s, active: {self.active_count})"
+            )
+
+    @property
+    def active_count(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Optional[BotSession]:
+        """세션 조회 (활성 세션 우선, 없으면 최근 종료 세션)"""
+        session = self._sessions.get(session_id)
+        if session:
+            return session
+        for past in self._history:
+            if past.session_id == session_id:
+                return past
+        return None
+
+    def list_sessions(self, include_finished: bool = False) -> List[BotSession]:
+        """세션 목록 반환"""
+        sessions = list(self._sessions.values())
+        if include_finished:
+            sessions += list(self._history)
+        return sessions
+
+    async def stop(self, session_id: str, timeout: float = 10.0) -> Optional[BotSession]:
+        """
+        세션을 중지합니다. EndFrame으로 정상 종료를 요청하고, 타임아웃 시 태스크를 취소합니다.
+
+        Returns:
+            중지된 BotSession 또는 None (세션 없음)
+        """
+        session = self._sessions.get(session_id)
+        if not session:
+            return self.get(session_id)
+
+        await self._request_stop(session)
+        await self._wait_or_cancel([session], timeout)
+        return session
+
+    async def _request_stop(self, session: BotSession):
+        if session.state == SessionState.STOPPING:
+            return
+        session.state = SessionState.STOPPING
+        try:
+            await session.bot.stop()
+        except Exception as e:
+            logger.error(f"❌ Error stopping bot session {session.session_id}: {e}")
+
+    async def _wait_or_cancel(self, sessions: List[BotSession], timeout: float):
+        tasks = [s.task for s in sessions if s.task and not s.task.done()]
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(f"⚠️ Cancelled {len(pending)} bot session(s) after {timeout}s timeout")
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def drain(self, timeout: float = 30.0, stop_grace: float = 5.0) -> Dict:
+        """
+        graceful drain: 새 세션을 거부하고 활성 세션이 스스로 끝나기를 기다립니다.
+        타임아웃까지 끝나지 않은 세션은 EndFrame으로 중지하고, stop_grace 후에도 남으면 취소합니다.
+
+        Args:
+            timeout: 활성 세션 자연 종료 대기 시간 (초)
+            stop_grace: 강제 중지 요청 후 추가 대기 시간 (초)
+
+        Returns:
+            drain 결과 요약
+        """
+        self.draining = True
+        sessions = list(self._sessions.values())
+        logger.info(f"🚰 Draining {len(sessions)} bot session(s) (timeout: {timeout}s)")
+
+        tasks = [s.task for s in sessions if s.task and not s.task.done()]
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+
+        remaining = [s for s in sessions if s.task and not s.task.done()]
+        for session in remaining:
+            await self._request_stop(session)
+        await self._wait_or_cancel(remaining, stop_grace)
+
+        summary = {
+            "drained": len(sessions) - len(remaining),
+            "stopped": len(remaining),
+            "active": self.active_count,
+        }
+        logger.info(f"✅ Drain completed: {summary}")
+        return summary
+
+    def resume(self):
+        """drain 모드 해제 (새 세션 다시 허용)"""
+        self.draining = False
+
+
+# 프로세스 전역 레지스트리
+session_registry = SessionRegistry()
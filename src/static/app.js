@@ -0,0 +1,671 @@
+let callFrame = null;
+let faceDetectionActive = false;
+let isFacingForward = false;
+let faceDetectionInterval = null;
+let inactivityTimer = null;
+const INACTIVITY_TIMEOUT = 5 * 60 * 1000; // 5분 (밀리초)
+
+function showStatus(message, type) {
+    const status = document.getElementById('status');
+    status.textContent = message;
+    status.className = 'status ' + type;
+    status.style.display = 'block';
+}
+
+function addChatMessage(speaker, message) {
+    const chatHistory = document.getElementById('chatHistory');
+
+    const messageDiv = document.createElement('div');
+    messageDiv.className = `chat-message ${speaker}`;
+
+    const now = new Date();
+    const timeString = now.toLocaleTimeString('ko-KR', { hour: '2-digit', minute: '2-digit' });
+
+    messageDiv.innerHTML = `
+        <div class="speaker">${speaker === 'user' ? '👤 나' : '🤖 어시스턴트'}</div>
+        <div>${message}</div>
+        <div class="timestamp">${timeString}</div>
+    `;
+
+    chatHistory.appendChild(messageDiv);
+
+    // 스크롤을 맨 아래로
+    chatHistory.scrollTop = chatHistory.scrollHeight;
+}
+
+function clearChat() {
+    const chatHistory = document.getElementById('chatHistory');
+    chatHistory.innerHTML = '';
+}
+
+// Image Modal Functions
+function showProductImages(products) {
+    const modal = document.getElementById('imageModal');
+    const modalBody = document.getElementById('imageModalBody');
+
+    let html = '<h2 style="margin-bottom: 20px; color: #667eea;">🛍️ 추천 제품 <span style="font-size: 14px; color: #999;">(클릭하면 매장 내 위치 확인)</span></h2>';
+    html += '<div class="product-grid">';
+
+    products.forEach((product, index) => {
+        const category = product.category || '기타';
+        const mapImage = getCategoryMapImage(category);
+
+        html += `
+            <div class="product-card" onclick="showLocationMap('${mapImage}', '${product.name}', '${category}')" style="cursor: pointer;">
+                <img src="${product.image_url}" alt="${product.name}" class="product-image" 
+                     onerror="this.src='https://via.placeholder.com/250x250?text=No+Image'">
+                <div class="product-info">
+                    <div class="product-name">${product.name}</div>
+                    <div class="product-price">
+                        ${product.discount_rate ? `<span class="discount-badge">${product.discount_rate}%</span>` : ''}
+                        ${product.sale_price ? `<span class="sale-price">${product.sale_price.toLocaleString()}원</span>` : ''}
+                    </div>
+                    <div style="margin-top: 10px; font-size: 12px; color: #667eea;">
+                        📍 ${category} 섹션
+                    </div>
+                </div>
+            </div>
+        `;
+    });
+
+    html += '</div>';
+    modalBody.innerHTML = html;
+    modal.classList.add('active');
+
+    console.log('✅ Product images displayed:', products.length);
+}
+
+function getCategoryMapImage(category) {
+    // 카테고리별 지도 이미지 매핑
+    const mapImages = {
+        '스킨케어': '/data/skincare.png',
+        '클렌징': '/data/cleansing.png',
+        '기타': '/data/skincare.png'  // 기본값
+    };
+    return mapImages[category] || '/data/skincare.png';
+}
+
+function showLocationMap(mapImageUrl, productName, category) {
+    const modal = document.getElementById('imageModal');
+    const modalBody = document.getElementById('imageModalBody');
+
+    let html = `
+        <div style="text-align: center;">
+            <h2 style="margin-bottom: 20px; color: #667eea;">📍 매장 내 위치</h2>
+            <p style="font-size: 16px; margin-bottom: 10px; color: #333;">${productName}</p>
+            <p style="font-size: 14px; margin-bottom: 20px; color: #666;">${category} 섹션</p>
+            <img src="${mapImageUrl}" alt="매장 지도" style="max-width: 100%; border-radius: 10px; box-shadow: 0 4px 12px rgba(0,0,0,0.1);"
+                 onerror="this.src='https://via.placeholder.com/600x400?text=지도+이미지+없음'">
+            <p style="margin-top: 20px; color: #999; font-size: 12px;">
+                💡 팁: 뒤로가기를 눌러 제품 목록으로 돌아가세요
+            </p>
+        </div>
+    `;
+
+    modalBody.innerHTML = html;
+    modal.classList.add('active');
+
+    console.log('🗺️ Location map displayed:', productName, category);
+}
+
+function showStoreImage(storeData) {
+    const modal = document.getElementById('imageModal');
+    const modalBody = document.getElementById('imageModalBody');
+
+    let html = `
+        <div class="store-image-container">
+            <h2 style="margin-bottom: 20px; color: #667eea;">🏪 ${storeData.store_name}</h2>
+            <img src="${storeData.image_url}" alt="${storeData.store_name}" class="store-image"
+                 onerror="this.src='https://via.placeholder.com/600x400?text=No+Image'">
+            <div class="store-info-text">
+                <p><strong>📍 주소:</strong> ${storeData.address || ''}</p>
+            </div>
+        </div>
+    `;
+
+    modalBody.innerHTML = html;
+    modal.classList.add('active');
+
+    console.log('✅ Store image displayed:', storeData.store_name);
+}
+
+function closeImageModal() {
+    const modal = document.getElementById('imageModal');
+    modal.classList.remove('active');
+}
+
+// Close modal on background click
+document.addEventListener('DOMContentLoaded', () => {
+    const modal = document.getElementById('imageModal');
+    modal.addEventListener('click', (e) => {
+        if (e.target === modal) {
+            closeImageModal();
+        }
+    });
+});
+
+// Test Image Popup (직접 표시)
+async function testImagePopup() {
+    try {
+        console.log('🧪 Testing image popup...');
+
+        // 샘플 제품 데이터 (카테고리 포함)
+        const sampleProducts = [
+            {
+                name: "[11월 올영픽] 에스트라 아토베리어365 크림 80ml 더블 기획",
+                image_url: "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/10/0000/0023/A00000023633808ko.jpg?l=ko&rs=800x0",
+                sale_price: 44500,
+                discount_rate: 25,
+                category: "스킨케어"
+            },
+            {
+                name: "[속보습세럼] 토리든 다이브인 저분자 히알루론산 세럼 50ml",
+                image_url: "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/10/0000/0018/A00000018926132ko.jpg?l=ko&rs=800x0",
+                sale_price: 25650,
+                discount_rate: 28,
+                category: "스킨케어"
+            },
+            {
+                name: "[11월 올영픽] 라로슈포제 시카플라스트 밤 B5+ 100ml",
+                image_url: "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/10/0000/0023/A00000023609906ko.jpg?l=ko&rs=800x0",
+                sale_price: 30000,
+                discount_rate: 25,
+                category: "클렌징"
+            }
+        ];
+
+        showProductImages(sampleProducts);
+        console.log('✅ Test popup displayed');
+    } catch (error) {
+        console.error('❌ Test failed:', error);
+    }
+}
+
+// Inactivity Timeout Functions
+function resetInactivityTimer() {
+    // 기존 타이머 취소
+    if (inactivityTimer) {
+        clearTimeout(inactivityTimer);
+    }
+
+    // 새로운 타이머 시작 (5분)
+    inactivityTimer = setTimeout(() => {
+        console.warn('⏰ Inactivity timeout (5 minutes). Ending session...');
+        showStatus('⏰ 5분간 대화가 없어 세션이 종료됩니다.', 'warning');
+
+        // 세션 종료
+        setTimeout(() => {
+            if (callFrame) {
+                callFrame.leave();
+            }
+            stopFaceDetection();
+        }, 2000);
+    }, INACTIVITY_TIMEOUT);
+
+    console.log('⏱️ Inactivity timer reset (5 min)');
+}
+
+function stopInactivityTimer() {
+    if (inactivityTimer) {
+        clearTimeout(inactivityTimer);
+        inactivityTimer = null;
+        console.log('⏱️ Inactivity timer stopped');
+    }
+}
+
+// Face Detection Functions
+let blazefaceModel = null;
+let localVideoStream = null;
+let localVideoElement = null;
+
+async function loadFaceDetectionModel() {
+    try {
+        console.log('Loading BlazeFace model...');
+        blazefaceModel = await blazeface.load();
+        console.log('BlazeFace model loaded');
+    } catch (error) {
+        console.error('Failed to load BlazeFace model:', error);
+    }
+}
+
+async function initializeLocalVideo() {
+    try {
+        // 로컬 비디오 스트림 가져오기 (한 번만)
+        localVideoStream = await navigator.mediaDevices.getUserMedia({ 
+            video: { width: 640, height: 480 }, 
+            audio: false 
+        });
+
+        // video element 생성 (디버깅용으로 보이게 설정)
+        localVideoElement = document.createElement('video');
+        localVideoElement.srcObject = localVideoStream;
+        localVideoElement.autoplay = true;
+        localVideoElement.muted = true;
+        localVideoElement.playsInline = true;  // iOS 호환성
+        localVideoElement.width = 640;
+        localVideoElement.height = 480;
+
+        // 디버깅용: 작은 미리보기로 표시
+        localVideoElement.style.position = 'fixed';
+        localVideoElement.style.bottom = '20px';
+        localVideoElement.style.right = '20px';
+        localVideoElement.style.width = '160px';
+        localVideoElement.style.height = '120px';
+        localVideoElement.style.border = '2px solid #667eea';
+        localVideoElement.style.borderRadius = '10px';
+        localVideoElement.style.zIndex = '999';
+        document.body.appendChild(localVideoElement);
+
+        // video가 재생될 때까지 대기
+        await new Promise((resolve, reject) => {
+            const timeout = setTimeout(() => reject(new Error('Video load timeout')), 5000);
+
+            localVideoElement.onloadeddata = () => {
+                clearTimeout(timeout);
+                console.log(`✅ Local video stream ready: ${localVideoElement.videoWidth}x${localVideoElement.videoHeight}`);
+                resolve();
+            };
+
+            localVideoElement.onerror = (e) => {
+                clearTimeout(timeout);
+                reject(e);
+            };
+        });
+
+        // 재생 시작
+        await localVideoElement.play();
+        console.log('✅ Video playing');
+
+        return true;
+    } catch (error) {
+        console.error('Failed to initialize local video:', error);
+        return false;
+    }
+}
+
+function updateFaceStatus(isFacing) {
+    const statusDiv = document.getElementById('faceStatus');
+    const statusIcon = document.getElementById('faceStatusIcon');
+    const statusText = document.getElementById('faceStatusText');
+
+    statusDiv.classList.add('active');
+
+    if (isFacing) {
+        statusIcon.className = 'face-status-icon green';
+        statusText.textContent = '🎤 마이크 활성 (정면 인식)';
+    } else {
+        statusIcon.className = 'face-status-icon red';
+        statusText.textContent = '⏸️ 마이크 대기 (정면을 봐주세요)';
+    }
+}
+
+async function detectFace(videoElement) {
+    if (!blazefaceModel) {
+        console.warn('BlazeFace model not ready');
+        return false;
+    }
+
+    if (!videoElement) {
+        console.warn('Video element not ready');
+        return false;
+    }
+
+    // 비디오 상태 확인
+    if (videoElement.readyState < 2) {
+        console.warn(`Video not ready: readyState=${videoElement.readyState}`);
+        return false;
+    }
+
+    if (videoElement.videoWidth === 0 || videoElement.videoHeight === 0) {
+        console.warn(`Video has no dimensions: ${videoElement.videoWidth}x${videoElement.videoHeight}`);
+        return false;
+    }
+
+    try {
+        // BlazeFace 예측
+        const predictions = await blazefaceModel.estimateFaces(videoElement, false);
+
+        console.log(`🔍 BlazeFace predictions: ${predictions.length} face(s) detected`);
+
+        if (predictions.length > 0) {
+            const face = predictions[0];
+
+            // 얼굴 크기로 거리 판단 (정면: 얼굴이 충분히 크게 보임)
+            const landmarks = face.landmarks;
+            const leftEye = landmarks[0];
+            const rightEye = landmarks[1];
+            const eyeDistance = Math.sqrt(
+                Math.pow(rightEye[0] - leftEye[0], 2) + 
+                Math.pow(rightEye[1] - leftEye[1], 2)
+            );
+
+            // 얼굴 박스 크기
+            const faceWidth = face.bottomRight[0] - face.topLeft[0];
+            const faceHeight = face.bottomRight[1] - face.topLeft[1];
+
+            // 정면 판단: 얼굴 크기가 일정 이상 (임계값 완화)
+            const isFrontal = faceWidth > 50 && faceHeight > 50 && eyeDistance > 20;
+
+            console.log(`✅ Face detected: width=${faceWidth.toFixed(0)}, height=${faceHeight.toFixed(0)}, eyeDist=${eyeDistance.toFixed(0)}, frontal=${isFrontal}`);
+
+            return isFrontal;
+        } else {
+            console.log(`❌ No face detected (video: ${videoElement.videoWidth}x${videoElement.videoHeight}, playing: ${!videoElement.paused})`);
+            return false;
+        }
+    } catch (error) {
+        console.error('Face detection error:', error);
+        return false;
+    }
+}
+
+async function startFaceDetection() {
+    if (faceDetectionInterval) return;
+
+    console.log('Starting face detection (1 fps)...');
+
+    // 로컬 비디오 초기화 (한 번만)
+    const videoReady = await initializeLocalVideo();
+    if (!videoReady || !localVideoElement) {
+        console.error('Failed to initialize video for face detection');
+        updateFaceStatus(false);
+        return;
+    }
+
+    // 1초에 1번 체크
+    faceDetectionInterval = setInterval(async () => {
+        if (!callFrame || !localVideoElement) {
+            console.warn('callFrame or localVideoElement not ready');
+            return;
+        }
+
+        try {
+            const participants = callFrame.participants();
+            const localParticipant = participants.local;
+
+            if (!localParticipant) {
+                console.warn('Local participant not found');
+                return;
+            }
+
+            console.log(`👤 Local participant video: ${localParticipant.video ? 'ON' : 'OFF'}`);
+
+            if (!localParticipant.video) {
+                isFacingForward = false;
+                updateFaceStatus(false);
+                // Daily.co 마이크 mute
+                await callFrame.setLocalAudio(false);
+                return;
+            }
+
+            // 얼굴 감지 (재사용 video element)
+            const wasFacing = isFacingForward;
+            isFacingForward = await detectFace(localVideoElement);
+
+            console.log(`📊 Face detection result: wasFacing=${wasFacing}, isFacingForward=${isFacingForward}`);
+
+            // 상태 업데이트
+            updateFaceStatus(isFacingForward);
+
+            // Daily.co 마이크 제어 (mute/unmute)
+            if (isFacingForward !== wasFacing && callFrame) {
+                console.log(`🔄 Changing microphone state: ${wasFacing} → ${isFacingForward}`);
+                await callFrame.setLocalAudio(isFacingForward);
+                console.log(`🎤 Microphone ${isFacingForward ? 'UNMUTED ✅' : 'MUTED ⏸️'}`);
+
+                // 상태 확인
+                const currentState = await callFrame.localAudio();
+                console.log(`✓ Current microphone state confirmed: ${currentState}`);
+            }
+
+        } catch (error) {
+            console.error('Face detection loop error:', error);
+        }
+    }, 1000); // 1초마다
+
+    faceDetectionActive = true;
+}
+
+function stopFaceDetection() {
+    if (faceDetectionInterval) {
+        clearInterval(faceDetectionInterval);
+        faceDetectionInterval = null;
+    }
+    faceDetectionActive = false;
+
+    // 비디오 스트림 정리
+    if (localVideoStream) {
+        localVideoStream.getTracks().forEach(track => track.stop());
+        localVideoStream = null;
+    }
+    if (localVideoElement) {
+        localVideoElement.srcObject = null;
+        if (localVideoElement.parentNode) {
+            localVideoElement.parentNode.removeChild(localVideoElement);
+        }
+        localVideoElement = null;
+    }
+
+    const statusDiv = document.getElementById('faceStatus');
+    statusDiv.classList.remove('active');
+
+    console.log('Face detection stopped and resources cleaned up');
+}
+
+async function startConversation() {
+    const btn = document.getElementById('startBtn');
+    btn.disabled = true;
+    showStatus('룸을 생성하는 중...', 'info');
+
+    // 얼굴 인식 모델 로드
+    if (!blazefaceModel) {
+        showStatus('얼굴 인식 모델 로딩 중...', 'info');
+        await loadFaceDetectionModel();
+    }
+
+    try {
+        // 룸 생성 요청
+        const response = await fetch('/api/create-room', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                duration_minutes: 30
+            })
+        });
+
+        if (!response.ok) {
+            throw new Error('룸 생성 실패');
+        }
+
+        const data = await response.json();
+        showStatus('연결 중... 잠시만 기다려주세요.', 'info');
+
+        // Daily.co 클라이언트 생성
+        console.log('Creating Daily iframe...');
+        callFrame = DailyIframe.createFrame(
+            document.getElementById('videoContainer'),
+            {
+                showLeaveButton: true,
+                showFullscreenButton: false,
+                iframeStyle: {
+                    width: '100%',
+                    height: '500px',
+                    border: 'none',
+                    borderRadius: '10px'
+                }
+            }
+        );
+
+        document.getElementById('videoContainer').style.display = 'block';
+
+        // 룸 참여 (사용자 먼저) - 타임아웃 추가
+        console.log('Joining room:', data.room_url);
+
+        const joinPromise = callFrame.join({ url: data.room_url });
+        const timeoutPromise = new Promise((_, reject) => 
+            setTimeout(() => reject(new Error('Daily.co 연결 타임아웃 (30초)')), 30000)
+        );
+
+        const joinResult = await Promise.race([joinPromise, timeoutPromise]);
+        console.log('Join result:', joinResult);
+
+        // 초기 마이크 꺼진 상태 (얼굴 인식으로 제어)
+        callFrame.setLocalAudio(false);
+        console.log('Initial microphone state: DISABLED (face detection pending)');
+
+        showStatus('봇이 참여하는 중... 잠시만 기다려주세요.', 'info');
+
+        // 선택된 언어 및 STT 프로바이더 가져오기
+        const selectedLanguage = document.querySelector('input[name="language"]:checked').value;
+        const selectedSTTProvider = document.querySelector('input[name="stt_provider"]:checked').value;
+        console.log('Selected language:', selectedLanguage);
+        console.log('Selected STT provider:', selectedSTTProvider);
+
+        // 사용자가 참여한 후 봇 시작 (token + language + stt_provider 전달)
+        await fetch('/api/start-bot', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                room_url: data.room_url,
+                room_name: data.room_name,
+                token: data.token,
+                language: selectedLanguage,
+                stt_provider: selectedSTTProvider
+            })
+        });
+
+        // 잠시 대기 후 성공 메시지 및 얼굴 인식 시작
+        setTimeout(async () => {
+            showStatus('✅ 연결되었습니다! 정면을 바라보면 마이크가 활성화됩니다.', 'success');
+
+            // 얼굴 인식 시작 (1초에 1번 체크)
+            await startFaceDetection();
+
+            // 비활성 타이머 시작 (5분)
+            resetInactivityTimer();
+        }, 2000);
+
+        // 채팅창 초기화
+        clearChat();
+        addChatMessage('assistant', '안녕하세요! 올리브영 쇼핑 어시스턴트입니다. 정면을 바라보시면 질문하실 수 있습니다.');
+
+        // WebSocket 연결 (OpenAI Whisper 결과 수신용)
+        const chatProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+        // protocol=2: 카탈로그 사전은 연결 시 한 번, 제품 카드는 ID만, 같은 틱의 이벤트는 배열 하나로 수신
+        const chatWs = new WebSocket(`${chatProtocol}//${window.location.host}/api/chat-ws?protocol=2`);
+        let catalogProducts = {};
+
+        chatWs.onopen = () => {
+            console.log('✅ Chat WebSocket connected');
+
+            // 연결 유지를 위한 ping (5초마다)
+            setInterval(() => {
+                if (chatWs.readyState === WebSocket.OPEN) {
+                    chatWs.send('ping');
+                }
+            }, 5000);
+        };
+
+        const handleChatEvent = (data) => {
+            console.log('📝 Received from server:', data);
+
+            if (data.type === 'catalog') {
+                // 제품 사전 (연결 시 한 번)
+                catalogProducts = data.products || {};
+                console.log('📦 Catalog received:', data.version, Object.keys(catalogProducts).length);
+            } else if (data.type === 'transcript' && data.speaker === 'user' && data.text) {
+                console.log('✅ Adding user message:', data.text);
+                addChatMessage('user', data.text);
+
+                // Intent:YES로 통과한 메시지 → 비활성 타이머 리셋
+                resetInactivityTimer();
+            } else if (data.type === 'response' && data.speaker === 'assistant' && data.text) {
+                console.log('✅ Adding assistant message:', data.text);
+                addChatMessage('assistant', data.text);
+            } else if (data.type === 'show_images') {
+                // 이미지 팝업 표시
+                console.log('🖼️ Showing images:', data.content_type);
+
+                if (data.content_type === 'products' && data.ids) {
+                    // 다른 카탈로그 버전의 제품은 메시지에 함께 옴 (사전보다 우선)
+                    const inline = data.products || {};
+                    const products = data.ids.map((id) => inline[id] || catalogProducts[id]).filter(Boolean);
+                    if (products.length) {
+                        showProductImages(products);
+                    }
+                } else if (data.content_type === 'products' && data.data && data.data.products) {
+                    showProductImages(data.data.products);
+                } else if (data.content_type === 'store' && data.data) {
+                    showStoreImage(data.data);
+                }
+            }
+        };
+
+        chatWs.onmessage = (event) => {
+            try {
+                const data = JSON.parse(event.data);
+                // v2는 같은 틱의 이벤트를 배열 하나로 묶어 보냄
+                (Array.isArray(data) ? data : [data]).forEach(handleChatEvent);
+            } catch (e) {
+                console.error('Error parsing chat message:', e);
+            }
+        };
+
+        chatWs.onerror = (error) => {
+            console.error('Chat WebSocket error:', error);
+        };
+
+        chatWs.onclose = () => {
+            console.log('Chat WebSocket closed');
+        };
+
+        // 통화 종료 이벤트 처리
+        callFrame.on('left-meeting', () => {
+            document.getElementById('videoContainer').style.display = 'none';
+            btn.disabled = false;
+            showStatus('대화가 종료되었습니다.', 'info');
+
+            // 얼굴 인식 중지
+            stopFaceDetection();
+
+            // 비활성 타이머 중지
+            stopInactivityTimer();
+        });
+
+    } catch (error) {
+        console.error('Error:', error);
+
+        // 얼굴 인식 중지
+        stopFaceDetection();
+
+        // 비활성 타이머 중지
+        stopInactivityTimer();
+
+        // 에러 타입별 처리
+        let errorMessage = '오류가 발생했습니다: ' + error.message;
+
+        if (error.message.includes('타임아웃')) {
+            errorMessage = 'Daily.co 연결 시간 초과. 인터넷 연결을 확인하거나 다시 시도해주세요.';
+        } else if (error.message.includes('룸 생성')) {
+            errorMessage = 'Daily.co API 키를 확인해주세요. .env 파일에 DAILY_API_KEY가 설정되어 있나요?';
+        }
+
+        showStatus(errorMessage, 'error');
+        btn.disabled = false;
+
+        // Daily iframe 정리
+        if (callFrame) {
+            try {
+                await callFrame.destroy();
+            } catch (e) {
+                console.log('Error destroying frame:', e);
+            }
+            callFrame = null;
+        }
+        document.getElementById('videoContainer').style.display = 'none';
+    }
+}
@@ -0,0 +1,231 @@
+"""
+정적 웹 UI 자산 서빙
+- src/static의 index.html / app.css / app.js를 처음 요청 시 한 번 읽고 gzip(brotli가 설치되어 있으면 brotli도)으로 미리 압축
+- 자산 URL(/static/..., /data/...)은 내용 해시 버전(?v=...)을 붙여 치환 → 버전이 맞는 요청은 1년 immutable 캐시
+- index.html과 버전 없는 요청은 no-cache + 내용 해시 강한 ETag (재방문은 304)
+- /data 마운트(CachedStaticFiles)도 같은 ETag/캐시 규칙, 압축 가능한 파일(JSON 등)은 압축 변형을 메모리에 캐시
+
+static 파일을 수정하면 서버를 재시작해야 반영됩니다 (프로세스당 한 번 빌드).
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+# 미리 압축할 MIME 타입 (PNG/JPEG 같은 이미 압축된 형식은 제외)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml")
+MIN_COMPRESS_SIZE = 256
+
+# Accept-Encoding이 둘 다 허용하면 brotli 우선
+_ENCODING_PREFERENCE = ("br", "gzip")
+
+# 페이지/스크립트 안의 자산 URL (치환 대상)
+_ASSET_URL = re.compile(r"(/static/|/data/)([\w.-]+\.\w+)(?![\w?])")
+
+
+def content_version(data: bytes) -> str:
+    """내용 해시 버전 (ETag, ?v= 값)"""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def precompress(body: bytes, media_type: str) -> Dict[str, bytes]:
+    """압축 변형 {"br": ..., "gzip": ...} (원본보다 작은 것만)"""
+    if not _is_compressible(media_type) or len(body) < MIN_COMPRESS_SIZE:
+        return {}
+    variants = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    return {encoding: data for encoding, data in variants.items() if len(data) < len(body)}
+
+
+def select_encoding(accept_encoding: Optional[str], available) -> Optional[str]:
+    """Accept-Encoding에서 허용한(q>0) 변형 중 선호 순서가 가장 높은 것"""
+    if not accept_encoding or not available:
+        return None
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip()
+        try:
+            if q.startswith("q=") and float(q[2:]) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    for encoding in _ENCODING_PREFERENCE:
+        if encoding in available and (encoding in accepted or "*" in accepted):
+            return encoding
+    return None
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+
+class StaticAsset:
+    """메모리에 올린 자산 하나 (원본 + 미리 압축한 변형)"""
+
+    __slots__ = ("body", "media_type", "version", "encodings")
+
+    def __init__(self, body: bytes, media_type: str):
+        self.body = body
+        self.media_type = media_type
+        self.version = content_version(body)
+        self.encodings = precompress(body, media_type)
+
+    def response(self, request_headers: Headers, cache_control: str) -> Response:
+        """협상한 인코딩으로 응답 (If-None-Match가 맞으면 304)"""
+        encoding = select_encoding(request_headers.get("accept-encoding"), self.encodings)
+        # 강한 ETag는 표현(인코딩)마다 달라야 함
+        etag = f'"{self.version}-{encoding}"' if encoding else f'"{self.version}"'
+        headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        if _etag_matches(request_headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        body = self.encodings[encoding] if encoding else self.body
+        return Response(body, media_type=self.media_type, headers=headers)
+
+
+def _media_type(path: Path) -> str:
+    media_type = mimetypes.guess_type(str(path))[0] or "application/octet-stream"
+    if media_type.startswith("text/") or media_type == "application/javascript":
+        media_type += "; charset=utf-8"
+    return media_type
+
+
+# /data 파일 내용 해시 캐시: 경로 → ((mtime_ns, size), 버전)
+_file_versions: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def file_version(path: Path, stat_result: Optional[os.stat_result] = None) -> str:
+    """파일 내용 해시 버전 (mtime/크기가 바뀔 때만 다시 계산)"""
+    stat_result = stat_result or os.stat(path)
+    key = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _file_versions.get(str(path))
+    if cached is None or cached[0] != key:
+        cached = (key, content_version(Path(path).read_bytes()))
+        _file_versions[str(path)] = cached
+    return cached[1]
+
+
+class WebUI:
+    """index.html + 버전 자산 묶음 (첫 요청 시 한 번 빌드)"""
+
+    ASSETS = ("app.css", "app.js")
+
+    def __init__(self, static_dir: Path = STATIC_DIR, data_dir: Path = Path("data")):
+        self.static_dir = Path(static_dir)
+        self.data_dir = Path(data_dir)
+        self._assets: Optional[Dict[str, StaticAsset]] = None
+        self._index: Optional[StaticAsset] = None
+        self._lock = threading.Lock()
+
+    def _versioned_urls(self, text: str, assets: Dict[str, StaticAsset]) -> str:
+        """자산 URL에 내용 해시 버전을 붙입니다 (없는 파일은 그대로)."""
+
+        def replace(match):
+            prefix, name = match.groups()
+            if prefix == "/static/":
+                version = assets[name].version if name in assets else None
+            else:
+                path = self.data_dir / name
+                version = file_version(path) if path.is_file() else None
+            return f"{prefix}{name}?v={version}" if version else match.group(0)
+
+        return _ASSET_URL.sub(replace, text)
+
+    def _build(self):
+        with self._lock:
+            if self._index is not None:
+                return
+            assets: Dict[str, StaticAsset] = {}
+            for name in self.ASSETS:  # app.css, app.js 먼저 (index.html이 이들의 버전을 참조)
+                path = self.static_dir / name
+                text = self._versioned_urls(path.read_text(encoding="utf-8"), assets)
+                assets[name] = StaticAsset(text.encode("utf-8"), _media_type(path))
+            index = self._versioned_urls((self.static_dir / "index.html").read_text(encoding="utf-8"), assets)
+            self._assets = assets
+            self._index = StaticAsset(index.encode("utf-8"), "text/html; charset=utf-8")
+
+    def index_response(self, request_headers: Headers) -> Response:
+        """index.html (항상 재검증, 바뀌지 않았으면 304)"""
+        if self._index is None:
+            self._build()
+        return self._index.response(request_headers, REVALIDATE_CACHE)
+
+    def asset_response(self, name: str, request_headers: Headers, version: Optional[str] = None) -> Optional[Response]:
+        """/static 자산 (버전이 현재 내용과 같으면 immutable 캐시, 없는 자산은 None)"""
+        if self._index is None:
+            self._build()
+        asset = self._assets.get(name)
+        if asset is None:
+            return None
+        return asset.response(request_headers, IMMUTABLE_CACHE if version == asset.version else REVALIDATE_CACHE)
+
+
+class CachedStaticFiles(StaticFiles):
+    """내용 해시 강한 ETag + 버전 캐시 헤더 + 압축 변형을 제공하는 StaticFiles (/data 마운트용)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 압축 가능한 파일: 경로 → ((mtime_ns, size), StaticAsset)
+        self._compressed: Dict[str, Tuple[Tuple[int, int], StaticAsset]] = {}
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200) -> Response:
+        if status_code != 200:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        request_headers = Headers(scope=scope)
+        version = file_version(Path(full_path), stat_result)
+        requested = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("v", [None])[0]
+        cache_control = IMMUTABLE_CACHE if requested == version else REVALIDATE_CACHE
+
+        media_type = _media_type(Path(full_path))
+        if _is_compressible(media_type):
+            key = (stat_result.st_mtime_ns, stat_result.st_size)
+            cached = self._compressed.get(str(full_path))
+            if cached is None or cached[0] != key:
+                cached = (key, StaticAsset(Path(full_path).read_bytes(), media_type))
+                self._compressed[str(full_path)] = cached
+            return cached[1].response(request_headers, cache_control)
+
+        response = FileResponse(
+            full_path,
+            stat_result=stat_result,
+            headers={"etag": f'"{version}"', "cache-control": cache_control},
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return Response(status_code=304, headers={"etag": f'"{version}"', "cache-control": cache_control})
+        return response
+
+
+# 프로세스 전역 웹 UI 자산 (첫 요청 시 빌드)
+web_ui = WebUI()
@@ -2,38 +2,434 @@
 올리브영 매장 정보 서비스
 매장 검색, 정보 조회, 추천 기능 제공
 """
-import json
+import asyncio
+import os
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import re
 
+from loguru import logger
+
+from .fuzzy_search import FuzzyIndex
+from .serialization import dumps, loads
+from .geo_index import GeoIndex, Gazetteer
+from .records import Product, Store, freeze
+
+# .oycat 경로를 지정하면 mmap 바이너리 백엔드 사용 (python -m src.catalog_binary로 컴파일)
+DEFAULT_DATA_PATH = os.getenv("STORE_DATA_PATH", "data/assistant_data.json")
+
+# 데이터 파일과 같은 디렉토리의 위치 데이터
+STORE_LOCATIONS_FILE = "store_locations.json"  # store_id → lat/lng (매장 레코드에 좌표가 없을 때)
+LANDMARKS_FILE = "landmarks.json"              # 랜드마크/지하철 출구 가제티어
+
+# 랜드마크 기준 "가까운 매장"으로 인정할 최대 거리 (미터)
+NEAREST_STORE_MAX_DISTANCE_M = 2000
+
+# 퍼지 검색 최소 유사도 (STT 오인식 허용 범위)
+PRODUCT_FUZZY_MIN_SCORE = 0.6
+STORE_FUZZY_MIN_SCORE = 0.75
+
+# format_store_info 상세 수준 (미리 렌더링 대상)
+STORE_DETAIL_LEVELS = ("brief", "medium", "full")
+
+
+def _file_stat(path: Path) -> Optional[Tuple[int, int]]:
+    """파일 변경 판단용 (mtime_ns, 크기) - 파일이 없으면 None"""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _normalize(text: str) -> str:
+    """검색용 정규화 (소문자 + 앞뒤 공백 제거)"""
+    return (text or "").lower().strip()
+
+
+def _store_name(store: Dict) -> str:
+    """매장명 (메인 매장은 store_name, 인근 매장은 name 키 사용)"""
+    return store.get("name") or store.get("store_name", "")
+
+
+def _is_open(store: Dict) -> bool:
+    """영업 중 여부 (status 정보가 없으면 영업 중으로 간주)"""
+    status = store.get("status")
+    return status is None or status == "영업 중"
+
+
+def _render_store_info(store: Dict, detail_level: str) -> str:
+    """매장 정보 텍스트 렌더링 (줄 목록을 한 번에 join)"""
+    # 기본 정보 (항상 포함)
+    lines = [
+        f"✨ {_store_name(store)}",
+        f"📍 주소: {store.get('address', '정보 없음')}",
+        f"📞 전화: {store.get('phone', '정보 없음')}",
+    ]
+    
+    if detail_level != "brief":
+        # 중간 상세 정보
+        hours = store.get("operating_hours", {})
+        lines.append("⏰ 영업시간:")
+        lines.append(f"   평일: {hours.get('weekday', '정보 없음')}")
+        lines.append(f"   주말: {hours.get('weekend', '정보 없음')}")
+    
+    if detail_level not in ("brief", "medium"):
+        # 전체 상세 정보
+        features = store.get("features", [])
+        if features:
+            lines.append(f"✅ 특징: {', '.join(features)}")
+        
+        services = store.get("services", [])
+        if services:
+            lines.append(f"🛍️ 서비스: {', '.join(services)}")
+        
+        landmarks = store.get("nearby_landmarks", [])
+        if landmarks:
+            lines.append(f"🗺️ 주변: {', '.join(landmarks)}")
+        
+        popular = store.get("popular_products", [])
+        if popular:
+            lines.append(f"🔥 인기상품: {', '.join(popular[:3])}")
+    
+    lines.append("")
+    return "\n".join(lines)
+
+
+class _SubstringIndex:
+    """부분 문자열 검색용 bigram 역색인
+    
+    문서마다 정규화된 텍스트를 한 번만 저장하고, 질의의 bigram posting 교집합으로
+    후보를 좁힌 뒤 `in`으로 확인합니다. 카탈로그 전체를 질의마다 훑지 않습니다.
+    """
+    
+    def __init__(self):
+        self._texts: List[str] = []
+        self._postings: Dict[str, set] = {}
+    
+    @staticmethod
+    def _grams(text: str):
+        if len(text) < 2:
+            return set(text)
+        return {text[i:i + 2] for i in range(len(text) - 1)}
+    
+    def add(self, text: str) -> int:
+        """정규화된 텍스트 추가 (문서 번호 반환)"""
+        doc_id = len(self._texts)
+        self._texts.append(text)
+        for gram in self._grams(text) | set(text):
+            self._postings.setdefault(gram, set()).add(doc_id)
+        return doc_id
+    
+    def search(self, query: str) -> List[int]:
+        """query를 부분 문자열로 포함하는 문서 번호 (추가 순서)"""
+        if not query:
+            return list(range(len(self._texts)))
+        postings = [self._postings.get(gram) for gram in self._grams(query)]
+        if not all(postings):
+            return []
+        candidates = set.intersection(*postings)
+        return sorted(doc_id for doc_id in candidates if query in self._texts[doc_id])
+
+
+def _product_records(products: Dict) -> Dict:
+    """products 섹션의 제품을 레코드로 변환합니다.
+    by_category와 all_products에 같은 제품(product_id)이 있으면 레코드 하나를 공유합니다."""
+    by_id: Dict[str, Product] = {}
+
+    def record(product: Dict) -> Product:
+        product_id = product.get("product_id")
+        existing = by_id.get(product_id)
+        # 레코드의 중첩 list/dict는 tuple/MappingProxyType으로 고정되어 있으므로 같은 형태로 비교
+        if existing is not None and existing.to_dict() == {key: freeze(value) for key, value in product.items()}:
+            return existing
+        converted = Product.from_dict(product)
+        if product_id is not None:
+            by_id.setdefault(product_id, converted)
+        return converted
+
+    converted = dict(products)
+    if "all_products" in products:
+        converted["all_products"] = [record(p) for p in products["all_products"]]
+    if "by_category" in products:
+        converted["by_category"] = {
+            category: [record(p) for p in cat_products]
+            for category, cat_products in products["by_category"].items()
+        }
+    return converted
+
 
 class StoreService:
-    """올리브영 매장 정보를 관리하고 검색하는 서비스"""
+    """올리브영 매장 정보를 관리하고 검색하는 서비스
+    
+    세션 간 공유되는 읽기 전용 스냅샷으로 사용합니다 (get_store_service()).
+    매장/제품은 수정할 수 없는 레코드(records.Store/Product)이며 딕셔너리처럼 읽을 수 있습니다.
+    필드를 추가해야 하면 to_dict() 복사본을 사용합니다.
+    """
     
-    def __init__(self, data_path: str = "data/assistant_data.json"):
+    def __init__(self, data_path: str = DEFAULT_DATA_PATH, version: int = 0):
         """
         Args:
             data_path: 매장 데이터 JSON 파일 경로
+            version: 카탈로그 스냅샷 버전 (reload마다 증가)
         """
         self.data_path = Path(data_path)
+        self.version = version
+        # 파싱 전에 기록 (파싱 중에 파일이 바뀌면 다음 감시 주기에 다시 로드)
+        self.file_stat = _file_stat(self.data_path)
+        self.catalog = None  # .oycat 백엔드일 때 BinaryCatalog (mmap)
         self.data = self._load_data()
+        self._product_array = None  # NumPy 컬럼 뷰 (첫 조회 시 생성)
+        self._product_fuzzy = None  # 제품명 퍼지 색인 (첫 조회 시 생성)
+        self._store_fuzzy = None    # 매장명 퍼지 색인 (첫 조회 시 생성)
+        self._build_store_indexes()
+        self._build_geo_index()
+        self._build_store_info_cache()
+        # 브라우저용 제품 JSON은 조회될 때 생성 (.oycat 지연 로드를 유지하도록 시작 시 전체 디코딩 안 함)
+        self._product_index = None       # product_id → (카탈로그 순서, 레코드/행)
+        self._json_category_of = None    # JSON 백엔드 product_id → 카테고리
+        self._product_payloads: Dict[str, str] = {}  # product_id → JSON 조각
+        self._catalog_payload = None     # v2 카탈로그 사전 JSON
         
     def _load_data(self) -> Dict:
         """매장 데이터를 로드합니다."""
+        if self.data_path.suffix == ".oycat":
+            return self._load_binary_data()
         try:
-            with open(self.data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # assistant_data.json 구조에 맞게 변환
-                return {
-                    "store": data.get("store", {}),
-                    "products": data.get("products", {}),
-                    "nearby_stores": data.get("nearby_stores", []),
-                    "stores": [data.get("store", {})] + data.get("nearby_stores", [])  # 호환성
-                }
+            with open(self.data_path, 'rb') as f:
+                data = loads(f.read())
         except FileNotFoundError:
             print(f"Warning: {self.data_path} not found. Using empty data.")
-            return {"store": {}, "products": {}, "nearby_stores": [], "stores": []}
+            return {"store": Store(), "products": {}, "nearby_stores": [], "stores": []}
+        # assistant_data.json 구조에 맞게 변환 (제품/매장은 읽기 전용 레코드)
+        store = Store.from_dict(data.get("store", {}))
+        nearby_stores = [Store.from_dict(s) for s in data.get("nearby_stores", [])]
+        return {
+            "store": store,
+            "products": _product_records(data.get("products", {})),
+            "nearby_stores": nearby_stores,
+            "stores": [store] + nearby_stores  # 호환성
+        }
+    
+    def _load_binary_data(self) -> Dict:
+        """컴파일된 .oycat 카탈로그를 mmap으로 로드합니다 (제품은 접근 시 지연 생성)."""
+        from .catalog_binary import BinaryCatalog, ProductRows
+        
+        if not self.data_path.exists():
+            print(f"Warning: {self.data_path} not found. Using empty data.")
+            return {"store": Store(), "products": {}, "nearby_stores": [], "stores": []}
+        
+        self.catalog = BinaryCatalog(str(self.data_path))
+        meta = self.catalog.meta
+        store = Store.from_dict(meta.get("store", {}))
+        nearby_stores = [Store.from_dict(s) for s in meta.get("nearby_stores", [])]
+        return {
+            "store": store,
+            "products": {
+                "total": meta.get("total", len(self.catalog)),
+                "by_category": {
+                    category: ProductRows(self.catalog, rows)
+                    for category, rows in meta.get("category_rows", {}).items()
+                },
+                "all_products": ProductRows(self.catalog, meta.get("all_rows", [])),
+            },
+            "nearby_stores": nearby_stores,
+            "stores": [store] + nearby_stores  # 호환성
+        }
+    
+    def _build_store_indexes(self):
+        """매장 조회용 인덱스를 로드 시 한 번 만듭니다 (질의마다 카탈로그를 소문자 변환하지 않음)."""
+        stores = self.data["stores"]
+        self._stores_by_id: Dict[str, Dict] = {}
+        self._stores_by_name: Dict[str, Dict] = {}
+        self._landmark_tokens: Dict[str, List[int]] = {}
+        self._name_index = _SubstringIndex()
+        self._location_index = _SubstringIndex()
+        self._landmark_index = _SubstringIndex()
+        self._service_index = _SubstringIndex()
+        
+        for i, store in enumerate(stores):
+            store_id = store.get("store_id")
+            if store_id is not None:
+                self._stores_by_id.setdefault(store_id, store)
+            
+            name = _normalize(_store_name(store))
+            self._stores_by_name.setdefault(name, store)
+            self._name_index.add(name)
+            
+            landmarks = [_normalize(mark) for mark in store.get("nearby_landmarks", [])]
+            for mark in landmarks:
+                for token in {mark, *mark.split()}:
+                    indices = self._landmark_tokens.setdefault(token, [])
+                    if not indices or indices[-1] != i:
+                        indices.append(i)
+            # 필드 사이 구분자(\x00)로 필드 경계를 넘는 매칭 방지
+            self._landmark_index.add("\x00".join(landmarks))
+            self._location_index.add("\x00".join([name, _normalize(store.get("address", "")), *landmarks]))
+            self._service_index.add("\x00".join(_normalize(svc) for svc in store.get("services", [])))
+    
+    def _build_store_info_cache(self):
+        """매장 정보 텍스트를 (store_id, detail_level)별로 미리 렌더링합니다.
+        캐시는 스냅샷(StoreService 인스턴스)에 속하므로 리로드로 교체되면 함께 폐기됩니다."""
+        self._store_info_cache: Dict[Tuple[str, str], Tuple[Dict, str]] = {}
+        for store_id, store in self._stores_by_id.items():
+            for detail_level in STORE_DETAIL_LEVELS:
+                self._store_info_cache[(store_id, detail_level)] = (store, _render_store_info(store, detail_level))
+    
+    def _product_locations(self) -> Dict[str, Tuple[int, object]]:
+        """product_id → (카탈로그 순서, 제품 레코드 또는 .oycat 행 번호) - 첫 조회 시 한 번 생성
+        .oycat 백엔드는 product_id 문자열 컬럼만 읽고 제품 레코드는 만들지 않습니다."""
+        if self._product_index is None:
+            index: Dict[str, Tuple[int, object]] = {}
+            if self.catalog is not None:
+                for order, row in enumerate(self.get_all_products().rows):
+                    product_id = self.catalog.string("product_id", row)
+                    if product_id and product_id not in index:
+                        index[product_id] = (order, row)
+            else:
+                for order, product in enumerate(self.get_all_products()):
+                    product_id = product.get("product_id")
+                    if product_id is not None and product_id not in index:
+                        index[product_id] = (order, product)
+            self._product_index = index
+        return self._product_index
+    
+    def _category_of(self, product_id: str, location) -> Optional[str]:
+        if self.catalog is not None:
+            return self.catalog.category_name(location)
+        if self._json_category_of is None:
+            category_of: Dict[str, str] = {}
+            for category, products in self.get_categories().items():
+                for product in products:
+                    category_of.setdefault(product.get("product_id"), category)
+            self._json_category_of = category_of
+        return self._json_category_of.get(product_id)
+    
+    def _product_payload(self, product_id: str) -> str:
+        """브라우저로 보낼 제품 JSON 조각(카테고리 포함) - product_id별로 처음 요청될 때 한 번 직렬화
+        show_images 메시지는 이 문자열을 이어 붙여 만들므로 이후 요청은 딕셔너리 복사/직렬화가 없습니다."""
+        payload = self._product_payloads.get(product_id)
+        if payload is None:
+            location = self._product_locations()[product_id][1]
+            product = self.catalog.product(location) if self.catalog is not None else location
+            data = product.to_dict()
+            category = self._category_of(product_id, location)
+            if category is not None:
+                data["category"] = category
+            payload = self._product_payloads[product_id] = dumps(data)
+        return payload
+    
+    @property
+    def catalog_payload(self) -> str:
+        """chat-ws v2 카탈로그 사전 {"product_id": 제품, ...} (첫 v2 클라이언트가 요청할 때 한 번 생성)"""
+        if self._catalog_payload is None:
+            locations = sorted(self._product_locations().items(), key=lambda item: item[1][0])
+            self._catalog_payload = "{" + ",".join(
+                f"{dumps(product_id)}:{self._product_payload(product_id)}" for product_id, _ in locations
+            ) + "}"
+        return self._catalog_payload
+    
+    def get_product_payloads(self, product_ids: List[str]) -> List[str]:
+        """
+        제품 ID들의 미리 직렬화된 JSON 조각을 반환합니다.
+        
+        Args:
+            product_ids: 제품 ID 목록 (LLM 응답의 [PRODUCTS:...] 태그)
+            
+        Returns:
+            카탈로그 순서의 JSON 문자열 리스트 (없는 ID는 제외)
+        """
+        return [payload for _, _, payload in self._select_products(product_ids)]
+    
+    def known_product_ids(self, product_ids: List[str]) -> List[str]:
+        """카탈로그에 있는 제품 ID만 카탈로그 순서로 반환합니다 (get_product_payloads와 같은 순서)."""
+        return [product_id for _, product_id, _ in self._select_products(product_ids)]
+    
+    def _select_products(self, product_ids: List[str]) -> List[Tuple[int, str, str]]:
+        """(카탈로그 순서, product_id, JSON 조각) 리스트 (중복/없는 ID 제외)"""
+        locations = self._product_locations()
+        return sorted(
+            (locations[pid][0], pid, self._product_payload(pid))
+            for pid in set(product_ids) if pid in locations
+        )
+    
+    def _build_geo_index(self):
+        """매장 좌표 KD-tree와 랜드마크 가제티어를 만듭니다."""
+        locations = {}
+        try:
+            with open(self.data_path.parent / STORE_LOCATIONS_FILE, "rb") as f:
+                locations = loads(f.read()).get("stores", {})
+        except FileNotFoundError:
+            pass
+        
+        entries = []
+        seen = set()
+        for store in self.data["stores"]:
+            store_id = store.get("store_id")
+            if store_id in seen:
+                continue  # 메인 매장이 nearby_stores에도 있는 경우 한 번만
+            seen.add(store_id)
+            coords = store if store.get("lat") is not None else locations.get(store_id)
+            if coords and coords.get("lat") is not None and coords.get("lng") is not None:
+                entries.append((coords["lat"], coords["lng"], store))
+        
+        self._geo_index = GeoIndex(entries)
+        self.gazetteer = Gazetteer.load(str(self.data_path.parent / LANDMARKS_FILE))
+    
+    def locate(self, place: str) -> Optional[Tuple[float, float]]:
+        """
+        랜드마크/지하철역/출구 이름을 좌표로 변환합니다.
+        
+        Args:
+            place: 장소명 (예: "명동역 8번 출구", "을지로입구역")
+            
+        Returns:
+            (lat, lng) 또는 None
+        """
+        landmark = self.gazetteer.resolve(place) if self.gazetteer else None
+        return (landmark["lat"], landmark["lng"]) if landmark else None
+    
+    def find_nearest_stores(
+        self,
+        lat: float,
+        lng: float,
+        k: int = 3,
+        open_only: bool = False,
+        max_distance_m: Optional[float] = None,
+    ) -> List[Tuple[Dict, float]]:
+        """
+        좌표에서 가장 가까운 매장 k개를 찾습니다 (haversine 거리).
+        
+        Args:
+            lat, lng: 기준 좌표
+            k: 매장 수
+            open_only: True면 영업 중인 매장만
+            max_distance_m: 최대 거리 (미터)
+            
+        Returns:
+            (매장 정보, 거리 m) 리스트 (가까운 순)
+        """
+        results = self._geo_index.nearest(
+            lat, lng, k=k, predicate=_is_open if open_only else None, max_distance_m=max_distance_m
+        )
+        return [(store, distance) for distance, store in results]
+    
+    def find_stores_within(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: float = 1000,
+        open_only: bool = False,
+    ) -> List[Tuple[Dict, float]]:
+        """
+        좌표 반경 안의 매장을 찾습니다.
+        
+        Returns:
+            (매장 정보, 거리 m) 리스트 (가까운 순)
+        """
+        results = self._geo_index.within(lat, lng, radius_m, predicate=_is_open if open_only else None)
+        return [(store, distance) for distance, store in results]
     
     def find_store_by_name(self, name: str) -> Optional[Dict]:
         """
@@ -45,11 +441,34 @@ class StoreService:
         Returns:
             매장 정보 딕셔너리 또는 None
         """
-        name_lower = name.lower()
-        for store in self.data["stores"]:
-            if name_lower in store["name"].lower():
-                return store
-        return None
+        name_lower = _normalize(name)
+        # 1. 정확한 매장명 (O(1))
+        store = self._stores_by_name.get(name_lower)
+        if store is not None:
+            return store
+        # 2. 매장명 일부 (bigram 색인 후보만 확인)
+        matches = self._name_index.search(name_lower)
+        if matches:
+            return self.data["stores"][matches[0]]
+        # 3. STT 오인식 허용 퍼지 매칭 (띄어쓰기, 잘못 들은 음절)
+        fuzzy = self.fuzzy_find_stores(name, limit=1, min_score=STORE_FUZZY_MIN_SCORE)
+        return fuzzy[0][0] if fuzzy else None
+    
+    def fuzzy_find_stores(
+        self, name: str, limit: int = 3, min_score: float = STORE_FUZZY_MIN_SCORE
+    ) -> List[Tuple[Dict, float]]:
+        """
+        매장명 퍼지 검색 (자모 편집 거리, 초성 질의 지원)
+        
+        Returns:
+            (매장 정보, 유사도) 리스트 (유사도 높은 순)
+        """
+        if self._store_fuzzy is None:
+            unique = {}
+            for store in self.data["stores"]:
+                unique.setdefault(store.get("store_id"), store)
+            self._store_fuzzy = FuzzyIndex([(_store_name(store), store) for store in unique.values()])
+        return self._store_fuzzy.search(name, limit=limit, min_score=min_score)
     
     def find_store_by_location(self, location: str) -> List[Dict]:
         """
@@ -61,40 +480,40 @@ class StoreService:
         Returns:
             매장 정보 리스트
         """
-        location_lower = location.lower()
-        results = []
-        
-        for store in self.data["stores"]:
-            # 매장명, 주소, 주변 랜드마크에서 검색
-            search_fields = [
-                store["name"],
-                store["address"],
-                *store.get("nearby_landmarks", [])
-            ]
-            
-            if any(location_lower in field.lower() for field in search_fields):
-                results.append(store)
-        
-        return results
+        # 매장명, 주소, 주변 랜드마크에서 검색 (로드 시 정규화된 색인 사용)
+        stores = self.data["stores"]
+        return [stores[i] for i in self._location_index.search(_normalize(location))]
     
     def find_nearest_store(self, landmark: str) -> Optional[Dict]:
         """
         특정 랜드마크 근처의 매장을 찾습니다.
         
         Args:
-            landmark: 랜드마크명 (예: "강남역", "명동역")
+            landmark: 랜드마크명 (예: "강남역", "명동역 8번 출구")
             
         Returns:
             가장 가까운 매장 정보 또는 None
         """
-        landmark_lower = landmark.lower()
+        # 1. 가제티어에 있는 장소면 실제 거리 기준 가장 가까운 영업 중 매장
+        coords = self.locate(landmark)
+        if coords:
+            nearest = self.find_nearest_stores(
+                *coords, k=1, open_only=True, max_distance_m=NEAREST_STORE_MAX_DISTANCE_M
+            )
+            if nearest:
+                return nearest[0][0]
         
-        for store in self.data["stores"]:
-            nearby = store.get("nearby_landmarks", [])
-            if any(landmark_lower in mark.lower() for mark in nearby):
-                return store
+        landmark_lower = _normalize(landmark)
+        stores = self.data["stores"]
         
-        return None
+        # 2. 랜드마크 토큰 정확히 일치 (O(1))
+        indices = self._landmark_tokens.get(landmark_lower)
+        if indices:
+            return stores[indices[0]]
+        
+        # 3. 랜드마크 일부 일치
+        matches = self._landmark_index.search(landmark_lower)
+        return stores[matches[0]] if matches else None
     
     def get_store_info(self, store_id: str) -> Optional[Dict]:
         """
@@ -106,10 +525,7 @@ class StoreService:
         Returns:
             매장 정보 딕셔너리 또는 None
         """
-        for store in self.data["stores"]:
-            if store["store_id"] == store_id:
-                return store
-        return None
+        return self._stores_by_id.get(store_id)
     
     def format_store_info(self, store: Dict, detail_level: str = "full") -> str:
         """
@@ -125,41 +541,12 @@ class StoreService:
         if not store:
             return "매장 정보를 찾을 수 없습니다."
         
-        # 기본 정보 (항상 포함)
-        result = f"✨ {store['name']}\n"
-        result += f"📍 주소: {store['address']}\n"
-        result += f"📞 전화: {store['phone']}\n"
-        
-        if detail_level == "brief":
-            return result
-        
-        # 중간 상세 정보
-        hours = store.get("operating_hours", {})
-        result += f"⏰ 영업시간:\n"
-        result += f"   평일: {hours.get('weekday', '정보 없음')}\n"
-        result += f"   주말: {hours.get('weekend', '정보 없음')}\n"
-        
-        if detail_level == "medium":
-            return result
-        
-        # 전체 상세 정보
-        features = store.get("features", [])
-        if features:
-            result += f"✅ 특징: {', '.join(features)}\n"
-        
-        services = store.get("services", [])
-        if services:
-            result += f"🛍️ 서비스: {', '.join(services)}\n"
-        
-        landmarks = store.get("nearby_landmarks", [])
-        if landmarks:
-            result += f"🗺️ 주변: {', '.join(landmarks)}\n"
-        
-        popular = store.get("popular_products", [])
-        if popular:
-            result += f"🔥 인기상품: {', '.join(popular[:3])}\n"
-        
-        return result
+        # 스냅샷 로드 시 미리 렌더링한 결과 재사용 (같은 매장 객체일 때만)
+        # 그 밖의 매장/상세 수준은 매번 렌더링 (공유 스냅샷은 조회 중에 수정하지 않음)
+        cached = self._store_info_cache.get((store.get("store_id"), detail_level))
+        if cached is not None and cached[0] is store:
+            return cached[1]
+        return _render_store_info(store, detail_level)
     
     def get_all_stores(self) -> List[Dict]:
         """모든 매장 정보를 반환합니다."""
@@ -175,15 +562,8 @@ class StoreService:
         Returns:
             매장 정보 리스트
         """
-        service_lower = service.lower()
-        results = []
-        
-        for store in self.data["stores"]:
-            services = store.get("services", [])
-            if any(service_lower in s.lower() for s in services):
-                results.append(store)
-        
-        return results
+        stores = self.data["stores"]
+        return [stores[i] for i in self._service_index.search(_normalize(service))]
     
     def get_brand_info(self, brand_type: str = "all") -> List[str]:
         """
@@ -209,40 +589,107 @@ class StoreService:
         products = self.data.get("products", {})
         return products.get("by_category", {})
     
-    def get_products_by_category(self, category: str) -> List[Dict]:
+    def get_products_by_category(self, category: str) -> List[Product]:
         """카테고리별 제품 조회"""
         products = self.data.get("products", {})
         by_category = products.get("by_category", {})
         return by_category.get(category, [])
     
-    def get_all_products(self) -> List[Dict]:
+    def get_all_products(self) -> List[Product]:
         """모든 제품 조회"""
         products = self.data.get("products", {})
         return products.get("all_products", [])
     
-    def search_products(self, keyword: str, limit: int = 5) -> List[Dict]:
-        """키워드로 제품 검색"""
+    def search_products(self, keyword: str, limit: int = 5) -> List[Product]:
+        """키워드로 제품 검색 (정확히 포함하는 제품이 없으면 퍼지 검색 결과를 유사도 순으로 반환)"""
         keyword_lower = keyword.lower()
         results = []
         
         for product in self.get_all_products():
-            if keyword_lower in product.get("name", "").lower():
+            if keyword_lower in (product.name or "").lower():
                 results.append(product)
                 if len(results) >= limit:
                     break
         
+        if not results:
+            results = [product for product, _ in self.fuzzy_search_products(keyword, limit)]
         return results
     
+    def fuzzy_search_products(
+        self, keyword: str, limit: int = 5, min_score: float = PRODUCT_FUZZY_MIN_SCORE
+    ) -> List[Tuple[Dict, float]]:
+        """
+        제품명 퍼지 검색 (자모 편집 거리, 초성 질의, 띄어쓰기 무시)
+        
+        Args:
+            keyword: 검색어 (예: "토리는 세럼" → 토리든 세럼)
+            limit: 최대 결과 수
+            min_score: 최소 유사도 (0~1)
+            
+        Returns:
+            (제품 정보, 유사도) 리스트 (유사도 높은 순)
+        """
+        if self._product_fuzzy is None:
+            self._product_fuzzy = FuzzyIndex([(p.name or "", p) for p in self.get_all_products()])
+        return self._product_fuzzy.search(keyword, limit=limit, min_score=min_score)
+    
+    @property
+    def product_array(self):
+        """제품 카탈로그의 NumPy 컬럼 뷰 (스냅샷당 한 번 생성)"""
+        if self._product_array is None:
+            from .product_array import ProductArray
+            
+            if self.catalog is not None:
+                all_products = self.get_all_products()
+                self._product_array = ProductArray.from_binary_catalog(
+                    self.catalog, all_products, all_products.rows
+                )
+            else:
+                self._product_array = ProductArray.from_products(self.get_all_products(), self.get_categories())
+        return self._product_array
+    
+    def query_products(
+        self,
+        max_price: Optional[int] = None,
+        min_price: Optional[int] = None,
+        in_stock: Optional[bool] = None,
+        category: Optional[str] = None,
+        min_discount: Optional[int] = None,
+        sort_by: str = "discount_rate",
+        limit: int = 5,
+    ) -> List[Dict]:
+        """
+        조건으로 제품을 필터링하고 정렬 기준 상위 제품을 반환합니다.
+        예: 3만원 이하, 재고 있음, 스킨케어, 할인율 상위 5개
+            query_products(max_price=30000, in_stock=True, category="스킨케어", limit=5)
+        
+        Args:
+            max_price: 최대 판매가 (원)
+            min_price: 최소 판매가 (원)
+            in_stock: True면 재고 있는 제품만
+            category: 카테고리 이름
+            min_discount: 최소 할인율 (%)
+            sort_by: 정렬 기준 (discount_rate: 높은 순, sale_price/original_price: 낮은 순)
+            limit: 최대 결과 수
+            
+        Returns:
+            제품 정보 리스트
+        """
+        array = self.product_array
+        mask = array.mask(
+            max_price=max_price,
+            min_price=min_price,
+            in_stock=in_stock,
+            category=category,
+            min_discount=min_discount,
+        )
+        rows = array.top_k(limit, by=sort_by, mask=mask, descending=(sort_by == "discount_rate"))
+        return array.select(rows)
+    
     def get_popular_products(self, limit: int = 3) -> List[Dict]:
         """인기 제품 조회 (할인율 높은 순)"""
-        products = self.get_all_products()
-        # 할인율 순으로 정렬
-        sorted_products = sorted(
-            products, 
-            key=lambda p: p.get("discount_rate", 0), 
-            reverse=True
-        )
-        return sorted_products[:limit]
+        array = self.product_array
+        return array.select(array.top_k(limit, by="discount_rate"))
     
     def get_main_store_image(self) -> Optional[str]:
         """메인 매장 이미지 URL 반환"""
@@ -250,3 +697,123 @@ class StoreService:
         images = store.get("store_images", [])
         return images[0] if images else None
 
+
+
+# 프로세스 전역 공유 스냅샷 (모든 봇 세션이 같은 인스턴스를 읽기 전용으로 사용)
+_shared_service: Optional[StoreService] = None
+_shared_lock = threading.Lock()
+# 비동기 reload 직렬화 (감시 태스크와 /api/catalog/reload가 동시에 파싱/교체하지 않도록)
+_reload_lock = asyncio.Lock()
+
+
+def get_store_service() -> StoreService:
+    """
+    프로세스 전역 StoreService 스냅샷을 반환합니다.
+    최초 호출 시 한 번만 파일을 읽고, 이후에는 파일 I/O 없이 같은 인스턴스를 반환합니다.
+    """
+    global _shared_service
+    service = _shared_service
+    if service is None:
+        with _shared_lock:
+            if _shared_service is None:
+                _shared_service = StoreService(DEFAULT_DATA_PATH, version=1)
+            service = _shared_service
+    return service
+
+
+def _is_stale(service: StoreService, current: Optional[StoreService]) -> bool:
+    """같은 파일에서 현재 스냅샷보다 오래된 내용을 읽은 스냅샷인지"""
+    if current is None or service.data_path != current.data_path:
+        return False
+    if service.file_stat is None or current.file_stat is None:
+        return False
+    return service.file_stat < current.file_stat
+
+
+def _swap_store_service(service: StoreService) -> StoreService:
+    """
+    새 스냅샷을 원자적으로 교체합니다 (참조 대입 한 번).
+    현재 스냅샷보다 오래된 파일 내용이면 교체하지 않고 현재 스냅샷을 반환합니다.
+    """
+    global _shared_service
+    with _shared_lock:
+        current = _shared_service
+        if _is_stale(service, current):
+            logger.warning(f"⚠️ Skipping stale catalog snapshot: {service.data_path} (keeping version {current.version})")
+            return current
+        service.version = (current.version if current else 0) + 1
+        _shared_service = service
+    return service
+
+
+def _current_data_path(data_path: Optional[str]) -> str:
+    current = _shared_service
+    return data_path or (str(current.data_path) if current else DEFAULT_DATA_PATH)
+
+
+def reload_store_service(data_path: Optional[str] = None) -> StoreService:
+    """
+    데이터 파일을 다시 읽어 새 스냅샷으로 교체합니다.
+    이전 스냅샷을 참조하는 세션은 그대로 이전 데이터를 사용합니다.
+    
+    Args:
+        data_path: 데이터 파일 경로 (None이면 현재 스냅샷 경로)
+        
+    Returns:
+        현재 StoreService 스냅샷 (읽은 내용이 현재보다 오래됐으면 기존 스냅샷)
+    """
+    return _swap_store_service(StoreService(_current_data_path(data_path)))
+
+
+def _build_store_service(path: str) -> StoreService:
+    """파일 파싱 + 인덱스 빌드 (워커 스레드에서 실행)"""
+    if not Path(path).exists():
+        # 빈 카탈로그로 교체되지 않도록 reload에서는 파일 누락을 오류로 처리
+        raise FileNotFoundError(f"Catalog file not found: {path}")
+    return StoreService(path)
+
+
+async def reload_store_service_async(data_path: Optional[str] = None) -> StoreService:
+    """
+    이벤트 루프를 막지 않고 카탈로그를 다시 로드합니다.
+    파싱과 인덱스 빌드는 스레드에서 수행하고, 완료되면 스냅샷 참조만 교체합니다.
+    stat → 파싱 → 교체 전체를 한 번에 하나만 실행하므로 늦게 끝난 오래된 파싱이 새 스냅샷을 덮지 않습니다.
+    실패하면 예외를 그대로 전달하고 기존 스냅샷을 유지합니다.
+    
+    Args:
+        data_path: 데이터 파일 경로 (None이면 현재 스냅샷 경로)
+        
+    Returns:
+        현재 StoreService 스냅샷
+    """
+    async with _reload_lock:
+        path = _current_data_path(data_path)
+        service = await asyncio.to_thread(_build_store_service, path)
+        live = _swap_store_service(service)
+    if live is service:
+        logger.info(f"🔄 Catalog reloaded: {path} (version {service.version}, {len(service.get_all_products())} products)")
+    return live
+
+
+async def watch_store_data(interval: float = 5.0):
+    """
+    데이터 파일 변경(mtime/크기)을 주기적으로 확인하고 바뀌면 스냅샷을 교체합니다.
+    비교 기준은 현재 스냅샷이 읽은 파일 상태이므로 /api/catalog/reload로 교체된 경우도 반영됩니다.
+    서버 수명 동안 백그라운드 태스크로 실행합니다.
+    
+    Args:
+        interval: 확인 주기 (초)
+    """
+    logger.info(f"👀 Watching catalog file: {get_store_service().data_path} (every {interval}s)")
+    while True:
+        await asyncio.sleep(interval)
+        snapshot = get_store_service()
+        path = snapshot.data_path
+        current = _file_stat(path)
+        if current is None or current == snapshot.file_stat:
+            continue
+        try:
+            await reload_store_service_async(str(path))
+        except Exception as e:
+            # 쓰기 도중의 불완전한 파일 등 - 기존 스냅샷 유지 후 다음 주기에 재시도
+            logger.error(f"❌ Catalog reload failed, keeping version {get_store_service().version}: {e}")
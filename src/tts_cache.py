@@ -0,0 +1,305 @@
+"""
+TTS 오디오 캐시
+반복되는 어시스턴트 응답(FAQ 답변, 매장 안내 등)의 합성 PCM을 (voice_id, 언어, 정규화 텍스트) 키로 저장
+- 메모리 계층: 바이트 예산 LRU
+- 디스크 계층: 바이트 예산, 오래 안 쓴 파일부터 삭제 (서버 재시작 후에도 유지)
+"""
+import bisect
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+
+# 환경 설정 (디스크 예산 0이면 디스크 계층 끔)
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "data/tts_cache")
+TTS_CACHE_MEMORY_MB = float(os.getenv("TTS_CACHE_MEMORY_MB", "32"))
+TTS_CACHE_DISK_MB = float(os.getenv("TTS_CACHE_DISK_MB", "256"))
+
+# 이보다 긴 응답은 저장하지 않음 (일회성 긴 설명이 예산을 차지하지 않도록)
+MAX_CACHEABLE_CHARS = 300
+
+# 처음 본 응답은 저장하지 않고 키만 기억 (두 번째부터 저장 - 일회성 LLM 응답이 LRU를 밀어내지 않도록)
+ADMISSION_HISTORY = 4096
+
+_FILE_SUFFIX = ".pcm"
+
+
+def normalize_tts_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (연속 공백 하나로, 앞뒤 공백 제거)"""
+    return " ".join((text or "").split())
+
+
+def _namespace(voice_id: str, language: str) -> str:
+    return f"{voice_id}|{language}"
+
+
+def cache_key(voice_id: str, language: str, text: str) -> str:
+    """내용 주소 키 (sha256)"""
+    raw = f"{_namespace(voice_id, language)}|{normalize_tts_text(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CachedAudio(NamedTuple):
+    audio: bytes
+    sample_rate: int
+    num_channels: int
+
+
+class TTSAudioCache:
+    """메모리 LRU + 디스크 2계층 PCM 캐시
+
+    디스크 파일 형식: 메타데이터 JSON 한 줄(text, voice_id, language, sample_rate, num_channels) + 원본 PCM
+    시작 시 메타데이터 줄만 읽어 텍스트 색인을 복원합니다 (오디오는 조회 시 로드).
+    """
+
+    def __init__(
+        self,
+        memory_budget_bytes: int,
+        disk_dir: Optional[str] = None,
+        disk_budget_bytes: int = 0,
+    ):
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_budget_bytes = disk_budget_bytes if disk_dir else 0
+        self.disk_dir = Path(disk_dir) if disk_dir and self.disk_budget_bytes > 0 else None
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, CachedAudio]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()  # key → 파일 크기 (오래 안 쓴 순)
+        self._disk_bytes = 0
+        self._texts: Dict[str, List[str]] = {}      # namespace → 정렬된 정규화 텍스트 (접두사 확인용)
+        self._key_text: Dict[str, Tuple[str, str]] = {}  # key → (namespace, 텍스트)
+        self._seen: "OrderedDict[str, None]" = OrderedDict()  # 저장 허용 판단용 최근 키
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        if self.disk_dir:
+            self._load_disk_index()
+
+    # ----- 텍스트 색인 -----
+
+    def _index_add(self, key: str, namespace: str, text: str):
+        if key in self._key_text:
+            return
+        self._key_text[key] = (namespace, text)
+        texts = self._texts.setdefault(namespace, [])
+        bisect.insort(texts, text)
+
+    def _index_remove(self, key: str):
+        if key in self._memory or key in self._disk:
+            return  # 다른 계층에 남아 있음
+        entry = self._key_text.pop(key, None)
+        if entry is None:
+            return
+        namespace, text = entry
+        texts = self._texts.get(namespace, [])
+        i = bisect.bisect_left(texts, text)
+        if i < len(texts) and texts[i] == text:
+            texts.pop(i)
+
+    def has_prefix(self, voice_id: str, language: str, text: str) -> bool:
+        """정규화 텍스트가 캐시된 어떤 응답의 앞부분인지 확인 (스트리밍 중 보류 판단용)"""
+        prefix = normalize_tts_text(text)
+        texts = self._texts.get(_namespace(voice_id, language))
+        if not texts:
+            return False
+        i = bisect.bisect_left(texts, prefix)
+        return i < len(texts) and texts[i].startswith(prefix)
+
+    # ----- 조회/저장 -----
+
+    def admit(self, voice_id: str, language: str, text: str) -> bool:
+        """저장할 가치가 있는 응답인지 (최근에 한 번 이상 나온 적 있는 짧은 응답만 True)"""
+        text = normalize_tts_text(text)
+        if not text or len(text) > MAX_CACHEABLE_CHARS:
+            return False
+        key = cache_key(voice_id, language, text)
+        with self._lock:
+            if key in self._seen:
+                self._seen.move_to_end(key)
+                return True
+            self._seen[key] = None
+            if len(self._seen) > ADMISSION_HISTORY:
+                self._seen.popitem(last=False)
+            return False
+
+    def get_memory(self, voice_id: str, language: str, text: str) -> Optional[CachedAudio]:
+        """메모리 계층만 조회 (파일 I/O 없음 - 이벤트 루프에서 바로 호출 가능, 미스는 집계하지 않음)"""
+        key = cache_key(voice_id, language, text)
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+            return cached
+
+    def get(self, voice_id: str, language: str, text: str) -> Optional[CachedAudio]:
+        """캐시된 오디오 (메모리 → 디스크 순, 디스크 적중 시 메모리로 승격)
+
+        디스크 계층은 블로킹 파일 읽기이므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+        """
+        key = cache_key(voice_id, language, text)
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return cached
+            if key not in self._disk:
+                self.stats["misses"] += 1
+                return None
+        cached = self._read_disk(key)
+        with self._lock:
+            if cached is None:
+                self._disk_bytes -= self._disk.pop(key, 0)
+                self._index_remove(key)
+                self.stats["misses"] += 1
+                return None
+            self._disk.move_to_end(key)
+            self.stats["disk_hits"] += 1
+            self._put_memory(key, cached)
+        return cached
+
+    def put(self, voice_id: str, language: str, text: str, audio: bytes, sample_rate: int, num_channels: int = 1):
+        """합성 오디오 저장 (너무 긴 텍스트나 빈 오디오는 무시)"""
+        text = normalize_tts_text(text)
+        if not text or not audio or len(text) > MAX_CACHEABLE_CHARS:
+            return
+        key = cache_key(voice_id, language, text)
+        cached = CachedAudio(bytes(audio), sample_rate, num_channels)
+        namespace = _namespace(voice_id, language)
+        with self._lock:
+            self._index_add(key, namespace, text)
+            self._put_memory(key, cached)
+            self.stats["stores"] += 1
+        if self.disk_dir:
+            self._write_disk(key, namespace, text, cached)
+
+    def _put_memory(self, key: str, cached: CachedAudio):
+        if len(cached.audio) > self.memory_budget_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous.audio)
+        self._memory[key] = cached
+        self._memory_bytes += len(cached.audio)
+        while self._memory_bytes > self.memory_budget_bytes:
+            evicted_key, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted.audio)
+            self.stats["evictions"] += 1
+            self._index_remove(evicted_key)
+
+    # ----- 디스크 계층 -----
+
+    def _path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}{_FILE_SUFFIX}"
+
+    def _load_disk_index(self):
+        files = []
+        for path in self.disk_dir.glob(f"*/*{_FILE_SUFFIX}"):
+            try:
+                with open(path, "rb") as f:
+                    meta = json.loads(f.readline())
+                files.append((path.stat().st_mtime, path.stem, path.stat().st_size, meta))
+            except (OSError, ValueError):
+                continue
+        for _, key, size, meta in sorted(files):
+            self._disk[key] = size
+            self._disk_bytes += size
+            self._index_add(key, _namespace(meta["voice_id"], meta["language"]), meta["text"])
+        if files:
+            logger.info(f"🔊 TTS cache: {len(files)} phrases on disk ({self._disk_bytes / 1e6:.1f} MB)")
+        self._evict_disk()
+
+    def _read_disk(self, key: str) -> Optional[CachedAudio]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                audio = f.read()
+            os.utime(path)  # 최근 사용 시각 (재시작 후 LRU 순서)
+        except (OSError, ValueError):
+            return None
+        return CachedAudio(audio, meta["sample_rate"], meta["num_channels"])
+
+    def _write_disk(self, key: str, namespace: str, text: str, cached: CachedAudio):
+        voice_id, language = namespace.split("|", 1)
+        meta = {
+            "text": text,
+            "voice_id": voice_id,
+            "language": language,
+            "sample_rate": cached.sample_rate,
+            "num_channels": cached.num_channels,
+        }
+        header = json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n"
+        size = len(header) + len(cached.audio)
+        if size > self.disk_budget_bytes:
+            return
+        path = self._path(key)
+        tmp = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 쓰기마다 고유한 임시 파일 (같은 키를 동시에 쓰는 워커/스레드끼리 섞이지 않도록)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{key}.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(cached.audio)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"⚠️ TTS cache disk write failed: {e}")
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+            return
+        with self._lock:
+            self._disk_bytes += size - self._disk.pop(key, 0)
+            self._disk[key] = size
+            self._evict_disk()
+
+    def _evict_disk(self):
+        while self._disk_bytes > self.disk_budget_bytes and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            self.stats["evictions"] += 1
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+            self._index_remove(key)
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    @property
+    def disk_bytes(self) -> int:
+        return self._disk_bytes
+
+
+# 프로세스 전역 TTS 캐시 (세션 간 공유, 첫 사용 시 생성)
+_shared_cache: Optional[TTSAudioCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSAudioCache:
+    """
+    프로세스 전역 TTS 캐시를 반환합니다.
+    최초 호출 시 한 번만 디스크 색인을 읽습니다 (import 시에는 캐시 디렉토리를 훑지 않음).
+    """
+    global _shared_cache
+    cache = _shared_cache
+    if cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = TTSAudioCache(
+                    memory_budget_bytes=int(TTS_CACHE_MEMORY_MB * 1024 * 1024),
+                    disk_dir=TTS_CACHE_DIR,
+                    disk_budget_bytes=int(TTS_CACHE_DISK_MB * 1024 * 1024),
+                )
+            cache = _shared_cache
+    return cache
@@ -0,0 +1,197 @@
+"""
+세션 간 배치 VAD 추론
+동시 세션이 많을 때 세션마다 프레임당 한 번씩 돌던 Silero ONNX 추론을 작업 스레드 하나에서 모아
+(batch, samples) 입력 한 번으로 실행하고, 결과는 세션별 Future로 돌려줍니다.
+Silero RNN 상태(state/context)는 분석기가 계속 들고 있고 요청과 함께 보냈다가 결과로 돌려받습니다.
+"""
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .vad_pool import PooledSileroVADAnalyzer
+
+# 첫 프레임이 온 뒤 다른 세션 프레임을 기다리는 최대 시간 (활성 세션이 모두 보내면 바로 실행)
+VAD_BATCH_WINDOW_MS = float(os.getenv("VAD_BATCH_WINDOW_MS", "4"))
+# 배치 하나의 최대 프레임 수
+VAD_BATCH_MAX = int(os.getenv("VAD_BATCH_MAX", "64"))
+
+# Silero 모델 상태 초기화 주기 (pipecat SileroVADAnalyzer와 동일)
+_MODEL_RESET_STATES_TIME = 5.0
+
+
+def _context_size(sample_rate: int) -> int:
+    return 64 if sample_rate == 16000 else 32
+
+
+class _Request:
+    __slots__ = ("audio", "state", "context", "sample_rate", "future")
+
+    def __init__(self, audio, state, context, sample_rate):
+        self.audio = audio
+        self.state = state
+        self.context = context
+        self.sample_rate = sample_rate
+        self.future: Future = Future()
+
+
+class BatchedVADService:
+    """프로세스 전역 배치 VAD 추론 서비스 (작업 스레드 하나)"""
+
+    def __init__(self, window_ms: float = VAD_BATCH_WINDOW_MS, max_batch: int = VAD_BATCH_MAX):
+        self.window = window_ms / 1000
+        self.max_batch = max(1, max_batch)
+        self._session = None
+        self._queue: "queue.SimpleQueue[Optional[_Request]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._active = 0  # 오디오를 보내는 세션 수 (전부 모이면 대기 없이 실행)
+        self.stats = {"batches": 0, "frames": 0, "max_batch": 0}
+
+    def start(self, session):
+        """공유 InferenceSession으로 작업 스레드를 시작합니다 (이미 실행 중이면 무시)."""
+        with self._lock:
+            if self._thread is None:
+                self._session = session
+                self._thread = threading.Thread(target=self._worker, name="vad-batch", daemon=True)
+                self._thread.start()
+                logger.info(f"🎙️ Batched VAD service started (window {self.window * 1000:.0f}ms, max batch {self.max_batch})")
+
+    def stop(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread:
+            self._queue.put(None)
+            thread.join()
+
+    def attach(self):
+        with self._lock:
+            self._active += 1
+
+    def detach(self):
+        with self._lock:
+            self._active = max(0, self._active - 1)
+
+    def submit(self, audio: np.ndarray, state: np.ndarray, context: np.ndarray, sample_rate: int) -> Future:
+        """
+        프레임 하나를 배치 큐에 넣습니다.
+
+        Returns:
+            (음성 확률, 새 state, 새 context)를 돌려줄 Future
+        """
+        request = _Request(audio, state, context, sample_rate)
+        self._queue.put(request)
+        return request.future
+
+    def infer(self, audio: np.ndarray, state: np.ndarray, context: np.ndarray, sample_rate: int):
+        """submit 후 결과를 기다립니다 (분석기 실행 스레드에서 호출)."""
+        return self.submit(audio, state, context, sample_rate).result()
+
+    def _collect(self, first: _Request) -> List[_Request]:
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < min(self.max_batch, max(1, self._active)):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                self._queue.put(None)  # 종료 신호는 이번 배치 처리 후
+                break
+            batch.append(request)
+        return batch
+
+    def _worker(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+            groups: Dict[int, List[_Request]] = {}
+            for request in batch:
+                groups.setdefault(request.sample_rate, []).append(request)
+            for sample_rate, requests in groups.items():
+                self._run(sample_rate, requests)
+
+    def _run(self, sample_rate: int, requests: List[_Request]):
+        context_size = _context_size(sample_rate)
+        try:
+            x = np.stack([np.concatenate((request.context, request.audio)) for request in requests])
+            state = np.concatenate([request.state for request in requests], axis=1)
+            out, new_state = self._session.run(
+                None, {"input": x, "state": state, "sr": np.array(sample_rate, dtype="int64")}
+            )
+        except Exception as e:
+            for request in requests:
+                request.future.set_exception(e)
+            return
+        for i, request in enumerate(requests):
+            request.future.set_result((float(out[i, 0]), new_state[:, i:i + 1].copy(), x[i, -context_size:].copy()))
+        self.stats["batches"] += 1
+        self.stats["frames"] += len(requests)
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(requests))
+
+    @property
+    def average_batch(self) -> float:
+        return self.stats["frames"] / self.stats["batches"] if self.stats["batches"] else 0.0
+
+
+class BatchedSileroVADAnalyzer(PooledSileroVADAnalyzer):
+    """추론을 BatchedVADService에 맡기는 Silero VAD 분석기 (음성 판정 로직은 pipecat 그대로)"""
+
+    def __init__(self, *, session, service: BatchedVADService, sample_rate: Optional[int] = None, params=None):
+        super().__init__(session=session, sample_rate=sample_rate, params=params)
+        self._service = service
+        self._attached = False
+        self._reset_session_state()
+
+    def _reset_session_state(self):
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context: Optional[np.ndarray] = None
+
+    def reset(self, params=None):
+        super().reset(params)
+        self._reset_session_state()
+        if not self._attached:
+            self._service.attach()
+            self._attached = True
+
+    def detach(self):
+        if self._attached:
+            self._service.detach()
+            self._attached = False
+
+    def voice_confidence(self, buffer) -> float:
+        try:
+            sample_rate = self.sample_rate
+            audio = np.frombuffer(buffer, np.int16).astype(np.float32) / 32768.0
+            if len(audio) != (512 if sample_rate == 16000 else 256):
+                raise ValueError(f"Unexpected VAD frame size {len(audio)} at {sample_rate}Hz")
+            context_size = _context_size(sample_rate)
+            if self._context is None or len(self._context) != context_size:
+                self._reset_session_state()
+                self._context = np.zeros(context_size, dtype=np.float32)
+
+            confidence, self._state, self._context = self._service.infer(audio, self._state, self._context, sample_rate)
+
+            # 상태가 계속 쌓이지 않도록 주기적으로 초기화 (pipecat SileroVADAnalyzer와 동일)
+            now = time.time()
+            if now - self._last_reset_time >= _MODEL_RESET_STATES_TIME:
+                self._reset_session_state()
+                self._last_reset_time = now
+            return confidence
+        except Exception as e:
+            logger.error(f"Error analyzing audio with batched Silero VAD: {e}")
+            return 0
+
+
+# 프로세스 전역 배치 VAD 서비스 (VAD_BATCHING=true일 때 분석기 풀이 사용)
+batched_vad_service = BatchedVADService()
@@ -0,0 +1,120 @@
+"""
+Silero VAD 모델 캐시 / 분석기 풀
+- 모델 캐시: ONNX InferenceSession은 프로세스당 하나만 만들어 모든 세션이 공유 (세션별 RNN 상태만 분리)
+- 분석기 풀: 끝난 세션의 분석기를 상태만 초기화해 다음 세션에 재사용 (모델 로드/스레드 생성 없음)
+- VAD_BATCHING=true면 세션 간 배치 추론 분석기를 만듦 (vad_batch.py)
+"""
+import os
+import threading
+import time
+from collections import deque
+from importlib import resources
+from typing import Deque, Optional
+
+import numpy as np
+from loguru import logger
+from pipecat.audio.vad.silero import SileroOnnxModel, SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+
+# 대기 상태로 보관할 분석기 수 (동시 세션 수에 맞추면 새 세션은 항상 준비된 분석기를 받음)
+VAD_POOL_SIZE = int(os.getenv("VAD_POOL_SIZE", "4"))
+
+# 동시 세션이 많은 서버에서 세션 간 프레임을 모아 한 번에 추론
+VAD_BATCHING = os.getenv("VAD_BATCHING", "false").lower() in ("1", "true", "yes")
+
+_MODEL_PACKAGE = "pipecat.audio.vad.data"
+_MODEL_NAME = "silero_vad.onnx"
+
+
+class _SharedSessionModel(SileroOnnxModel):
+    """공유 InferenceSession 위의 세션별 Silero 상태 (state/context만 분석기마다 따로 가짐)"""
+
+    def __init__(self, session):
+        self.session = session
+        self.sample_rates = [8000, 16000]
+        self.reset_states()
+
+
+class PooledSileroVADAnalyzer(SileroVADAnalyzer):
+    """공유 모델을 쓰는 Silero VAD 분석기 (생성 시 모델을 다시 로드하지 않음)"""
+
+    def __init__(self, *, session, sample_rate: Optional[int] = None, params: Optional[VADParams] = None):
+        VADAnalyzer.__init__(self, sample_rate=sample_rate, params=params)
+        self._model = _SharedSessionModel(session)
+        self._last_reset_time = 0
+
+    def reset(self, params: Optional[VADParams] = None):
+        """다음 세션을 위해 모델 상태와 버퍼/음성 판정 상태를 초기화합니다."""
+        self._model.reset_states()
+        self._vad_buffer = b""
+        self._prev_volume = 0
+        self._last_reset_time = 0
+        self._params = params or VADParams()
+        if self._sample_rate:
+            self.set_params(self._params)  # 시작/종료 프레임 카운터, QUIET 상태로
+
+    def detach(self):
+        """풀에 반납될 때 호출 (배치 분석기는 활성 세션 수에서 빠짐)"""
+
+
+class VADAnalyzerPool:
+    """프로세스 전역 Silero 모델 캐시 + 미리 만들어 둔 분석기 풀"""
+
+    def __init__(self, size: int = VAD_POOL_SIZE, batched: bool = VAD_BATCHING):
+        self.size = max(0, size)
+        self.batched = batched
+        self._session = None
+        self._idle: Deque[PooledSileroVADAnalyzer] = deque()
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "model_load_ms": 0.0}
+
+    def _load_session(self):
+        """ONNX 모델을 한 번만 로드하고 첫 추론(그래프 최적화/메모리 할당)까지 미리 실행"""
+        if self._session is None:
+            started = time.perf_counter()
+            model = SileroOnnxModel(str(resources.files(_MODEL_PACKAGE).joinpath(_MODEL_NAME)), force_onnx_cpu=True)
+            model(np.zeros(512, dtype=np.float32), 16000)
+            self._session = model.session
+            self.stats["model_load_ms"] = (time.perf_counter() - started) * 1000
+            logger.info(f"🎙️ Silero VAD model loaded ({self.stats['model_load_ms']:.0f}ms, shared by all sessions)")
+        return self._session
+
+    def _create(self) -> PooledSileroVADAnalyzer:
+        self.stats["created"] += 1
+        if self.batched:
+            from .vad_batch import BatchedSileroVADAnalyzer, batched_vad_service
+            batched_vad_service.start(self._load_session())
+            return BatchedSileroVADAnalyzer(session=self._load_session(), service=batched_vad_service)
+        return PooledSileroVADAnalyzer(session=self._load_session())
+
+    def warm(self):
+        """모델을 로드하고 풀을 채웁니다 (서버 시작 시 백그라운드 스레드에서 호출)."""
+        with self._lock:
+            while len(self._idle) < self.size:
+                self._idle.append(self._create())
+
+    def acquire(self, params: Optional[VADParams] = None) -> PooledSileroVADAnalyzer:
+        """준비된 분석기를 꺼냅니다 (풀이 비었으면 공유 모델로 새로 만듦)."""
+        with self._lock:
+            if self._idle:
+                analyzer = self._idle.popleft()
+                self.stats["reused"] += 1
+            else:
+                analyzer = self._create()
+        analyzer.reset(params)
+        return analyzer
+
+    def release(self, analyzer: PooledSileroVADAnalyzer):
+        """세션이 끝난 분석기를 반납합니다 (풀이 가득 차면 버림)."""
+        analyzer.detach()
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(analyzer)
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+
+# 프로세스 전역 VAD 풀 (세션 간 공유)
+vad_pool = VADAnalyzerPool()
@@ -1,21 +1,54 @@
 """
 WebSocket 연결 관리 모듈
+
+채팅 WebSocket 프로토콜 (/api/chat-ws?protocol=N):
+- v1 (기본): 이벤트마다 JSON 객체 하나를 텍스트 프레임 하나로 전송, show_images는 제품 객체 전체 포함
+- v2: 연결 시 카탈로그 사전({"type": "catalog", "version", "products": {id: 제품}})을 한 번 보내고,
+  제품 카드는 ID만 전송 ({"type": "show_images", "content_type": "products", "ids": [...]}).
+  클라이언트가 가진 사전과 다른 스냅샷(카탈로그 리로드 전후 세션)의 제품은 해당 제품만
+  메시지에 함께 실어 보냄 ("products": {id: 제품}) - 사전 전체를 다시 보내지 않음.
+  같은 루프 틱(또는 CHAT_WS_COALESCE_MS) 안에 생긴 이벤트는 JSON 배열 프레임 하나로 묶어 전송
 """
+import asyncio
+import os
+from typing import Dict, List, Optional
+
 from loguru import logger
-import json
+
+from .serialization import dumps
+
+# v2 이벤트 묶음 대기 시간 (0이면 같은 이벤트 루프 틱 안의 이벤트만 묶음)
+CHAT_WS_COALESCE_MS = float(os.getenv("CHAT_WS_COALESCE_MS", "0"))
+
+# 지원하는 채팅 프로토콜 버전
+PROTOCOL_VERSIONS = (1, 2)
 
 # 전역 WebSocket 저장소
 _active_websockets = {}
+_protocols: Dict[int, int] = {}         # client_id → 프로토콜 버전
+_catalog_versions: Dict[int, int] = {}  # client_id → 보낸 카탈로그 스냅샷 버전 (v2)
+_pending: Dict[int, List[str]] = {}     # client_id → 아직 보내지 않은 v2 이벤트
+_flush_task: Optional[asyncio.Task] = None
+
+# show_images 제품 메시지 틀 (products 배열 자리에 제품 JSON 조각을 이어 붙임)
+_PRODUCTS_MESSAGE_PREFIX = dumps({"type": "show_images", "content_type": "products", "data": {"products": []}})[:-3]
+_PRODUCTS_MESSAGE_SUFFIX = "]}}"
 
 
-def add_websocket(client_id, websocket):
-    """WebSocket 연결 추가"""
+def add_websocket(client_id, websocket, protocol: int = 1):
+    """WebSocket 연결 추가 (지원하지 않는 프로토콜 버전은 v1로 처리)"""
     _active_websockets[client_id] = websocket
-    logger.info(f"✅ WebSocket added: {client_id}, Total: {len(_active_websockets)}")
+    _protocols[client_id] = protocol if protocol in PROTOCOL_VERSIONS else 1
+    logger.info(
+        f"✅ WebSocket added: {client_id} (protocol v{_protocols[client_id]}), Total: {len(_active_websockets)}"
+    )
 
 
 def remove_websocket(client_id):
     """WebSocket 연결 제거"""
+    _protocols.pop(client_id, None)
+    _catalog_versions.pop(client_id, None)
+    _pending.pop(client_id, None)
     if client_id in _active_websockets:
         del _active_websockets[client_id]
         logger.info(f"🗑️ WebSocket removed: {client_id}, Remaining: {len(_active_websockets)}")
@@ -26,22 +59,153 @@ def get_active_websockets():
     return _active_websockets
 
 
+def products_message(payloads: List[str]) -> str:
+    """미리 직렬화된 제품 JSON 조각으로 show_images 메시지를 만듭니다 (문자열 연결만 수행)."""
+    return _PRODUCTS_MESSAGE_PREFIX + ",".join(payloads) + _PRODUCTS_MESSAGE_SUFFIX
+
+
+def catalog_message(store_service) -> str:
+    """v2 카탈로그 사전 메시지 (스냅샷에 미리 직렬화된 사전을 감싸기만 함)"""
+    return f'{{"type":"catalog","version":{store_service.version},"products":{store_service.catalog_payload}}}'
+
+
+def send_catalog(client_id, store_service):
+    """v2 클라이언트에 카탈로그 사전을 보냅니다 (이미 같은 버전을 보냈으면 생략)."""
+    if _protocols.get(client_id) != 2 or _catalog_versions.get(client_id) == store_service.version:
+        return
+    _catalog_versions[client_id] = store_service.version
+    _queue(client_id, catalog_message(store_service))
+
+
+def send_catalog_if_missing(client_id, store_service):
+    """아직 카탈로그 사전을 받지 않은 v2 클라이언트에만 사전을 보냅니다."""
+    if client_id not in _catalog_versions:
+        send_catalog(client_id, store_service)
+
+
+def _queue(client_id, event: str):
+    """v2 이벤트를 묶음 전송 대기열에 넣습니다 (첫 이벤트가 flush 예약)."""
+    global _flush_task
+    _pending.setdefault(client_id, []).append(event)
+    if _flush_task is None:
+        _flush_task = asyncio.get_running_loop().create_task(_flush_pending())
+
+
+async def _flush_pending():
+    global _flush_task
+    await asyncio.sleep(CHAT_WS_COALESCE_MS / 1000)
+    # 전송 중에 들어온 이벤트는 다음 묶음으로
+    _flush_task = None
+    batches = dict(_pending)
+    _pending.clear()
+
+    disconnected = []
+    for client_id, events in batches.items():
+        ws = _active_websockets.get(client_id)
+        if ws is not None and not await _send(client_id, ws, "[" + ",".join(events) + "]"):
+            disconnected.append(client_id)
+    for client_id in disconnected:
+        remove_websocket(client_id)
+
+
+async def flush():
+    """대기 중인 v2 이벤트 전송이 끝날 때까지 기다립니다."""
+    while _flush_task is not None:
+        await _flush_task
+
+
+async def _send(client_id, ws, message: str) -> bool:
+    try:
+        await ws.send_text(message)
+        logger.info(f"✅ Sent to WebSocket {client_id}")
+        return True
+    except Exception as e:
+        logger.error(f"❌ Error sending to WebSocket {client_id}: {e}")
+        return False
+
+
 async def broadcast_message(data: dict):
     """모든 WebSocket에 메시지 전송"""
-    message = json.dumps(data)
-    disconnected = []
-    
     logger.info(f"📤 Broadcasting to {len(_active_websockets)} WebSocket(s): {data}")
-    
+    await broadcast_raw(dumps(data))
+
+
+async def broadcast_raw(message: str, summary: Optional[str] = None, v2_message: Optional[str] = None):
+    """
+    이미 직렬화된 메시지를 모든 WebSocket에 전송합니다.
+
+    Args:
+        message: JSON 문자열 (v1은 바로 전송, v2는 같은 틱의 다른 이벤트와 묶어 전송)
+        summary: 로그에 남길 요약 (None이면 broadcast_message가 이미 로그를 남긴 경우)
+        v2_message: v2 클라이언트에 대신 보낼 이벤트 (None이면 message)
+    """
+    disconnected = []
+
+    if summary is not None:
+        logger.info(f"📤 Broadcasting to {len(_active_websockets)} WebSocket(s): {summary}")
+
     for client_id, ws in list(_active_websockets.items()):
-        try:
-            await ws.send_text(message)
-            logger.info(f"✅ Sent to WebSocket {client_id}")
-        except Exception as e:
-            logger.error(f"❌ Error sending to WebSocket {client_id}: {e}")
+        if _protocols.get(client_id) == 2:
+            _queue(client_id, v2_message or message)
+        elif not await _send(client_id, ws, message):
             disconnected.append(client_id)
-    
+
     # 연결 끊긴 소켓 제거
     for client_id in disconnected:
         remove_websocket(client_id)
 
+
+async def broadcast_products(store_service, product_ids: List[str]) -> int:
+    """
+    제품 카드를 전송합니다 (v1: 제품 객체 전체, v2: 제품 ID만).
+    다른 스냅샷 사전을 가진 v2 클라이언트에는 이 제품들의 JSON을 메시지에 함께 실어 보냅니다.
+
+    Args:
+        store_service: 제품 ID를 해석할 카탈로그 스냅샷
+        product_ids: 제품 ID 목록
+
+    Returns:
+        카탈로그에서 찾은 제품 수 (0이면 아무것도 보내지 않음)
+    """
+    product_ids = store_service.known_product_ids(product_ids)
+    if not product_ids:
+        return 0
+
+    ids_message = dumps({"type": "show_images", "content_type": "products", "ids": product_ids})
+    v1_message = inline_message = None
+    disconnected = []
+    logger.info(
+        f"📤 Broadcasting to {len(_active_websockets)} WebSocket(s): show_images (products: {len(product_ids)})"
+    )
+    for client_id, ws in list(_active_websockets.items()):
+        if _protocols.get(client_id) != 2:
+            if v1_message is None:
+                v1_message = products_message(store_service.get_product_payloads(product_ids))
+            if not await _send(client_id, ws, v1_message):
+                disconnected.append(client_id)
+            continue
+        # 아직 사전이 없는 클라이언트만 이 스냅샷 사전을 받음
+        send_catalog_if_missing(client_id, store_service)
+        if _catalog_versions.get(client_id) == store_service.version:
+            _queue(client_id, ids_message)
+        else:
+            # 다른 스냅샷 사전을 가진 클라이언트: 이 제품들만 메시지에 포함
+            if inline_message is None:
+                inline_message = _inline_products_message(store_service, product_ids)
+            _queue(client_id, inline_message)
+
+    for client_id in disconnected:
+        remove_websocket(client_id)
+    return len(product_ids)
+
+
+def _inline_products_message(store_service, product_ids: List[str]) -> str:
+    """ID 목록 + 해당 제품 JSON 조각을 함께 담은 v2 show_images 메시지"""
+    products = ",".join(
+        f"{dumps(product_id)}:{payload}"
+        for product_id, payload in zip(product_ids, store_service.get_product_payloads(product_ids))
+    )
+    return (
+        f'{{"type":"show_images","content_type":"products","ids":{dumps(product_ids)},'
+        f'"products":{{{products}}}}}'
+    )
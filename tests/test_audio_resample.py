@@ -0,0 +1,94 @@
+"""
+스트리밍 오디오 리샘플러/다운믹서 테스트
+"""
+import asyncio
+import numpy as np
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipecat.frames.frames import InputAudioRawFrame
+from pipecat.processors.frame_processor import FrameDirection
+
+from src.audio_resample import AudioConverter, StreamingResampler
+from src.bot import AudioFormatConverter
+
+
+def _tone(freq: float, rate: int, seconds: float = 0.5, amplitude: float = 10000) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (np.sin(2 * np.pi * freq * t) * amplitude).astype(np.float32)
+
+
+def _peak_hz(samples: np.ndarray, rate: int) -> float:
+    spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+    return np.argmax(spectrum) * rate / len(samples)
+
+
+@pytest.mark.parametrize("input_rate", [48000, 44100, 24000, 8000])
+def test_chunked_stream_matches_one_shot(input_rate):
+    """프레임 단위로 나눠 넣어도 한 번에 변환한 결과와 같고, 주파수가 보존되는지 테스트"""
+    tone = _tone(440, input_rate)
+    whole = StreamingResampler(input_rate, 16000).process(tone)
+
+    resampler = StreamingResampler(input_rate, 16000)
+    step = input_rate // 50 + 7  # 프레임 경계가 위상과 어긋나도록
+    chunked = np.concatenate([resampler.process(tone[i:i + step]) for i in range(0, len(tone), step)])
+
+    assert len(whole) == len(chunked) == 8000
+    assert np.allclose(whole, chunked, atol=0.01)
+    assert abs(_peak_hz(whole[500:], 16000) - 440) < 3
+
+
+def test_anti_aliasing():
+    """출력 나이퀴스트(8kHz)를 넘는 성분은 접혀 들어오지 않도록 감쇠하는지 테스트"""
+    passed = StreamingResampler(48000, 16000).process(_tone(3000, 48000))
+    blocked = StreamingResampler(48000, 16000).process(_tone(11000, 48000))
+    assert np.abs(passed[500:]).max() > 9000
+    assert np.abs(blocked[500:]).max() < 200
+
+
+def test_converter_downmixes_stereo_and_splits_odd_chunks():
+    """스테레오 다운믹스 + 샘플 경계가 안 맞는 청크도 이어 붙여 변환하는지 테스트"""
+    left = _tone(440, 48000).astype(np.int16)
+    stereo = np.stack([left, left // 2], axis=1).reshape(-1).tobytes()
+
+    one_shot = AudioConverter(48000, 2, 16000).convert(stereo)
+    converter = AudioConverter(48000, 2, 16000)
+    pieces = [converter.convert(stereo[i:i + 1001]) for i in range(0, len(stereo), 1001)]
+    assert b"".join(pieces) == one_shot
+
+    mono = np.frombuffer(one_shot, dtype=np.int16)
+    assert len(mono) == 8000
+    assert 7000 < np.abs(mono[500:]).max() < 8000  # (L + L/2) / 2 = 0.75 * 10000
+
+    passthrough = AudioConverter(16000, 1, 16000)
+    assert passthrough.convert(b"\x01\x02") == b"\x01\x02"
+
+
+def test_audio_format_converter_frames():
+    """48kHz 스테레오 프레임은 16kHz 모노 프레임으로, 16kHz 모노는 그대로 통과하는지 테스트"""
+    processor = AudioFormatConverter(16000)
+    pushed = []
+
+    async def push_frame(frame, direction=FrameDirection.DOWNSTREAM):
+        pushed.append(frame)
+
+    processor.push_frame = push_frame
+    stereo = InputAudioRawFrame(audio=b"\x00\x00" * 960 * 2, sample_rate=48000, num_channels=2)
+    mono = InputAudioRawFrame(audio=b"\x00\x00" * 320, sample_rate=16000, num_channels=1)
+
+    async def run():
+        await processor.process_frame(stereo, FrameDirection.DOWNSTREAM)
+        await processor.process_frame(mono, FrameDirection.DOWNSTREAM)
+
+    asyncio.run(run())
+
+    assert (pushed[0].sample_rate, pushed[0].num_channels, len(pushed[0].audio)) == (16000, 1, 640)
+    assert pushed[1] is mono
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,276 @@
+"""
+끼어들기(barge-in) 테스트
+InterruptionFrame이 오면 각 프로세서가 진행 중인 응답 상태를 버리고 프레임은 그대로 전달하는지 확인
+"""
+import asyncio
+from dataclasses import dataclass, field
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipecat.audio.interruptions.min_words_interruption_strategy import MinWordsInterruptionStrategy
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    DataFrame,
+    EndFrame,
+    InterruptionFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMMessagesFrame,
+    StartFrame,
+    TextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.llm_response import LLMUserAggregatorParams, LLMUserResponseAggregator
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+import src.bot as bot_module
+from src.bot import (
+    IntentDetectionFilter,
+    ResponseLogger,
+    SentenceStreamer,
+    TTSCacheLookup,
+    TTSCacheRecorder,
+)
+from src.tts_cache import TTSAudioCache
+
+VOICE = "voice-ko"
+PCM = b"\x01\x00" * 24000  # 1초 (24kHz 16bit mono)
+
+
+@dataclass
+class _Flush(DataFrame):
+    """앞서 넣은 프레임이 파이프라인 끝까지 처리됐는지 확인하는 표시 프레임"""
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class _Sink(FrameProcessor):
+    """파이프라인 끝에서 내려온 프레임 수집"""
+
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, _Flush):
+            frame.done.set()
+            return
+        if direction == FrameDirection.DOWNSTREAM and not isinstance(frame, (StartFrame, EndFrame)):
+            self.frames.append(frame)
+        await self.push_frame(frame, direction)
+
+
+class _Harness:
+    """프로세서를 실제 PipelineTask/PipelineRunner 안에서 실행 (StartFrame과 태스크 매니저까지 준비된 상태)"""
+
+    def __init__(self, *processors, params: PipelineParams = None):
+        self.sink = _Sink()
+        self.frames = self.sink.frames
+        self.task = PipelineTask(
+            Pipeline([*processors, self.sink]),
+            params=params or PipelineParams(),
+            cancel_on_idle_timeout=False,
+            enable_rtvi=False,
+        )
+
+    async def __aenter__(self):
+        self._run = asyncio.create_task(PipelineRunner(handle_sigint=False).run(self.task))
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.task.queue_frame(EndFrame())
+        await asyncio.wait_for(self._run, 5)
+
+    async def feed(self, *frames):
+        """프레임을 하나씩 넣고 끝까지 처리될 때까지 대기 (시스템 프레임이 앞선 데이터 프레임을 앞지르지 않도록)"""
+        for frame in frames:
+            flush = _Flush()
+            await self.task.queue_frames([frame, flush])
+            await asyncio.wait_for(flush.done.wait(), 2)
+
+    async def queue(self, *frames):
+        """처리를 기다리지 않고 넣기 (응답 생성 중인 프로세서가 있을 때)"""
+        await self.task.queue_frames(list(frames))
+
+
+async def _until(predicate, timeout: float = 3):
+    """조건이 만족될 때까지 대기"""
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+class _StreamingLLM(FrameProcessor):
+    """사용자 메시지마다 응답을 조각 단위로 천천히 스트리밍하는 가짜 LLM (끼어들기 시 처리 태스크와 함께 취소됨)"""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, LLMMessagesFrame):
+            await self.push_frame(LLMFullResponseStartFrame())
+            for chunk in self.responses.pop(0):
+                await self.push_frame(TextFrame(chunk))
+                await asyncio.sleep(0.1)
+            await self.push_frame(LLMFullResponseEndFrame())
+        else:
+            await self.push_frame(frame, direction)
+
+
+def test_response_logger_discards_interrupted_response():
+    """끼어들기 시 응답 버퍼/플래그/완료 타이머를 초기화하고 횟수를 세는지 테스트"""
+    counters = {}
+    response_logger = ResponseLogger(counters)
+
+    async def run():
+        async with _Harness(response_logger) as harness:
+            await harness.feed(TextFrame("토리든 세럼을 "))
+            assert response_logger.response_buffer and response_logger.completion_timer
+            timer = response_logger.completion_timer
+            await harness.feed(InterruptionFrame())
+            await asyncio.sleep(0)
+            return timer, harness.frames
+
+    timer, pushed = asyncio.run(run())
+
+    assert timer.done() and "assistant_turns" not in counters  # 취소된 응답은 전송되지 않음
+    assert response_logger.completion_timer is None
+    assert response_logger.response_buffer == ""
+    assert not (response_logger.products_sent or response_logger.store_sent or response_logger.response_sent)
+    assert counters["interruptions"] == 1
+    assert isinstance(pushed[-1], InterruptionFrame)
+
+
+def test_sentence_streamer_drops_pending_text():
+    """끼어들기 전 미완성 문장은 다음 응답에 섞이지 않는지 테스트"""
+    streamer = SentenceStreamer()
+
+    async def run():
+        async with _Harness(streamer) as harness:
+            await harness.feed(
+                LLMFullResponseStartFrame(), TextFrame("매장은 명동"), InterruptionFrame(),
+                TextFrame("네, 말씀하세요."), LLMFullResponseEndFrame(),
+            )
+            return harness.frames
+
+    pushed = asyncio.run(run())
+
+    texts = [frame.text for frame in pushed if isinstance(frame, TextFrame)]
+    assert texts == ["네, 말씀하세요."]
+    assert any(isinstance(frame, InterruptionFrame) for frame in pushed)
+
+
+def test_tts_cache_ignores_interrupted_audio():
+    """끼어들기로 취소된 응답은 보류 프레임을 버리고, 늦게 온 오디오는 캐시에 저장하지 않는지 테스트"""
+    cache = TTSAudioCache(memory_budget_bytes=len(PCM) * 4)
+    counters = {}
+    recorder = TTSCacheRecorder(VOICE, "ko", counters, cache=cache)
+    lookup = TTSCacheLookup(VOICE, "ko", recorder, counters, cache=cache)
+    cache.put(VOICE, "ko", "영업시간은 매일 10시부터입니다.", PCM, 24000)
+
+    async def run():
+        # 캐시 접두사와 일치해 보류 중인 응답 → 끼어들기로 버림
+        async with _Harness(lookup) as harness:
+            await harness.feed(LLMFullResponseStartFrame(), TextFrame("영업시간은 "), InterruptionFrame())
+            assert [type(frame) for frame in harness.frames] == [InterruptionFrame]
+            assert lookup._held == [] and not lookup._holding
+
+        # 합성 중이던 컨텍스트는 끼어들기 후 도착한 오디오까지 무시
+        recorder.expect("영업시간은 매일 10시부터입니다.")
+        async with _Harness(recorder) as harness:
+            await harness.feed(
+                TTSStartedFrame(context_id="ctx-1"),
+                TTSAudioRawFrame(PCM[:24000], 24000, 1, context_id="ctx-1"),
+                InterruptionFrame(),
+                TTSAudioRawFrame(PCM[24000:], 24000, 1, context_id="ctx-1"),
+                TTSStoppedFrame(context_id="ctx-1"),
+            )
+            return harness.frames
+
+    recorder_out = asyncio.run(run())
+
+    assert "tts_cache_stores" not in counters
+    assert recorder._contexts == {} and recorder._expected == {}
+    assert len(recorder_out) == 5  # 모든 프레임은 그대로 전달
+
+
+def test_intent_mode_interruption_cancels_inflight_response(monkeypatch):
+    """intent 모드: 봇이 말하는 중 의도 필터를 통과한 발화가 오면 생성 중인 응답이 취소되고 새 응답만 전달되는지 테스트"""
+    sent = []
+
+    async def capture(message):
+        sent.append(message)
+
+    monkeypatch.setattr(bot_module, "broadcast_message", capture)
+    counters = {}
+    llm = _StreamingLLM([
+        ["안녕하세요! ", "오늘 ", "추천 ", "제품은 ", "토리든 ", "세럼", "입니다."],
+        ["네, 매장 위치를 ", "알려드릴게요."],
+    ])
+    params = PipelineParams(
+        allow_interruptions=True,
+        interruption_strategies=[MinWordsInterruptionStrategy(min_words=1)],
+    )
+
+    def texts(frames):
+        return "".join(frame.text for frame in frames if isinstance(frame, TextFrame))
+
+    async def run():
+        async with _Harness(
+            IntentDetectionFilter("test-key"),
+            # 시스템 프레임(UserStoppedSpeaking)이 전사 결과를 앞지르면 집계 타임아웃 후 전달되므로 짧게
+            LLMUserResponseAggregator(
+                [{"role": "system", "content": "test"}],
+                params=LLMUserAggregatorParams(aggregation_timeout=0.05),
+            ),
+            llm,
+            ResponseLogger(counters),
+            params=params,
+        ) as harness:
+            # 첫 질문 → 응답 스트리밍 시작, 봇이 말하는 중
+            await harness.queue(
+                UserStartedSpeakingFrame(), TranscriptionFrame("제품 추천해줘", "user", ""), UserStoppedSpeakingFrame(),
+            )
+            await _until(lambda: "오늘" in texts(harness.frames))
+            await harness.queue(BotStartedSpeakingFrame())
+
+            # 잡담(의도 필터에서 차단)으로는 끊기지 않음
+            await harness.queue(
+                UserStartedSpeakingFrame(), TranscriptionFrame("구독 좋아요 눌러주세요", "user", ""), UserStoppedSpeakingFrame(),
+            )
+            await asyncio.sleep(0.2)
+            assert not any(isinstance(frame, InterruptionFrame) for frame in harness.frames)
+
+            # 어시스턴트에게 하는 말 → 끼어들기
+            await harness.queue(
+                UserStartedSpeakingFrame(), TranscriptionFrame("매장 어디야", "user", ""), UserStoppedSpeakingFrame(),
+            )
+            await _until(lambda: any(message.get("type") == "response" for message in sent))
+            return harness.frames
+
+    frames = asyncio.run(run())
+
+    interrupted_at = next(i for i, frame in enumerate(frames) if isinstance(frame, InterruptionFrame))
+    assert "입니다." not in texts(frames)  # 첫 응답의 나머지는 생성되지 않음
+    assert texts(frames[interrupted_at:]) == "네, 매장 위치를 알려드릴게요."
+    assert [message["text"] for message in sent if message.get("type") == "response"] == ["네, 매장 위치를 알려드릴게요."]
+    assert counters["interruptions"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,103 @@
+"""
+바이너리 카탈로그(.oycat) 테스트
+"""
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.catalog_binary import BinaryCatalog, compile_catalog
+from src.store_service import StoreService
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "assistant_data.json"
+
+
+@pytest.fixture
+def compiled_path(tmp_path):
+    """테스트용 .oycat 파일을 컴파일합니다."""
+    return compile_catalog(str(DATA_PATH), str(tmp_path / "assistant_data.oycat"))
+
+
+def test_binary_catalog_roundtrip(compiled_path):
+    """컴파일 후 모든 제품이 JSON 원본과 동일하게 복원되는지 테스트"""
+    source = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    json_service = StoreService(str(DATA_PATH))
+    binary_service = StoreService(str(compiled_path))
+
+    assert list(binary_service.get_all_products()) == source["products"]["all_products"]
+    assert list(binary_service.get_categories().keys()) == list(source["products"]["by_category"].keys())
+    for category, products in source["products"]["by_category"].items():
+        assert list(binary_service.get_products_by_category(category)) == products
+    assert binary_service.data["store"] == json_service.data["store"]
+    assert binary_service.get_popular_products(3) == json_service.get_popular_products(3)
+    assert binary_service.search_products("세럼") == json_service.search_products("세럼")
+    assert binary_service.query_products(max_price=30000, in_stock=True, category="스킨케어") == \
+        json_service.query_products(max_price=30000, in_stock=True, category="스킨케어")
+
+
+def test_binary_catalog_columns_are_zero_copy(compiled_path):
+    """숫자 컬럼이 mmap 위의 memoryview로 제공되는지 테스트"""
+    source = json.loads(DATA_PATH.read_text(encoding="utf-8"))["products"]["all_products"]
+    catalog = BinaryCatalog(str(compiled_path))
+
+    assert len(catalog) == len(source)
+    sale_prices = catalog.column("sale_price")
+    assert isinstance(sale_prices, memoryview)
+    assert list(sale_prices) == [p["sale_price"] for p in source]
+    assert catalog.string("product_id", 0) == source[0]["product_id"]
+    assert catalog.category_name(0) in catalog.categories
+
+    del sale_prices
+    catalog.close()
+
+
+def test_binary_catalog_rejects_other_files(tmp_path):
+    """잘못된 파일 형식 거부 테스트"""
+    bad = tmp_path / "bad.oycat"
+    bad.write_bytes(b"not a catalog" * 10)
+    with pytest.raises(ValueError):
+        BinaryCatalog(str(bad))
+
+
+@pytest.mark.parametrize("field, value", [
+    ("sale_price", 15900.5),        # 소수
+    ("sale_price", "15900"),        # 문자열 숫자
+    ("original_price", 2 ** 31),    # i32 범위 초과
+    ("discount_rate", True),
+    ("product_id", 1001),           # 문자열 필드에 숫자
+])
+def test_compile_rejects_values_outside_schema(tmp_path, field, value):
+    """고정 스키마로 그대로 옮길 수 없는 값은 잘라내지 않고 컴파일을 거부하는지 테스트"""
+    data = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    data["products"]["all_products"][0][field] = value
+    source = tmp_path / "assistant_data.json"
+    source.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    with pytest.raises(ValueError, match=field):
+        compile_catalog(str(source), str(tmp_path / "assistant_data.oycat"))
+    assert not (tmp_path / "assistant_data.oycat").exists()
+
+
+def test_compile_warns_about_discarded_fields(tmp_path):
+    """스키마에 없는 제품 필드는 경고를 남기는지 테스트"""
+    from loguru import logger
+
+    data = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    data["products"]["all_products"][0]["brand"] = "토리든"
+    source = tmp_path / "assistant_data.json"
+    source.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    messages = []
+    handler = logger.add(messages.append, level="WARNING")
+    try:
+        compile_catalog(str(source), str(tmp_path / "assistant_data.oycat"))
+    finally:
+        logger.remove(handler)
+
+    assert any("brand (1)" in message for message in messages)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
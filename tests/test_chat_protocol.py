@@ -0,0 +1,147 @@
+"""
+채팅 WebSocket 프로토콜(v1/v2) 테스트
+"""
+import asyncio
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import websocket_manager
+from src.store_service import StoreService
+
+
+class FakeWebSocket:
+    """보낸 텍스트 프레임을 기록하는 WebSocket 흉내"""
+
+    def __init__(self, fail: bool = False):
+        self.frames = []
+        self.fail = fail
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.frames.append(json.loads(text))
+
+
+@pytest.fixture
+def service():
+    return StoreService()
+
+
+@pytest.fixture(autouse=True)
+def clean_clients():
+    yield
+    for client_id in list(websocket_manager.get_active_websockets()):
+        websocket_manager.remove_websocket(client_id)
+
+
+def _turn(service, product_ids):
+    """한 턴의 이벤트 (전사 → 제품 카드 + 응답을 같은 틱에)"""
+
+    async def run():
+        await websocket_manager.broadcast_message({"type": "transcript", "speaker": "user", "text": "세럼 추천해줘"})
+        await websocket_manager.flush()
+        await websocket_manager.broadcast_products(service, product_ids)
+        await websocket_manager.broadcast_message({"type": "response", "speaker": "assistant", "text": "추천 제품입니다."})
+        await websocket_manager.flush()
+
+    return run
+
+
+def test_v1_sends_one_object_per_event(service):
+    """v1: 이벤트마다 프레임 하나, 제품 객체 전체 포함"""
+    ws = FakeWebSocket()
+    websocket_manager.add_websocket(1, ws)
+    product_ids = [p["product_id"] for p in service.get_all_products()[:2]]
+
+    asyncio.run(_turn(service, product_ids)())
+
+    assert [frame["type"] for frame in ws.frames] == ["transcript", "show_images", "response"]
+    assert [p["product_id"] for p in ws.frames[1]["data"]["products"]] == product_ids
+    assert all("category" in p for p in ws.frames[1]["data"]["products"])
+
+
+def test_v2_sends_catalog_once_and_coalesces_events(service):
+    """v2: 연결 시 카탈로그 사전 한 번, 제품은 ID만, 같은 틱 이벤트는 배열 프레임 하나"""
+    ws = FakeWebSocket()
+
+    async def connect_and_talk():
+        websocket_manager.add_websocket(2, ws, protocol=2)
+        websocket_manager.send_catalog(2, service)
+        await websocket_manager.flush()
+        product_ids = [p["product_id"] for p in service.get_all_products()[:2]]
+        await _turn(service, product_ids + ["없는ID"])()
+        await _turn(service, product_ids)()
+        return product_ids
+
+    product_ids = asyncio.run(connect_and_talk())
+
+    catalog, *turns = ws.frames
+    assert [event["type"] for event in catalog] == ["catalog"]
+    assert set(catalog[0]["products"]) == {p["product_id"] for p in service.get_all_products()}
+    assert catalog[0]["version"] == service.version
+    # 턴마다 프레임 2개 (전사 / 제품 카드 + 응답), 카탈로그는 다시 보내지 않음
+    assert len(turns) == 4
+    assert [event["type"] for event in turns[1]] == ["show_images", "response"]
+    assert turns[1][0]["ids"] == product_ids
+    assert turns[3] == turns[1]
+
+
+def test_v2_inlines_products_from_other_snapshot(service):
+    """리로드 전후 스냅샷이 번갈아 제품을 보내도 사전 전체를 다시 보내지 않고 해당 제품만 함께 보냄"""
+    ws = FakeWebSocket()
+    reloaded = StoreService(version=service.version + 1)
+    product_ids = [p["product_id"] for p in service.get_all_products()[:2]]
+
+    async def run():
+        websocket_manager.add_websocket(3, ws, protocol=2)
+        websocket_manager.send_catalog(3, service)
+        await websocket_manager.flush()
+        for snapshot in (reloaded, service, reloaded, service):
+            await websocket_manager.broadcast_products(snapshot, product_ids)
+            await websocket_manager.flush()
+
+    asyncio.run(run())
+
+    catalog, *cards = ws.frames
+    assert [event["type"] for event in catalog] == ["catalog"]
+    assert all([event["type"] for event in frame] == ["show_images"] for frame in cards)
+    other, same = cards[0][0], cards[1][0]
+    assert other["ids"] == product_ids
+    assert set(other["products"]) == set(product_ids)
+    assert other["products"][product_ids[0]]["name"] == reloaded.get_all_products()[0]["name"]
+    assert "products" not in same and same["ids"] == product_ids
+    assert cards[2] == cards[0] and cards[3] == cards[1]
+
+
+def test_failed_send_removes_client(service):
+    """전송 실패한 v1/v2 연결은 제거"""
+
+    async def run():
+        websocket_manager.add_websocket(4, FakeWebSocket(fail=True))
+        websocket_manager.add_websocket(5, FakeWebSocket(fail=True), protocol=2)
+        await websocket_manager.broadcast_message({"type": "response", "speaker": "assistant", "text": "안녕하세요"})
+        await websocket_manager.flush()
+
+    asyncio.run(run())
+
+    assert websocket_manager.get_active_websockets() == {}
+
+
+def test_unknown_protocol_falls_back_to_v1(service):
+    """지원하지 않는 버전은 v1로 처리"""
+    ws = FakeWebSocket()
+    websocket_manager.add_websocket(6, ws, protocol=9)
+    websocket_manager.send_catalog(6, service)  # v1에는 사전을 보내지 않음
+
+    asyncio.run(websocket_manager.broadcast_message({"type": "response", "speaker": "assistant", "text": "네"}))
+
+    assert ws.frames == [{"type": "response", "speaker": "assistant", "text": "네"}]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+"""
+대화 컨텍스트 예산 관리 테스트
+"""
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.context_budget import SUMMARY_HEADER, ContextBudgetManager
+
+PREFIX = [
+    {"role": "system", "content": "SYSTEM"},
+    {"role": "user", "content": "예시 질문"},
+    {"role": "assistant", "content": "예시 답변 [STORE:D176]"},
+]
+
+
+def add_turn(messages, i):
+    messages.append({"role": "user", "content": f"질문 {i}"})
+    messages.append({"role": "assistant", "content": f"답변 {i} [PRODUCTS:A{i:03d},B{i:03d}]"})
+
+
+def test_compact_keeps_prefix_and_recent_turns():
+    """prefix와 최근 N턴은 원문 유지, 오래된 턴은 요약 한 개로 접히는지 테스트"""
+    messages = [dict(m) for m in PREFIX]
+    shared = messages  # 집계기들이 공유하는 리스트
+    budget = ContextBudgetManager(prefix_length=len(PREFIX), max_turns=2, summary_items=3)
+
+    for i in range(2):
+        add_turn(messages, i)
+    assert not budget.compact(messages)
+
+    for i in range(2, 6):
+        add_turn(messages, i)
+    assert budget.compact(messages)
+    assert messages is shared
+    assert messages[:len(PREFIX)] == PREFIX
+    summary = messages[len(PREFIX)]
+    assert summary["role"] == "system" and summary["content"].startswith(SUMMARY_HEADER)
+    assert "- 고객: 질문 3 → 추천 제품: A003,B003" in summary["content"]
+    assert "질문 0" not in summary["content"]  # 요약도 최근 summary_items 줄만
+    assert [m["content"] for m in messages[len(PREFIX) + 1:]] == [
+        "질문 4", "답변 4 [PRODUCTS:A004,B004]", "질문 5", "답변 5 [PRODUCTS:A005,B005]"
+    ]
+
+    # 다음 압축은 기존 요약에 이어 붙이고 최근 summary_items 줄만 유지
+    for i in range(6, 8):
+        add_turn(messages, i)
+    assert budget.compact(messages)
+    lines = messages[len(PREFIX)]["content"].split("\n")[1:]
+    assert [line.split(" →")[0] for line in lines] == ["- 고객: 질문 3", "- 고객: 질문 4", "- 고객: 질문 5"]
+    assert len(messages) == len(PREFIX) + 1 + 4
+    assert budget.dropped_turns == 6
+
+
+def test_compact_enforces_char_budget():
+    """최근 턴이라도 글자 수 예산을 넘으면 더 줄이되 마지막 턴은 유지하는지 테스트"""
+    messages = [dict(m) for m in PREFIX]
+    budget = ContextBudgetManager(prefix_length=len(PREFIX), max_turns=10, max_history_chars=100)
+    for i in range(3):
+        messages.append({"role": "user", "content": "긴 질문 " * 20})
+        messages.append({"role": "assistant", "content": "긴 답변 " * 20})
+
+    assert budget.compact(messages)
+    assert len(messages) == len(PREFIX) + 1 + 2
+
+    # 세션 길이와 관계없이 크기 상한 유지
+    for i in range(200):
+        add_turn(messages, i)
+        budget.compact(messages)
+    assert len(messages) <= len(PREFIX) + 1 + 2 * 10
+    assert len(messages[len(PREFIX)]["content"].split("\n")) <= 1 + budget.summary_items
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
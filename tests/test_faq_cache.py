@@ -0,0 +1,118 @@
+"""
+매장 FAQ 응답 캐시 테스트
+"""
+import asyncio
+import gc
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipecat.frames.frames import (
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    TextFrame,
+    TranscriptionFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection
+
+from src.bot import FaqResponder
+from src.faq_cache import FaqCache
+from src.store_service import StoreService
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "assistant_data.json"
+
+
+@pytest.fixture
+def store_service():
+    """StoreService 인스턴스를 생성합니다."""
+    return StoreService(str(DATA_PATH))
+
+
+def test_faq_matches_store_questions(store_service):
+    """매장 질문은 매장 데이터 템플릿과 STORE 태그로 답하는지 테스트"""
+    cache = FaqCache()
+    store = store_service.data["store"]
+
+    answer = cache.match("매장 어디에 있어요?", store_service)
+    assert answer.intent == "location"
+    assert store["address"] in answer.text
+    assert answer.text.endswith(f"[STORE:{store['store_id']}]")
+
+    assert cache.match("몇 시까지 해요?", store_service).intent == "hours"
+    assert cache.match("전화번호 좀 알려줘", store_service).text.count(store["phone"]) == 1
+    assert cache.match("명동역 몇 번 출구야?", store_service).intent == "subway"
+
+
+def test_faq_misses_other_questions(store_service):
+    """제품 질문이나 다른 매장/장소 질문은 LLM으로 넘기는지 테스트"""
+    cache = FaqCache()
+    for text in ["토리든 세럼 매장에 있어?", "이 세럼 몇 시까지 할인해", "제품 추천해줘",
+                 "강남역 매장 어디 있어?", "올리브영 명동 중앙점 어디 있어", "네"]:
+        assert cache.match(text, store_service) is None, text
+    assert cache.stats == {"lookups": 6, "hits": 0}
+    assert cache.hit_rate == 0.0
+
+
+def test_faq_invalidated_on_snapshot_change(tmp_path, store_service):
+    """카탈로그 스냅샷이 바뀌면 새 매장 데이터로 답하는지 테스트"""
+    cache = FaqCache()
+    assert "02-736-5290" in cache.match("전화번호 알려줘", store_service).text
+
+    data = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    data["store"]["phone"] = "02-000-0000"
+    data_file = tmp_path / "assistant_data.json"
+    data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    reloaded = StoreService(str(data_file), version=2)
+    assert "02-000-0000" in cache.match("전화번호 알려줘", reloaded).text
+
+    # 리로드 전후 세션이 번갈아 조회해도 스냅샷별 답변을 다시 만들지 않음
+    compiled = {id(service): cache._for(service) for service in (store_service, reloaded)}
+    for service in (store_service, reloaded, store_service, reloaded):
+        assert cache.match("전화번호 알려줘", service) is not None
+        assert cache._for(service) is compiled[id(service)]
+    assert len(cache._compiled) == 2
+
+    # 더 이상 쓰지 않는 스냅샷은 답변과 함께 해제
+    del reloaded, service
+    gc.collect()
+    assert len(cache._compiled) == 1
+
+
+def test_faq_responder_answers_without_llm(store_service):
+    """적중 시 전사 프레임 대신 LLM 응답 형태의 프레임을 내보내는지 테스트"""
+    messages = [{"role": "system", "content": "SYSTEM"}]
+    counters = {}
+    responder = FaqResponder(messages, store_service, counters, cache=FaqCache())
+    pushed = []
+
+    async def push_frame(frame, direction=FrameDirection.DOWNSTREAM):
+        pushed.append(frame)
+
+    responder.push_frame = push_frame
+
+    async def run():
+        await responder.process_frame(
+            TranscriptionFrame("영업시간 알려줘", "user", "2024-01-01T00:00:00"), FrameDirection.DOWNSTREAM
+        )
+        await responder.process_frame(
+            TranscriptionFrame("세럼 추천해줘", "user", "2024-01-01T00:00:01"), FrameDirection.DOWNSTREAM
+        )
+
+    asyncio.run(run())
+
+    assert [type(frame) for frame in pushed] == [
+        LLMFullResponseStartFrame, TextFrame, LLMFullResponseEndFrame, TranscriptionFrame
+    ]
+    assert "영업시간" in pushed[1].text
+    assert messages[-1] == {"role": "user", "content": "영업시간 알려줘"}
+    assert counters["faq_hits"] == 1 and counters["faq_misses"] == 1
+    assert counters["faq_latency_saved_ms"] > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
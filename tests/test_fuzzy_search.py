@@ -0,0 +1,96 @@
+"""
+한글 자모 퍼지 검색 테스트
+"""
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.fuzzy_search import FuzzyIndex, bounded_edit_distance, chosung, decompose_jamo, is_chosung_query
+from src.store_service import StoreService
+
+
+@pytest.fixture
+def store_service():
+    """StoreService 인스턴스를 생성합니다."""
+    return StoreService()
+
+
+def test_jamo_and_chosung():
+    """자모 분해/초성 키 테스트"""
+    assert decompose_jamo("토리든") == "ㅌㅗㄹㅣㄷㅡㄴ"
+    assert decompose_jamo("CICA 크림") == "cica ㅋㅡㄹㅣㅁ"
+    assert chosung("토리든 세럼") == "ㅌㄹㄷ ㅅㄹ"
+    assert is_chosung_query("ㅌㄹㄷ")
+    assert not is_chosung_query("토리든")
+
+
+def test_bounded_edit_distance():
+    """제한 편집 거리 테스트"""
+    assert bounded_edit_distance("kitten", "sitting", 3) == 3
+    assert bounded_edit_distance("kitten", "sitting", 2) is None
+    assert bounded_edit_distance("abc", "abc", 0) == 0
+    assert bounded_edit_distance("", "ab", 2) == 2
+
+
+def test_fuzzy_index_ranking():
+    """유사도 순 정렬 및 오인식 허용 테스트"""
+    index = FuzzyIndex([
+        ("토리든 다이브인 세럼", "torriden"),
+        ("달바 퍼스트 스프레이 세럼", "dalba"),
+        ("라로슈포제 시카플라스트 크림", "laroche"),
+    ])
+    # 잘못 들은 음절 (든 → 는)
+    assert index.search("토리는")[0][0] == "torriden"
+    # 띄어쓰기 차이
+    assert index.search("다이브 인")[0][0] == "torriden"
+    assert index.search("라로쉬포제")[0][0] == "laroche"
+    # 초성 질의
+    assert [item for item, _ in index.search("ㄷㅂ")] == ["dalba"]
+    # 관계없는 질의
+    assert index.search("샴푸") == []
+
+    scores = [score for _, score in index.search("세럼")]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_chosung_search_uses_prefix_index():
+    """초성 질의가 접두사 색인 후보만 확인하면서 전체 스캔과 같은 결과를 내는지 테스트"""
+    brands = ["토리든", "달바", "라운드랩", "아누아", "메디힐", "닥터지"]
+    kinds = ["다이브인 세럼", "퍼스트 스프레이 세럼", "독도 토너", "어성초 크림", "마스크팩", "선크림"]
+    items = [(f"{brand} {kind} {i}호", (brand, kind, i)) for i in range(50) for brand in brands for kind in kinds]
+    index = FuzzyIndex(items)
+
+    def scan(query, limit):
+        keys = query.split()
+        return [
+            (item, 1.0) for name, item in items
+            if all(any(chosung(token).startswith(key) for token in name.split()) for key in keys)
+        ][:limit]
+
+    for query in ("ㅌㄹㄷ", "ㄷㅂ ㅅㄹ", "ㄹㅇㄷㄹ ㄷㄷ", "ㅁ", "ㅅㅋㄹ ㅌㄹㄷ", "ㅎㅎㅎ"):
+        assert index.search(query, limit=20) == scan(query, 20), query
+    # 4글자 이상 키는 앞 3글자 색인으로 후보를 찾고 startswith로 확인
+    assert all(item[0] == "라운드랩" for item, _ in index.search("ㄹㅇㄷㄹ", limit=100))
+    assert index.search("ㄹㅇㄷㅋ") == []
+
+
+def test_store_service_fuzzy_fallback(store_service):
+    """정확 검색 실패 시 퍼지 검색으로 대체되는지 테스트"""
+    # 정확 검색은 그대로
+    exact = store_service.search_products("토리든")
+    assert exact and all("토리든" in p["name"] for p in exact)
+
+    # STT 오인식
+    results = store_service.search_products("토리는 세럼")
+    assert results and "토리든" in results[0]["name"]
+    assert store_service.search_products("전혀없는제품명") == []
+
+    store = store_service.find_store_by_name("명동 타임 워크")
+    assert store is not None and store["store_id"] == "DD6F"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,96 @@
+"""
+위치 기반 매장 검색 테스트
+"""
+import random
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.geo_index import GeoIndex, Gazetteer, haversine_m
+from src.store_service import StoreService
+
+
+@pytest.fixture
+def random_points():
+    """전국 범위의 임의 좌표 (매장 1,300개 규모)"""
+    rng = random.Random(3)
+    return [(rng.uniform(33.2, 38.5), rng.uniform(126.1, 129.5), f"S{i}") for i in range(1300)]
+
+
+def _brute_force(points, lat, lng):
+    return sorted((haversine_m(lat, lng, p_lat, p_lng), item) for p_lat, p_lng, item in points)
+
+
+def test_haversine_known_distance():
+    """서울역 ↔ 강남역 거리 (약 8.6km) 테스트"""
+    distance = haversine_m(37.5547, 126.9707, 37.4979, 127.0276)
+    assert 8000 < distance < 9000
+    assert haversine_m(37.5, 127.0, 37.5, 127.0) == 0
+
+
+def test_nearest_matches_brute_force(random_points):
+    """k-최근접 결과가 전체 탐색과 같은지 테스트"""
+    index = GeoIndex(random_points)
+    rng = random.Random(11)
+    for _ in range(50):
+        lat, lng = rng.uniform(33.0, 38.6), rng.uniform(126.0, 129.6)
+        expected = [item for _, item in _brute_force(random_points, lat, lng)[:5]]
+        assert [item for _, item in index.nearest(lat, lng, k=5)] == expected
+
+
+def test_nearest_with_predicate_and_max_distance(random_points):
+    """조건 함수와 최대 거리 테스트"""
+    index = GeoIndex(random_points)
+    even = lambda item: int(item[1:]) % 2 == 0
+    lat, lng = 37.56, 126.98
+    expected = [item for _, item in _brute_force(random_points, lat, lng) if even(item)][:3]
+    assert [item for _, item in index.nearest(lat, lng, k=3, predicate=even)] == expected
+
+    nearest_distance = _brute_force(random_points, lat, lng)[0][0]
+    assert index.nearest(lat, lng, k=1, max_distance_m=nearest_distance / 2) == []
+    assert GeoIndex([]).nearest(lat, lng) == []
+
+
+def test_within_matches_brute_force(random_points):
+    """반경 검색 결과가 전체 탐색과 같은지 테스트"""
+    index = GeoIndex(random_points)
+    for lat, lng, radius in [(37.56, 126.98, 20_000), (35.1, 129.0, 50_000), (36.0, 127.5, 1_000)]:
+        expected = [(d, item) for d, item in _brute_force(random_points, lat, lng) if d <= radius]
+        assert [item for _, item in index.within(lat, lng, radius)] == [item for _, item in expected]
+
+
+def test_gazetteer_resolve():
+    """가제티어 이름/별칭/포함 매칭 테스트"""
+    gazetteer = Gazetteer([
+        {"name": "명동역", "lat": 37.5609, "lng": 126.9863, "aliases": ["명동"]},
+        {"name": "명동역 8번 출구", "lat": 37.5613, "lng": 126.9855},
+    ])
+    assert gazetteer.resolve("명동역")["name"] == "명동역"
+    assert gazetteer.resolve("명동")["name"] == "명동역"
+    assert gazetteer.resolve("명동역8번출구")["name"] == "명동역 8번 출구"
+    assert gazetteer.resolve("명동역 8번 출구 근처 매장")["name"] == "명동역 8번 출구"
+    assert gazetteer.resolve("강남역") is None
+
+
+def test_store_service_geo_queries():
+    """StoreService 좌표 기반 매장 검색 테스트"""
+    service = StoreService()
+    coords = service.locate("종각역")
+    assert coords is not None
+
+    nearest = service.find_nearest_stores(*coords, k=3, open_only=True)
+    assert len(nearest) == 3
+    distances = [distance for _, distance in nearest]
+    assert distances == sorted(distances)
+    assert nearest[0][1] < 1000
+
+    within = service.find_stores_within(*coords, radius_m=500)
+    assert all(distance <= 500 for _, distance in within)
+    assert service.find_nearest_store("종각역") is nearest[0][0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+"""
+NumPy 제품 컬럼 뷰 테스트
+"""
+import random
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.product_array import ProductArray
+from src.store_service import StoreService
+
+
+@pytest.fixture
+def store_service():
+    """StoreService 인스턴스를 생성합니다."""
+    return StoreService()
+
+
+def _synthetic_products(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    products = []
+    for i in range(n):
+        price = rng.randrange(5000, 80000, 100)
+        products.append({
+            "product_id": f"P{i:06d}",
+            "name": f"제품 {i}",
+            "original_price": price,
+            "discount_rate": rng.randrange(0, 60, 5),
+            "sale_price": price - price * rng.randrange(0, 50) // 100,
+            "stock_status": "재고있음" if rng.random() > 0.2 else "품절",
+        })
+    return products
+
+
+def test_top_k_matches_sorted_order():
+    """argpartition top-k가 안정 정렬 결과와 같은지 테스트 (동점 순서 포함)"""
+    products = _synthetic_products(2000)
+    array = ProductArray.from_products(products, {"전체": products})
+
+    expected = sorted(products, key=lambda p: p["discount_rate"], reverse=True)[:10]
+    assert array.select(array.top_k(10)) == expected
+
+    cheapest = sorted(products, key=lambda p: p["sale_price"])[:5]
+    assert array.select(array.top_k(5, by="sale_price", descending=False)) == cheapest
+
+    assert len(array.top_k(5000)) == len(products)
+    assert len(array.top_k(0)) == 0
+    with pytest.raises(ValueError):
+        array.top_k(3, by="name")
+
+
+def test_filter_mask_matches_python_loop():
+    """벡터 필터 결과가 Python 루프 필터와 같은지 테스트"""
+    products = _synthetic_products(1000)
+    half = len(products) // 2
+    array = ProductArray.from_products(products, {"스킨케어": products[:half], "클렌징": products[half:]})
+
+    mask = array.mask(max_price=30000, in_stock=True, category="스킨케어")
+    expected = [
+        p for p in products[:half]
+        if p["sale_price"] <= 30000 and p["stock_status"] == "재고있음"
+    ]
+    assert array.select(mask.nonzero()[0]) == expected
+    assert not array.mask(category="없는카테고리").any()
+
+
+def test_query_products(store_service):
+    """StoreService.query_products 조건 조회 테스트"""
+    results = store_service.query_products(max_price=30000, in_stock=True, category="스킨케어", limit=5)
+    assert 0 < len(results) <= 5
+    assert all(p["sale_price"] <= 30000 for p in results)
+    skincare_ids = {p["product_id"] for p in store_service.get_products_by_category("스킨케어")}
+    assert all(p["product_id"] in skincare_ids for p in results)
+    rates = [p["discount_rate"] for p in results]
+    assert rates == sorted(rates, reverse=True)
+
+
+def test_get_popular_products(store_service):
+    """인기 제품 조회가 기존 정렬 방식과 같은 결과인지 테스트"""
+    expected = sorted(
+        store_service.get_all_products(), key=lambda p: p.get("discount_rate", 0), reverse=True
+    )[:3]
+    assert store_service.get_popular_products(3) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,89 @@
+"""
+시스템 프롬프트 캐시 테스트
+"""
+import gc
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.prompt_builder import FEW_SHOT_MESSAGES, SESSION_GREETING, PromptBuilder
+from src.store_service import StoreService
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "assistant_data.json"
+
+
+def test_prompt_cached_per_snapshot_and_language():
+    """같은 스냅샷/언어는 다시 렌더링하지 않는지 테스트"""
+    builder = PromptBuilder()
+    service = StoreService(str(DATA_PATH), version=1)
+
+    prompt = builder.system_prompt(service, "ko")
+    assert builder.system_prompt(service, "ko") is prompt
+    assert builder.stats["prompt_builds"] == 1
+    assert builder.stats["prompt_hits"] == 1
+
+    # 본문이 언어와 무관하므로 다른 언어도 다시 렌더링하지 않고 같은 문자열 공유
+    assert builder.system_prompt(service, "en") is prompt
+    assert builder.stats["prompt_builds"] == 1
+    assert builder.stats["section_builds"] == len(service.get_categories())
+
+    for product in service.get_all_products():
+        assert product["product_id"] in prompt
+
+
+def test_reload_rebuilds_only_changed_sections(tmp_path):
+    """리로드 시 바뀐 카테고리 섹션만 다시 포맷팅하는지 테스트"""
+    data = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    builder = PromptBuilder()
+    first = builder.system_prompt(StoreService(str(DATA_PATH), version=1))
+    section_count = len(data["products"]["by_category"])
+
+    category = next(iter(data["products"]["by_category"]))
+    changed = data["products"]["by_category"][category][0]
+    changed["sale_price"] = 1234
+    data_file = tmp_path / "assistant_data.json"
+    data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    second = builder.system_prompt(StoreService(str(data_file), version=2))
+    assert second != first
+    assert "1,234원" in second
+    assert builder.stats["section_builds"] == section_count + 1
+    assert builder.stats["section_hits"] == section_count - 1
+
+
+def test_alternating_snapshots_do_not_rebuild(tmp_path):
+    """리로드 전후 세션이 번갈아 조회해도 서로의 프롬프트를 다시 만들지 않고, 안 쓰는 스냅샷은 해제되는지 테스트"""
+    builder = PromptBuilder()
+    old = StoreService(str(DATA_PATH), version=1)
+    new = StoreService(str(DATA_PATH), version=2)
+
+    prompts = {id(service): builder.system_prompt(service) for service in (old, new)}
+    for service in (old, new, old, new):
+        assert builder.system_prompt(service, "ko") is prompts[id(service)]
+    assert builder.stats["prompt_builds"] == 2
+
+    del new, service
+    gc.collect()
+    assert len(builder._prompts) == 1
+
+
+def test_initial_messages_are_per_session():
+    """세션별 메시지 목록이 공유 few-shot 예제를 변경하지 않는지 테스트"""
+    builder = PromptBuilder()
+    messages = builder.initial_messages("SYSTEM")
+    assert messages[0] == {"role": "system", "content": "SYSTEM"}
+    assert messages[1:-1] == list(FEW_SHOT_MESSAGES)
+    assert messages[-1] == {"role": "system", "content": SESSION_GREETING}
+
+    messages.append({"role": "user", "content": "안녕"})
+    messages[1]["content"] = "변경"
+    assert builder.initial_messages("SYSTEM") == list(builder.shared_prefix("SYSTEM"))
+    assert builder.initial_messages("SYSTEM")[1:-1] == list(FEW_SHOT_MESSAGES)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,62 @@
+"""
+prompt prefix 캐시 계측 프로세서 테스트
+"""
+import asyncio
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipecat.frames.frames import MetricsFrame
+from pipecat.metrics.metrics import LLMTokenUsage, LLMUsageMetricsData, TTFBMetricsData
+from pipecat.processors.frame_processor import FrameDirection
+
+from src.bot import PromptCacheMonitor
+
+
+def test_prompt_cache_monitor_records_cached_tokens():
+    """턴별 캐시/비캐시 토큰과 TTFB를 기록하고 다른 서비스 메트릭은 무시하는지 테스트"""
+    counters = {}
+    monitor = PromptCacheMonitor(counters, llm_name="llm#0")
+    pushed = []
+
+    async def push_frame(frame, direction=FrameDirection.DOWNSTREAM):
+        pushed.append(frame)
+
+    monitor.push_frame = push_frame
+
+    def usage(prompt, cached):
+        tokens = LLMTokenUsage(prompt_tokens=prompt, completion_tokens=20, total_tokens=prompt + 20,
+                               cache_read_input_tokens=cached)
+        return LLMUsageMetricsData(processor="llm#0", value=tokens)
+
+    frames = [
+        MetricsFrame(data=[TTFBMetricsData(processor="stt#0", value=0.9)]),
+        MetricsFrame(data=[TTFBMetricsData(processor="llm#0", value=0.45)]),
+        MetricsFrame(data=[usage(1800, None)]),
+        MetricsFrame(data=[TTFBMetricsData(processor="llm#0", value=0.2)]),
+        MetricsFrame(data=[usage(1850, 1792)]),
+    ]
+
+    async def run():
+        for frame in frames:
+            await monitor.process_frame(frame, FrameDirection.DOWNSTREAM)
+
+    asyncio.run(run())
+
+    assert pushed == frames
+    assert monitor.turns == [
+        {"prompt_tokens": 1800, "cached_tokens": 0, "ttfb": 0.45},
+        {"prompt_tokens": 1850, "cached_tokens": 1792, "ttfb": 0.2},
+    ]
+    assert counters["llm_calls"] == 2
+    assert counters["prompt_tokens"] == 3650
+    assert counters["cached_prompt_tokens"] == 1792
+    assert counters["llm_ttfb_samples"] == 2
+    assert counters["llm_ttfb_ms_total"] == pytest.approx(650)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
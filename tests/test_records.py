@@ -0,0 +1,131 @@
+"""
+읽기 전용 카탈로그 레코드 테스트
+"""
+import dataclasses
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.records import Product, Store
+from src.serialization import available_backends, get_codec
+from src.store_service import StoreService
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "assistant_data.json"
+
+PRODUCT = {
+    "product_id": "A1",
+    "name": "토리든 다이브인 세럼",
+    "image_url": "https://example.com/a1.jpg",
+    "original_price": 22000,
+    "discount_rate": 14,
+    "sale_price": 18900,
+    "stock_info": "재고 있음",
+    "stock_status": "재고 있음",
+}
+
+
+def test_product_reads_like_dict():
+    """기존 딕셔너리 접근 방식이 그대로 동작하는지 테스트"""
+    product = Product.from_dict(PRODUCT)
+
+    assert product.name == PRODUCT["name"]
+    assert product["sale_price"] == 18900
+    assert product.get("discount_rate") == 14
+    assert product.get("brand", "없음") == "없음"
+    assert "name" in product and "brand" not in product
+    assert dict(product) == PRODUCT
+    assert product == PRODUCT
+    assert {**product, "category": "스킨케어"} == {**PRODUCT, "category": "스킨케어"}
+    with pytest.raises(KeyError):
+        product["brand"]
+
+
+def test_missing_and_extra_fields():
+    """JSON에 없던 필드는 없는 키로, 스키마 밖 키는 extra로 유지되는지 테스트"""
+    product = Product.from_dict({"product_id": "B2", "name": "세럼", "brand": "토리든"})
+
+    assert product.sale_price is None
+    assert "sale_price" not in product
+    assert product.get("sale_price", 0) == 0
+    assert product["brand"] == "토리든"
+    assert product.to_dict() == {"product_id": "B2", "name": "세럼", "brand": "토리든"}
+
+
+def test_records_are_immutable():
+    """레코드와 중첩 값을 수정할 수 없는지 테스트"""
+    product = Product.from_dict(PRODUCT)
+    store = Store.from_dict({
+        "store_id": "S1", "name": "강남역점", "services": ["픽업 서비스"],
+        "business_hours": {"월": "10:00 ~ 22:00"}, "popular_products": ["A"],
+    })
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        product.sale_price = 1
+    with pytest.raises(TypeError):
+        product["sale_price"] = 1
+    with pytest.raises((AttributeError, TypeError)):
+        product.category = "스킨케어"  # slots: 새 속성 추가 불가
+    with pytest.raises(AttributeError):
+        store.services.append("면세")
+    with pytest.raises(TypeError):
+        store.business_hours["화"] = "휴무"
+    with pytest.raises(AttributeError):
+        store["popular_products"].append("B")
+
+    copy = product.to_dict()
+    copy["category"] = "스킨케어"
+    assert "category" not in product
+
+
+def test_store_service_shares_product_records():
+    """카탈로그 제품이 레코드이고 카테고리 목록과 전체 목록이 같은 레코드를 공유하는지 테스트"""
+    service = StoreService(str(DATA_PATH))
+    all_products = service.get_all_products()
+    by_id = {p.product_id: p for p in all_products}
+
+    assert all(isinstance(p, Product) for p in all_products)
+    assert isinstance(service.data["store"], Store)
+    for products in service.get_categories().values():
+        for product in products:
+            assert product is by_id[product.product_id]
+
+
+def test_records_with_nested_values_are_shared(tmp_path):
+    """list/dict 값이 있는 제품도 카테고리 목록과 전체 목록이 같은 레코드를 공유하는지 테스트"""
+    product = dict(PRODUCT, tags=["수분", "진정"], options={"용량": "50ml"})
+    data_file = tmp_path / "assistant_data.json"
+    data_file.write_text(
+        json.dumps({"store": {}, "products": {"all_products": [product], "by_category": {"스킨케어": [dict(product)]}}},
+                   ensure_ascii=False),
+        encoding="utf-8",
+    )
+    service = StoreService(str(data_file))
+
+    assert service.get_products_by_category("스킨케어")[0] is service.get_all_products()[0]
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_records_serialize_same_on_every_backend(backend):
+    """레코드 직렬화가 백엔드와 관계없이 원본 JSON과 같은 키만 출력하는지 테스트 (None 필드 없음)"""
+    codec = get_codec(backend)
+    source = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    service = StoreService(str(DATA_PATH))
+    product = Product.from_dict({"product_id": "B2", "name": "세럼", "tags": ["수분"]})
+    store = service.data["store"]
+
+    assert codec.loads(codec.dumps(product)) == {"product_id": "B2", "name": "세럼", "tags": ["수분"]}
+    assert codec.loads(codec.dumps(store)) == source["store"]
+    assert "null" not in codec.dumps(store)
+    # 메시지 안에 중첩된 레코드도 같은 형태
+    nested = codec.loads(codec.dumps({"products": list(service.get_all_products()[:2])}))
+    assert nested["products"] == source["products"]["all_products"][:2]
+    for record in (product, store):
+        assert codec.loads(codec.dumps(record)) == get_codec("json").loads(get_codec("json").dumps(record.to_dict()))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
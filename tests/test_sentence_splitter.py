@@ -0,0 +1,77 @@
+"""
+스트리밍 문장 분리기 테스트
+"""
+import asyncio
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipecat.frames.frames import (
+    AggregatedTextFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    TextFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection
+
+from src.bot import SentenceStreamer
+from src.sentence_splitter import SPEECH, TAG, SentenceSplitter
+
+
+def test_sentences_released_at_boundaries():
+    """문장 경계가 확인되는 즉시 문장을 내보내는지 테스트 (소수점은 경계 아님)"""
+    splitter = SentenceSplitter()
+    assert splitter.feed("토리든 세럼 추천") == []
+    assert splitter.feed("드립니다. 23.") == [(SPEECH, "토리든 세럼 추천드립니다. ")]
+    assert splitter.feed("5% 할인이에요! Great") == [(SPEECH, "23.5% 할인이에요! ")]
+    assert splitter.feed(" choice?\nEnjoy") == [(SPEECH, "Great choice?\n")]
+    assert splitter.flush() == [(SPEECH, "Enjoy")]
+
+
+def test_tags_never_spoken():
+    """태그는 닫힐 때까지 보류 후 분리하고, 태그가 아닌 '['는 바로 일반 텍스트로 처리하는지 테스트"""
+    splitter = SentenceSplitter()
+    pieces = []
+    for token in ["추천합니다. [", "PROD", "UCTS:A1,", "A2] [참고", "] 끝."]:
+        pieces.extend(splitter.feed(token))
+    pieces.extend(splitter.flush())
+    assert pieces == [
+        (SPEECH, "추천합니다. "),
+        (TAG, "[PRODUCTS:A1,A2]"),
+        (SPEECH, " [참고] 끝."),
+    ]
+
+    # 닫히지 않은 태그 조각은 응답 끝에서 버림
+    assert splitter.feed("위치입니다 [STORE:D1") == []
+    assert splitter.flush() == [(SPEECH, "위치입니다 ")]
+
+
+def test_sentence_streamer_frames():
+    """문장은 AggregatedTextFrame, 태그는 skip_tts TextFrame으로 내보내는지 테스트"""
+    streamer = SentenceStreamer()
+    pushed = []
+
+    async def push_frame(frame, direction=FrameDirection.DOWNSTREAM):
+        pushed.append(frame)
+
+    streamer.push_frame = push_frame
+
+    async def run():
+        for frame in [LLMFullResponseStartFrame(), TextFrame("매장은 명동에 있습니다. "),
+                      TextFrame("[STORE:D176]"), LLMFullResponseEndFrame()]:
+            await streamer.process_frame(frame, FrameDirection.DOWNSTREAM)
+
+    asyncio.run(run())
+
+    assert [type(frame) for frame in pushed] == [
+        LLMFullResponseStartFrame, AggregatedTextFrame, TextFrame, LLMFullResponseEndFrame
+    ]
+    assert pushed[1].text == "매장은 명동에 있습니다. "
+    assert pushed[2].text == "[STORE:D176]" and pushed[2].skip_tts
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
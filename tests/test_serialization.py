@@ -0,0 +1,94 @@
+"""
+JSON 직렬화 백엔드 테스트
+"""
+from collections.abc import Mapping
+import numpy as np
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import serialization
+from src.serialization import DecodeError, ScribeMessage, ScribeWord, available_backends, get_codec
+
+
+class LazyRecord(Mapping):
+    """지연 생성 제품 레코드 흉내 (dict가 아닌 Mapping)"""
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
+MESSAGE = {
+    "type": "show_images",
+    "content_type": "products",
+    "products": [LazyRecord({"product_id": "A1", "name": "토리든 세럼", "sale_price": np.int64(18900)})],
+    "ratio": 0.5,
+    "empty": None,
+}
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_produce_identical_output(backend):
+    """모든 백엔드가 같은 바이트를 만들고 (UTF-8 그대로, 공백 없음) 그대로 되읽는지 테스트"""
+    codec = get_codec(backend)
+    text = codec.dumps(MESSAGE)
+    assert text == (
+        '{"type":"show_images","content_type":"products","products":[{"product_id":"A1",'
+        '"name":"토리든 세럼","sale_price":18900}],"ratio":0.5,"empty":null}'
+    )
+    assert codec.dumps_bytes(MESSAGE) == text.encode("utf-8")
+    assert codec.loads(text) == codec.loads(text.encode("utf-8")) == get_codec("json").loads(text)
+
+    with pytest.raises(DecodeError):
+        codec.loads('{"broken": ')
+
+
+def test_scribe_message_decoding():
+    """Scribe 메시지를 타입 있는 객체로 디코드하는지 테스트 (모르는 필드 무시, 에러 형식 두 가지)"""
+    raw = (
+        '{"message_type":"committed_transcript_with_timestamps","text":"선크림 추천해줘",'
+        '"words":[{"text":"선크림","start":120,"end":480,"type":"word","logprob":-0.1}],"language_code":"ko"}'
+    )
+    for decode in (serialization.decode_scribe_message, lambda r: serialization._scribe_from_dict(serialization.loads(r))):
+        message = decode(raw)
+        assert isinstance(message, ScribeMessage)
+        assert message.kind == "committed_transcript_with_timestamps"
+        assert message.text == "선크림 추천해줘"
+        assert message.words == [ScribeWord(text="선크림", start=120, end=480, type="word")]
+
+        started = decode('{"type":"session_started","session_id":"s1","config":{"sample_rate":16000}}')
+        assert (started.kind, started.session_id, started.config) == ("session_started", "s1", {"sample_rate": 16000})
+
+        assert decode('{"message_type":"input_error","error":"bad chunk"}').error_message == "bad chunk"
+        error = decode('{"message_type":"error","error":{"type":"rate_limit","message":"slow down"}}')
+        assert (error.error_type, error.error_message) == ("rate_limit", "slow down")
+
+        with pytest.raises(DecodeError):
+            decode('{"type":"partial_transcript","text":5}')
+        with pytest.raises(DecodeError):
+            decode("[1, 2]")
+
+
+
+def test_scribe_messages_are_slotted():
+    """Scribe 메시지 dataclass가 __dict__ 없이 slots로 저장되는지 테스트"""
+    message = serialization.decode_scribe_message('{"message_type": "partial_transcript", "text": "세럼"}')
+
+    assert not hasattr(message, "__dict__")
+    assert not hasattr(ScribeWord(), "__dict__")
+    assert message.kind == "partial_transcript"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,53 @@
+"""
+서버 콜드 스타트 테스트
+src.server 임포트만으로는 봇 의존성(pipecat 등)을 로드하지 않는지 확인 (새 인터프리터에서 측정)
+"""
+import asyncio
+import json
+import subprocess
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_server_import_defers_bot_modules():
+    """HTML/헬스체크만 서빙하는 워커는 봇 모듈을 임포트하지 않는지 테스트"""
+    code = (
+        "import json, sys\n"
+        "import src.server\n"
+        "print(json.dumps(sorted(name for name in sys.modules if name == 'src.bot' or name.startswith('pipecat'))))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+
+def test_concurrent_bot_loads_warm_once(monkeypatch):
+    """미리 로드와 첫 /api/start가 겹쳐도 VAD 풀은 한 번만 준비하는지 테스트"""
+    sys.path.insert(0, str(ROOT))
+    from src import server
+    from src.vad_pool import vad_pool
+
+    warmed = []
+
+    def slow_warm():
+        warmed.append(threading.get_ident())
+        time.sleep(0.2)
+
+    monkeypatch.setattr(server, "_bot_class", None)
+    monkeypatch.setattr(vad_pool, "warm", slow_warm)
+
+    async def load_twice():
+        return await asyncio.gather(server.load_bot_class(), server.load_bot_class())
+
+    first, second = asyncio.run(load_twice())
+    assert first is second
+    assert len(warmed) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,113 @@
+"""
+봇 세션 레지스트리 테스트
+"""
+import asyncio
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.session_registry import SessionRegistry, SessionRejectedError, SessionState
+
+
+class FakeBot:
+    """stop() 호출 시 종료되는 테스트용 봇"""
+
+    def __init__(self, duration: float = 10.0, fail: bool = False, ignore_stop: bool = False):
+        self.duration = duration
+        self.fail = fail
+        self.ignore_stop = ignore_stop
+        self.counters = {"user_turns": 0}
+        self._stopped = asyncio.Event()
+
+    async def run(self):
+        self.counters["user_turns"] += 1
+        if self.fail:
+            raise RuntimeError("pipeline crashed")
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=self.duration)
+        except asyncio.TimeoutError:
+            pass
+
+    async def stop(self):
+        if not self.ignore_stop:
+            self._stopped.set()
+
+
+def test_start_and_list_sessions():
+    """세션 등록 및 목록 조회 테스트"""
+    async def scenario():
+        registry = SessionRegistry()
+        bot = FakeBot(duration=0.05)
+        session = registry.start(bot, bot.run(), room_name="room-1")
+        await asyncio.sleep(0)
+        assert registry.active_count == 1
+        assert registry.list_sessions()[0].to_dict()["room_name"] == "room-1"
+
+        await session.task
+        assert session.state == SessionState.FINISHED
+        assert registry.active_count == 0
+        assert registry.get(session.session_id) is session
+        assert session.to_dict()["counters"]["user_turns"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_failed_session_is_recorded():
+    """봇 예외가 사라지지 않고 세션에 기록되는지 테스트"""
+    async def scenario():
+        registry = SessionRegistry()
+        bot = FakeBot(fail=True)
+        session = registry.start(bot, bot.run(), room_name="room-err")
+        await session.task
+        assert session.state == SessionState.FAILED
+        assert "pipeline crashed" in session.error
+
+    asyncio.run(scenario())
+
+
+def test_stop_session():
+    """세션 중지 테스트"""
+    async def scenario():
+        registry = SessionRegistry()
+        bot = FakeBot(duration=10)
+        session = registry.start(bot, bot.run(), room_name="room-2")
+        await asyncio.sleep(0)
+        stopped = await registry.stop(session.session_id, timeout=1)
+        assert stopped is session
+        assert session.task.done()
+        assert registry.active_count == 0
+        assert await registry.stop("unknown") is None
+
+    asyncio.run(scenario())
+
+
+def test_drain_rejects_new_sessions_and_waits():
+    """drain 모드: 새 세션 거부 + 활성 세션 종료 대기 테스트"""
+    async def scenario():
+        registry = SessionRegistry()
+        short_bot = FakeBot(duration=0.05)
+        stuck_bot = FakeBot(duration=10, ignore_stop=True)
+        registry.start(short_bot, short_bot.run(), room_name="short")
+        stuck = registry.start(stuck_bot, stuck_bot.run(), room_name="stuck")
+        await asyncio.sleep(0)
+
+        summary = await registry.drain(timeout=0.2, stop_grace=0.1)
+        assert summary == {"drained": 1, "stopped": 1, "active": 0}
+        assert stuck.task.cancelled() or stuck.task.done()
+
+        new_bot = FakeBot()
+        with pytest.raises(SessionRejectedError):
+            registry.start(new_bot, new_bot.run(), room_name="late")
+
+        registry.resume()
+        session = registry.start(new_bot, new_bot.run(), room_name="after-resume")
+        await registry.stop(session.session_id, timeout=1)
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
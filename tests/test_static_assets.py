@@ -0,0 +1,136 @@
+"""
+정적 웹 UI 자산 (사전 압축, ETag, 캐시 헤더) 테스트
+"""
+import gzip
+import re
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.static_assets import (
+    IMMUTABLE_CACHE,
+    REVALIDATE_CACHE,
+    CachedStaticFiles,
+    WebUI,
+    select_encoding,
+)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+@pytest.fixture
+def client():
+    """실제 src/static 자산과 data 디렉토리를 서빙하는 앱"""
+    web_ui = WebUI(data_dir=DATA_DIR)
+    app = FastAPI()
+    app.mount("/data", CachedStaticFiles(directory=str(DATA_DIR)), name="data")
+
+    @app.get("/")
+    async def root(request: Request):
+        return web_ui.index_response(request.headers)
+
+    @app.get("/static/{name}")
+    async def static_asset(name: str, request: Request):
+        return web_ui.asset_response(name, request.headers, request.query_params.get("v"))
+
+    return TestClient(app)
+
+
+def test_index_is_compressed_and_revalidated(client):
+    """index.html: gzip 전송, no-cache + 강한 ETag, 재방문은 304"""
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["cache-control"] == REVALIDATE_CACHE
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content) / 2
+    etag = response.headers["etag"]
+    assert not etag.startswith("W/")
+
+    repeat = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+
+    # 다른 인코딩 표현은 다른 ETag
+    plain = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] != etag
+    assert plain.text == response.text
+
+
+def test_versioned_assets_are_immutable(client):
+    """index.html이 참조하는 자산은 내용 해시 버전 URL, 버전이 맞으면 immutable 캐시"""
+    page = client.get("/").text
+    urls = re.findall(r'/static/[\w.]+\?v=\w+', page)
+    assert {url.split("?")[0] for url in urls} == {"/static/app.css", "/static/app.js"}
+
+    for url in urls:
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE
+
+    # 버전이 없거나 다르면 재검증
+    assert client.get("/static/app.js").headers["cache-control"] == REVALIDATE_CACHE
+    assert client.get("/static/app.js?v=old").headers["cache-control"] == REVALIDATE_CACHE
+
+
+def test_data_maps_get_content_etag_and_cache(client):
+    """app.js의 지도 이미지 URL이 버전 URL로 치환되고 /data가 ETag/캐시 헤더를 주는지 테스트"""
+    page = client.get("/").text
+    script_url = re.search(r'/static/app\.js\?v=\w+', page).group(0)
+    script = client.get(script_url).text
+    map_url = re.search(r"/data/skincare\.png\?v=\w+", script).group(0)
+
+    response = client.get(map_url)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE
+    assert response.content == (DATA_DIR / "skincare.png").read_bytes()
+    assert "content-encoding" not in response.headers  # PNG는 압축하지 않음
+
+    unversioned = client.get("/data/skincare.png")
+    assert unversioned.headers["cache-control"] == REVALIDATE_CACHE
+    assert client.get("/data/skincare.png", headers={"If-None-Match": unversioned.headers["etag"]}).status_code == 304
+
+
+def test_data_json_is_compressed(client):
+    """/data의 JSON은 gzip 변형으로 전송"""
+    response = client.get("/data/landmarks.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == (DATA_DIR / "landmarks.json").read_bytes()
+    assert client.get("/data/없는파일.png").status_code == 404
+
+
+def test_select_encoding():
+    """Accept-Encoding 협상 (q=0 제외, brotli 우선)"""
+    variants = {"gzip": b"", "br": b""}
+    assert select_encoding("gzip, deflate, br", variants) == "br"
+    assert select_encoding("gzip, br;q=0", variants) == "gzip"
+    assert select_encoding("gzip", {"gzip": b""}) == "gzip"
+    assert select_encoding("identity", variants) is None
+    assert select_encoding("*", {"gzip": b""}) == "gzip"
+    assert select_encoding(None, variants) is None
+
+
+def test_gzip_variant_is_deterministic():
+    """사전 압축 결과가 빌드마다 같은지 (mtime=0) 테스트 - 워커 간 ETag/본문 일치"""
+    first = WebUI(data_dir=DATA_DIR)
+    second = WebUI(data_dir=DATA_DIR)
+    first._build()
+    second._build()
+
+    for name in WebUI.ASSETS:
+        assert first._assets[name].version == second._assets[name].version
+        assert first._assets[name].encodings["gzip"] == second._assets[name].encodings["gzip"]
+        assert gzip.decompress(first._assets[name].encodings["gzip"]) == first._assets[name].body
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,6 +1,9 @@
 """
 매장 서비스 테스트
 """
+import asyncio
+import json
+import time
 import pytest
 from pathlib import Path
 import sys
@@ -8,7 +11,15 @@ import sys
 # 상위 디렉토리를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.store_service import StoreService
+from src.store_service import (
+    DEFAULT_DATA_PATH,
+    StoreService,
+    get_store_service,
+    reload_store_service,
+    reload_store_service_async,
+    watch_store_data,
+)
+from src import store_service as store_service_module
 
 
 @pytest.fixture
@@ -91,6 +102,245 @@ def test_get_categories(store_service):
     assert len(categories["skincare"]) > 0
 
 
+def test_shared_store_service_snapshot():
+    """공유 스냅샷: 같은 인스턴스 재사용 + reload 시 새 스냅샷으로 교체 테스트"""
+    shared = get_store_service()
+    assert get_store_service() is shared
+    
+    reloaded = reload_store_service()
+    assert reloaded is not shared
+    assert reloaded.version == shared.version + 1
+    assert get_store_service() is reloaded
+    # 이전 스냅샷은 그대로 사용 가능
+    assert shared.get_all_products() == reloaded.get_all_products()
+
+
+def test_reload_store_service_async(tmp_path):
+    """비동기 reload: 새 데이터로 교체, 기존 스냅샷 유지, 실패 시 교체하지 않음 테스트"""
+    data = json.loads(Path(DEFAULT_DATA_PATH).read_text(encoding="utf-8"))
+    data_file = tmp_path / "assistant_data.json"
+    data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    
+    try:
+        old = reload_store_service(str(data_file))
+        first_id = old.get_all_products()[0]["product_id"]
+        old_price = old.get_all_products()[0]["sale_price"]
+        
+        data["products"]["all_products"][0]["sale_price"] = old_price + 1000
+        data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        
+        new = asyncio.run(reload_store_service_async())
+        assert new.version == old.version + 1
+        assert get_store_service() is new
+        assert new.get_all_products()[0]["sale_price"] == old_price + 1000
+        # 기존 스냅샷을 가진 세션은 이전 데이터로 계속 진행
+        assert old.get_all_products()[0]["sale_price"] == old_price
+        assert old.get_all_products()[0]["product_id"] == first_id
+        
+        # 잘못된 파일이면 예외 + 기존 스냅샷 유지
+        data_file.write_text("{broken", encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            asyncio.run(reload_store_service_async())
+        assert get_store_service() is new
+    finally:
+        reload_store_service(DEFAULT_DATA_PATH)
+
+
+def test_concurrent_reloads_keep_newest_snapshot(tmp_path, monkeypatch):
+    """감시 태스크와 수동 reload가 겹쳐도 늦게 끝난 오래된 파싱이 새 스냅샷을 덮지 않는지 테스트"""
+    data = json.loads(Path(DEFAULT_DATA_PATH).read_text(encoding="utf-8"))
+    data_file = tmp_path / "assistant_data.json"
+    data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    build = store_service_module._build_store_service
+    calls = []
+
+    def slow_first_build(path):
+        service = build(path)
+        calls.append(service)
+        if len(calls) == 1:
+            time.sleep(0.2)  # 이전 내용을 읽은 파싱이 늦게 끝남
+        return service
+
+    async def run():
+        slow = asyncio.create_task(reload_store_service_async(str(data_file)))
+        await asyncio.sleep(0.05)
+        data["products"]["all_products"][0]["sale_price"] = 1
+        data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        fast = await reload_store_service_async(str(data_file))
+        await slow
+        return fast
+
+    try:
+        reload_store_service(str(data_file))
+        monkeypatch.setattr(store_service_module, "_build_store_service", slow_first_build)
+        newest = asyncio.run(run())
+        assert get_store_service() is newest
+        assert newest.get_all_products()[0]["sale_price"] == 1
+
+        # 오래된 파일 상태로 읽은 스냅샷은 교체하지 않음
+        stale = StoreService(str(data_file))
+        stale.file_stat = (newest.file_stat[0] - 1, newest.file_stat[1])
+        assert store_service_module._swap_store_service(stale) is newest
+        assert get_store_service() is newest
+    finally:
+        reload_store_service(DEFAULT_DATA_PATH)
+
+
+def test_watcher_compares_against_current_snapshot(tmp_path):
+    """감시 태스크는 현재 스냅샷이 읽은 파일 상태와 비교 (수동 reload 후 다시 로드하지 않음)"""
+    data = json.loads(Path(DEFAULT_DATA_PATH).read_text(encoding="utf-8"))
+    data_file = tmp_path / "assistant_data.json"
+    data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    async def run():
+        watcher = asyncio.create_task(watch_store_data(0.01))
+        try:
+            data["products"]["all_products"][0]["sale_price"] = 2
+            data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            manual = await reload_store_service_async()
+            await asyncio.sleep(0.1)
+            assert get_store_service() is manual  # 이미 반영된 변경은 다시 로드하지 않음
+
+            data["products"]["all_products"][0]["sale_price"] = 3
+            data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if get_store_service() is not manual:
+                    break
+            assert get_store_service().get_all_products()[0]["sale_price"] == 3
+        finally:
+            watcher.cancel()
+
+    try:
+        reload_store_service(str(data_file))
+        asyncio.run(run())
+    finally:
+        reload_store_service(DEFAULT_DATA_PATH)
+
+
+def test_store_indexes_match_linear_scan(tmp_path):
+    """매장 색인 조회 결과가 선형 탐색 결과와 같은지 테스트"""
+    data = {
+        "store": {"store_name": "올리브영 명동 타운", "store_id": "D176", "address": "서울특별시 중구 명동길 53",
+                  "services": ["스마트 반품", "택스리펀드"], "nearby_landmarks": ["명동역 8번 출구"]},
+        "nearby_stores": [
+            {"name": "강남역점", "store_id": "S001", "address": "서울특별시 강남구 강남대로 396",
+             "services": ["픽업 서비스"], "nearby_landmarks": ["강남역 11번 출구", "CGV 강남"]},
+            {"name": "신강남점", "store_id": "S002", "address": "서울특별시 강남구 테헤란로 1",
+             "services": ["면세", "스마트 반품"], "nearby_landmarks": ["신논현역"]},
+            {"name": "Hongdae Flagship", "store_id": "S003", "address": "서울특별시 마포구 양화로 153",
+             "services": [], "nearby_landmarks": ["홍대입구역 9번 출구"]},
+        ],
+    }
+    data_file = tmp_path / "stores.json"
+    data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    service = StoreService(str(data_file))
+    stores = service.get_all_stores()
+    
+    def scan(query, fields):
+        q = query.lower()
+        return [s for s in stores if any(q in f.lower() for f in fields(s))]
+    
+    for query in ["강남", "서울", "명동", "역", "hongdae", "출구", "없는곳"]:
+        expected = scan(query, lambda s: [s.get("name") or s["store_name"], s["address"], *s.get("nearby_landmarks", [])])
+        assert service.find_store_by_location(query) == expected
+    
+    for query in ["스마트", "면세", "반품", "없음"]:
+        assert service.search_by_service(query) == scan(query, lambda s: s.get("services", []))
+    
+    assert service.get_store_info("S002")["name"] == "신강남점"
+    assert service.get_store_info("NONE") is None
+    assert service.find_store_by_name("강남")["store_id"] == "S001"
+    assert service.find_store_by_name("신강남점")["store_id"] == "S002"
+    assert service.find_store_by_name("HONGDAE")["store_id"] == "S003"
+    assert service.find_store_by_name("명동 타운")["store_id"] == "D176"
+    assert service.find_nearest_store("강남역")["store_id"] == "S001"
+    assert service.find_nearest_store("신논현")["store_id"] == "S002"
+    assert service.find_nearest_store("을지로") is None
+
+
+def test_format_store_info_is_prerendered(tmp_path):
+    """매장 정보 텍스트가 스냅샷 로드 시 미리 렌더링되고 리로드 시 새로 만들어지는지 테스트"""
+    store = {"name": "강남역점", "store_id": "S001", "address": "서울특별시 강남구 강남대로 396",
+             "phone": "02-000-0000", "operating_hours": {"weekday": "10:00~22:00"},
+             "services": ["픽업 서비스"], "nearby_landmarks": ["강남역 11번 출구"],
+             "popular_products": ["A", "B", "C", "D"]}
+    data_file = tmp_path / "stores.json"
+    data_file.write_text(json.dumps({"store": store, "nearby_stores": []}, ensure_ascii=False), encoding="utf-8")
+    service = StoreService(str(data_file))
+    found = service.get_store_info("S001")
+    
+    brief = service.format_store_info(found, "brief")
+    assert brief == "✨ 강남역점\n📍 주소: 서울특별시 강남구 강남대로 396\n📞 전화: 02-000-0000\n"
+    medium = service.format_store_info(found, "medium")
+    assert medium == brief + "⏰ 영업시간:\n   평일: 10:00~22:00\n   주말: 정보 없음\n"
+    full = service.format_store_info(found, "full")
+    assert full == medium + "🛍️ 서비스: 픽업 서비스\n🗺️ 주변: 강남역 11번 출구\n🔥 인기상품: A, B, C\n"
+    # 같은 스냅샷에서는 렌더링 없이 같은 문자열 객체 반환
+    assert service.format_store_info(found, "full") is full
+    assert service.format_store_info(None) == "매장 정보를 찾을 수 없습니다."
+    
+    # 같은 store_id라도 다른 매장 객체(다른 스냅샷)는 캐시를 쓰지 않음
+    changed = dict(found, name="강남역 플래그십")
+    assert "강남역 플래그십" in service.format_store_info(changed, "brief")
+    assert service.format_store_info(found, "brief") is brief
+    
+    # 조회는 공유 스냅샷의 캐시를 늘리지 않음 (미리 렌더링한 매장 × 상세 수준만 유지)
+    entries = len(service._store_info_cache)
+    service.format_store_info(found, "unknown-level")
+    service.format_store_info({"store_id": "S999", "name": "임시 매장"}, "brief")
+    assert len(service._store_info_cache) == entries
+
+
+
+def test_product_payloads_match_legacy_message(store_service):
+    """미리 직렬화한 제품 조각으로 만든 show_images 메시지가 기존 방식(복사 + 카테고리 추가 후 직렬화)과 같은지 테스트"""
+    from src.serialization import dumps, loads
+    from src.websocket_manager import products_message
+    
+    all_products = store_service.get_all_products()
+    product_ids = [all_products[3]["product_id"], all_products[0]["product_id"], "없는ID", all_products[0]["product_id"]]
+    
+    selected = [p.to_dict() for p in all_products if p["product_id"] in product_ids]
+    for product in selected:
+        for category, products in store_service.get_categories().items():
+            if any(p["product_id"] == product["product_id"] for p in products):
+                product["category"] = category
+                break
+    legacy = dumps({"type": "show_images", "content_type": "products", "data": {"products": selected}})
+    
+    payloads = store_service.get_product_payloads(product_ids)
+    assert len(payloads) == 2
+    assert products_message(payloads) == legacy
+    assert all("category" in loads(payload) for payload in payloads)
+    # 카탈로그 레코드에는 category가 추가되지 않음
+    assert all("category" not in p for p in all_products)
+    assert store_service.get_product_payloads(["없는ID"]) == []
+
+
+def test_product_payloads_are_lazy_on_binary_catalog(tmp_path, monkeypatch):
+    """.oycat 스냅샷은 시작 시 제품을 디코딩하지 않고, 요청된 제품만 한 번 직렬화하는지 테스트"""
+    from src.catalog_binary import BinaryCatalog, compile_catalog
+    
+    compiled = compile_catalog(DEFAULT_DATA_PATH, str(tmp_path / "assistant_data.oycat"))
+    decoded = []
+    product = BinaryCatalog.product
+    monkeypatch.setattr(BinaryCatalog, "product", lambda self, row: decoded.append(row) or product(self, row))
+    
+    binary_service = StoreService(str(compiled))
+    assert decoded == []
+    
+    json_service = StoreService(DEFAULT_DATA_PATH)
+    product_ids = [p["product_id"] for p in json_service.get_all_products()[:3]]
+    assert binary_service.get_product_payloads(product_ids) == json_service.get_product_payloads(product_ids)
+    assert len(decoded) == 3
+    binary_service.get_product_payloads(product_ids)
+    assert len(decoded) == 3  # product_id별로 한 번만
+    
+    # v2 카탈로그 사전은 처음 요청될 때 생성
+    assert binary_service._catalog_payload is None
+    assert binary_service.catalog_payload == json_service.catalog_payload
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -0,0 +1,232 @@
+"""
+TTS 오디오 캐시 테스트
+"""
+import asyncio
+import threading
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipecat.frames.frames import (
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    TextFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection
+
+from src.bot import TTSCacheLookup, TTSCacheRecorder
+from src import tts_cache
+from src.tts_cache import TTSAudioCache, cache_key
+
+VOICE = "voice-ko"
+PCM = b"\x01\x00" * 24000  # 1초 (24kHz 16bit mono)
+
+
+def test_memory_lru_byte_budget():
+    """메모리 계층이 바이트 예산을 넘으면 오래 안 쓴 항목부터 내보내는지 테스트"""
+    cache = TTSAudioCache(memory_budget_bytes=len(PCM) * 2)
+    cache.put(VOICE, "ko", "첫 번째 문장입니다.", PCM, 24000)
+    cache.put(VOICE, "ko", "두 번째 문장입니다.", PCM, 24000)
+    assert cache.get(VOICE, "ko", "첫 번째   문장입니다. ") is not None  # 공백 정규화, 최근 사용 갱신
+    cache.put(VOICE, "ko", "세 번째 문장입니다.", PCM, 24000)
+
+    assert cache.memory_bytes == len(PCM) * 2
+    assert cache.get(VOICE, "ko", "두 번째 문장입니다.") is None
+    assert cache.get(VOICE, "ko", "첫 번째 문장입니다.").audio == PCM
+    assert cache.get(VOICE, "en", "첫 번째 문장입니다.") is None  # 언어/목소리별 키
+    assert cache.stats["evictions"] == 1
+    assert cache.has_prefix(VOICE, "ko", "세 번째")
+    assert not cache.has_prefix(VOICE, "ko", "두 번째")
+    assert cache.get_memory(VOICE, "ko", "세 번째 문장입니다.").audio == PCM
+    assert cache.get_memory(VOICE, "ko", "두 번째 문장입니다.") is None
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    """디스크 계층이 재시작 후에도 색인을 복원하고 예산을 지키는지 테스트"""
+    cache = TTSAudioCache(memory_budget_bytes=len(PCM), disk_dir=str(tmp_path), disk_budget_bytes=len(PCM) * 2 + 1000)
+    cache.put(VOICE, "ko", "매장 위치 안내", PCM, 24000)
+    cache.put(VOICE, "ko", "영업시간 안내", PCM, 24000)
+    assert cache.get(VOICE, "ko", "매장 위치 안내").audio == PCM  # 디스크에서 승격
+    assert cache.stats["disk_hits"] == 1
+
+    restarted = TTSAudioCache(memory_budget_bytes=len(PCM), disk_dir=str(tmp_path), disk_budget_bytes=len(PCM) * 2 + 1000)
+    assert restarted.has_prefix(VOICE, "ko", "영업")
+    assert restarted.get(VOICE, "ko", "영업시간 안내").sample_rate == 24000
+
+    restarted.put(VOICE, "ko", "전화번호 안내", PCM, 24000)
+    assert restarted.disk_bytes <= restarted.disk_budget_bytes
+    assert len(list(tmp_path.glob("*/*.pcm"))) == 2
+    assert (tmp_path / cache_key(VOICE, "ko", "전화번호 안내")[:2]).exists()
+
+
+def test_concurrent_disk_writes_use_unique_temp_files(tmp_path):
+    """같은 키를 동시에 써도 파일이 섞이지 않고 임시 파일이 남지 않는지 테스트"""
+    caches = [
+        TTSAudioCache(memory_budget_bytes=len(PCM), disk_dir=str(tmp_path), disk_budget_bytes=len(PCM) * 4)
+        for _ in range(4)
+    ]
+    threads = [
+        threading.Thread(target=cache.put, args=(VOICE, "ko", "매장 위치 안내", PCM, 24000))
+        for cache in caches
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert list(tmp_path.glob("*/*.tmp")) == []
+    restarted = TTSAudioCache(memory_budget_bytes=len(PCM), disk_dir=str(tmp_path), disk_budget_bytes=len(PCM) * 4)
+    assert restarted.get(VOICE, "ko", "매장 위치 안내").audio == PCM
+
+
+def test_shared_cache_is_built_lazily(monkeypatch):
+    """전역 캐시는 import 시가 아니라 첫 사용 시 한 번 생성되는지 테스트"""
+    monkeypatch.setattr(tts_cache, "_shared_cache", None)
+    monkeypatch.setattr(tts_cache, "TTS_CACHE_DISK_MB", 0)  # 테스트에서 디스크 계층 끔
+    assert not hasattr(tts_cache, "tts_cache")
+
+    first = tts_cache.get_tts_cache()
+    assert tts_cache.get_tts_cache() is first
+    assert first.disk_dir is None
+
+
+def test_admission_requires_repeat():
+    """처음 나온 응답은 저장 대상이 아니고 반복될 때만 저장 대상인지 테스트"""
+    cache = TTSAudioCache(memory_budget_bytes=len(PCM))
+    assert not cache.admit(VOICE, "ko", "안녕하세요")
+    assert cache.admit(VOICE, "ko", "안녕하세요 ")
+    assert not cache.admit(VOICE, "ko", "가" * 1000)
+
+
+def _collect(processor):
+    pushed = []
+
+    async def push_frame(frame, direction=FrameDirection.DOWNSTREAM):
+        pushed.append(frame)
+
+    processor.push_frame = push_frame
+    return pushed
+
+
+async def _feed(processor, frames):
+    for frame in frames:
+        await processor.process_frame(frame, FrameDirection.DOWNSTREAM)
+
+
+def test_lookup_and_recorder_round_trip():
+    """합성 오디오를 저장하고 다음 같은 응답은 TTS 없이 재생하는지 테스트"""
+    cache = TTSAudioCache(memory_budget_bytes=len(PCM) * 4)
+    counters = {}
+    recorder = TTSCacheRecorder(VOICE, "ko", counters, cache=cache)
+    lookup = TTSCacheLookup(VOICE, "ko", recorder, counters, cache=cache)
+    lookup_out = _collect(lookup)
+    recorder_out = _collect(recorder)
+    text = "영업시간은 매일 10시부터 22시 30분까지입니다."
+
+    def response(*chunks):
+        return [LLMFullResponseStartFrame(), *[TextFrame(chunk) for chunk in chunks], LLMFullResponseEndFrame()]
+
+    def tts_audio(context_id):
+        return [
+            TTSStartedFrame(context_id=context_id),
+            TTSAudioRawFrame(PCM[:24000], 24000, 1, context_id=context_id),
+            TTSAudioRawFrame(PCM[24000:], 24000, 1, context_id=context_id),
+            TTSStoppedFrame(context_id=context_id),
+        ]
+
+    async def run():
+        # 1회차: 처음 본 응답 → TTS로 넘기고 저장 안 함
+        await _feed(lookup, response("영업시간은 ", "매일 10시부터 ", "22시 30분까지입니다."))
+        await _feed(recorder, tts_audio("ctx-1"))
+        # 2회차: 반복 → TTS로 넘기고 저장
+        await _feed(lookup, response(text))
+        await _feed(recorder, tts_audio("ctx-2"))
+        assert counters["tts_cache_stores"] == 1
+        assert not any(frame.skip_tts for frame in lookup_out if isinstance(frame, TextFrame))
+
+        # 3회차: 캐시 적중 → 텍스트는 TTS 건너뛰고 저장된 오디오 출력
+        lookup_out.clear()
+        await _feed(lookup, response("영업시간은 ", "매일 10시부터 22시 30분까지입니다."))
+
+        # 캐시와 다른 응답은 달라지는 즉시 TTS로 흘려보냄
+        hit_frames = list(lookup_out)
+        lookup_out.clear()
+        await _feed(lookup, [LLMFullResponseStartFrame(), TextFrame("영업시간은 "), TextFrame("휴무 없이")])
+        assert [type(frame) for frame in lookup_out] == [LLMFullResponseStartFrame, TextFrame, TextFrame]
+        return hit_frames
+
+    hit_frames = asyncio.run(run())
+
+    audio = b"".join(frame.audio for frame in hit_frames if isinstance(frame, TTSAudioRawFrame))
+    assert audio == PCM
+    assert isinstance(hit_frames[1], TTSStartedFrame)
+    texts = [frame for frame in hit_frames if isinstance(frame, TextFrame)]
+    assert len(texts) == 1 and texts[0].skip_tts and texts[0].text == text
+    assert hit_frames[0].skip_tts and hit_frames[-1].skip_tts
+    assert counters["tts_cache_hits"] == 1
+    assert counters["tts_cache_misses"] == 2
+
+
+def test_lookup_releases_held_text_after_hold_timeout():
+    """첫 문장만 캐시와 같고 나머지가 늦게 오는 응답은 보류 시간이 지나면 TTS로 넘기는지 테스트 (미스 경로)"""
+    cache = TTSAudioCache(memory_budget_bytes=len(PCM) * 4)
+    cached_text = "영업시간은 매일 10시부터 22시까지입니다."
+    cache.put(VOICE, "ko", cached_text, PCM, 24000)
+    counters = {}
+    recorder = TTSCacheRecorder(VOICE, "ko", counters, cache=cache)
+    lookup = TTSCacheLookup(VOICE, "ko", recorder, counters, cache=cache, max_hold_seconds=0.05)
+    out = _collect(lookup)
+
+    async def run():
+        await _feed(lookup, [LLMFullResponseStartFrame(), TextFrame(cached_text)])
+        assert out == []  # 캐시 앞부분과 일치하는 동안은 보류
+        await asyncio.sleep(0.15)
+        released = list(out)  # 다음 문장이 오기 전에 TTS로 넘어감
+        await _feed(lookup, [TextFrame(" 주말도 같습니다."), LLMFullResponseEndFrame()])
+        return released
+
+    released = asyncio.run(run())
+
+    assert [type(frame) for frame in released] == [LLMFullResponseStartFrame, TextFrame]
+    assert released[1].text == cached_text and not released[1].skip_tts
+    assert [type(frame) for frame in out] == [LLMFullResponseStartFrame, TextFrame, TextFrame, LLMFullResponseEndFrame]
+    assert not any(isinstance(frame, TTSAudioRawFrame) for frame in out)
+    assert not any(frame.skip_tts for frame in out)
+    assert counters["tts_cache_misses"] == 1 and "tts_cache_hits" not in counters
+
+
+def test_lookup_reads_disk_tier_off_event_loop(tmp_path, monkeypatch):
+    """메모리에 없는 응답은 디스크 계층을 이벤트 루프 밖(to_thread)에서 읽는지 테스트"""
+    cache = TTSAudioCache(memory_budget_bytes=len(PCM) // 2, disk_dir=str(tmp_path), disk_budget_bytes=len(PCM) * 4)
+    text = "매장 위치는 강남역 11번 출구 앞입니다."
+    cache.put(VOICE, "ko", text, PCM, 24000)  # 메모리 예산보다 커서 디스크에만 저장
+    assert cache.get_memory(VOICE, "ko", text) is None
+
+    loop_thread = threading.get_ident()
+    read_threads = []
+    read_disk = cache._read_disk
+
+    def tracking_read(key):
+        read_threads.append(threading.get_ident())
+        return read_disk(key)
+
+    monkeypatch.setattr(cache, "_read_disk", tracking_read)
+    counters = {}
+    lookup = TTSCacheLookup(VOICE, "ko", TTSCacheRecorder(VOICE, "ko", counters, cache=cache), counters, cache=cache)
+    out = _collect(lookup)
+    asyncio.run(_feed(lookup, [LLMFullResponseStartFrame(), TextFrame(text), LLMFullResponseEndFrame()]))
+
+    assert counters["tts_cache_hits"] == 1
+    assert b"".join(frame.audio for frame in out if isinstance(frame, TTSAudioRawFrame)) == PCM
+    assert read_threads and loop_thread not in read_threads
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,91 @@
+"""
+세션 간 배치 VAD 추론 테스트
+"""
+import threading
+import numpy as np
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.vad_batch import BatchedVADService
+from src.vad_pool import VADAnalyzerPool
+
+
+def _speech_like(seconds: float, freq: float, sample_rate: int = 16000) -> bytes:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    signal = sum(np.sin(2 * np.pi * freq * k * t) / k for k in range(1, 6)) * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t))
+    return (signal / np.abs(signal).max() * 12000).astype(np.int16).tobytes()
+
+
+def _confidences(analyzer, audio: bytes):
+    step = analyzer.num_frames_required() * 2
+    return [float(np.ravel(analyzer.voice_confidence(audio[i:i + step]))[0]) for i in range(0, len(audio) - step + 1, step)]
+
+
+@pytest.fixture
+def batched_pool():
+    pool = VADAnalyzerPool(size=0, batched=True)
+    service = BatchedVADService(window_ms=20, max_batch=8)
+    session = pool._load_session()
+    service.start(session)
+    yield service, session
+    service.stop()
+
+
+def test_batched_results_match_per_session_inference(batched_pool):
+    """여러 세션 프레임을 묶어 추론해도 세션별 단독 추론과 같은 확률이 나오는지 테스트"""
+    service, session = batched_pool
+    from src.vad_batch import BatchedSileroVADAnalyzer
+
+    audios = [_speech_like(0.6, freq) for freq in (150, 200, 260, 320)]
+    expected = []
+    for audio in audios:
+        single = VADAnalyzerPool(size=0).acquire()
+        single.set_sample_rate(16000)
+        expected.append(_confidences(single, audio))
+
+    analyzers = []
+    for _ in audios:
+        analyzer = BatchedSileroVADAnalyzer(session=session, service=service)
+        analyzer.reset()
+        analyzer.set_sample_rate(16000)
+        analyzers.append(analyzer)
+
+    results = [None] * len(audios)
+
+    def run(i):
+        results[i] = _confidences(analyzers[i], audios[i])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(audios))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for got, want in zip(results, expected):
+        assert np.allclose(got, want, atol=1e-4)
+    assert service.stats["max_batch"] > 1  # 실제로 배치가 만들어짐
+    assert service.stats["frames"] == sum(len(r) for r in results)
+
+    for analyzer in analyzers:
+        analyzer.detach()
+    assert service._active == 0
+
+
+def test_pool_creates_batched_analyzers():
+    """VAD_BATCHING 풀은 배치 분석기를 만들고 반납 시 활성 세션에서 빼는지 테스트"""
+    from src.vad_batch import BatchedSileroVADAnalyzer, batched_vad_service
+
+    pool = VADAnalyzerPool(size=1, batched=True)
+    analyzer = pool.acquire()
+    assert isinstance(analyzer, BatchedSileroVADAnalyzer)
+    active = batched_vad_service._active
+    pool.release(analyzer)
+    assert batched_vad_service._active == active - 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""
+Silero VAD 분석기 풀 테스트
+"""
+import numpy as np
+import pytest
+from pathlib import Path
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADParams, VADState
+
+from src.vad_pool import VADAnalyzerPool
+
+
+def _speech_like(seconds: float = 1.0, sample_rate: int = 16000) -> bytes:
+    """음성 대역 배음 + 진폭 변조 신호 (16bit PCM)"""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    signal = sum(np.sin(2 * np.pi * f * t) / i for i, f in enumerate((180, 360, 540, 720, 900), 1))
+    signal *= 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    return (signal / np.abs(signal).max() * 12000).astype(np.int16).tobytes()
+
+
+def _confidences(analyzer, audio: bytes):
+    step = analyzer.num_frames_required() * 2
+    return [float(np.ravel(analyzer.voice_confidence(audio[i:i + step]))[0]) for i in range(0, len(audio) - step + 1, step)]
+
+
+def test_pool_shares_model_and_reuses_analyzers():
+    """모델은 한 번만 로드하고, 반납한 분석기를 다음 세션에 재사용하는지 테스트"""
+    pool = VADAnalyzerPool(size=2)
+    pool.warm()
+    assert pool.idle_count == 2 and pool.stats["created"] == 2
+
+    first = pool.acquire(VADParams(stop_secs=0.2))
+    second = pool.acquire()
+    third = pool.acquire()  # 풀이 비면 공유 모델로 새로 생성
+    assert first._model.session is second._model.session is third._model.session
+    assert first._model is not second._model  # 세션별 RNN 상태는 분리
+    assert first.params.stop_secs == 0.2
+    assert pool.stats == {**pool.stats, "created": 3, "reused": 2}
+
+    for analyzer in (first, second, third):
+        pool.release(analyzer)
+    assert pool.idle_count == 2  # 풀 크기 초과분은 버림
+
+
+def test_reused_analyzer_matches_fresh_model():
+    """재사용한 분석기가 새로 로드한 Silero 분석기와 같은 결과를 내는지 테스트 (이전 세션 상태가 남지 않음)"""
+    pool = VADAnalyzerPool(size=1)
+    audio = _speech_like()
+
+    analyzer = pool.acquire()
+    analyzer.set_sample_rate(16000)
+    _confidences(analyzer, audio[::-1])  # 이전 세션에서 다른 오디오를 처리
+    analyzer._vad_state = VADState.SPEAKING
+    pool.release(analyzer)
+
+    reused = pool.acquire()
+    assert reused is analyzer
+    assert reused._vad_state == VADState.QUIET and reused._vad_buffer == b""
+
+    fresh = SileroVADAnalyzer(sample_rate=16000)
+    fresh.set_sample_rate(16000)
+    assert np.allclose(_confidences(reused, audio), _confidences(fresh, audio), atol=1e-5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])